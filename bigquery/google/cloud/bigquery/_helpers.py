@@ -219,9 +219,47 @@ def _row_from_json(row, schema):
     return tuple(row_data)
 
 
+def _repeated_from_json(converter):
+    """Wrap a cell converter to convert each value of a repeated field.
+
+    :type converter: callable
+    :param converter: The converter of a single value.
+
+    :rtype: callable
+    :returns: A converter of a list of values.
+    """
+    def _convert(value, field):
+        return [converter(item['v'], field) for item in value]
+    return _convert
+
+
 def _rows_from_json(rows, schema):
-    """Convert JSON row data to rows with appropriate types."""
-    return [_row_from_json(row, schema) for row in rows]
+    """Convert JSON row data to rows with appropriate types.
+
+    The converter of each field is looked up once for all the rows.
+
+    :type rows: list of dict
+    :param rows: JSON response rows to be converted.
+
+    :type schema: tuple
+    :param schema: A tuple of
+                   :class:`~google.cloud.bigquery.schema.SchemaField`.
+
+    :rtype: list of tuple
+    :returns: The rows of data converted to native types.
+    """
+    if not rows:
+        return []
+    converters = []
+    for field in schema:
+        converter = _CELLDATA_FROM_JSON[field.field_type]
+        if field.mode == 'REPEATED':
+            converter = _repeated_from_json(converter)
+        converters.append((converter, field))
+    return [
+        tuple([converter(cell['v'], field)
+               for (converter, field), cell in zip(converters, row['f'])])
+        for row in rows]
 
 
 class _ConfigurationProperty(object):
@@ -19,6 +19,8 @@ from google.cloud._helpers import _datetime_from_microseconds
 from google.cloud.exceptions import NotFound
 from google.cloud.bigquery.table import Table
 from google.cloud.iterator import HTTPIterator
+from google.cloud.metadata_cache import invalidate_resource
+from google.cloud.metadata_cache import reload_resource
 
 
 class AccessGrant(object):
@@ -468,8 +470,7 @@ class Dataset(object):
         """
         client = self._require_client(client)
 
-        api_response = client._connection.api_request(
-            method='GET', path=self.path)
+        api_response = reload_resource(client, self.path)
         self._set_properties(api_response)
 
     def patch(self, client=None, **kw):
@@ -509,6 +510,7 @@ class Dataset(object):
 
         api_response = client._connection.api_request(
             method='PATCH', path=self.path, data=partial)
+        invalidate_resource(client, self.path)
         self._set_properties(api_response)
 
     def update(self, client=None):
@@ -525,6 +527,7 @@ class Dataset(object):
         client = self._require_client(client)
         api_response = client._connection.api_request(
             method='PUT', path=self.path, data=self._build_resource())
+        invalidate_resource(client, self.path)
         self._set_properties(api_response)
 
     def delete(self, client=None):
@@ -540,6 +543,7 @@ class Dataset(object):
         """
         client = self._require_client(client)
         client._connection.api_request(method='DELETE', path=self.path)
+        invalidate_resource(client, self.path)
 
     def list_tables(self, max_results=None, page_token=None):
         """List tables for the project associated with this client.
@@ -33,7 +33,10 @@ from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
 from google.cloud.streaming.transfer import Upload
 from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery._helpers import _row_from_json
+from google.cloud.bigquery._helpers import _rows_from_json
 from google.cloud.iterator import HTTPIterator
+from google.cloud.metadata_cache import invalidate_resource
+from google.cloud.metadata_cache import reload_resource
 
 
 _TABLE_HAS_NO_SCHEMA = "Table has no schema:  call 'table.reload()'"
@@ -533,8 +536,7 @@ class Table(object):
         """
         client = self._require_client(client)
 
-        api_response = client._connection.api_request(
-            method='GET', path=self.path)
+        api_response = reload_resource(client, self.path)
         self._set_properties(api_response)
 
     def patch(self,
@@ -610,6 +612,7 @@ class Table(object):
 
         api_response = client._connection.api_request(
             method='PATCH', path=self.path, data=partial)
+        invalidate_resource(client, self.path)
         self._set_properties(api_response)
 
     def update(self, client=None):
@@ -626,6 +629,7 @@ class Table(object):
         client = self._require_client(client)
         api_response = client._connection.api_request(
             method='PUT', path=self.path, data=self._build_resource())
+        invalidate_resource(client, self.path)
         self._set_properties(api_response)
 
     def delete(self, client=None):
@@ -641,6 +645,7 @@ class Table(object):
         """
         client = self._require_client(client)
         client._connection.api_request(method='DELETE', path=self.path)
+        invalidate_resource(client, self.path)
 
     def fetch_data(self, max_results=None, page_token=None, client=None):
         """API call:  fetch the table data via a GET request
@@ -679,7 +684,8 @@ class Table(object):
         iterator = HTTPIterator(client=client, path=path,
                                 item_to_value=_item_to_row, items_key='rows',
                                 page_token=page_token, max_results=max_results,
-                                page_start=_rows_page_start)
+                                page_start=_rows_page_start,
+                                items_to_values=_items_to_rows)
         iterator.schema = self._schema
         # Over-ride the key used to retrieve the next page token.
         iterator._NEXT_TOKEN = 'pageToken'
@@ -1094,6 +1100,21 @@ def _item_to_row(iterator, resource):
     return _row_from_json(resource, iterator.schema)
 
 
+def _items_to_rows(iterator, resources):
+    """Convert a batch of JSON rows to native objects.
+
+    :type iterator: :class:`~google.cloud.iterator.Iterator`
+    :param iterator: The iterator that is currently in use.
+
+    :type resources: list of dict
+    :param resources: Items to be converted to rows.
+
+    :rtype: list of tuple
+    :returns: The rows, in the same order.
+    """
+    return _rows_from_json(resources, iterator.schema)
+
+
 # pylint: disable=unused-argument
 def _rows_page_start(iterator, page, response):
     """Grab total rows after a :class:`~google.cloud.iterator.Page` started.
@@ -445,6 +445,9 @@ class Test_rows_from_json(unittest.TestCase):
         coerced = self._call_fut(rows, schema)
         self.assertEqual(coerced, expected)
 
+    def test_wo_rows(self):
+        self.assertEqual(self._call_fut([], None), [])
+
     def test_w_int64_float64_bool(self):
         # "Standard" SQL dialect uses 'INT64', 'FLOAT64', 'BOOL'.
         candidate = _Field('REQUIRED', 'candidate', 'STRING')
@@ -29,9 +29,9 @@ In the hierarchy of API concepts
 
 import os
 
-import google.auth.credentials
 from google.longrunning import operations_grpc
 
+from google.cloud import token_cache
 from google.cloud._helpers import make_insecure_stub
 from google.cloud._helpers import make_secure_stub
 from google.cloud.bigtable._generated import bigtable_instance_admin_pb2
@@ -77,10 +77,12 @@ def _make_data_stub(client):
     """
     if client.emulator_host is None:
         return make_secure_stub(client.credentials, client.user_agent,
-                                bigtable_pb2.BigtableStub, DATA_API_HOST)
+                                bigtable_pb2.BigtableStub, DATA_API_HOST,
+                                timeout=client.timeout)
     else:
         return make_insecure_stub(bigtable_pb2.BigtableStub,
-                                  client.emulator_host)
+                                  client.emulator_host,
+                                  timeout=client.timeout)
 
 
 def _make_instance_stub(client):
@@ -96,11 +98,11 @@ def _make_instance_stub(client):
         return make_secure_stub(
             client.credentials, client.user_agent,
             bigtable_instance_admin_pb2.BigtableInstanceAdminStub,
-            INSTANCE_ADMIN_HOST)
+            INSTANCE_ADMIN_HOST, timeout=client.timeout)
     else:
         return make_insecure_stub(
             bigtable_instance_admin_pb2.BigtableInstanceAdminStub,
-            client.emulator_host)
+            client.emulator_host, timeout=client.timeout)
 
 
 def _make_operations_stub(client):
@@ -118,10 +120,11 @@ def _make_operations_stub(client):
     if client.emulator_host is None:
         return make_secure_stub(client.credentials, client.user_agent,
                                 operations_grpc.OperationsStub,
-                                OPERATIONS_API_HOST)
+                                OPERATIONS_API_HOST, timeout=client.timeout)
     else:
         return make_insecure_stub(operations_grpc.OperationsStub,
-                                  client.emulator_host)
+                                  client.emulator_host,
+                                  timeout=client.timeout)
 
 
 def _make_table_stub(client):
@@ -137,11 +140,11 @@ def _make_table_stub(client):
         return make_secure_stub(
             client.credentials, client.user_agent,
             bigtable_table_admin_pb2.BigtableTableAdminStub,
-            TABLE_ADMIN_HOST)
+            TABLE_ADMIN_HOST, timeout=client.timeout)
     else:
         return make_insecure_stub(
             bigtable_table_admin_pb2.BigtableTableAdminStub,
-            client.emulator_host)
+            client.emulator_host, timeout=client.timeout)
 
 
 class Client(_ClientFactoryMixin, _ClientProjectMixin):
@@ -178,6 +181,11 @@ class Client(_ClientFactoryMixin, _ClientProjectMixin):
     :param user_agent: (Optional) The user agent to be used with API request.
                        Defaults to :const:`DEFAULT_USER_AGENT`.
 
+    :type timeout: float
+    :param timeout: (Optional) The default number of seconds before a gRPC
+                    call times out. Calls passing their own ``timeout`` are
+                    unaffected. If not passed, calls may block indefinitely.
+
     :raises: :class:`ValueError <exceptions.ValueError>` if both ``read_only``
              and ``admin`` are :data:`True`
     """
@@ -187,7 +195,8 @@ class Client(_ClientFactoryMixin, _ClientProjectMixin):
     _table_stub_internal = None
 
     def __init__(self, project=None, credentials=None,
-                 read_only=False, admin=False, user_agent=DEFAULT_USER_AGENT):
+                 read_only=False, admin=False, user_agent=DEFAULT_USER_AGENT,
+                 timeout=None):
         _ClientProjectMixin.__init__(self, project=project)
         if credentials is None:
             credentials = get_credentials()
@@ -209,11 +218,11 @@ class Client(_ClientFactoryMixin, _ClientProjectMixin):
 
         self._admin = bool(admin)
 
-        credentials = google.auth.credentials.with_scopes_if_required(
-            credentials, scopes)
+        credentials = token_cache.scoped_credentials(credentials, scopes)
 
         self._credentials = credentials
         self.user_agent = user_agent
+        self.timeout = timeout
         self.emulator_host = os.getenv(BIGTABLE_EMULATOR)
 
         # Create gRPC stubs for making requests.
@@ -238,6 +247,7 @@ class Client(_ClientFactoryMixin, _ClientProjectMixin):
             self._read_only,
             self._admin,
             self.user_agent,
+            self.timeout,
         )
 
     @property
@@ -210,7 +210,7 @@ class Table(object):
             result[column_family_id] = column_family
         return result
 
-    def read_row(self, row_key, filter_=None):
+    def read_row(self, row_key, filter_=None, timeout=None):
         """Read a single row from this table.
 
         :type row_key: bytes
@@ -220,6 +220,10 @@ class Table(object):
         :param filter_: (Optional) The filter to apply to the contents of the
                         row. If unset, returns the entire row.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the read
+                        times out.
+
         :rtype: :class:`.PartialRowData`, :data:`NoneType <types.NoneType>`
         :returns: The contents of the row if any chunks were returned in
                   the response, otherwise :data:`None`.
@@ -229,7 +233,10 @@ class Table(object):
         request_pb = _create_row_request(self.name, row_key=row_key,
                                          filter_=filter_)
         client = self._instance._client
-        response_iterator = client._data_stub.ReadRows(request_pb)
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        response_iterator = client._data_stub.ReadRows(request_pb, **kwargs)
         rows_data = PartialRowsData(response_iterator)
         rows_data.consume_all()
         if rows_data.state not in (rows_data.NEW_ROW, rows_data.START):
@@ -241,7 +248,7 @@ class Table(object):
         return rows_data.rows[row_key]
 
     def read_rows(self, start_key=None, end_key=None, limit=None,
-                  filter_=None):
+                  filter_=None, timeout=None):
         """Read rows from this table.
 
         :type start_key: bytes
@@ -264,6 +271,10 @@ class Table(object):
                         specified row(s). If unset, reads every column in
                         each row.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the read
+                        (including streaming all of its results) times out.
+
         :rtype: :class:`.PartialRowsData`
         :returns: A :class:`.PartialRowsData` convenience wrapper for consuming
                   the streamed results.
@@ -272,7 +283,10 @@ class Table(object):
             self.name, start_key=start_key, end_key=end_key, filter_=filter_,
             limit=limit)
         client = self._instance._client
-        response_iterator = client._data_stub.ReadRows(request_pb)
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        response_iterator = client._data_stub.ReadRows(request_pb, **kwargs)
         # We expect an iterator of `data_messages_v2_pb2.ReadRowsResponse`
         return PartialRowsData(response_iterator)
 
@@ -46,7 +46,8 @@ class Test__make_data_stub(unittest.TestCase):
         fake_stub = object()
         make_secure_stub_args = []
 
-        def mock_make_secure_stub(*args):
+        def mock_make_secure_stub(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client.timeout})
             make_secure_stub_args.append(args)
             return fake_stub
 
@@ -73,7 +74,8 @@ class Test__make_data_stub(unittest.TestCase):
         fake_stub = object()
         make_insecure_stub_args = []
 
-        def mock_make_insecure_stub(*args):
+        def mock_make_insecure_stub(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client.timeout})
             make_insecure_stub_args.append(args)
             return fake_stub
 
@@ -106,7 +108,8 @@ class Test__make_instance_stub(unittest.TestCase):
         fake_stub = object()
         make_secure_stub_args = []
 
-        def mock_make_secure_stub(*args):
+        def mock_make_secure_stub(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client.timeout})
             make_secure_stub_args.append(args)
             return fake_stub
 
@@ -133,7 +136,8 @@ class Test__make_instance_stub(unittest.TestCase):
         fake_stub = object()
         make_insecure_stub_args = []
 
-        def mock_make_insecure_stub(*args):
+        def mock_make_insecure_stub(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client.timeout})
             make_insecure_stub_args.append(args)
             return fake_stub
 
@@ -168,7 +172,8 @@ class Test__make_operations_stub(unittest.TestCase):
         fake_stub = object()
         make_secure_stub_args = []
 
-        def mock_make_secure_stub(*args):
+        def mock_make_secure_stub(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client.timeout})
             make_secure_stub_args.append(args)
             return fake_stub
 
@@ -197,7 +202,8 @@ class Test__make_operations_stub(unittest.TestCase):
         fake_stub = object()
         make_insecure_stub_args = []
 
-        def mock_make_insecure_stub(*args):
+        def mock_make_insecure_stub(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client.timeout})
             make_insecure_stub_args.append(args)
             return fake_stub
 
@@ -230,7 +236,8 @@ class Test__make_table_stub(unittest.TestCase):
         fake_stub = object()
         make_secure_stub_args = []
 
-        def mock_make_secure_stub(*args):
+        def mock_make_secure_stub(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client.timeout})
             make_secure_stub_args.append(args)
             return fake_stub
 
@@ -257,7 +264,8 @@ class Test__make_table_stub(unittest.TestCase):
         fake_stub = object()
         make_insecure_stub_args = []
 
-        def mock_make_insecure_stub(*args):
+        def mock_make_insecure_stub(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client.timeout})
             make_insecure_stub_args.append(args)
             return fake_stub
 
@@ -341,6 +349,7 @@ class TestClient(unittest.TestCase):
 
         self.assertEqual(client.project, self.PROJECT)
         self.assertEqual(client.user_agent, user_agent)
+        self.assertIsNone(client.timeout)
         # Check gRPC stubs (or mocks of them) are set
         self.assertIs(client._data_stub, mock_make_data_stub.result)
         if admin:
@@ -362,6 +371,12 @@ class TestClient(unittest.TestCase):
         creds = _make_credentials()
         self._constructor_test_helper(expected_scopes, creds)
 
+    def test_constructor_w_timeout(self):
+        creds = _make_credentials()
+        client = self._make_oneWithMocks(project=self.PROJECT,
+                                         credentials=creds, timeout=5.0)
+        self.assertEqual(client.timeout, 5.0)
+
     def test_constructor_custom_user_agent(self):
         from google.cloud.bigtable import client as MUT
 
@@ -423,7 +438,8 @@ class TestClient(unittest.TestCase):
             credentials=credentials,
             read_only=read_only,
             admin=admin,
-            user_agent=self.USER_AGENT)
+            user_agent=self.USER_AGENT,
+            timeout=5.0)
         # Put some fake stubs in place so that we can verify they don't
         # get copied. In the admin=False case, only the data stub will
         # not be None, so we over-ride all the internal values.
@@ -445,6 +461,7 @@ class TestClient(unittest.TestCase):
         self.assertEqual(new_client._credentials, client._credentials)
         self.assertEqual(new_client.project, client.project)
         self.assertEqual(new_client.user_agent, client.user_agent)
+        self.assertEqual(new_client.timeout, client.timeout)
         # Make sure stubs are not preserved.
         self.assertNotEqual(new_client._data_stub, client._data_stub)
         self.assertNotEqual(new_client._instance_stub_internal,
@@ -638,6 +655,8 @@ class TestClient(unittest.TestCase):
 
 class _Client(object):
 
+    timeout = 7.5
+
     def __init__(self, credentials, user_agent, emulator_host=None):
         self.credentials = credentials
         self.user_agent = user_agent
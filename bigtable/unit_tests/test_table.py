@@ -308,6 +308,18 @@ class TestTable(unittest.TestCase):
         self.assertEqual(mock_created,
                          [(table.name, self.ROW_KEY, filter_obj)])
 
+    def test_read_row_w_timeout(self):
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        table = self._make_one(self.TABLE_ID, instance)
+        client._data_stub = stub = _FakeStub(iter(()))
+
+        self.assertIsNone(table.read_row(self.ROW_KEY, timeout=5.0))
+
+        (name, _, kwargs), = stub.method_calls
+        self.assertEqual(name, 'ReadRows')
+        self.assertEqual(kwargs, {'timeout': 5.0})
+
     def test_read_row_miss_no__responses(self):
         self._read_row_helper(None, None)
 
@@ -398,6 +410,18 @@ class TestTable(unittest.TestCase):
         }
         self.assertEqual(mock_created, [(table.name, created_kwargs)])
 
+    def test_read_rows_w_timeout(self):
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        table = self._make_one(self.TABLE_ID, instance)
+        client._data_stub = stub = _FakeStub(iter(()))
+
+        table.read_rows(timeout=5.0)
+
+        (name, _, kwargs), = stub.method_calls
+        self.assertEqual(name, 'ReadRows')
+        self.assertEqual(kwargs, {'timeout': 5.0})
+
     def test_sample_row_keys(self):
         from unit_tests._testing import _FakeStub
 
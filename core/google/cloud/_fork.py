@@ -0,0 +1,171 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Detect forks, so that clients can be shared with child processes.
+
+A process forked from another (e.g. a ``gunicorn`` worker, or a
+:mod:`multiprocessing` pool worker) inherits the sockets, gRPC channels
+and locks of its parent, but none of its threads.  Objects holding such
+resources compare :func:`generation` to the one they were created (or
+last reset) in, and rebuild them when it changed.
+
+These are *not* part of the API.
+"""
+
+import os
+
+
+_STATE = {'pid': os.getpid(), 'generation': 0}
+
+
+def _after_fork_in_child():
+    """Account for a fork, in the child process."""
+    _STATE['pid'] = os.getpid()
+    _STATE['generation'] += 1
+
+
+if hasattr(os, 'register_at_fork'):  # pragma: NO COVER  Python >= 3.7
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+    _GETPID = None
+else:  # pragma: NO COVER
+    _GETPID = os.getpid  # Compared on each call, without fork hooks.
+
+
+def generation():
+    """Count the forks which led to the current process.
+
+    :rtype: int
+    :returns: The number of forks since this module was imported: it
+              changes in a child process, so the resources inherited from
+              the parent must be rebuilt.
+    """
+    if _GETPID is not None and _GETPID() != _STATE['pid']:
+        _after_fork_in_child()
+    return _STATE['generation']
+
+
+def reset_http(http):
+    """Drop the connections an HTTP transport inherited from a parent.
+
+    The sockets are not closed: they are still used by the parent.
+
+    :type http: :class:`httplib2.Http` or workalike
+    :param http: The transport, possibly wrapped by
+                 :class:`google_auth_httplib2.AuthorizedHttp`.
+    """
+    http = getattr(http, 'http', http)
+    if hasattr(http, 'reset_after_fork'):
+        http.reset_after_fork()
+    elif isinstance(getattr(http, 'connections', None), dict):
+        http.connections = {}
+
+
+class _ForkSafeMultiCallable(object):
+    """Callable for an RPC, bound to the channel of the current process.
+
+    :type channel: :class:`ForkSafeChannel`
+    :param channel: The channel creating the callable.
+
+    :type kind: str
+    :param kind: The name of the channel method creating the callable,
+                 e.g. ``'unary_unary'``.
+
+    :type args: tuple
+    :param args: Positional arguments passed to that method.
+
+    :type kwargs: dict
+    :param kwargs: Keyword arguments passed to that method.
+    """
+
+    def __init__(self, channel, kind, args, kwargs):
+        self._channel = channel
+        self._kind = kind
+        self._args = args
+        self._kwargs = kwargs
+        self._generation = None
+        self._callable = None
+
+    def _current(self):
+        """Get the callable bound to the channel of the current process.
+
+        :rtype: callable
+        :returns: The multi-callable created by the gRPC channel.
+        """
+        current = generation()
+        if self._generation != current:
+            factory = getattr(self._channel.channel, self._kind)
+            self._callable = factory(*self._args, **self._kwargs)
+            self._generation = current
+        return self._callable
+
+    def __call__(self, *args, **kwargs):
+        return self._current()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._current(), name)
+
+
+class ForkSafeChannel(object):
+    """gRPC channel re-created in each process using it.
+
+    Stubs bind callables to their channel once, so the callables returned
+    by this channel look up the current channel on each call.
+
+    :type make_channel: callable
+    :param make_channel: Callable taking no arguments and returning a new
+                         :class:`grpc.Channel`.
+    """
+
+    def __init__(self, make_channel):
+        self._make_channel = make_channel
+        self._channel = make_channel()
+        self._generation = generation()
+
+    @property
+    def channel(self):
+        """The channel of the current process.
+
+        :rtype: :class:`grpc.Channel`
+        :returns: The channel, created anew after a fork.
+        """
+        current = generation()
+        if self._generation != current:
+            # The parent's channel is dropped, not closed: it is still
+            # used by the parent.
+            self._channel = self._make_channel()
+            self._generation = current
+        return self._channel
+
+    def unary_unary(self, *args, **kwargs):
+        """Create a callable for a unary-unary RPC."""
+        return _ForkSafeMultiCallable(self, 'unary_unary', args, kwargs)
+
+    def unary_stream(self, *args, **kwargs):
+        """Create a callable for a unary-stream RPC."""
+        return _ForkSafeMultiCallable(self, 'unary_stream', args, kwargs)
+
+    def stream_unary(self, *args, **kwargs):
+        """Create a callable for a stream-unary RPC."""
+        return _ForkSafeMultiCallable(self, 'stream_unary', args, kwargs)
+
+    def stream_stream(self, *args, **kwargs):
+        """Create a callable for a stream-stream RPC."""
+        return _ForkSafeMultiCallable(self, 'stream_stream', args, kwargs)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.channel, name)
@@ -22,24 +22,166 @@ from __future__ import absolute_import
 
 import calendar
 import datetime
+import functools
+import importlib
 import os
 import re
+import sys
 from threading import local as Local
+import types
 
 import google.auth
-from google.protobuf import timestamp_pb2
-import google_auth_httplib2
-
-try:
-    import grpc
-    import google.auth.transport.grpc
-except ImportError:  # pragma: NO COVER
-    grpc = None
-
-import httplib2
 import six
 from six.moves import http_client
 
+from google.cloud import instrumentation
+
+
+class _LazyModule(object):
+    """A module imported when one of its attributes is first looked up.
+
+    Used to keep heavy dependencies out of the import time of modules
+    which only need them for some operations.
+
+    :type name: str
+    :param name: The absolute name of the module.
+    """
+
+    def __init__(self, name):
+        self._name = name
+
+    def __repr__(self):
+        return '<_LazyModule %r>' % (self._name,)
+
+    def __getattr__(self, attr):
+        # Only costly on first use: imported modules are in sys.modules.
+        return getattr(importlib.import_module(self._name), attr)
+
+
+class _LazyAttributesModule(types.ModuleType):
+    """A module whose given attributes are computed when first looked up.
+
+    Module-level ``__getattr__`` needs Python 3.7, so instead the module is
+    wrapped by this proxy in :data:`sys.modules`. All other attributes are
+    looked up, set and deleted on the wrapped module.
+
+    :type module: :class:`types.ModuleType`
+    :param module: The wrapped module.
+
+    :type factories: dict
+    :param factories: Callables taking no arguments, computing the value of
+                      each lazy attribute, by name.
+    """
+
+    _METADATA = ('__file__', '__loader__', '__package__', '__path__',
+                 '__spec__')
+
+    def __init__(self, module, factories):
+        super(_LazyAttributesModule, self).__init__(
+            module.__name__, module.__doc__)
+        # Bypass ``__setattr__``, which sets attributes on the wrapped module.
+        for name in self._METADATA:
+            self.__dict__.pop(name, None)
+            if name in module.__dict__:
+                self.__dict__[name] = module.__dict__[name]
+        self.__dict__['_LazyAttributesModule__module'] = module
+        self.__dict__['_LazyAttributesModule__factories'] = factories
+
+    def __getattr__(self, name):
+        module = self.__module
+        if name in self.__factories and name not in module.__dict__:
+            # Cache the value on the module, so it is only computed once.
+            setattr(module, name, self.__factories[name]())
+        return getattr(module, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.__module, name, value)
+
+    def __delattr__(self, name):
+        delattr(self.__module, name)
+
+    def __dir__(self):
+        return sorted(set(dir(self.__module)) | set(self.__factories))
+
+
+def _lazy_attributes(module_name, **factories):
+    """Compute some attributes of a module when they are first looked up.
+
+    Replaces the module in :data:`sys.modules` with a
+    :class:`_LazyAttributesModule`, so it must be called while the module
+    is imported, e.g. ``_lazy_attributes(__name__, NAME=factory)``.
+
+    :type module_name: str
+    :param module_name: The absolute name of the module.
+
+    :type factories: dict
+    :param factories: Callables taking no arguments, computing the value of
+                      each lazy attribute, by name.
+    """
+    module = sys.modules[module_name]
+    sys.modules[module_name] = _LazyAttributesModule(module, factories)
+
+
+def _lazy_import(module_name, source_name, **names):
+    """Import attributes of a module from another one, when first needed.
+
+    Equivalent to ``from <source_name> import <attr> as <name>`` for each
+    item of ``names``, except that ``source_name`` is only imported when
+    one of the names is first looked up on the module, or when the
+    returned function is first called.  If it cannot be imported, e.g.
+    because one of its dependencies is missing or broken, the names are
+    set to :data:`None`.
+
+    Like :func:`_lazy_attributes`, it must be called while the module is
+    imported, and only once for a given module.
+
+    :type module_name: str
+    :param module_name: The absolute name of the module.
+
+    :type source_name: str
+    :param source_name: The absolute name of the module imported from.
+
+    :type names: dict
+    :param names: The names of the attributes in ``source_name``, by the
+                  name they get in the module.
+
+    :rtype: callable
+    :returns: A function taking no arguments, which imports
+              ``source_name`` if not done yet and returns whether it
+              could be imported.
+    """
+    module = sys.modules[module_name]
+    # Holds whether ``source_name`` was imported, and the imported values.
+    state = []
+
+    def load():
+        if not state:
+            try:
+                source = importlib.import_module(source_name)
+            except ImportError:
+                state.append((False, dict.fromkeys(names)))
+            else:
+                state.append((True, dict(
+                    (name, getattr(source, attr))
+                    for name, attr in names.items())))
+        imported, values = state[0]
+        for name, value in values.items():
+            # Keep the values set in the meantime, e.g. by tests.
+            module.__dict__.setdefault(name, value)
+        return imported
+
+    def factory(name):
+        load()
+        return module.__dict__[name]
+
+    _lazy_attributes(module_name, **dict(
+        (name, functools.partial(factory, name)) for name in names))
+    return load
+
+
+grpc = _LazyModule('grpc')
+google_auth_httplib2 = _LazyModule('google_auth_httplib2')
+httplib2 = _LazyModule('httplib2')
 
 _NOW = datetime.datetime.utcnow  # To be replaced by tests.
 _RFC3339_MICROS = '%Y-%m-%dT%H:%M:%S.%fZ'
@@ -55,6 +197,11 @@ _RFC3339_NANOS = re.compile(r"""
     )?
     Z                                        # Zulu
 """, re.VERBOSE)
+# Lengths of the fixed-format timestamps handled without the regex.
+_RFC3339_NO_FRACTION_LEN = len('YYYY-MM-DDTHH:MM:SSZ')
+_RFC3339_MIN_FRACTION_LEN = len('YYYY-MM-DDTHH:MM:SS.fZ')
+_RFC3339_MAX_MICROS_LEN = len('YYYY-MM-DDTHH:MM:SS.ffffffZ')
+_RFC3339_MAX_NANOS_LEN = len('YYYY-MM-DDTHH:MM:SS.fffffffffZ')
 # NOTE: Catching this ImportError is a workaround for GAE not supporting the
 #       "pwd" module which is imported lazily when "expanduser" is called.
 try:
@@ -206,6 +353,32 @@ def _datetime_from_microseconds(value):
     return _EPOCH + datetime.timedelta(microseconds=value)
 
 
+def _datetimes_from_microseconds(values, as_numpy=False):
+    """Convert timestamps to datetimes, assuming UTC.
+
+    Bulk variant of :func:`_datetime_from_microseconds`.
+
+    :type values: iterable of float
+    :param values: The timestamps to convert.
+
+    :type as_numpy: bool
+    :param as_numpy: (Optional) If True, return a NumPy array of
+                     ``datetime64[us]`` values instead of a list.
+                     Requires ``numpy``.
+
+    :rtype: list of :class:`datetime.datetime`, or :class:`numpy.ndarray`
+    :returns: The datetime objects created from the values.
+    """
+    if as_numpy:
+        import numpy
+
+        micros = numpy.rint(numpy.asarray(values, dtype=numpy.float64))
+        return micros.astype(numpy.int64).astype('datetime64[us]')
+
+    epoch, timedelta = _EPOCH, datetime.timedelta
+    return [epoch + timedelta(microseconds=value) for value in values]
+
+
 def _microseconds_from_datetime(value):
     """Convert non-none datetime to microseconds.
 
@@ -271,10 +444,52 @@ def _rfc3339_to_datetime(dt_str):
     :rtype: :class:`datetime.datetime`
     :returns: The datetime object created from the string.
     """
+    if _RFC3339_MIN_FRACTION_LEN <= len(dt_str) <= _RFC3339_MAX_MICROS_LEN:
+        result = _rfc3339_fixed_to_datetime(dt_str)
+        if result is not None:
+            return result
     return datetime.datetime.strptime(
         dt_str, _RFC3339_MICROS).replace(tzinfo=UTC)
 
 
+def _rfc3339_fixed_to_datetime(dt_str):
+    """Convert a fixed-format RFC 3339 timestamp to a native datetime.
+
+    Handles the ``YYYY-MM-DDTHH:MM:SS[.fffffffff]Z`` shape returned by the
+    APIs by slicing the string at fixed offsets, which is much faster than
+    matching a regular expression and calling
+    :meth:`~datetime.datetime.strptime`.  Fractions of a second are
+    truncated to microseconds.
+
+    :type dt_str: str
+    :param dt_str: The string to convert.
+
+    :rtype: :class:`datetime.datetime`
+    :returns: The datetime object created from the string, or ``None`` if
+              the string does not have the fixed shape.
+    :raises ValueError: If a field of the timestamp is out of range.
+    """
+    length = len(dt_str)
+    if (length < _RFC3339_NO_FRACTION_LEN or length > _RFC3339_MAX_NANOS_LEN or
+            dt_str[-1] != 'Z' or dt_str[4] != '-' or dt_str[7] != '-' or
+            dt_str[10] != 'T' or dt_str[13] != ':' or dt_str[16] != ':'):
+        return None
+    if length == _RFC3339_NO_FRACTION_LEN:
+        fraction = ''
+    elif length >= _RFC3339_MIN_FRACTION_LEN and dt_str[19] == '.':
+        fraction = dt_str[20:-1]
+    else:
+        return None
+    year, month, day = dt_str[0:4], dt_str[5:7], dt_str[8:10]
+    hour, minute, second = dt_str[11:13], dt_str[14:16], dt_str[17:19]
+    if not (year + month + day + hour + minute + second +
+            fraction).isdigit():
+        return None
+    micros = int((fraction + '000000')[:6])
+    return datetime.datetime(int(year), int(month), int(day), int(hour),
+                             int(minute), int(second), micros, UTC)
+
+
 def _rfc3339_nanos_to_datetime(dt_str):
     """Convert a nanosecond-precision timestamp to a native datetime.
 
@@ -291,6 +506,9 @@ def _rfc3339_nanos_to_datetime(dt_str):
     :raises ValueError: If the timestamp does not match the RFC 3339
                         regular expression.
     """
+    result = _rfc3339_fixed_to_datetime(dt_str)
+    if result is not None:
+        return result
     with_nanos = _RFC3339_NANOS.match(dt_str)
     if with_nanos is None:
         raise ValueError(
@@ -308,6 +526,49 @@ def _rfc3339_nanos_to_datetime(dt_str):
     return bare_seconds.replace(microsecond=micros, tzinfo=UTC)
 
 
+def _rfc3339_nanos_to_datetimes(dt_strs, as_numpy=False):
+    """Convert nanosecond-precision timestamps to native datetimes.
+
+    Bulk variant of :func:`_rfc3339_nanos_to_datetime`.
+
+    :type dt_strs: iterable of str
+    :param dt_strs: The strings to convert.
+
+    :type as_numpy: bool
+    :param as_numpy: (Optional) If True, return a NumPy array of
+                     ``datetime64[ns]`` values instead of a list.  Unlike
+                     native datetimes, these keep nanosecond precision.
+                     Requires ``numpy``.
+
+    :rtype: list of :class:`datetime.datetime`, or :class:`numpy.ndarray`
+    :returns: The datetime objects created from the strings.
+    :raises ValueError: If a timestamp does not match the RFC 3339
+                        regular expression.
+    """
+    if as_numpy:
+        import numpy
+
+        naive = []
+        for dt_str in dt_strs:
+            with_nanos = _RFC3339_NANOS.match(dt_str)
+            if with_nanos is None:
+                raise ValueError(
+                    'Timestamp: %r, does not match pattern: %r' % (
+                        dt_str, _RFC3339_NANOS.pattern))
+            # NumPy datetimes are naive: drop the 'Z' (UTC) suffix.
+            naive.append(with_nanos.group(0)[:-1])
+        return numpy.array(naive, dtype='datetime64[ns]')
+
+    fixed = _rfc3339_fixed_to_datetime
+    result = []
+    for dt_str in dt_strs:
+        value = fixed(dt_str)
+        if value is None:
+            value = _rfc3339_nanos_to_datetime(dt_str)
+        result.append(value)
+    return result
+
+
 def _datetime_to_rfc3339(value, ignore_zone=True):
     """Convert a timestamp to a string.
 
@@ -421,6 +682,8 @@ def _datetime_to_pb_timestamp(when):
     ms_value = _microseconds_from_datetime(when)
     seconds, micros = divmod(ms_value, 10**6)
     nanos = micros * 10**3
+    from google.protobuf import timestamp_pb2
+
     return timestamp_pb2.Timestamp(seconds=seconds, nanos=nanos)
 
 
@@ -465,7 +728,7 @@ def _name_from_project_path(path, project, template):
     return match.group('name')
 
 
-def make_secure_channel(credentials, user_agent, host):
+def make_secure_channel(credentials, user_agent, host, timeout=None):
     """Makes a secure channel for an RPC service.
 
     Uses / depends on gRPC.
@@ -480,22 +743,48 @@ def make_secure_channel(credentials, user_agent, host):
     :type host: str
     :param host: The host for the service.
 
+    :type timeout: float
+    :param timeout: (Optional) The default number of seconds before a call
+                    sent over the channel times out. Calls passing their
+                    own ``timeout`` are unaffected.
+
+    :rtype: :class:`~google.cloud._fork.ForkSafeChannel`
+    :returns: gRPC secure channel with credentials attached, re-created
+              in processes forked from this one.
+    """
+    from google.cloud._fork import ForkSafeChannel
+
+    return ForkSafeChannel(functools.partial(
+        _make_secure_channel, credentials, user_agent, host, timeout))
+
+
+def _make_secure_channel(credentials, user_agent, host, timeout):
+    """Makes a secure channel for an RPC service, bound to this process.
+
+    See :func:`make_secure_channel`.
+
     :rtype: :class:`grpc._channel.Channel`
     :returns: gRPC secure channel with credentials attached.
     """
+    import google.auth.transport.grpc
+    from google.cloud.deadline import with_default_timeout
+
     target = '%s:%d' % (host, http_client.HTTPS_PORT)
     http_request = google_auth_httplib2.Request(http=httplib2.Http())
     options = (
         ('grpc.primary_user_agent', user_agent),
     )
-    return google.auth.transport.grpc.secure_authorized_channel(
+    channel = google.auth.transport.grpc.secure_authorized_channel(
         credentials,
         http_request,
         target,
         options=options)
+    channel = with_default_timeout(channel, timeout)
+    return instrumentation.instrument_channel(channel, host)
 
 
-def make_secure_stub(credentials, user_agent, stub_class, host):
+def make_secure_stub(credentials, user_agent, stub_class, host,
+                     timeout=None):
     """Makes a secure stub for an RPC service.
 
     Uses / depends on gRPC.
@@ -513,14 +802,19 @@ def make_secure_stub(credentials, user_agent, stub_class, host):
     :type host: str
     :param host: The host for the service.
 
+    :type timeout: float
+    :param timeout: (Optional) The default number of seconds before a call
+                    sent with the stub times out.
+
     :rtype: object, instance of ``stub_class``
     :returns: The stub object used to make gRPC requests to a given API.
     """
-    channel = make_secure_channel(credentials, user_agent, host)
+    channel = make_secure_channel(credentials, user_agent, host,
+                                  timeout=timeout)
     return stub_class(channel)
 
 
-def make_insecure_stub(stub_class, host, port=None):
+def make_insecure_stub(stub_class, host, port=None, timeout=None):
     """Makes an insecure stub for an RPC service.
 
     Uses / depends on gRPC.
@@ -535,16 +829,22 @@ def make_insecure_stub(stub_class, host, port=None):
     :type port: int
     :param port: (Optional) The port for the service.
 
+    :type timeout: float
+    :param timeout: (Optional) The default number of seconds before a call
+                    sent with the stub times out.
+
     :rtype: object, instance of ``stub_class``
     :returns: The stub object used to make gRPC requests to a given API.
     """
+    from google.cloud.deadline import with_default_timeout
+
     if port is None:
         target = host
     else:
         # NOTE: This assumes port != http_client.HTTPS_PORT:
         target = '%s:%d' % (host, port)
     channel = grpc.insecure_channel(target)
-    return stub_class(channel)
+    return stub_class(with_default_timeout(channel, timeout))
 
 
 try:
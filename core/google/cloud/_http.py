@@ -14,24 +14,280 @@
 
 """Shared implementation of connections to API servers."""
 
-import json
-from pkg_resources import get_distribution
+import functools
+import socket
+import threading
+import zlib
+
 import six
 from six.moves.urllib.parse import urlencode
 
 import google.auth.credentials
-import google_auth_httplib2
-import httplib2
 
+from google.cloud import _fork
+from google.cloud import instrumentation
+from google.cloud import token_cache
+from google.cloud._helpers import _lazy_attributes
+from google.cloud._helpers import _LazyModule
+from google.cloud.codec import DEFAULT_CODEC
+from google.cloud.deadline import as_deadline
+from google.cloud.exceptions import DeadlineExceeded
 from google.cloud.exceptions import make_exception
 
 
 API_BASE_URL = 'https://www.googleapis.com'
 """The base of the API call URL."""
 
-DEFAULT_USER_AGENT = 'gcloud-python/{0}'.format(
-    get_distribution('google-cloud-core').version)
-"""The user agent for google-cloud-python requests."""
+DEFAULT_COMPRESS_THRESHOLD = 1024
+"""Default minimum size (in bytes) of request bodies sent compressed."""
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+_USER_AGENT_TEMPLATE = 'gcloud-python/{0}'
+_DISTRIBUTION_NAME = 'google-cloud-core'
+_USER_AGENT_CACHE = {}
+
+google_auth_httplib2 = _LazyModule('google_auth_httplib2')
+httplib2 = _LazyModule('httplib2')
+
+
+def _get_default_user_agent():
+    """The user agent for google-cloud-python requests.
+
+    Looking up the installed version of the package is costly, so it is
+    only done when the user agent is first needed.
+
+    :rtype: str
+    :returns: The user agent.
+    """
+    user_agent = _USER_AGENT_CACHE.get(_DISTRIBUTION_NAME)
+    if user_agent is None:
+        try:
+            from importlib import metadata
+        except ImportError:  # pragma: NO COVER
+            from pkg_resources import get_distribution
+            version = get_distribution(_DISTRIBUTION_NAME).version
+        else:
+            version = metadata.version(_DISTRIBUTION_NAME)
+        user_agent = _USER_AGENT_TEMPLATE.format(version)
+        _USER_AGENT_CACHE[_DISTRIBUTION_NAME] = user_agent
+    return user_agent
+
+
+# The user agent for google-cloud-python requests, as DEFAULT_USER_AGENT.
+_lazy_attributes(__name__, DEFAULT_USER_AGENT=_get_default_user_agent)
+
+
+class _DefaultUserAgent(object):
+    """Descriptor for :attr:`Connection.USER_AGENT`, looked up when used."""
+
+    def __get__(self, instance, owner):
+        return _get_default_user_agent()
+
+
+def _send_with_retry(send, method, retry):
+    """Send a request, retrying it if a policy is given.
+
+    :type send: callable
+    :param send: Callable taking no arguments, sending the request and
+                 returning a ``(response, content)`` pair.
+
+    :type method: str
+    :param method: The HTTP method of the request.
+
+    :type retry: :class:`~google.cloud.retry.Retry`
+    :param retry: The policy used to retry the request, or :data:`None`.
+
+    :rtype: tuple of ``response`` (a dictionary of sorts)
+            and ``content`` (a string).
+    :returns: The HTTP response object and the content of the response.
+    """
+    if retry is None:
+        return send()
+    return retry.call(send, method)
+
+
+def _retry_before_deadline(retry, deadline):
+    """Bound the deadline of a retry policy by the deadline of a call.
+
+    :type retry: :class:`~google.cloud.retry.Retry`
+    :param retry: The policy used to retry the request, or :data:`None`.
+
+    :type deadline: :class:`~google.cloud.deadline.Deadline`
+    :param deadline: The deadline of the call, or :data:`None`.
+
+    :rtype: :class:`~google.cloud.retry.Retry`
+    :returns: The policy, with a deadline no later than the call's.
+    """
+    if retry is None or deadline is None:
+        return retry
+    remaining = deadline.remaining()
+    if retry.deadline is not None:
+        remaining = min(retry.deadline, remaining)
+    return retry.with_deadline(remaining)
+
+
+def _send_before_deadline(send, deadline):
+    """Send a request with the time remaining before a deadline.
+
+    :type send: callable
+    :param send: Callable sending the request, taking its ``timeout`` (in
+                 seconds) and returning a ``(response, content)`` pair.
+
+    :type deadline: :class:`~google.cloud.deadline.Deadline`
+    :param deadline: The deadline of the call.
+
+    :rtype: tuple of ``response`` (a dictionary of sorts)
+            and ``content`` (a string).
+    :returns: The HTTP response object and the content of the response.
+    :raises: :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+             deadline expired before a response was received.
+    """
+    timeout = deadline.check()
+    try:
+        return send(timeout=timeout)
+    except socket.timeout:
+        if not deadline.expired:
+            raise
+        raise DeadlineExceeded(
+            'Deadline of %r seconds exceeded' % (deadline.timeout,))
+
+
+def _set_http_timeout(http, timeout):
+    """Set the socket timeout of an :class:`httplib2.Http` (or workalike).
+
+    Applies to the connections opened from now on, as well as to those
+    already open.
+
+    :type http: :class:`httplib2.Http` or
+                :class:`google_auth_httplib2.AuthorizedHttp`
+    :param http: The HTTP object.
+
+    :type timeout: float
+    :param timeout: The timeout, in seconds, or :data:`None` to block.
+
+    :rtype: float
+    :returns: The previous timeout.
+    """
+    previous = http.timeout
+    http.timeout = timeout
+    # ``AuthorizedHttp`` wraps the ``httplib2.Http`` holding connections.
+    connections = getattr(getattr(http, 'http', http), 'connections', None)
+    for conn_key, connection in list((connections or {}).items()):
+        # httplib2 stores both connection classes (keyed by scheme) and
+        # connection instances (keyed by scheme + authority).
+        if ':' in conn_key:
+            connection.timeout = timeout
+            if getattr(connection, 'sock', None) is not None:
+                connection.sock.settimeout(timeout)
+    return previous
+
+
+def _request_with_timeout(http, timeout, **kwargs):
+    """Send a request with an HTTP object, bounding its socket operations.
+
+    Transports whose ``request()`` takes a ``timeout`` (e.g.
+    :class:`~google.cloud.transport.PooledHttp`, or an ``AuthorizedHttp``
+    wrapping one) receive it directly; otherwise the ``timeout`` attribute
+    of ``httplib2`` objects is set for the duration of the request.  Other
+    transports ignore ``timeout``.
+
+    :type http: :class:`httplib2.Http` or class that defines ``request()``.
+    :param http: The HTTP object sending the request.
+
+    :type timeout: float
+    :param timeout: The timeout, in seconds, or :data:`None` to block.
+
+    :type kwargs: dict
+    :param kwargs: The arguments of ``http.request()``.
+
+    :rtype: tuple of ``response`` (a dictionary of sorts)
+            and ``content`` (a string).
+    :returns: The HTTP response object and the content of the response.
+    """
+    if timeout is None:
+        return http.request(**kwargs)
+    # ``AuthorizedHttp`` passes extra arguments on to the object it wraps.
+    if getattr(getattr(http, 'http', http), 'ACCEPTS_TIMEOUT', False):
+        return http.request(timeout=timeout, **kwargs)
+    if not hasattr(http, 'timeout'):
+        return http.request(**kwargs)
+    previous = _set_http_timeout(http, timeout)
+    try:
+        return http.request(**kwargs)
+    finally:
+        _set_http_timeout(http, previous)
+
+
+class _InFlight(object):
+    """A request in flight, whose outcome is shared by its callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _SingleFlight(object):
+    """Share the outcome of identical requests sent concurrently.
+
+    While a request is in flight, callers sending an identical request
+    wait for its outcome rather than sending their own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def send(self, key, send, deadline=None):
+        """Send a request, unless an identical one is already in flight.
+
+        :type key: tuple
+        :param key: Identifies requests whose outcome may be shared.
+
+        :type send: callable
+        :param send: Callable taking no arguments, sending the request and
+                     returning a ``(response, content)`` pair.
+
+        :type deadline: :class:`~google.cloud.deadline.Deadline`
+        :param deadline: (Optional) The deadline of the call: how long to
+                         wait for a request in flight.
+
+        :rtype: tuple of ``response`` (a dictionary of sorts)
+                and ``content`` (a string).
+        :returns: The HTTP response object and the content of the response.
+        :raises: The error raised by the request in flight, or
+                 :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 ``deadline`` expired while waiting for it.
+        """
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = self._in_flight[key] = _InFlight()
+
+        if not leader:
+            timeout = None if deadline is None else deadline.check()
+            if not in_flight.done.wait(timeout):
+                raise DeadlineExceeded(
+                    'Deadline of %r seconds exceeded' % (deadline.timeout,))
+            if isinstance(in_flight.error, DeadlineExceeded):
+                # Only the deadline of the other caller expired.
+                return send()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.result
+
+        try:
+            in_flight.result = send()
+        except Exception as exc:
+            in_flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.done.set()
+        return in_flight.result
 
 
 class Connection(object):
@@ -69,7 +325,7 @@ class Connection(object):
     :param http: An optional HTTP object to make requests.
     """
 
-    USER_AGENT = DEFAULT_USER_AGENT
+    USER_AGENT = _DefaultUserAgent()
 
     SCOPE = None
     """The scopes required for authenticating with a service.
@@ -77,9 +333,57 @@ class Connection(object):
     Needs to be set by subclasses.
     """
 
+    retry = None
+    """Default :class:`~google.cloud.retry.Retry` policy for API requests.
+
+    If :data:`None`, failed requests are not retried.
+    """
+
+    codec = DEFAULT_CODEC
+    """Codec (see :mod:`google.cloud.codec`) for JSON request bodies."""
+
+    compress_threshold = None
+    """Minimum size (in bytes) of request bodies sent gzip-compressed.
+
+    If :data:`None`, request bodies are only compressed when requested
+    for a single call (see :meth:`JSONConnection.api_request`).
+    """
+
+    timeout = None
+    """Default number of seconds before an API request times out.
+
+    Bounds the whole request, retries included (see
+    :mod:`google.cloud.deadline`). If :data:`None`, requests may block
+    indefinitely.
+    """
+
+    coalesce_gets = False
+    """Whether concurrent identical ``GET`` requests share one response.
+
+    If True, while a ``GET`` request is in flight, identical requests
+    (same URL, query string and headers) sent from other threads wait for
+    its response rather than being sent. Each caller decodes its own copy
+    of the response.
+    """
+
+    rate_limiter = None
+    """Limit on the rate of requests sent, shared by all threads.
+
+    A :class:`~google.cloud.rate_limit.RateLimiter`, or :data:`None` to
+    send requests as soon as they are made.
+    """
+
+    cache_metadata = True
+    """Whether resource reloads may use the client's metadata cache.
+
+    See :mod:`google.cloud.metadata_cache`.
+    """
+
     def __init__(self, credentials=None, http=None):
         self._http = http
-        self._credentials = google.auth.credentials.with_scopes_if_required(
+        self._http_generation = _fork.generation()
+        self._single_flight = _SingleFlight()
+        self._credentials = token_cache.scoped_credentials(
             credentials, self.SCOPE)
 
     @property
@@ -96,9 +400,16 @@ class Connection(object):
     def http(self):
         """A getter for the HTTP transport used in talking to the API.
 
+        Connections inherited from a parent process are dropped on first
+        use after a fork.
+
         :rtype: :class:`httplib2.Http`
         :returns: A Http object used to transport data.
         """
+        if self._http_generation != _fork.generation():
+            if self._http is not None:
+                _fork.reset_http(self._http)
+            self._http_generation = _fork.generation()
         if self._http is None:
             if self._credentials:
                 self._http = google_auth_httplib2.AuthorizedHttp(
@@ -175,7 +486,7 @@ class JSONConnection(Connection):
         return url
 
     def _make_request(self, method, url, data=None, content_type=None,
-                      headers=None, target_object=None):
+                      headers=None, target_object=None, timeout=None):
         """A low level method to send a request to the API.
 
         Typically, you shouldn't need to use this method.
@@ -186,8 +497,9 @@ class JSONConnection(Connection):
         :type url: str
         :param url: The URL to send the request to.
 
-        :type data: str
+        :type data: str or dict
         :param data: The data to send as the body of the request.
+                     Dictionaries are encoded with :attr:`codec`.
 
         :type content_type: str
         :param content_type: The proper MIME type of the data provided.
@@ -201,18 +513,45 @@ class JSONConnection(Connection):
             custom behavior, for example, to defer an HTTP request and complete
             initialization of the object at a later time.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: tuple of ``response`` (a dictionary of sorts)
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response,
                   returned by :meth:`_do_request`.
         """
+        data, content_type = self._encode_data(data, content_type)
+        headers = self._build_headers(
+            data=data, content_type=content_type, headers=headers)
+        return self._do_request(method, url, headers, data, target_object,
+                                timeout=timeout)
+
+    def _build_headers(self, data=None, content_type=None, headers=None):
+        """Add the standard headers to those sent with a request.
+
+        :type data: bytes or str
+        :param data: The (encoded) data to send as the body of the request.
+
+        :type content_type: str
+        :param content_type: The proper MIME type of the data provided.
+
+        :type headers: dict
+        :param headers: A dictionary of HTTP headers to send with the request.
+
+        :rtype: dict
+        :returns: The headers to send with the request.
+        """
         headers = headers or {}
         headers['Accept-Encoding'] = 'gzip'
 
-        if data:
-            content_length = len(str(data))
-        else:
+        if not data:
             content_length = 0
+        elif isinstance(data, six.text_type):
+            content_length = len(data.encode('utf-8'))
+        else:
+            content_length = len(data)
 
         # NOTE: str is intended, bytes are sufficient for headers.
         headers['Content-Length'] = str(content_length)
@@ -221,11 +560,11 @@ class JSONConnection(Connection):
             headers['Content-Type'] = content_type
 
         headers['User-Agent'] = self.USER_AGENT
-
-        return self._do_request(method, url, headers, data, target_object)
+        return headers
 
     def _do_request(self, method, url, headers, data,
-                    target_object):  # pylint: disable=unused-argument
+                    target_object,  # pylint: disable=unused-argument
+                    timeout=None):
         """Low-level helper:  perform the actual API request over HTTP.
 
         Allows batch context managers to override and defer a request.
@@ -247,17 +586,24 @@ class JSONConnection(Connection):
             (Optional) Unused ``target_object`` here but may be used by a
             superclass.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: tuple of ``response`` (a dictionary of sorts)
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response.
         """
-        return self.http.request(uri=url, method=method, headers=headers,
-                                 body=data)
+        return _request_with_timeout(
+            self.http, timeout, uri=url, method=method, headers=headers,
+            body=data)
 
     def api_request(self, method, path, query_params=None,
                     data=None, content_type=None, headers=None,
                     api_base_url=None, api_version=None,
-                    expect_json=True, _target_object=None):
+                    expect_json=True, retry=None,
+                    compress=None, timeout=None, coalesce=None,
+                    _target_object=None):
         """Make a request over the HTTP transport to the API.
 
         You shouldn't need to use this method, but if you plan to
@@ -305,13 +651,37 @@ class JSONConnection(Connection):
                             response as JSON and raise an exception if
                             that cannot be done.  Default is True.
 
+        :type retry: :class:`~google.cloud.retry.Retry`
+        :param retry: (Optional) The policy used to retry the request if it
+                      fails with a transient error. Defaults to
+                      :attr:`retry`.
+
+        :type compress: bool
+        :param compress: (Optional) Whether to gzip-compress the body of the
+                         request, if at least :attr:`compress_threshold`
+                         (or :data:`DEFAULT_COMPRESS_THRESHOLD`) bytes
+                         long. Defaults to compressing only if the
+                         connection's :attr:`compress_threshold` is set.
+
+        :type timeout: float or :class:`~google.cloud.deadline.Deadline`
+        :param timeout: (Optional) The number of seconds before the request
+                        times out, retries included, or a deadline shared
+                        with other requests. Defaults to :attr:`timeout`.
+
+        :type coalesce: bool
+        :param coalesce: (Optional) Whether a ``GET`` request may share the
+                         response of an identical request in flight.
+                         Defaults to :attr:`coalesce_gets`.
+
         :type _target_object: :class:`object`
         :param _target_object:
             (Optional) Protected argument to be used by library callers. This
             can allow custom behavior, for example, to defer an HTTP request
             and complete initialization of the object at a later time.
 
-        :raises: Exception if the response code is not 200 OK.
+        :raises: Exception if the response code is not 200 OK, or
+                 :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 request timed out.
         :rtype: dict or str
         :returns: The API response payload, either as a raw string or
                   a dictionary if the response is valid JSON.
@@ -319,17 +689,198 @@ class JSONConnection(Connection):
         url = self.build_api_url(path=path, query_params=query_params,
                                  api_base_url=api_base_url,
                                  api_version=api_version)
+        data, content_type = self._encode_data(data, content_type)
+        data, headers = self._compress_data(data, headers, compress)
+
+        send = functools.partial(
+            self._make_request, method=method, url=url, data=data,
+            content_type=content_type, headers=headers,
+            target_object=_target_object)
+        deadline = as_deadline(self.timeout if timeout is None else timeout)
+        retry = _retry_before_deadline(retry or self.retry, deadline)
+        if deadline is not None:
+            send = functools.partial(_send_before_deadline, send, deadline)
+        if self.rate_limiter is not None:
+            send = functools.partial(
+                self.rate_limiter.call, send, method, deadline=deadline,
+                path=path)
+        send = functools.partial(
+            self._send_instrumented, send, method, url, retry, data,
+            api_base_url=api_base_url, api_version=api_version)
+
+        if coalesce is None:
+            coalesce = self.coalesce_gets
+        if coalesce and method == 'GET':
+            key = (url, tuple(sorted((headers or {}).items())))
+            response, content = self._single_flight.send(
+                key, send, deadline)
+        else:
+            response, content = send()
+
+        return self._process_response(
+            method, url, response, content, expect_json=expect_json)
+
+    def _send_instrumented(self, send, method, url, retry, data,
+                           api_base_url=None, api_version=None):
+        """Send a request, retrying it and firing the instrumentation hooks.
+
+        :type send: callable
+        :param send: Callable taking no arguments, sending the request and
+                     returning a ``(response, content)`` pair.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type url: str
+        :param url: The URL the request is sent to.
+
+        :type retry: :class:`~google.cloud.retry.Retry`
+        :param retry: The policy used to retry the request, or :data:`None`.
+
+        :type data: bytes or str
+        :param data: The (encoded) body of the request.
+
+        :type api_base_url: str
+        :param api_base_url: (Optional) The base URL for the API endpoint.
+
+        :type api_version: str
+        :param api_version: (Optional) The version of the API called.
+
+        :rtype: tuple of ``response`` (a dictionary of sorts)
+                and ``content`` (a string).
+        :returns: The HTTP response object and the content of the response.
+        """
+        if not instrumentation.HOOKS:
+            return _send_with_retry(send, method, retry)
+
+        with self._request_event(method, url, data, api_base_url,
+                                 api_version) as event:
+            attempts = []
+
+            def _counted_send():
+                attempts.append(None)
+                event.retries = len(attempts) - 1
+                return send()
+
+            response, content = _send_with_retry(
+                _counted_send, method, retry)
+            event.status = response.status
+            event.response_bytes = len(content) if content else 0
+        return response, content
+
+    def _request_event(self, method, url, data, api_base_url=None,
+                       api_version=None):
+        """Fire the instrumentation hooks around a request.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type url: str
+        :param url: The URL the request is sent to.
+
+        :type data: bytes or str
+        :param data: The (encoded) body of the request.
+
+        :type api_base_url: str
+        :param api_base_url: (Optional) The base URL for the API endpoint.
+
+        :type api_version: str
+        :param api_version: (Optional) The version of the API called.
+
+        :rtype: context manager
+        :returns: A context manager yielding the
+                  :class:`~google.cloud.instrumentation.RequestEvent` of
+                  the request.
+        """
+        api = self.build_api_url(path='', api_base_url=api_base_url,
+                                 api_version=api_version)
+        return instrumentation.HOOKS.request(
+            api, method, url, url_template=self.API_URL_TEMPLATE,
+            request_bytes=len(data) if data else 0)
+
+    def _encode_data(self, data, content_type):
+        """Encode the body of a request.
+
+        :type data: str or dict
+        :param data: The data to send as the body of the request.
 
+        :type content_type: str
+        :param content_type: The proper MIME type of the data provided.
+
+        :rtype: tuple
+        :returns: The (possibly encoded) ``data`` and its ``content_type``.
+        """
         # Making the executive decision that any dictionary
         # data will be sent properly as JSON.
         if data and isinstance(data, dict):
-            data = json.dumps(data)
+            data = self.codec.dumps(data)
             content_type = 'application/json'
+        return data, content_type
 
-        response, content = self._make_request(
-            method=method, url=url, data=data, content_type=content_type,
-            headers=headers, target_object=_target_object)
+    def _compress_data(self, data, headers, compress=None):
+        """Gzip-compress the body of a request, if large enough.
 
+        :type data: bytes or str
+        :param data: The (encoded) body of the request.
+
+        :type headers: dict
+        :param headers: The HTTP headers to send with the request.
+
+        :type compress: bool
+        :param compress: (Optional) Whether to compress the body. Defaults
+                         to compressing only if :attr:`compress_threshold`
+                         is set.
+
+        :rtype: tuple
+        :returns: The (possibly compressed) ``data`` and the ``headers`` to
+                  send with it.
+        """
+        if compress is None:
+            threshold = self.compress_threshold
+        elif compress:
+            threshold = self.compress_threshold or DEFAULT_COMPRESS_THRESHOLD
+        else:
+            threshold = None
+
+        if threshold is None or not data:
+            return data, headers
+        if isinstance(data, six.text_type):
+            data = data.encode('utf-8')
+        if len(data) < threshold:
+            return data, headers
+
+        compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, _GZIP_WBITS)
+        data = compressor.compress(data) + compressor.flush()
+        headers = dict(headers or {})
+        headers['Content-Encoding'] = 'gzip'
+        return data, headers
+
+    def _process_response(self, method, url, response, content,
+                          expect_json=True):
+        """Check the status of a response and decode its payload.
+
+        :type method: str
+        :param method: The HTTP method used in the request.
+
+        :type url: str
+        :param url: The URL the request was sent to.
+
+        :type response: :class:`httplib2.Response` or workalike
+        :param response: The HTTP response object.
+
+        :type content: str
+        :param content: The content of the response.
+
+        :type expect_json: bool
+        :param expect_json: If True, try to parse the content as JSON and
+                            raise an exception if that cannot be done.
+
+        :raises: Exception if the response code is not 200 OK.
+        :rtype: dict or str
+        :returns: The API response payload, either as a raw string or
+                  a dictionary if the response is valid JSON.
+        """
         if not 200 <= response.status < 300:
             raise make_exception(response, content,
                                  error_info=method + ' ' + url)
@@ -339,8 +890,6 @@ class JSONConnection(Connection):
             content_type = response.get('content-type', '')
             if not content_type.startswith('application/json'):
                 raise TypeError('Expected JSON, got %s' % content_type)
-            if isinstance(content, six.binary_type):
-                content = content.decode('utf-8')
-            return json.loads(content)
+            return self.codec.loads(content)
 
         return content
@@ -0,0 +1,617 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio support for Google Cloud JSON APIs.
+
+.. note::
+
+   This module requires Python 3.5 or later.  It is not imported by the
+   rest of the package (so the package still imports on Python 2.7), and
+   it is left out of the Python 2.7 lint, coverage and docs builds.
+
+:class:`AsyncJSONConnection` wraps the
+:class:`~google.cloud._http.JSONConnection` of an existing client, so that
+API requests share its URL building, headers and error mapping but can be
+awaited from an event loop::
+
+    >>> from google.cloud import storage
+    >>> from google.cloud.aio import AsyncJSONConnection
+    >>> client = storage.Client()
+    >>> connection = AsyncJSONConnection(client._connection)
+    >>> bucket = await connection.api_request('GET', '/b/my-bucket')
+
+Requests honor the ``retry``, ``timeout`` and ``rate_limiter`` of the
+wrapped connection, and fire the
+:mod:`~google.cloud.instrumentation` hooks, waiting with
+:func:`asyncio.sleep` rather than blocking the event loop.  Identical
+``GET`` requests are not coalesced (``coalesce_gets`` is ignored).
+
+If :mod:`aiohttp` is installed, requests are sent on the event loop by
+:class:`AiohttpTransport`.  Otherwise they are sent from the default
+executor of the loop by :class:`ExecutorTransport`, using a thread-safe
+:class:`~google.cloud.transport.PooledHttp`.
+
+:class:`AsyncHTTPIterator` is the counterpart of
+:class:`~google.cloud.iterator.HTTPIterator`::
+
+    >>> iterator = AsyncHTTPIterator(
+    ...     client, connection, '/b/my-bucket/o', item_to_value)
+    >>> async for blob in iterator:
+    ...     print(blob.name)
+"""
+
+import asyncio
+
+import google_auth_httplib2
+import httplib2
+
+try:
+    import aiohttp
+except ImportError:  # pragma: NO COVER
+    aiohttp = None
+
+from google.cloud import instrumentation
+from google.cloud import retry as retry_mod
+from google.cloud._http import _retry_before_deadline
+from google.cloud.deadline import as_deadline
+from google.cloud.exceptions import DeadlineExceeded
+from google.cloud.iterator import DEFAULT_ITEMS_KEY
+from google.cloud.iterator import HTTPIterator
+from google.cloud.iterator import _do_nothing_page_start
+from google.cloud.transport import PooledHttp
+from google.cloud.transport import authorized_pooled_http
+
+
+_REFRESH_STATUS_CODES = (401,)
+
+
+async def _send_with_retry(send, method, retry):
+    """Send a request, retrying it if a policy is given.
+
+    Asynchronous counterpart of :meth:`google.cloud.retry.Retry.call`.
+
+    :type send: callable
+    :param send: Coroutine function taking no arguments, sending the
+                 request and returning a ``(response, content)`` pair.
+
+    :type method: str
+    :param method: The HTTP method of the request.
+
+    :type retry: :class:`~google.cloud.retry.Retry`
+    :param retry: The policy used to retry the request, or :data:`None`.
+
+    :rtype: tuple of ``response`` (a dictionary of sorts)
+            and ``content`` (a string).
+    :returns: The last response received.
+    :raises: The last transport error, if the request may not be retried.
+    """
+    if retry is None:
+        return await send()
+    allowed = retry.allows_method(method)
+    start = retry_mod._NOW()
+    attempt = 0
+    while True:
+        try:
+            response, content = await send()
+        except retry_mod._RETRYABLE_EXCEPTIONS:
+            delay = retry._delay_before_retry(allowed, start, attempt)
+            if delay is None:
+                raise
+        else:
+            delay = retry._delay_before_retry(
+                allowed, start, attempt, response)
+            if delay is None:
+                return response, content
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+class AiohttpTransport(object):
+    """Send HTTP requests on the event loop using :mod:`aiohttp`.
+
+    :type credentials: :class:`google.auth.credentials.Credentials`
+    :param credentials: (Optional) The credentials used to authorize
+                        requests.
+
+    :type session: :class:`aiohttp.ClientSession`
+    :param session: (Optional) The session used to send requests. If not
+                    passed, one is created on first use.
+
+    :raises: :class:`ImportError` if :mod:`aiohttp` is not installed.
+    """
+
+    def __init__(self, credentials=None, session=None):
+        if aiohttp is None:
+            raise ImportError('aiohttp is required by AiohttpTransport')
+        self.credentials = credentials
+        self._session = session
+
+    def _get_session(self):
+        """Get the session used to send requests, creating it if needed.
+
+        :rtype: :class:`aiohttp.ClientSession`
+        :returns: The session.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def _refresh_credentials(self):
+        """Refresh the credentials without blocking the event loop."""
+        refresh_request = google_auth_httplib2.Request(httplib2.Http())
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None, self.credentials.refresh, refresh_request)
+
+    async def _send(self, uri, method, body, headers):
+        """Send a single request.
+
+        :rtype: tuple of ``response`` (a :class:`httplib2.Response`)
+                and ``content`` (bytes).
+        :returns: The HTTP response object and the content of the response.
+        """
+        headers = dict(headers or {})
+        # aiohttp computes the length of the body itself.
+        headers.pop('Content-Length', None)
+        if self.credentials is not None:
+            if not self.credentials.valid:
+                await self._refresh_credentials()
+            self.credentials.apply(headers)
+
+        session = self._get_session()
+        async with session.request(
+                method, uri, data=body, headers=headers) as response:
+            content = await response.read()
+            info = {key.lower(): value
+                    for key, value in response.headers.items()}
+            info['status'] = str(response.status)
+        return httplib2.Response(info), content
+
+    async def request(self, uri, method='GET', body=None, headers=None):
+        """Send a request, refreshing the credentials once on a 401.
+
+        Same signature as :meth:`httplib2.Http.request` (less the
+        ``redirections`` and ``connection_type`` arguments).
+
+        :type uri: str
+        :param uri: The URI to send the request to.
+
+        :type method: str
+        :param method: The HTTP method to use.
+
+        :type body: str
+        :param body: (Optional) The body of the request.
+
+        :type headers: dict
+        :param headers: (Optional) The headers to send.
+
+        :rtype: tuple of ``response`` (a :class:`httplib2.Response`)
+                and ``content`` (bytes).
+        :returns: The HTTP response object and the content of the response.
+        """
+        response, content = await self._send(uri, method, body, headers)
+        if (response.status in _REFRESH_STATUS_CODES and
+                self.credentials is not None):
+            await self._refresh_credentials()
+            response, content = await self._send(uri, method, body, headers)
+        return response, content
+
+    async def close(self):
+        """Close the underlying session, if one was created."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class ExecutorTransport(object):
+    """Send HTTP requests from the default executor of the event loop.
+
+    :type http: :class:`httplib2.Http` or workalike
+    :param http: A thread-safe HTTP object used to send requests, such
+                 as a :class:`~google.cloud.transport.PooledHttp`.
+    """
+
+    def __init__(self, http):
+        self.http = http
+
+    async def request(self, uri, method='GET', body=None, headers=None):
+        """Send a request without blocking the event loop.
+
+        :type uri: str
+        :param uri: The URI to send the request to.
+
+        :type method: str
+        :param method: The HTTP method to use.
+
+        :type body: str
+        :param body: (Optional) The body of the request.
+
+        :type headers: dict
+        :param headers: (Optional) The headers to send.
+
+        :rtype: tuple of ``response`` (a dictionary of sorts)
+                and ``content`` (a string).
+        :returns: The HTTP response object and the content of the response.
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, lambda: self.http.request(
+                uri=uri, method=method, body=body, headers=headers))
+
+
+def _default_transport(credentials):
+    """Create the transport used when none is passed to a connection.
+
+    :type credentials: :class:`google.auth.credentials.Credentials`
+    :param credentials: The credentials used to authorize requests.
+
+    :rtype: :class:`AiohttpTransport` or :class:`ExecutorTransport`
+    :returns: A transport for the credentials.
+    """
+    if aiohttp is not None:
+        return AiohttpTransport(credentials)
+    if credentials is not None:
+        return ExecutorTransport(authorized_pooled_http(credentials))
+    return ExecutorTransport(PooledHttp())
+
+
+class AsyncJSONConnection(object):
+    """Asyncio counterpart of a :class:`~google.cloud._http.JSONConnection`.
+
+    :type connection: :class:`~google.cloud._http.JSONConnection`
+    :param connection: The connection used to build URLs and headers, and
+                       to map error responses onto exceptions.
+
+    :type transport: :class:`AiohttpTransport` or :class:`ExecutorTransport`
+    :param transport: (Optional) The object used to send requests; any
+                      object with an awaitable ``request()`` method taking
+                      ``uri``, ``method``, ``body`` and ``headers`` will do.
+                      Defaults to :class:`AiohttpTransport` if
+                      :mod:`aiohttp` is installed, otherwise to
+                      :class:`ExecutorTransport`.
+    """
+
+    def __init__(self, connection, transport=None):
+        self._connection = connection
+        if transport is None:
+            transport = _default_transport(connection.credentials)
+        self.transport = transport
+
+    @property
+    def connection(self):
+        """The wrapped synchronous connection.
+
+        :rtype: :class:`~google.cloud._http.JSONConnection`
+        :returns: The connection passed to the constructor.
+        """
+        return self._connection
+
+    async def api_request(self, method, path, query_params=None,
+                          data=None, content_type=None, headers=None,
+                          api_base_url=None, api_version=None,
+                          expect_json=True, retry=None, compress=None,
+                          timeout=None):
+        """Make a request over the transport to the API.
+
+        Accepts the same arguments as
+        :meth:`~google.cloud._http.JSONConnection.api_request`, less
+        ``coalesce`` and ``_target_object``.
+
+        :type method: str
+        :param method: The HTTP method name (ie, ``GET``, ``POST``, etc).
+
+        :type path: str
+        :param path: The path to the resource (ie, ``'/b/bucket-name'``).
+
+        :type query_params: dict or list
+        :param query_params: A dictionary of keys and values (or list of
+                             key-value pairs) to insert into the query
+                             string of the URL.
+
+        :type data: str
+        :param data: The data to send as the body of the request.
+
+        :type content_type: str
+        :param content_type: The proper MIME type of the data provided.
+
+        :type headers: dict
+        :param headers: extra HTTP headers to be sent with the request.
+
+        :type api_base_url: str
+        :param api_base_url: The base URL for the API endpoint.
+
+        :type api_version: str
+        :param api_version: The version of the API to call.
+
+        :type expect_json: bool
+        :param expect_json: If True, this method will try to parse the
+                            response as JSON and raise an exception if
+                            that cannot be done.  Default is True.
+
+        :type retry: :class:`~google.cloud.retry.Retry`
+        :param retry: (Optional) The policy used to retry the request if it
+                      fails with a transient error. Defaults to the
+                      ``retry`` of the wrapped connection.
+
+        :type compress: bool
+        :param compress: (Optional) Whether to gzip-compress the body of the
+                         request. Defaults to the setting of the wrapped
+                         connection.
+
+        :type timeout: float or :class:`~google.cloud.deadline.Deadline`
+        :param timeout: (Optional) The number of seconds before the request
+                        times out, retries included, or a deadline shared
+                        with other requests. Defaults to the ``timeout`` of
+                        the wrapped connection.
+
+        :raises: Exception if the response code is not 200 OK, or
+                 :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 request timed out.
+        :rtype: dict or str
+        :returns: The API response payload, either as a raw string or
+                  a dictionary if the response is valid JSON.
+        """
+        connection = self._connection
+        url = connection.build_api_url(
+            path=path, query_params=query_params,
+            api_base_url=api_base_url, api_version=api_version)
+        data, content_type = connection._encode_data(data, content_type)
+        data, headers = connection._compress_data(data, headers, compress)
+        headers = connection._build_headers(
+            data=data, content_type=content_type, headers=headers)
+        deadline = as_deadline(
+            connection.timeout if timeout is None else timeout)
+        retry = _retry_before_deadline(retry or connection.retry, deadline)
+
+        async def send():
+            return await self._send(method, path, url, data, headers, deadline)
+
+        if not instrumentation.HOOKS:
+            response, content = await _send_with_retry(send, method, retry)
+        else:
+            with connection._request_event(method, url, data, api_base_url,
+                                           api_version) as event:
+                attempts = []
+
+                async def counted_send():
+                    attempts.append(None)
+                    event.retries = len(attempts) - 1
+                    return await send()
+
+                response, content = await _send_with_retry(
+                    counted_send, method, retry)
+                event.status = response.status
+                event.response_bytes = len(content) if content else 0
+
+        return connection._process_response(
+            method, url, response, content, expect_json=expect_json)
+
+    async def _send(self, method, path, url, data, headers, deadline):
+        """Send a single request, once the rate limit allows it.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type path: str
+        :param path: The path of the request, relative to the API version.
+
+        :type url: str
+        :param url: The URL the request is sent to.
+
+        :type data: bytes or str
+        :param data: The (encoded) body of the request.
+
+        :type headers: dict
+        :param headers: The HTTP headers to send.
+
+        :type deadline: :class:`~google.cloud.deadline.Deadline`
+        :param deadline: The deadline of the call, or :data:`None`.
+
+        :rtype: tuple of ``response`` (a dictionary of sorts)
+                and ``content`` (a string).
+        :returns: The HTTP response object and the content of the response.
+        :raises: :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 deadline expired before a response was received.
+        """
+        rate_limiter = self._connection.rate_limiter
+        if rate_limiter is not None:
+            wait = rate_limiter.reserve(method, deadline, path)
+            if wait > 0.0:
+                await asyncio.sleep(wait)
+        request = self.transport.request(
+            uri=url, method=method, body=data, headers=headers)
+        if deadline is None:
+            response, content = await request
+        else:
+            try:
+                response, content = await asyncio.wait_for(
+                    request, deadline.check())
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded(
+                    'Deadline of %r seconds exceeded' % (deadline.timeout,))
+        if rate_limiter is not None:
+            rate_limiter.record(method, response.status, path)
+        return response, content
+
+    async def close(self):
+        """Release the resources held by the transport."""
+        close = getattr(self.transport, 'close', None)
+        if close is not None:
+            await close()
+
+
+class _AsyncPages(object):
+    """Asynchronous iterator over the pages of an :class:`AsyncHTTPIterator`.
+
+    :type iterator: :class:`AsyncHTTPIterator`
+    :param iterator: The iterator whose pages are fetched.
+    """
+
+    def __init__(self, iterator):
+        self._iterator = iterator
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        iterator = self._iterator
+        page = await iterator._fetch_page_async()
+        if page is None:
+            raise StopAsyncIteration
+        iterator.page_number += 1
+        iterator.num_results += page.remaining
+        iterator._consume_page(page)
+        return page
+
+
+class AsyncHTTPIterator(HTTPIterator):
+    """Asyncio counterpart of :class:`~google.cloud.iterator.HTTPIterator`.
+
+    Iterate over it with ``async for``, either item by item or page by
+    page (via :attr:`pages`).
+
+    :type client: :class:`~google.cloud.client.Client`
+    :param client: The client used to identify the application.
+
+    :type connection: :class:`AsyncJSONConnection`
+    :param connection: The connection used to request each page.
+
+    :type path: str
+    :param path: The path to query for the list of items.
+
+    :type item_to_value: callable
+    :param item_to_value: Callable to convert an item from JSON
+                          into the native object. Assumed signature
+                          takes an :class:`Iterator` and a dictionary
+                          holding a single item.
+
+    :type items_key: str
+    :param items_key: (Optional) The key used to grab retrieved items from an
+                      API response. Defaults to :data:`DEFAULT_ITEMS_KEY`.
+
+    :type page_token: str
+    :param page_token: (Optional) A token identifying a page in a result set.
+
+    :type max_results: int
+    :param max_results: (Optional) The maximum number of results to fetch.
+
+    :type extra_params: dict
+    :param extra_params: (Optional) Extra query string parameters for the
+                         API call.
+
+    :type page_start: callable
+    :param page_start: (Optional) Callable to provide any special behavior
+                       after a new page has been created.
+    """
+
+    def __init__(self, client, connection, path, item_to_value,
+                 items_key=DEFAULT_ITEMS_KEY,
+                 page_token=None, max_results=None, extra_params=None,
+                 page_start=_do_nothing_page_start):
+        super(AsyncHTTPIterator, self).__init__(
+            client, path, item_to_value, items_key=items_key,
+            page_token=page_token, max_results=max_results,
+            extra_params=extra_params, page_start=page_start)
+        self.connection = connection
+
+    @property
+    def pages(self):
+        """Asynchronous iterator of pages in the response.
+
+        :rtype: :class:`_AsyncPages`
+        :returns: An asynchronous iterator of :class:`Page` instances.
+        :raises ValueError: If the iterator has already been started.
+        """
+        if self._started:
+            raise ValueError('Iterator has already started', self)
+        self._started = True
+        return _AsyncPages(self)
+
+    def __iter__(self):
+        """Not supported: use ``async for`` instead.
+
+        :raises TypeError: Always.
+        """
+        raise TypeError('Use "async for" with an AsyncHTTPIterator', self)
+
+    def __aiter__(self):
+        """Asynchronous iterator for each item returned.
+
+        :rtype: :class:`AsyncHTTPIterator`
+        :returns: The iterator itself.
+        :raises ValueError: If the iterator has already been started.
+        """
+        if self._started:
+            raise ValueError('Iterator has already started', self)
+        self._started = True
+        return self
+
+    async def __anext__(self):
+        while self._page is None or self._page.remaining == 0:
+            page = await self._fetch_page_async()
+            if page is None:
+                raise StopAsyncIteration
+            self.page_number += 1
+            self._consume_page(page)
+        item = next(self._page)
+        self.num_results += 1
+        return item
+
+    async def _fetch_page_async(self):
+        """Get the next page, recording the token used to request it.
+
+        Asynchronous counterpart of
+        :meth:`~google.cloud.iterator.Iterator._fetch_page`, so that
+        :meth:`~google.cloud.iterator.Iterator.checkpoint` and
+        :meth:`~google.cloud.iterator.Iterator.resume` apply.
+
+        :rtype: :class:`~google.cloud.iterator.Page`
+        :returns: The next page in the iterator (or :data:`None` if
+                  there are no pages left).
+        """
+        page_token = self.next_page_token
+        page = await self._next_page()
+        return self._prepare_page(page, page_token)
+
+    async def _next_page(self):
+        """Get the next page in the iterator.
+
+        :rtype: :class:`~google.cloud.iterator.Page`
+        :returns: The next page in the iterator (or :data:`None` if
+                  there are no pages left).
+        """
+        if not self._has_next_page():
+            return None
+        response = await self._get_next_page_response()
+        return self._make_page(response)
+
+    async def _get_next_page_response(self):
+        """Requests the next page from the path provided.
+
+        :rtype: dict
+        :returns: The parsed JSON response of the next page's contents.
+        """
+        params = self._get_query_params()
+        if self._HTTP_METHOD == 'GET':
+            return await self.connection.api_request(
+                method=self._HTTP_METHOD,
+                path=self.path,
+                query_params=params)
+        elif self._HTTP_METHOD == 'POST':
+            return await self.connection.api_request(
+                method=self._HTTP_METHOD,
+                path=self.path,
+                data=params)
+        else:
+            raise ValueError('Unexpected HTTP method', self._HTTP_METHOD)
@@ -15,7 +15,6 @@
 """Base classes for client used to interact with Google Cloud APIs."""
 
 import google.auth.credentials
-from google.oauth2 import service_account
 import six
 
 from google.cloud._helpers import _determine_default_project
@@ -60,6 +59,8 @@ class _ClientFactoryMixin(object):
         :raises: :class:`TypeError` if there is a conflict with the kwargs
                  and the credentials created by the factory.
         """
+        from google.oauth2 import service_account
+
         if 'credentials' in kwargs:
             raise TypeError('credentials must not be in keyword arguments')
         credentials = service_account.Credentials.from_service_account_file(
@@ -88,6 +89,14 @@ class Client(_ClientFactoryMixin):
                  ``credentials`` for the current object.
     """
 
+    metadata_cache = None
+    """Cache of resource metadata, used by ``reload()`` methods.
+
+    If set to a :class:`~google.cloud.metadata_cache.MetadataCache`, reloads
+    of unchanged resources are answered with ``304 Not Modified`` rather
+    than their full properties.
+    """
+
     def __init__(self, credentials=None, http=None):
         if (credentials is not None and
                 not isinstance(
@@ -0,0 +1,101 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Codecs used to encode and decode the JSON bodies of API requests.
+
+A codec is any object with ``dumps`` (returning the encoded ``bytes``) and
+``loads`` (accepting ``bytes`` or text) methods.  The codec used by a
+client can be swapped for a faster one::
+
+    >>> from google.cloud.codec import OrjsonCodec
+    >>> client._connection.codec = OrjsonCodec()
+"""
+
+import json
+
+import six
+
+
+class JSONCodec(object):
+    """Codec built on the standard library's :mod:`json` module."""
+
+    @staticmethod
+    def dumps(value):
+        """Encode a value as JSON.
+
+        :type value: object
+        :param value: A JSON-serializable value.
+
+        :rtype: bytes
+        :returns: The UTF-8 encoded JSON document.
+        """
+        return json.dumps(value).encode('utf-8')
+
+    @staticmethod
+    def loads(content):
+        """Decode a JSON document.
+
+        :type content: bytes or str
+        :param content: The (UTF-8 encoded) JSON document.
+
+        :rtype: object
+        :returns: The decoded value.
+        """
+        if isinstance(content, six.binary_type):
+            content = content.decode('utf-8')
+        return json.loads(content)
+
+
+class OrjsonCodec(object):
+    """Codec built on the `orjson`_ library.
+
+    Much faster than :class:`JSONCodec`, but rejects integers which do not
+    fit in 64 bits and dictionaries with non-string keys.
+
+    .. _orjson: https://pypi.python.org/pypi/orjson
+
+    :raises: :class:`ImportError` if ``orjson`` is not installed.
+    """
+
+    def __init__(self):
+        # Imported here, so that importing this module stays cheap.
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, value):
+        """Encode a value as JSON.
+
+        :type value: object
+        :param value: A JSON-serializable value.
+
+        :rtype: bytes
+        :returns: The UTF-8 encoded JSON document.
+        """
+        return self._orjson.dumps(value)
+
+    def loads(self, content):
+        """Decode a JSON document.
+
+        :type content: bytes or str
+        :param content: The (UTF-8 encoded) JSON document.
+
+        :rtype: object
+        :returns: The decoded value.
+        """
+        return self._orjson.loads(content)
+
+
+DEFAULT_CODEC = JSONCodec()
+"""The codec used by connections unless configured otherwise."""
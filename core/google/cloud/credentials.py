@@ -15,7 +15,11 @@
 """A simple wrapper around the OAuth2 credentials library."""
 
 import base64
+import collections
 import datetime
+import json
+import threading
+
 import six
 from six.moves.urllib.parse import urlencode
 
@@ -23,10 +27,14 @@ import google.auth
 import google.auth.credentials
 
 from google.cloud._helpers import UTC
+from google.cloud._helpers import _LazyModule
 from google.cloud._helpers import _NOW
 from google.cloud._helpers import _microseconds_from_datetime
 
 
+multiprocessing = _LazyModule('multiprocessing')
+
+
 def get_credentials():
     """Gets credentials implicitly from the current environment.
 
@@ -40,6 +48,23 @@ def get_credentials():
     return credentials
 
 
+def _check_signing(credentials):
+    """Check that credentials can sign text.
+
+    :type credentials: :class:`google.auth.credentials.Credentials`
+    :param credentials: The credentials to check.
+
+    :raises AttributeError: If :meth: sign_blob is unavailable.
+    """
+    if not isinstance(credentials, google.auth.credentials.Signing):
+        auth_uri = ('http://google-cloud-python.readthedocs.io/en/latest/'
+                    'google-cloud-auth.html#setting-up-a-service-account')
+        raise AttributeError('you need a private key to sign credentials.'
+                             'the credentials you are currently using %s '
+                             'just contains a token. see %s for more '
+                             'details.' % (type(credentials), auth_uri))
+
+
 def _get_signed_query_params(credentials, expiration, string_to_sign):
     """Gets query parameters for creating a signed URL.
 
@@ -59,14 +84,7 @@ def _get_signed_query_params(credentials, expiration, string_to_sign):
     :returns: Query parameters matching the signing credentials with a
               signed payload.
     """
-    if not isinstance(credentials, google.auth.credentials.Signing):
-        auth_uri = ('http://google-cloud-python.readthedocs.io/en/latest/'
-                    'google-cloud-auth.html#setting-up-a-service-account')
-        raise AttributeError('you need a private key to sign credentials.'
-                             'the credentials you are currently using %s '
-                             'just contains a token. see %s for more '
-                             'details.' % (type(credentials), auth_uri))
-
+    _check_signing(credentials)
     signature_bytes = credentials.sign_bytes(string_to_sign)
     signature = base64.b64encode(signature_bytes)
     service_account_name = credentials.signer_email
@@ -176,19 +194,76 @@ def generate_signed_url(credentials, resource, expiration,
               until expiration.
     """
     expiration = _get_expiration_seconds(expiration)
+    string_to_sign = _get_string_to_sign(
+        resource, expiration, method, content_md5, content_type)
+
+    # Set the right query parameters.
+    query_params = _get_signed_query_params(credentials,
+                                            expiration,
+                                            string_to_sign)
+    return _build_signed_url(api_access_endpoint, resource, query_params,
+                             response_type, response_disposition, generation)
 
-    # Generate the string to sign.
-    string_to_sign = '\n'.join([
+
+def _get_string_to_sign(resource, expiration, method='GET',
+                        content_md5=None, content_type=None):
+    """Generate the string signed to create a signed URL.
+
+    :type resource: str
+    :param resource: A pointer to a specific resource.
+
+    :type expiration: int
+    :param expiration: When the signed URL should expire, as a timestamp.
+
+    :type method: str
+    :param method: The HTTP verb that will be used when requesting the URL.
+
+    :type content_md5: str
+    :param content_md5: (Optional) The MD5 hash of the resource.
+
+    :type content_type: str
+    :param content_type: (Optional) The content type of the resource.
+
+    :rtype: str
+    :returns: The string to sign.
+    """
+    return '\n'.join([
         method,
         content_md5 or '',
         content_type or '',
         str(expiration),
         resource])
 
-    # Set the right query parameters.
-    query_params = _get_signed_query_params(credentials,
-                                            expiration,
-                                            string_to_sign)
+
+def _build_signed_url(api_access_endpoint, resource, query_params,
+                      response_type=None, response_disposition=None,
+                      generation=None):
+    """Build a signed URL from its signed query parameters.
+
+    :type api_access_endpoint: str
+    :param api_access_endpoint: The URI base.
+
+    :type resource: str
+    :param resource: A pointer to a specific resource.
+
+    :type query_params: dict
+    :param query_params: The signed query parameters (updated in place).
+
+    :type response_type: str
+    :param response_type: (Optional) Content type of responses to requests for
+                          the signed URL.
+
+    :type response_disposition: str
+    :param response_disposition: (Optional) Content disposition of responses to
+                                 requests for the signed URL.
+
+    :type generation: str
+    :param generation: (Optional) A value that indicates which generation of
+                       the resource to fetch.
+
+    :rtype: str
+    :returns: The signed URL.
+    """
     if response_type is not None:
         query_params['response-content-type'] = response_type
     if response_disposition is not None:
@@ -200,3 +275,312 @@ def generate_signed_url(credentials, resource, expiration,
     return '{endpoint}{resource}?{querystring}'.format(
         endpoint=api_access_endpoint, resource=resource,
         querystring=urlencode(query_params))
+
+
+DEFAULT_SIGNATURE_CACHE_SIZE = 4096
+"""Number of signatures cached by a :class:`URLSigner`."""
+
+# Signer loaded in each worker process of a URLSigner's pool.
+_WORKER_STATE = {}
+
+
+def _init_worker(service_account_info):
+    """Load the signer of a worker process.
+
+    :type service_account_info: dict
+    :param service_account_info: The service account info, in Google format.
+    """
+    import google.auth.crypt
+
+    _WORKER_STATE['signer'] = (
+        google.auth.crypt.RSASigner.from_service_account_info(
+            service_account_info))
+
+
+def _sign_in_worker(string_to_sign):
+    """Sign a string with the signer of a worker process.
+
+    :type string_to_sign: str
+    :param string_to_sign: The string to sign.
+
+    :rtype: bytes
+    :returns: The signature.
+    """
+    return _WORKER_STATE['signer'].sign(string_to_sign)
+
+
+class URLSigner(object):
+    """Generate signed URLs in bulk, reusing one loaded signer.
+
+    The URLs are the same as the ones returned by
+    :func:`generate_signed_url`::
+
+        >>> signer = URLSigner(credentials, expiration_bucket=300)
+        >>> urls = signer.sign_many([
+        ...     ('/bucket-name/blob-1', datetime.timedelta(hours=1)),
+        ...     ('/bucket-name/blob-2', datetime.timedelta(hours=1), 'PUT'),
+        ... ])
+
+    Signatures are cached, so signing the same resource with the same
+    expiration again is nearly free.  To benefit from the cache across
+    calls, use ``expiration_bucket``: URLs for a resource expiring in
+    the same bucket are then identical.
+
+    To spread the signing across cores, create the signer from a service
+    account key with :meth:`from_service_account_json` (or
+    :meth:`from_service_account_info`) and pass ``processes``: each worker
+    process loads the key once, and signs a share of each batch.
+
+    :type credentials: :class:`google.auth.credentials.Signing`
+    :param credentials: Credentials object with an associated private key to
+                        sign text.
+
+    :type api_access_endpoint: str
+    :param api_access_endpoint: (Optional) URI base. Defaults to empty string.
+
+    :type expiration_bucket: int
+    :param expiration_bucket: (Optional) Round expirations up to a multiple of
+                              this many seconds.  The URLs then stay valid
+                              for up to this many seconds longer.
+
+    :type cache_size: int
+    :param cache_size: (Optional) The number of signatures cached.  Pass
+                       ``0`` to disable caching.
+
+    :type processes: int
+    :param processes: (Optional) The number of worker processes signing in
+                      parallel.  Defaults to signing in the calling thread.
+
+    :raises AttributeError: If ``credentials`` cannot sign text.
+    """
+
+    _service_account_info = None
+
+    def __init__(self, credentials, api_access_endpoint='',
+                 expiration_bucket=None,
+                 cache_size=DEFAULT_SIGNATURE_CACHE_SIZE, processes=None):
+        _check_signing(credentials)
+        self.credentials = credentials
+        self.api_access_endpoint = api_access_endpoint
+        self.expiration_bucket = expiration_bucket
+        self.cache_size = cache_size
+        self.processes = processes
+        self._cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = None
+
+    @classmethod
+    def from_service_account_info(cls, info, **kwargs):
+        """Create a signer from a service account's key.
+
+        :type info: dict
+        :param info: The service account info, in Google format (the parsed
+                     contents of a JSON key file).
+
+        :type kwargs: dict
+        :param kwargs: Remaining keyword arguments to pass to the constructor.
+
+        :rtype: :class:`URLSigner`
+        :returns: The signer created from the key.
+        """
+        from google.oauth2 import service_account
+
+        credentials = service_account.Credentials.from_service_account_info(
+            info)
+        signer = cls(credentials, **kwargs)
+        signer._service_account_info = info
+        return signer
+
+    @classmethod
+    def from_service_account_json(cls, json_credentials_path, **kwargs):
+        """Create a signer from a service account's JSON key file.
+
+        :type json_credentials_path: str
+        :param json_credentials_path: The path to a private key file (this
+                                      file was given to you when you created
+                                      the service account).
+
+        :type kwargs: dict
+        :param kwargs: Remaining keyword arguments to pass to the constructor.
+
+        :rtype: :class:`URLSigner`
+        :returns: The signer created from the key.
+        """
+        with open(json_credentials_path) as json_file:
+            info = json.load(json_file)
+        return cls.from_service_account_info(info, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Shut down the worker processes, if any."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def _get_expiration(self, expiration):
+        """Convert an expiration to a (rounded up) timestamp.
+
+        :type expiration: int, long, datetime.datetime, datetime.timedelta
+        :param expiration: When the signed URL should expire.
+
+        :rtype: int
+        :returns: a timestamp as an absolute number of seconds.
+        """
+        expiration = _get_expiration_seconds(expiration)
+        bucket = self.expiration_bucket
+        if bucket:
+            expiration = -(-expiration // bucket) * bucket
+        return expiration
+
+    def _get_pool(self):
+        """Get the pool of worker processes, creating it if needed.
+
+        :rtype: :class:`multiprocessing.pool.Pool`
+        :returns: The pool, or ``None`` if signing in the calling thread.
+        :raises ValueError: If the signer was not created from a service
+                            account key.
+        """
+        if not self.processes:
+            return None
+        if self._pool is None:
+            if self._service_account_info is None:
+                raise ValueError(
+                    'Signing in worker processes requires a signer created '
+                    'from a service account key.')
+            self._pool = multiprocessing.Pool(
+                self.processes, initializer=_init_worker,
+                initargs=(self._service_account_info,))
+        return self._pool
+
+    def _sign_strings(self, strings):
+        """Sign strings, in the worker processes if configured.
+
+        :type strings: list of str
+        :param strings: The strings to sign.
+
+        :rtype: list of bytes
+        :returns: The base64-encoded signatures.
+        """
+        pool = self._get_pool()
+        if pool is None:
+            sign_bytes = self.credentials.sign_bytes
+            signatures = [sign_bytes(string) for string in strings]
+        else:
+            chunksize = max(1, len(strings) // (4 * self.processes))
+            signatures = pool.map(_sign_in_worker, strings, chunksize)
+        return [base64.b64encode(signature) for signature in signatures]
+
+    def _get_signatures(self, strings):
+        """Get the signatures of strings, from the cache when possible.
+
+        :type strings: list of str
+        :param strings: The strings to sign.
+
+        :rtype: dict
+        :returns: The base64-encoded signatures, keyed by string.
+        """
+        found = {}
+        with self._lock:
+            for string in strings:
+                signature = self._cache.pop(string, None)
+                if signature is not None:
+                    # Re-insert the signature as the most recently used.
+                    self._cache[string] = found[string] = signature
+
+        missing = [string for string in set(strings) if string not in found]
+        if not missing:
+            return found
+        signed = dict(zip(missing, self._sign_strings(missing)))
+        found.update(signed)
+
+        if self.cache_size:
+            with self._lock:
+                self._cache.update(signed)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return found
+
+    def sign_many(self, requests, response_type=None,
+                  response_disposition=None):
+        """Generate signed URLs for many resources.
+
+        :type requests: iterable of tuple
+        :param requests: ``(resource, expiration)`` or
+                         ``(resource, expiration, method)`` tuples, where
+                         ``resource`` is a pointer to a specific resource
+                         (typically, ``/bucket-name/path/to/blob.txt``),
+                         ``expiration`` is as for
+                         :func:`generate_signed_url`, and ``method`` (by
+                         default ``'GET'``) is the HTTP verb that will be
+                         used when requesting the URL.
+
+        :type response_type: str
+        :param response_type: (Optional) Content type of responses to requests
+                              for the signed URLs.
+
+        :type response_disposition: str
+        :param response_disposition: (Optional) Content disposition of
+                                     responses to requests for the signed
+                                     URLs.
+
+        :rtype: list of str
+        :returns: The signed URLs, in the order of ``requests``.
+        """
+        signed = []
+        for request in requests:
+            resource, expiration = request[:2]
+            method = request[2] if len(request) > 2 else 'GET'
+            expiration = self._get_expiration(expiration)
+            string_to_sign = _get_string_to_sign(resource, expiration, method)
+            signed.append((resource, expiration, string_to_sign))
+
+        signatures = self._get_signatures(
+            [string_to_sign for _, _, string_to_sign in signed])
+        signer_email = self.credentials.signer_email
+        return [
+            _build_signed_url(
+                self.api_access_endpoint, resource, {
+                    'GoogleAccessId': signer_email,
+                    'Expires': str(expiration),
+                    'Signature': signatures[string_to_sign],
+                }, response_type, response_disposition)
+            for resource, expiration, string_to_sign in signed]
+
+    def sign(self, resource, expiration, method='GET', response_type=None,
+             response_disposition=None):
+        """Generate a signed URL for a resource.
+
+        :type resource: str
+        :param resource: A pointer to a specific resource
+                         (typically, ``/bucket-name/path/to/blob.txt``).
+
+        :type expiration: :class:`int`, :class:`long`,
+                          :class:`datetime.datetime`,
+                          :class:`datetime.timedelta`
+        :param expiration: When the signed URL should expire.
+
+        :type method: str
+        :param method: The HTTP verb that will be used when requesting the
+                       URL.  Defaults to ``'GET'``.
+
+        :type response_type: str
+        :param response_type: (Optional) Content type of responses to requests
+                              for the signed URL.
+
+        :type response_disposition: str
+        :param response_disposition: (Optional) Content disposition of
+                                     responses to requests for the signed URL.
+
+        :rtype: str
+        :returns: A signed URL you can use to access the resource
+                  until expiration.
+        """
+        return self.sign_many([(resource, expiration, method)],
+                              response_type=response_type,
+                              response_disposition=response_disposition)[0]
@@ -0,0 +1,189 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side deadlines for API calls.
+
+Every connection has a default :attr:`~google.cloud._http.Connection.timeout`
+(in seconds), and most calls accept a ``timeout`` of their own::
+
+    >>> client._connection.timeout = 30.0
+    >>> client.get_multi(keys, timeout=5.0)
+
+The timeout bounds the whole call: when a call needs several requests
+(e.g. retries, the pages of a listing, or the repeated lookups of
+deferred keys), they share a single :class:`Deadline`, and each request
+only gets the time remaining.  Once it expires,
+:class:`~google.cloud.exceptions.DeadlineExceeded` is raised.
+"""
+
+import collections
+import time
+
+from google.cloud.exceptions import DeadlineExceeded
+
+
+_NOW = time.time  # To be replaced by tests.
+
+_GRPC_STATE = {}
+
+
+class Deadline(object):
+    """A point in time by which a call must complete.
+
+    :type timeout: float
+    :param timeout: The number of seconds, from now, before the deadline
+                    expires.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.expires_at = _NOW() + timeout
+
+    def __repr__(self):
+        return '<Deadline timeout=%r remaining=%r>' % (
+            self.timeout, self.remaining())
+
+    def remaining(self):
+        """The number of seconds left before the deadline expires.
+
+        :rtype: float
+        :returns: The time remaining, or ``0.0`` if the deadline expired.
+        """
+        return max(0.0, self.expires_at - _NOW())
+
+    @property
+    def expired(self):
+        """Whether the deadline has expired.
+
+        :rtype: bool
+        :returns: True if there is no time left.
+        """
+        return self.remaining() <= 0.0
+
+    def check(self):
+        """Get the time remaining for the next step of a call.
+
+        :rtype: float
+        :returns: The number of seconds left before the deadline expires.
+        :raises: :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 deadline has expired.
+        """
+        remaining = self.remaining()
+        if remaining <= 0.0:
+            raise DeadlineExceeded(
+                'Deadline of %r seconds exceeded' % (self.timeout,))
+        return remaining
+
+
+def as_deadline(timeout):
+    """Convert a ``timeout`` argument to a :class:`Deadline`.
+
+    :type timeout: float or :class:`Deadline`
+    :param timeout: A number of seconds, an existing deadline (returned
+                    as is, so that its budget is shared) or :data:`None`.
+
+    :rtype: :class:`Deadline`
+    :returns: The deadline, or :data:`None` if ``timeout`` is :data:`None`.
+    """
+    if timeout is None or isinstance(timeout, Deadline):
+        return timeout
+    return Deadline(timeout)
+
+
+def _make_interceptor_class():
+    """Create the class of gRPC interceptors setting a default timeout.
+
+    :rtype: type
+    :returns: The interceptor class, or :data:`None` if the installed
+              version of gRPC does not support interceptors.
+    """
+    import grpc
+
+    if not hasattr(grpc, 'intercept_channel'):  # pragma: NO COVER
+        return None
+
+    fields = ('method', 'timeout', 'metadata', 'credentials',
+              'wait_for_ready', 'compression')
+
+    class _CallDetails(collections.namedtuple('_CallDetails', fields),
+                       grpc.ClientCallDetails):
+        """Details of a call, with its timeout replaced."""
+
+    class _TimeoutInterceptor(grpc.UnaryUnaryClientInterceptor,
+                              grpc.UnaryStreamClientInterceptor):
+        """Apply a default timeout to calls which do not set one."""
+
+        def __init__(self, timeout):
+            self.timeout = timeout
+
+        def _with_timeout(self, details):
+            if details.timeout is not None:
+                return details
+            return _CallDetails(
+                details.method, self.timeout, details.metadata,
+                details.credentials,
+                getattr(details, 'wait_for_ready', None),
+                getattr(details, 'compression', None))
+
+        def intercept_unary_unary(self, continuation, client_call_details,
+                                  request):
+            return continuation(
+                self._with_timeout(client_call_details), request)
+
+        def intercept_unary_stream(self, continuation, client_call_details,
+                                   request):
+            return continuation(
+                self._with_timeout(client_call_details), request)
+
+    return _TimeoutInterceptor
+
+
+def _interceptor_class():
+    """The class of gRPC interceptors setting a default timeout.
+
+    Created (importing gRPC) on first use.
+
+    :rtype: type
+    :returns: The interceptor class, or :data:`None` if not supported.
+    """
+    if 'interceptor_class' not in _GRPC_STATE:
+        _GRPC_STATE['interceptor_class'] = _make_interceptor_class()
+    return _GRPC_STATE['interceptor_class']
+
+
+def with_default_timeout(channel, timeout):
+    """Make the calls sent over a gRPC channel time out by default.
+
+    Calls passing their own ``timeout`` are unaffected.  The channel is
+    returned unchanged if ``timeout`` is :data:`None`, or if the installed
+    version of gRPC does not support interceptors.
+
+    :type channel: :class:`grpc.Channel`
+    :param channel: The channel to wrap.
+
+    :type timeout: float
+    :param timeout: The default number of seconds before a call times out.
+
+    :rtype: :class:`grpc.Channel`
+    :returns: The wrapped channel.
+    """
+    if timeout is None:
+        return channel
+    interceptor_class = _interceptor_class()
+    if interceptor_class is None:  # pragma: NO COVER
+        return channel
+
+    import grpc
+
+    return grpc.intercept_channel(channel, interceptor_class(timeout))
@@ -22,22 +22,32 @@ from __future__ import absolute_import
 
 import copy
 import json
+
 import six
 
+from google.cloud._helpers import _lazy_attributes
 from google.cloud._helpers import _to_bytes
 
 _HTTP_CODE_TO_EXCEPTION = {}  # populated at end of module
 
-try:
-    from grpc._channel import _Rendezvous
-except ImportError:  # pragma: NO COVER
-    _Rendezvous = None
+
+def _get_grpc_rendezvous():
+    """Exception class raised by gRPC stable.
+
+    gRPC is only imported when the class is first looked up.
+
+    :rtype: type
+    :returns: The class, or :data:`None` if gRPC is not installed.
+    """
+    try:
+        from grpc._channel import _Rendezvous
+    except ImportError:  # pragma: NO COVER
+        _Rendezvous = None
+    return _Rendezvous
 
 
-# pylint: disable=invalid-name
-GrpcRendezvous = _Rendezvous
-"""Exception class raised by gRPC stable."""
-# pylint: enable=invalid-name
+# The exception class raised by gRPC stable, as GrpcRendezvous.
+_lazy_attributes(__name__, GrpcRendezvous=_get_grpc_rendezvous)
 
 
 class GoogleCloudError(Exception):
@@ -185,6 +195,10 @@ class GatewayTimeout(ServerError):
     code = 504
 
 
+class DeadlineExceeded(Exception):
+    """Raised when a client-side deadline expires before work completes."""
+
+
 def make_exception(response, content, error_info=None, use_json=True):
     """Factory:  create exception based on HTTP response code.
 
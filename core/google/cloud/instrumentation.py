@@ -0,0 +1,582 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Hooks fired around API requests, and client-side request metrics.
+
+A hook is any object defining ``before_request`` and / or
+``after_request`` methods, each taking a :class:`RequestEvent`.  Once
+registered, hooks are called for every JSON API request, every Datastore
+request over HTTP and every gRPC call::
+
+    >>> from google.cloud import instrumentation
+    >>> metrics = instrumentation.RequestMetrics()
+    >>> instrumentation.register(metrics)
+    >>> bucket = client.get_bucket('my-bucket')
+    >>> metrics.snapshot()['https://www.googleapis.com/storage/v1']['count']
+    1
+
+.. note::
+
+   The hooks of a streaming gRPC call are fired once the response stream
+   is exhausted (or fails); its ``request_bytes`` and ``response_bytes``
+   add up all the messages sent and received.
+
+Hooks are called on the thread sending the request, so they should be
+quick and must be thread-safe.  Exceptions raised by hooks are propagated
+to the caller.
+"""
+
+import bisect
+import contextlib
+import threading
+import time
+
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+"""Upper bounds (in seconds) of the latency histogram buckets."""
+
+_NOW = time.time  # To be replaced by tests.
+_EXPORT_THREAD_NAME = 'google.cloud.instrumentation.Exporter'
+
+
+class RequestEvent(object):
+    """Description of a single API request.
+
+    The attributes describing the response are only populated in the
+    event passed to ``after_request``.
+
+    :type api: str
+    :param api: The API endpoint, e.g.
+                ``'https://www.googleapis.com/storage/v1'`` for a JSON API
+                or ``'bigtable.googleapis.com'`` for a gRPC API.
+
+    :type method: str
+    :param method: The HTTP method or the name of the RPC.
+
+    :type url: str
+    :param url: The URL requested (or the full name of the RPC).
+
+    :type url_template: str
+    :param url_template: (Optional) The template used to build ``url``.
+
+    :type request_bytes: int
+    :param request_bytes: (Optional) The size of the request payload.
+    """
+
+    status = None
+    """The response status (HTTP status code or gRPC status code)."""
+
+    response_bytes = 0
+    """The size of the response payload."""
+
+    retries = 0
+    """The number of times the request was retried."""
+
+    latency = None
+    """The wall-clock time taken by the request, in seconds."""
+
+    error = None
+    """The exception raised by the request, if any."""
+
+    def __init__(self, api, method, url, url_template=None,
+                 request_bytes=0):
+        self.api = api
+        self.method = method
+        self.url = url
+        self.url_template = url_template
+        self.request_bytes = request_bytes
+
+    def __repr__(self):
+        return '<RequestEvent %s %s status=%r latency=%r>' % (
+            self.method, self.url, self.status, self.latency)
+
+
+class Hooks(object):
+    """Registry of hooks fired around each request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hooks = ()
+
+    def __len__(self):
+        return len(self._hooks)
+
+    def register(self, hook):
+        """Add a hook to the registry.
+
+        :type hook: object
+        :param hook: An object defining ``before_request`` and / or
+                     ``after_request``.
+        """
+        with self._lock:
+            self._hooks += (hook,)
+
+    def unregister(self, hook):
+        """Remove a hook from the registry.
+
+        :type hook: object
+        :param hook: A previously registered hook.
+
+        :raises: :class:`ValueError` if the hook is not registered.
+        """
+        with self._lock:
+            hooks = list(self._hooks)
+            hooks.remove(hook)
+            self._hooks = tuple(hooks)
+
+    def before_request(self, event):
+        """Fire the ``before_request`` method of each hook.
+
+        :type event: :class:`RequestEvent`
+        :param event: The request about to be sent.
+        """
+        for hook in self._hooks:
+            before_request = getattr(hook, 'before_request', None)
+            if before_request is not None:
+                before_request(event)
+
+    def after_request(self, event):
+        """Fire the ``after_request`` method of each hook.
+
+        :type event: :class:`RequestEvent`
+        :param event: The completed request.
+        """
+        for hook in self._hooks:
+            after_request = getattr(hook, 'after_request', None)
+            if after_request is not None:
+                after_request(event)
+
+    @contextlib.contextmanager
+    def request(self, api, method, url, url_template=None, request_bytes=0):
+        """Context manager firing the hooks around a request.
+
+        The caller should set the ``status``, ``response_bytes`` and
+        ``retries`` of the yielded event; ``latency`` and ``error`` are
+        set on exit.
+
+        :type api: str
+        :param api: The API endpoint.
+
+        :type method: str
+        :param method: The HTTP method or the name of the RPC.
+
+        :type url: str
+        :param url: The URL requested.
+
+        :type url_template: str
+        :param url_template: (Optional) The template used to build ``url``.
+
+        :type request_bytes: int
+        :param request_bytes: (Optional) The size of the request payload.
+
+        :rtype: :class:`RequestEvent`
+        :returns: The event describing the request.
+        """
+        event = RequestEvent(api, method, url, url_template=url_template,
+                             request_bytes=request_bytes)
+        if not self._hooks:
+            yield event
+            return
+
+        self.before_request(event)
+        start = _NOW()
+        try:
+            yield event
+        except Exception as exc:
+            event.error = exc
+            raise
+        finally:
+            event.latency = _NOW() - start
+            self.after_request(event)
+
+
+HOOKS = Hooks()
+"""The hooks fired around every request."""
+
+
+def register(hook):
+    """Register a hook fired around every request.
+
+    :type hook: object
+    :param hook: An object defining ``before_request`` and / or
+                 ``after_request``.
+    """
+    HOOKS.register(hook)
+
+
+def unregister(hook):
+    """Unregister a hook registered with :func:`register`.
+
+    :type hook: object
+    :param hook: A previously registered hook.
+    """
+    HOOKS.unregister(hook)
+
+
+class _APIMetrics(object):
+    """Counters and latency histogram for a single API.
+
+    :type buckets: tuple of float
+    :param buckets: Upper bounds of the histogram buckets.
+    """
+
+    def __init__(self, buckets):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        # One more bucket for latencies above the last bound.
+        self.histogram = [0] * (len(buckets) + 1)
+
+    def add(self, event, buckets):
+        """Account for a completed request.
+
+        :type event: :class:`RequestEvent`
+        :param event: The completed request.
+
+        :type buckets: tuple of float
+        :param buckets: Upper bounds of the histogram buckets.
+        """
+        self.count += 1
+        if event.error is not None or (
+                isinstance(event.status, int) and event.status >= 400):
+            self.errors += 1
+        self.retries += event.retries
+        self.request_bytes += event.request_bytes
+        self.response_bytes += event.response_bytes
+        latency = event.latency or 0.0
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.histogram[bisect.bisect_left(buckets, latency)] += 1
+
+
+class RequestMetrics(object):
+    """Hook aggregating per-API latency histograms and throughput counters.
+
+    :type buckets: tuple of float
+    :param buckets: (Optional) Upper bounds (in seconds) of the latency
+                    histogram buckets. Defaults to
+                    :data:`DEFAULT_LATENCY_BUCKETS`.
+    """
+
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._apis = {}
+        self._since = _NOW()
+        self._exporter = None
+
+    def after_request(self, event):
+        """Account for a completed request.
+
+        :type event: :class:`RequestEvent`
+        :param event: The completed request.
+        """
+        with self._lock:
+            metrics = self._apis.get(event.api)
+            if metrics is None:
+                metrics = self._apis[event.api] = _APIMetrics(self.buckets)
+            metrics.add(event, self.buckets)
+
+    def snapshot(self, reset=False):
+        """Get the metrics aggregated so far.
+
+        :type reset: bool
+        :param reset: (Optional) If True, start aggregating from scratch
+                      once the snapshot is taken.
+
+        :rtype: dict
+        :returns: A mapping from each API to a dictionary holding its
+                  request ``count``, ``errors``, ``retries``,
+                  ``request_bytes``, ``response_bytes``, ``latency_sum``,
+                  ``latency_max``, the ``latency_histogram`` (a list of
+                  ``(upper_bound, count)`` pairs) and the request
+                  ``throughput`` (per second since the last reset).
+        """
+        now = _NOW()
+        with self._lock:
+            apis, since = self._apis, self._since
+            if reset:
+                self._apis, self._since = {}, now
+            else:
+                apis = dict(apis)
+            result = {}
+            elapsed = now - since
+            bounds = self.buckets + (float('inf'),)
+            for api, metrics in apis.items():
+                result[api] = {
+                    'count': metrics.count,
+                    'errors': metrics.errors,
+                    'retries': metrics.retries,
+                    'request_bytes': metrics.request_bytes,
+                    'response_bytes': metrics.response_bytes,
+                    'latency_sum': metrics.latency_sum,
+                    'latency_max': metrics.latency_max,
+                    'latency_histogram': list(
+                        zip(bounds, metrics.histogram)),
+                    'throughput': (
+                        metrics.count / elapsed if elapsed > 0 else 0.0),
+                }
+        return result
+
+    def start_export(self, export, interval=60.0):
+        """Periodically pass snapshots to a callback from a daemon thread.
+
+        Each snapshot resets the metrics, so that each export covers
+        the preceding ``interval``.
+
+        :type export: callable
+        :param export: Callable taking the dictionary returned by
+                       :meth:`snapshot`.
+
+        :type interval: float
+        :param interval: (Optional) Number of seconds between exports.
+
+        :raises: :class:`ValueError` if an export is already running.
+        """
+        if self._exporter is not None:
+            raise ValueError('Export already started')
+        stopped = threading.Event()
+
+        def _run():
+            while not stopped.wait(interval):
+                export(self.snapshot(reset=True))
+
+        thread = threading.Thread(target=_run, name=_EXPORT_THREAD_NAME)
+        thread.daemon = True
+        self._exporter = (thread, stopped)
+        thread.start()
+
+    def stop_export(self):
+        """Stop the export started by :meth:`start_export`, if any."""
+        if self._exporter is not None:
+            thread, stopped = self._exporter
+            self._exporter = None
+            stopped.set()
+            thread.join()
+
+
+_GRPC_STATE = {}
+
+
+def _count_request_bytes(requests, event):
+    """Add the size of each request of a stream to an event.
+
+    :type requests: iterable
+    :param requests: The request messages.
+
+    :type event: :class:`RequestEvent`
+    :param event: The event describing the call.
+
+    :rtype: iterator
+    :returns: The request messages.
+    """
+    for request in requests:
+        event.request_bytes += request.ByteSize()
+        yield request
+
+
+class _ResponseStream(object):
+    """Iterator over the responses of a streaming gRPC call.
+
+    Fires the ``after_request`` hooks once the stream is exhausted or
+    fails.  Other attributes are those of the wrapped call.
+
+    :type call: :class:`grpc.Call`
+    :param call: The call whose responses are iterated over.
+
+    :type event: :class:`RequestEvent`
+    :param event: The event describing the call.
+
+    :type start: float
+    :param start: The time the call was started.
+    """
+
+    def __init__(self, call, event, start):
+        self._call = call
+        self._event = event
+        self._start = start
+        self._finished = False
+
+    def __getattr__(self, name):
+        return getattr(self._call, name)
+
+    def __iter__(self):
+        return self
+
+    def _finish(self, error=None):
+        if self._finished:
+            return
+        self._finished = True
+        event = self._event
+        event.latency = _NOW() - self._start
+        event.error = error
+        code = getattr(error if error is not None else self._call,
+                       'code', None)
+        if code is not None:
+            event.status = code()
+        HOOKS.after_request(event)
+
+    def __next__(self):
+        try:
+            response = next(self._call)
+        except StopIteration:
+            self._finish()
+            raise
+        except Exception as exc:
+            self._finish(exc)
+            raise
+        self._event.response_bytes += response.ByteSize()
+        return response
+
+    next = __next__
+
+
+def _make_interceptor_class():
+    """Create the class of gRPC interceptors firing the hooks.
+
+    :rtype: type
+    :returns: The interceptor class, or :data:`None` if the installed
+              version of gRPC does not support interceptors.
+    """
+    try:
+        import grpc
+    except ImportError:  # pragma: NO COVER
+        return None
+    if not hasattr(grpc, 'intercept_channel'):  # pragma: NO COVER
+        return None
+
+    class _Interceptor(grpc.UnaryUnaryClientInterceptor,
+                       grpc.UnaryStreamClientInterceptor,
+                       grpc.StreamUnaryClientInterceptor,
+                       grpc.StreamStreamClientInterceptor):
+        """Fire the registered hooks around gRPC calls.
+
+        Calls made while no hook is registered are passed through.
+
+        :type api: str
+        :param api: The host serving the API.
+        """
+
+        def __init__(self, api):
+            self._api = api
+
+        def _before(self, client_call_details, request_bytes=0):
+            """Fire the ``before_request`` hooks of a call."""
+            event = RequestEvent(
+                self._api, client_call_details.method.rsplit('/', 1)[-1],
+                client_call_details.method, request_bytes=request_bytes)
+            HOOKS.before_request(event)
+            return event, _NOW()
+
+        @staticmethod
+        def _after_future(call, event, start):
+            """Fire the ``after_request`` hooks once a call completes."""
+
+            def _done(future):
+                event.latency = _NOW() - start
+                event.status = future.code()
+                exception = future.exception()
+                if exception is None:
+                    event.response_bytes = future.result().ByteSize()
+                else:
+                    event.error = exception
+                HOOKS.after_request(event)
+
+            call.add_done_callback(_done)
+            return call
+
+        def intercept_unary_unary(self, continuation, client_call_details,
+                                  request):
+            """Intercept a unary call, firing the hooks around it."""
+            if not HOOKS:
+                return continuation(client_call_details, request)
+            event, start = self._before(
+                client_call_details, request.ByteSize())
+            return self._after_future(
+                continuation(client_call_details, request), event, start)
+
+        def intercept_unary_stream(self, continuation, client_call_details,
+                                   request):
+            """Intercept a response-streaming call."""
+            if not HOOKS:
+                return continuation(client_call_details, request)
+            event, start = self._before(
+                client_call_details, request.ByteSize())
+            return _ResponseStream(
+                continuation(client_call_details, request), event, start)
+
+        def intercept_stream_unary(self, continuation, client_call_details,
+                                   request_iterator):
+            """Intercept a request-streaming call."""
+            if not HOOKS:
+                return continuation(client_call_details, request_iterator)
+            event, start = self._before(client_call_details)
+            requests = _count_request_bytes(request_iterator, event)
+            return self._after_future(
+                continuation(client_call_details, requests), event, start)
+
+        def intercept_stream_stream(self, continuation, client_call_details,
+                                    request_iterator):
+            """Intercept a bidirectional streaming call."""
+            if not HOOKS:
+                return continuation(client_call_details, request_iterator)
+            event, start = self._before(client_call_details)
+            requests = _count_request_bytes(request_iterator, event)
+            return _ResponseStream(
+                continuation(client_call_details, requests), event, start)
+
+    return _Interceptor
+
+
+def _interceptor_class():
+    """The class of gRPC interceptors firing the hooks.
+
+    gRPC is only imported once a channel needs instrumenting.
+
+    :rtype: type
+    :returns: The interceptor class, or :data:`None` if not supported.
+    """
+    if 'interceptor_class' not in _GRPC_STATE:
+        _GRPC_STATE['interceptor_class'] = _make_interceptor_class()
+    return _GRPC_STATE['interceptor_class']
+
+
+def instrument_channel(channel, api):
+    """Fire the registered hooks around the calls of a channel.
+
+    Hooks are looked up on each call, so that hooks registered after the
+    channel is created see its traffic.  The channel is returned unchanged
+    if the installed version of gRPC does not support interceptors.
+
+    :type channel: :class:`grpc.Channel`
+    :param channel: The channel to instrument.
+
+    :type api: str
+    :param api: The host serving the API.
+
+    :rtype: :class:`grpc.Channel`
+    :returns: The (possibly) instrumented channel.
+    """
+    interceptor_class = _interceptor_class()
+    if interceptor_class is None:  # pragma: NO COVER
+        return channel
+
+    import grpc
+
+    return grpc.intercept_channel(channel, interceptor_class(api))
@@ -75,15 +75,56 @@ To consume an entire page::
         <MyItemClass at 0x7fd64a098ed0>,
         <MyItemClass at 0x7fd64a098e90>,
     ]
+
+By default, the next page is only requested once the current one has
+been consumed. To overlap the requests with the processing of results,
+set ``prefetch`` to the number of pages to read ahead, either in the
+constructor or on an iterator returned by a ``list_*`` method before
+it is started::
+
+    >>> iterator = bucket.list_blobs()
+    >>> iterator.prefetch = 2
+    >>> for blob in iterator:
+    ...     process(blob)
+
+The pages are then fetched by a background thread into a bounded queue.
+Errors raised while fetching are re-raised to the consumer when it
+reaches the failed page, and the thread stops once the consumer stops
+iterating. Note that while prefetching, :attr:`Iterator.page_number`,
+:attr:`Iterator.num_results` and :attr:`Iterator.next_page_token`
+describe the pages fetched so far, which may be ahead of those consumed.
+
+Long listings can be checkpointed and resumed, e.g. after a crash or in
+another process. :meth:`Iterator.checkpoint` returns a JSON-serializable
+state, which :meth:`Iterator.resume` applies to a new iterator::
+
+    >>> state = json.dumps(iterator.checkpoint())
+    >>> iterator = bucket.list_blobs().resume(json.loads(state))
+
+When converting items dominates (e.g. for millions of small items),
+pass ``items_to_values`` to convert the items of a page in one call
+rather than calling ``item_to_value`` for each of them::
+
+    >>> def items_to_values(iterator, items):
+    ...     return [MyItemClass.from_api_repr(item) for item in items]
 """
 
 
+import collections
+import sys
+import threading
+
 import six
+from six.moves import queue
+
+from google.cloud.deadline import as_deadline
 
 
 DEFAULT_ITEMS_KEY = 'items'
 """The dictionary key used to retrieve items from each response."""
 
+_PREFETCH_THREAD_NAME = 'google.cloud.iterator.Prefetch'
+
 
 # pylint: disable=unused-argument
 def _do_nothing_page_start(iterator, page, response):
@@ -118,14 +159,23 @@ class Page(object):
                           raw API response into the native object.
                           Assumed signature takes an :class:`Iterator` and a
                           raw API response with a single item.
+
+    :type items_to_values: callable
+    :param items_to_values: (Optional) Callable converting a list of items
+                            at once, used instead of ``item_to_value``.
+                            Assumed signature takes an :class:`Iterator`
+                            and a list of raw items, and returns a list of
+                            native objects, in the same order.
     """
 
-    def __init__(self, parent, items, item_to_value):
+    def __init__(self, parent, items, item_to_value, items_to_values=None):
         self._parent = parent
         self._num_items = len(items)
         self._remaining = self._num_items
         self._item_iter = iter(items)
         self._item_to_value = item_to_value
+        self._items_to_values = items_to_values
+        self._values = collections.deque()
 
     @property
     def num_items(self):
@@ -151,8 +201,11 @@ class Page(object):
 
     def next(self):
         """Get the next value in the page."""
-        item = six.next(self._item_iter)
-        result = self._item_to_value(self._parent, item)
+        if self._items_to_values is None:
+            item = six.next(self._item_iter)
+            result = self._item_to_value(self._parent, item)
+        else:
+            result = self._next_converted()
         # Since we've successfully got the next value from the
         # iterator, we update the number of remaining.
         self._remaining -= 1
@@ -161,6 +214,113 @@ class Page(object):
     # Alias needed for Python 2/3 support.
     __next__ = next
 
+    def _next_converted(self):
+        """Get the next value, converting a batch of items if needed.
+
+        :rtype: object
+        :returns: The next native object in the page.
+        :raises: :class:`StopIteration` if there are no items left.
+        """
+        if not self._values:
+            items = list(self._item_iter)
+            if not items:
+                raise StopIteration
+            self._values.extend(self._items_to_values(self._parent, items))
+        return self._values.popleft()
+
+    @property
+    def _offset(self):
+        """The number of items already consumed from the page.
+
+        :rtype: int
+        :returns: The offset of the next item in the page.
+        """
+        return self._num_items - self._remaining
+
+    def _skip(self, count):
+        """Skip items, without converting them to native objects.
+
+        :type count: int
+        :param count: The number of items to skip.
+        """
+        for _ in six.moves.range(count):
+            if self._values:
+                self._values.popleft()
+                self._remaining -= 1
+                continue
+            try:
+                six.next(self._item_iter)
+            except StopIteration:
+                return
+            self._remaining -= 1
+
+
+class _PrefetchWorker(object):
+    """Fetch pages of an :class:`Iterator` ahead of its consumer.
+
+    Pages are requested by a background thread and handed over through a
+    queue holding at most ``depth`` pages.
+
+    :type iterator: :class:`Iterator`
+    :param iterator: The iterator whose pages are fetched.
+
+    :type depth: int
+    :param depth: The maximum number of pages fetched ahead.
+    """
+
+    def __init__(self, iterator, depth):
+        self._iterator = iterator
+        self._queue = queue.Queue(maxsize=depth)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=_PREFETCH_THREAD_NAME)
+        self._thread.daemon = True
+
+    def _run(self):
+        """The entry point for the worker thread.
+
+        Does the page / result accounting usually done by the consumer,
+        since it is needed to request the following pages.
+        """
+        iterator = self._iterator
+        try:
+            page = iterator._fetch_page()
+            while page is not None:
+                iterator.page_number += 1
+                iterator.num_results += page.remaining
+                self._queue.put((page, None))
+                if self._stopped.is_set():
+                    return
+                page = iterator._fetch_page()
+        except Exception:  # pylint: disable=broad-except
+            self._queue.put((None, sys.exc_info()))
+        else:
+            self._queue.put((None, None))
+
+    def pages(self):
+        """Generator of the pages fetched by the worker thread.
+
+        Starts the thread on first use, and stops it once the generator
+        is exhausted or closed.
+
+        Yields :class:`Page` instances.
+        """
+        self._thread.start()
+        try:
+            while True:
+                page, exc_info = self._queue.get()
+                if exc_info is not None:
+                    six.reraise(*exc_info)
+                if page is None:
+                    return
+                yield page
+        finally:
+            self._stopped.set()
+            # Make room in the queue so that a blocked worker can see the
+            # stop request (it puts at most one more page).
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
 
 class Iterator(object):
     """A generic class for iterating through API list responses.
@@ -179,18 +339,97 @@ class Iterator(object):
 
     :type max_results: int
     :param max_results: (Optional) The maximum number of results to fetch.
+
+    :type prefetch: int
+    :param prefetch: (Optional) The number of pages to fetch ahead on a
+                     background thread. Defaults to ``0``, which fetches
+                     each page only when it is needed.
+
+    :type items_to_values: callable
+    :param items_to_values: (Optional) Callable converting the raw items of
+                            a page in a single call, used instead of
+                            ``item_to_value``. Assumed signature takes an
+                            :class:`Iterator` and a list of raw items, and
+                            returns a list of native objects in the same
+                            order.
     """
 
     def __init__(self, client, item_to_value,
-                 page_token=None, max_results=None):
+                 page_token=None, max_results=None, prefetch=0,
+                 items_to_values=None):
         self._started = False
         self.client = client
         self._item_to_value = item_to_value
+        self._items_to_values = items_to_values
         self.max_results = max_results
+        self.prefetch = prefetch
         # The attributes below will change over the life of the iterator.
         self.page_number = 0
         self.next_page_token = page_token
         self.num_results = 0
+        # Consumer-side state, recorded by checkpoints.
+        self._page = None
+        self._page_token = page_token
+        self._results_before_page = 0
+        self._skip_items = 0
+
+    def checkpoint(self):
+        """Capture the position of the consumer of the iterator.
+
+        The state is JSON-serializable, and can be passed to
+        :meth:`resume` on a new iterator over the same listing (possibly in
+        another process) to continue from the next item not yet consumed::
+
+            >>> iterator = bucket.list_blobs()
+            >>> for blob in iterator:
+            ...     process(blob)
+            ...     save(iterator.checkpoint())
+            ...
+            >>> iterator = bucket.list_blobs().resume(load())
+
+        When iterating over :attr:`pages`, all the items of the pages
+        before the current one count as consumed.
+
+        :rtype: dict
+        :returns: The token of the current page (``page_token``), the
+                  number of items consumed from that page (``offset``)
+                  and the total number of items consumed
+                  (``num_results``).
+        """
+        page = self._page
+        if page is None:
+            token, offset = self._page_token, self._skip_items
+        else:
+            token, offset = page._page_token, page._offset
+        if isinstance(token, six.binary_type):
+            token = token.decode('ascii')
+        return {
+            'page_token': token,
+            'offset': offset,
+            'num_results': self._results_before_page + offset,
+        }
+
+    def resume(self, state):
+        """Continue iterating from a checkpoint.
+
+        The page holding the next item is fetched again, and the items
+        already consumed from it are skipped.
+
+        :type state: dict
+        :param state: A state returned by :meth:`checkpoint`.
+
+        :rtype: :class:`Iterator`
+        :returns: This iterator.
+        :raises ValueError: If the iterator has already been started.
+        """
+        if self._started:
+            raise ValueError('Iterator has already started', self)
+        offset = state['offset']
+        self.next_page_token = self._page_token = state['page_token']
+        self.num_results = state['num_results'] - offset
+        self._results_before_page = self.num_results
+        self._skip_items = offset
+        return self
 
     @property
     def pages(self):
@@ -207,9 +446,12 @@ class Iterator(object):
 
     def _items_iter(self):
         """Iterator for each item returned."""
+        # When prefetching, results are counted as their page is fetched.
+        count_items = not self.prefetch
         for page in self._page_iter(increment=False):
             for item in page:
-                self.num_results += 1
+                if count_items:
+                    self.num_results += 1
                 yield item
 
     def __iter__(self):
@@ -236,13 +478,84 @@ class Iterator(object):
 
         Yields :class:`Page` instances.
         """
-        page = self._next_page()
+        if self.prefetch:
+            pages = _PrefetchWorker(self, self.prefetch).pages()
+            try:
+                for page in pages:
+                    self._consume_page(page)
+                    yield page
+            finally:
+                pages.close()
+            return
+
+        page = self._fetch_page()
         while page is not None:
             self.page_number += 1
             if increment:
-                self.num_results += page.num_items
+                self.num_results += page.remaining
+            self._consume_page(page)
             yield page
-            page = self._next_page()
+            page = self._fetch_page()
+
+    def _fetch_page(self):
+        """Get the next page, recording the token used to request it.
+
+        After :meth:`resume`, skips the items already consumed from the
+        first page (counting them as results).
+
+        :rtype: :class:`Page`
+        :returns: The next page in the iterator (or :data:`None` if
+                  there are no pages left).
+        """
+        page_token = self.next_page_token
+        return self._prepare_page(self._next_page(), page_token)
+
+    def _prepare_page(self, page, page_token):
+        """Record the token used to request a page, and skip resumed items.
+
+        :type page: :class:`Page`
+        :param page: The page just fetched (or :data:`None`).
+
+        :type page_token: str
+        :param page_token: The token used to request the page.
+
+        :rtype: :class:`Page`
+        :returns: The page passed in.
+        """
+        if page is not None:
+            page._page_token = page_token
+            if self._skip_items:
+                page._skip(self._skip_items)
+                self.num_results += self._skip_items
+                self._skip_items = 0
+        return page
+
+    def _consume_page(self, page):
+        """Record that the consumer moved on to a new page.
+
+        :type page: :class:`Page`
+        :param page: The page handed to the consumer.
+        """
+        if self._page is not None:
+            self._results_before_page += self._page.num_items
+        self._page = page
+
+    def _new_page(self, page_class, items):
+        """Create a page converting its items with this iterator's callables.
+
+        :type page_class: type
+        :param page_class: The class of the page, e.g. :class:`Page`.
+
+        :type items: iterable
+        :param items: The raw items of the page.
+
+        :rtype: :class:`Page`
+        :returns: The new page.
+        """
+        if self._items_to_values is None:
+            return page_class(self, items, self._item_to_value)
+        return page_class(self, items, self._item_to_value,
+                          items_to_values=self._items_to_values)
 
     @staticmethod
     def _next_page():
@@ -292,6 +605,22 @@ class HTTPIterator(Iterator):
                        the :class:`Page` that was started and the dictionary
                        containing the page response.
 
+    :type prefetch: int
+    :param prefetch: (Optional) The number of pages to fetch ahead on a
+                     background thread.
+
+    :type timeout: float or :class:`~google.cloud.deadline.Deadline`
+    :param timeout: (Optional) The number of seconds, from the first
+                    request, before fetching the pages times out. Each
+                    page request only gets the time remaining. Defaults to
+                    the timeout of each request of the connection.
+
+    :type items_to_values: callable
+    :param items_to_values: (Optional) Callable converting the items of a
+                            page in a single call, used instead of
+                            ``item_to_value``. Assumed signature takes an
+                            :class:`Iterator` and a list of dictionaries.
+
     .. autoattribute:: pages
     """
 
@@ -304,14 +633,18 @@ class HTTPIterator(Iterator):
     def __init__(self, client, path, item_to_value,
                  items_key=DEFAULT_ITEMS_KEY,
                  page_token=None, max_results=None, extra_params=None,
-                 page_start=_do_nothing_page_start):
+                 page_start=_do_nothing_page_start, prefetch=0,
+                 timeout=None, items_to_values=None):
         super(HTTPIterator, self).__init__(
             client, item_to_value, page_token=page_token,
-            max_results=max_results)
+            max_results=max_results, prefetch=prefetch,
+            items_to_values=items_to_values)
         self.path = path
         self._items_key = items_key
         self.extra_params = extra_params
         self._page_start = page_start
+        self._timeout = timeout
+        self._deadline = None
         # Verify inputs / provide defaults.
         if self.extra_params is None:
             self.extra_params = {}
@@ -337,14 +670,25 @@ class HTTPIterator(Iterator):
         """
         if self._has_next_page():
             response = self._get_next_page_response()
-            items = response.get(self._items_key, ())
-            page = Page(self, items, self._item_to_value)
-            self._page_start(self, page, response)
-            self.next_page_token = response.get(self._NEXT_TOKEN)
-            return page
+            return self._make_page(response)
         else:
             return None
 
+    def _make_page(self, response):
+        """Wrap the response for a page and capture its next page token.
+
+        :type response: dict
+        :param response: The parsed JSON response of a page.
+
+        :rtype: :class:`Page`
+        :returns: The page holding the items in ``response``.
+        """
+        items = response.get(self._items_key, ())
+        page = self._new_page(Page, items)
+        self._page_start(self, page, response)
+        self.next_page_token = response.get(self._NEXT_TOKEN)
+        return page
+
     def _has_next_page(self):
         """Determines whether or not there are more pages with results.
 
@@ -381,16 +725,21 @@ class HTTPIterator(Iterator):
         :returns: The parsed JSON response of the next page's contents.
         """
         params = self._get_query_params()
+        kwargs = {}
+        if self._timeout is not None:
+            if self._deadline is None:
+                self._deadline = as_deadline(self._timeout)
+            kwargs['timeout'] = self._deadline
         if self._HTTP_METHOD == 'GET':
             return self.client._connection.api_request(
                 method=self._HTTP_METHOD,
                 path=self.path,
-                query_params=params)
+                query_params=params, **kwargs)
         elif self._HTTP_METHOD == 'POST':
             return self.client._connection.api_request(
                 method=self._HTTP_METHOD,
                 path=self.path,
-                data=params)
+                data=params, **kwargs)
         else:
             raise ValueError('Unexpected HTTP method', self._HTTP_METHOD)
 
@@ -414,15 +763,41 @@ class GAXIterator(Iterator):
     :type max_results: int
     :param max_results: (Optional) The maximum number of results to fetch.
 
+    :type prefetch: int
+    :param prefetch: (Optional) The number of pages to fetch ahead on a
+                     background thread.
+
+    :type items_to_values: callable
+    :param items_to_values: (Optional) Callable converting the items of a
+                            page in a single call, used instead of
+                            ``item_to_value``. Assumed signature takes an
+                            :class:`Iterator` and a list of protobufs.
+
     .. autoattribute:: pages
     """
 
-    def __init__(self, client, page_iter, item_to_value, max_results=None):
+    def __init__(self, client, page_iter, item_to_value, max_results=None,
+                 prefetch=0, items_to_values=None):
         super(GAXIterator, self).__init__(
             client, item_to_value, page_token=page_iter.page_token,
-            max_results=max_results)
+            max_results=max_results, prefetch=prefetch,
+            items_to_values=items_to_values)
         self._gax_page_iter = page_iter
 
+    def resume(self, state):
+        """Continue iterating from a checkpoint.
+
+        :type state: dict
+        :param state: A state returned by :meth:`checkpoint`.
+
+        :rtype: :class:`GAXIterator`
+        :returns: This iterator.
+        :raises ValueError: If the iterator has already been started.
+        """
+        super(GAXIterator, self).resume(state)
+        self._gax_page_iter.page_token = state['page_token']
+        return self
+
     def _next_page(self):
         """Get the next page in the iterator.
 
@@ -435,7 +810,7 @@ class GAXIterator(Iterator):
         """
         try:
             items = six.next(self._gax_page_iter)
-            page = Page(self, items, self._item_to_value)
+            page = self._new_page(Page, items)
             self.next_page_token = self._gax_page_iter.page_token or None
             return page
         except StopIteration:
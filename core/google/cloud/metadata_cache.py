@@ -0,0 +1,244 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Conditional reloads of resource metadata.
+
+Setting a :class:`MetadataCache` on a client makes the ``reload()``
+methods of its resources (storage buckets and blobs, BigQuery datasets
+and tables, DNS zones) remember the last properties fetched, along with
+their ``etag``::
+
+    >>> from google.cloud.metadata_cache import MetadataCache
+    >>> client.metadata_cache = MetadataCache(max_size=500, ttl=60.0)
+
+The next reload of the same resource sends ``If-None-Match``: if the
+resource is unchanged, the server answers ``304 Not Modified`` with an
+empty body and the cached properties are used.  As the server checks the
+``etag``, a reload never returns stale properties.
+
+Entries expire after ``ttl`` seconds, the least recently used ones are
+evicted beyond ``max_size``, and entries are dropped when the client
+patches or deletes their resource.  Resources without an ``etag`` are
+never cached.
+"""
+
+import collections
+import copy
+import threading
+import time
+
+from google.cloud.exceptions import NotModified
+
+
+_NOW = time.time  # To be replaced by tests.
+
+_Entry = collections.namedtuple(
+    '_Entry', ['query_params', 'etag', 'properties', 'stored_at'])
+
+
+def _query_key(query_params):
+    """Convert query parameters to a hashable, comparable value.
+
+    :type query_params: dict
+    :param query_params: (Optional) The query parameters of a request.
+
+    :rtype: tuple
+    :returns: The sorted items of the query parameters.
+    """
+    return tuple(sorted((query_params or {}).items()))
+
+
+class MetadataCache(object):
+    """Thread-safe LRU cache of resource properties, keyed by path.
+
+    :type max_size: int
+    :param max_size: (Optional) The maximum number of resources cached.
+
+    :type ttl: float
+    :param ttl: (Optional) The number of seconds an entry is kept without
+                being revalidated. If :data:`None`, entries never expire.
+    """
+
+    def __init__(self, max_size=1000, ttl=300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, path, query_params):
+        """Find the live entry for a resource.
+
+        :type path: str
+        :param path: The path of the resource.
+
+        :type query_params: dict
+        :param query_params: (Optional) The query parameters of the request.
+
+        :rtype: :class:`_Entry`
+        :returns: The entry, or :data:`None` if missing, expired or stored
+                  for other query parameters.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            if (self.ttl is not None and
+                    _NOW() - entry.stored_at >= self.ttl):
+                del self._entries[path]
+                return None
+            if entry.query_params != _query_key(query_params):
+                return None
+            return entry
+
+    def _store(self, path, query_params, etag, properties):
+        """Store (or refresh) the entry of a resource as most recently used.
+
+        :type path: str
+        :param path: The path of the resource.
+
+        :type query_params: dict
+        :param query_params: (Optional) The query parameters of the request.
+
+        :type etag: str
+        :param etag: The ``etag`` of the properties.
+
+        :type properties: dict
+        :param properties: The properties of the resource.
+        """
+        entry = _Entry(_query_key(query_params), etag, properties, _NOW())
+        with self._lock:
+            self._entries.pop(path, None)
+            self._entries[path] = entry
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path):
+        """Drop the entry of a resource.
+
+        :type path: str
+        :param path: The path of the resource.
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_resource(self, connection, path, query_params=None, **kwargs):
+        """Fetch the properties of a resource with a conditional ``GET``.
+
+        :type connection: :class:`~google.cloud._http.JSONConnection`
+        :param connection: The connection sending the request.
+
+        :type path: str
+        :param path: The path of the resource.
+
+        :type query_params: dict
+        :param query_params: (Optional) The query parameters of the request.
+
+        :type kwargs: dict
+        :param kwargs: (Optional) Other arguments passed to
+                       :meth:`~google.cloud._http.JSONConnection.api_request`.
+
+        :rtype: dict
+        :returns: The properties of the resource, owned by the caller.
+        """
+        entry = self._lookup(path, query_params)
+        headers = None
+        if entry is not None:
+            headers = {'If-None-Match': entry.etag}
+        try:
+            api_response = connection.api_request(
+                method='GET', path=path, query_params=query_params,
+                headers=headers, **kwargs)
+        except NotModified:
+            if entry is None:
+                raise
+            self._store(path, query_params, entry.etag, entry.properties)
+            return copy.deepcopy(entry.properties)
+
+        if isinstance(api_response, dict) and 'etag' in api_response:
+            self._store(path, query_params, api_response['etag'],
+                        copy.deepcopy(api_response))
+        else:
+            self.invalidate(path)
+        return api_response
+
+
+def _cache_for(client):
+    """Get the metadata cache to use for a client's requests.
+
+    :type client: :class:`~google.cloud.client.Client`
+    :param client: The client sending the requests.
+
+    :rtype: :class:`MetadataCache`
+    :returns: The client's cache, or :data:`None` if it has none or if its
+              current connection does not support it (e.g. a batch).
+    """
+    cache = getattr(client, 'metadata_cache', None)
+    if cache is None:
+        return None
+    if not getattr(client._connection, 'cache_metadata', True):
+        return None
+    return cache
+
+
+def reload_resource(client, path, query_params=None, **kwargs):
+    """Fetch the properties of a resource, using the client's cache if any.
+
+    :type client: :class:`~google.cloud.client.Client`
+    :param client: The client sending the request.
+
+    :type path: str
+    :param path: The path of the resource.
+
+    :type query_params: dict
+    :param query_params: (Optional) The query parameters of the request.
+
+    :type kwargs: dict
+    :param kwargs: (Optional) Other arguments passed to
+                   :meth:`~google.cloud._http.JSONConnection.api_request`.
+
+    :rtype: dict
+    :returns: The properties of the resource.
+    """
+    cache = _cache_for(client)
+    if cache is None:
+        if query_params is not None:
+            kwargs['query_params'] = query_params
+        return client._connection.api_request(
+            method='GET', path=path, **kwargs)
+    return cache.get_resource(
+        client._connection, path, query_params=query_params, **kwargs)
+
+
+def invalidate_resource(client, path):
+    """Drop a resource from the client's cache, if any.
+
+    Called when the client patches, updates or deletes the resource.
+
+    :type client: :class:`~google.cloud.client.Client`
+    :param client: The client changing the resource.
+
+    :type path: str
+    :param path: The path of the resource.
+    """
+    cache = getattr(client, 'metadata_cache', None)
+    if cache is not None:
+        cache.invalidate(path)
@@ -12,14 +12,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Wrap long-running operations returned from Google Cloud APIs."""
+"""Wrap long-running operations returned from Google Cloud APIs.
+
+Many operations can be waited for at once, polling each of them with an
+exponential backoff on a shared schedule::
+
+    >>> from google.cloud.operation import as_completed
+    >>> for operation in as_completed(operations, timeout=600):
+    ...     print(operation.name, operation.response)
+
+or::
+
+    >>> from google.cloud.operation import FIRST_COMPLETED, wait
+    >>> done, not_done = wait(operations, return_when=FIRST_COMPLETED)
+"""
+
+import functools
+import heapq
+import time
 
 from google.longrunning import operations_pb2
 from google.protobuf import json_format
 
+from google.cloud._helpers import grpc
+from google.cloud.exceptions import DeadlineExceeded
+
 
 _GOOGLE_APIS_PREFIX = 'type.googleapis.com'
 
+FIRST_COMPLETED = 'FIRST_COMPLETED'
+"""Make :func:`wait` return as soon as any operation completes."""
+
+ALL_COMPLETED = 'ALL_COMPLETED'
+"""Make :func:`wait` return once all operations have completed."""
+
+_COALESCE_FRACTION = 0.1
+"""Fraction of its polling interval by which an operation may be polled
+early, so that it shares a wake-up with other operations."""
+
+_NOW = time.time  # To be replaced by tests.
+_SLEEP = time.sleep  # To be replaced by tests.
+
 _TYPE_URL_MAP = {
 }
 
@@ -198,41 +231,67 @@ class Operation(object):
         """
         return self._complete
 
-    def _get_operation_rpc(self):
+    def _get_operation_rpc(self, timeout=None):
         """Polls the status of the current operation.
 
         Uses gRPC request to check.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: :class:`~google.longrunning.operations_pb2.Operation`
         :returns: The latest status of the current operation.
+        :raises: :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 request timed out.
         """
         request_pb = operations_pb2.GetOperationRequest(name=self.name)
-        return self.client._operations_stub.GetOperation(request_pb)
-
-    def _get_operation_http(self):
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        try:
+            return self.client._operations_stub.GetOperation(
+                request_pb, **kwargs)
+        except grpc.RpcError as exc:
+            if exc.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                raise DeadlineExceeded(exc.details())
+            raise
+
+    def _get_operation_http(self, timeout=None):
         """Checks the status of the current operation.
 
         Uses HTTP request to check.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: :class:`~google.longrunning.operations_pb2.Operation`
         :returns: The latest status of the current operation.
         """
         path = 'operations/%s' % (self.name,)
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
         api_response = self.client._connection.api_request(
-            method='GET', path=path)
+            method='GET', path=path, **kwargs)
         return json_format.ParseDict(
             api_response, operations_pb2.Operation())
 
-    def _get_operation(self):
+    def _get_operation(self, timeout=None):
         """Checks the status of the current operation.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: :class:`~google.longrunning.operations_pb2.Operation`
         :returns: The latest status of the current operation.
         """
         if self._from_grpc:
-            return self._get_operation_rpc()
+            return self._get_operation_rpc(timeout=timeout)
         else:
-            return self._get_operation_http()
+            return self._get_operation_http(timeout=timeout)
 
     def _update_state(self, operation_pb):
         """Update the state of the current object based on operation.
@@ -253,18 +312,224 @@ class Operation(object):
         elif result_type == 'response':
             self.response = _from_any(operation_pb.response)
 
-    def poll(self):
+    def poll(self, timeout=None):
         """Check if the operation has finished.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        checking the status of the operation times out.
+
         :rtype: bool
         :returns: A boolean indicating if the current operation has completed.
         :raises: :class:`~exceptions.ValueError` if the operation
-                 has already completed.
+                 has already completed, or
+                 :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 request timed out.
         """
         if self.complete:
             raise ValueError('The operation has completed.')
 
-        operation_pb = self._get_operation()
+        operation_pb = self._get_operation(timeout=timeout)
         self._update_state(operation_pb)
 
         return self.complete
+
+
+def _poll(operation):
+    """Poll an operation (a helper for ``executor.map``).
+
+    :type operation: :class:`Operation`
+    :param operation: The operation to poll.
+
+    :rtype: bool
+    :returns: True if the operation has completed.
+    """
+    return operation.poll()
+
+
+def _poll_before(deadline, operation):
+    """Poll an operation, with the time remaining before a deadline.
+
+    :type deadline: float
+    :param deadline: The time (as returned by :func:`time.time`) by which
+                     the poll must complete.
+
+    :type operation: :class:`Operation`
+    :param operation: The operation to poll.
+
+    :rtype: bool
+    :returns: True if the operation has completed; False if not, or if the
+              poll timed out.
+    """
+    remaining = deadline - _NOW()
+    if remaining <= 0.0:
+        return False
+    try:
+        return operation.poll(timeout=remaining)
+    except DeadlineExceeded:
+        return False
+
+
+def _completions(operations, timeout, initial_delay, max_delay,
+                 multiplier, executor):
+    """Generator of operations, as they complete.
+
+    See :func:`as_completed` for the arguments.
+
+    Stops once all operations are complete, or once no operation can be
+    polled before the timeout expires.  Each poll only gets the time
+    remaining before the timeout expires.
+
+    Yields :class:`Operation` instances.
+    """
+    start = _NOW()
+    if timeout is None:
+        deadline = None
+        poll = _poll
+    else:
+        deadline = start + timeout
+        poll = functools.partial(_poll_before, deadline)
+    # Heap of (due time, insertion order, delay, operation).
+    schedule = []
+    for index, operation in enumerate(operations):
+        if operation.complete:
+            yield operation
+        else:
+            schedule.append((start + initial_delay, index,
+                             initial_delay, operation))
+    heapq.heapify(schedule)
+
+    while schedule:
+        due = schedule[0][0]
+        if deadline is not None and due > deadline:
+            _SLEEP(max(0.0, deadline - _NOW()))
+            return
+        now = _NOW()
+        if due > now:
+            _SLEEP(due - now)
+            now = due
+
+        batch = []
+        while schedule:
+            due, index, delay, operation = schedule[0]
+            if due > now + _COALESCE_FRACTION * delay:
+                break
+            heapq.heappop(schedule)
+            batch.append((index, delay, operation))
+
+        polling = [operation for _, _, operation in batch]
+        if executor is None:
+            results = [poll(operation) for operation in polling]
+        else:
+            results = list(executor.map(poll, polling))
+
+        polled = _NOW()
+        for (index, delay, operation), complete in zip(batch, results):
+            if complete:
+                yield operation
+            else:
+                delay = min(delay * multiplier, max_delay)
+                heapq.heappush(schedule,
+                               (polled + delay, index, delay, operation))
+
+
+def as_completed(operations, timeout=None, initial_delay=1.0,
+                 max_delay=60.0, multiplier=2.0, executor=None):
+    """Wait for operations, yielding each one as it completes.
+
+    Each pending operation is polled after ``initial_delay`` seconds, then
+    at intervals growing by ``multiplier`` (up to ``max_delay``).  Polls of
+    operations due at about the same time share a single wake-up.
+
+    :type operations: iterable of :class:`Operation`
+    :param operations: The operations to wait for.
+
+    :type timeout: float
+    :param timeout: (Optional) The maximum number of seconds to wait. If
+                    :data:`None`, wait until all operations complete.
+
+    :type initial_delay: float
+    :param initial_delay: (Optional) Seconds before the first poll.
+
+    :type max_delay: float
+    :param max_delay: (Optional) Maximum number of seconds between two
+                      polls of an operation.
+
+    :type multiplier: float
+    :param multiplier: (Optional) Factor by which the interval between two
+                       polls of an operation grows.
+
+    :type executor: :class:`concurrent.futures.Executor`
+    :param executor: (Optional) Executor used to send the polls due at the
+                     same time in parallel. Defaults to polling them
+                     one after the other.
+
+    :rtype: :class:`~types.GeneratorType`
+    :returns: A generator of completed :class:`Operation` instances.
+    :raises: :class:`~google.cloud.exceptions.DeadlineExceeded` if
+             operations are still pending once ``timeout`` expires.
+    """
+    operations = list(operations)
+    pending = set(operations)
+    for operation in _completions(operations, timeout, initial_delay,
+                                  max_delay, multiplier, executor):
+        pending.discard(operation)
+        yield operation
+    if pending:
+        raise DeadlineExceeded(
+            '%d operation(s) still pending after %r seconds' % (
+                len(pending), timeout))
+
+
+def wait(operations, timeout=None, return_when=ALL_COMPLETED,
+         initial_delay=1.0, max_delay=60.0, multiplier=2.0, executor=None):
+    """Wait for operations to complete.
+
+    See :func:`as_completed` for the polling schedule.
+
+    :type operations: iterable of :class:`Operation`
+    :param operations: The operations to wait for.
+
+    :type timeout: float
+    :param timeout: (Optional) The maximum number of seconds to wait. If
+                    :data:`None`, there is no limit.
+
+    :type return_when: str
+    :param return_when: (Optional) Either :data:`ALL_COMPLETED` (the
+                        default) or :data:`FIRST_COMPLETED`.
+
+    :type initial_delay: float
+    :param initial_delay: (Optional) Seconds before the first poll.
+
+    :type max_delay: float
+    :param max_delay: (Optional) Maximum number of seconds between two
+                      polls of an operation.
+
+    :type multiplier: float
+    :param multiplier: (Optional) Factor by which the interval between two
+                       polls of an operation grows.
+
+    :type executor: :class:`concurrent.futures.Executor`
+    :param executor: (Optional) Executor used to send the polls due at the
+                     same time in parallel.
+
+    :rtype: tuple
+    :returns: A pair of sets: the completed operations and the pending
+              ones (which is non-empty only if the ``timeout`` expired or
+              ``return_when`` is :data:`FIRST_COMPLETED`).
+    :raises: :class:`ValueError` if ``return_when`` is invalid.
+    """
+    if return_when not in (FIRST_COMPLETED, ALL_COMPLETED):
+        raise ValueError('Invalid return_when', return_when)
+
+    operations = list(operations)
+    completions = _completions(operations, timeout, initial_delay,
+                               max_delay, multiplier, executor)
+    for _ in completions:
+        if return_when == FIRST_COMPLETED:
+            completions.close()
+            break
+
+    # Operations polled along with the first one may have completed too.
+    done = set(operation for operation in operations if operation.complete)
+    return done, set(operations) - done
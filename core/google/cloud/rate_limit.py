@@ -0,0 +1,357 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side rate limiting of API requests.
+
+A :class:`RateLimiter` spaces out the requests sent by a connection (and
+by every thread sharing it) so that they stay under a quota, rather than
+failing with ``429 Too Many Requests``::
+
+    >>> from google.cloud.rate_limit import RateLimiter
+    >>> client._connection.rate_limiter = RateLimiter(
+    ...     10.0, method_rates={'POST /images:annotate': 2.0}, adaptive=True)
+
+Each request (and each retry) takes a token from a bucket refilled at
+``rate`` tokens per second and holding at most ``burst`` tokens: when
+the bucket is empty, the request waits for its turn.  Requests matching
+a key of ``method_rates`` use a bucket of their own.  A key names an API
+method by its HTTP method and path, relative to the API version, with
+shell-style wildcards (e.g. ``'POST /projects/*/managedZones/*/changes'``).
+A key without a path (e.g. ``'POST'``) matches any path.
+
+In adaptive mode, the rate of a bucket is halved whenever a ``429``
+response comes back, then creeps back up towards its configured value
+as requests succeed.
+"""
+
+import fnmatch
+import re
+import threading
+import time
+
+from google.cloud.exceptions import DeadlineExceeded
+
+
+_NOW = time.time  # To be replaced by tests.
+_SLEEP = time.sleep  # To be replaced by tests.
+
+DEFAULT_KEY = '*'
+"""Key of the bucket shared by methods without a rate of their own."""
+
+_TOO_MANY_REQUESTS = 429
+
+
+def _parse_key(key):
+    """Parse a key of ``method_rates``.
+
+    :type key: str
+    :param key: An HTTP method, optionally followed by a path pattern.
+
+    :rtype: tuple
+    :returns: The normalized key, and a compiled regular expression
+              matching ``'METHOD /path'`` strings.
+    """
+    method, _, path = key.strip().partition(' ')
+    method = method.upper()
+    path = path.strip()
+    if not path:
+        return method, re.compile(re.escape(method + ' '))
+    key = '%s %s' % (method, path)
+    return key, re.compile(fnmatch.translate(key))
+
+
+class _TokenBucket(object):
+    """Tokens refilled at a (possibly varying) rate.
+
+    :type rate: float
+    :param rate: The configured number of tokens added per second.
+
+    :type burst: float
+    :param burst: The maximum number of tokens held.
+    """
+
+    def __init__(self, rate, burst):
+        self.max_rate = self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = self.burst
+        self.updated = _NOW()
+        self.requests = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.throttled = 0
+
+    def _refill(self, now):
+        """Add the tokens accumulated since the last update.
+
+        :type now: float
+        :param now: The current time.
+        """
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def reserve(self, deadline=None):
+        """Take a token, possibly ahead of its refill.
+
+        :type deadline: :class:`~google.cloud.deadline.Deadline`
+        :param deadline: (Optional) The deadline of the request.
+
+        :rtype: float
+        :returns: The number of seconds to wait before the token is
+                  available.
+        :raises: :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 deadline would expire first.
+        """
+        self._refill(_NOW())
+        wait = 0.0
+        if self.tokens < 1.0:
+            wait = (1.0 - self.tokens) / self.rate
+            if deadline is not None and wait >= deadline.remaining():
+                raise DeadlineExceeded(
+                    'Deadline of %r seconds exceeded waiting for the rate '
+                    'limit' % (deadline.timeout,))
+            self.delayed += 1
+            self.wait_seconds += wait
+        self.tokens -= 1.0
+        self.requests += 1
+        return wait
+
+    def adapt(self, throttled, decrease, increase):
+        """Adjust the rate after a response.
+
+        :type throttled: bool
+        :param throttled: Whether the response was a ``429``.
+
+        :type decrease: float
+        :param decrease: The factor applied to the rate when throttled.
+
+        :type increase: float
+        :param increase: The fraction of the configured rate added back
+                         after a successful response.
+        """
+        self._refill(_NOW())
+        if throttled:
+            self.throttled += 1
+            self.rate = max(self.max_rate * 0.01, self.rate * decrease)
+        else:
+            self.rate = min(self.max_rate,
+                            self.rate + self.max_rate * increase)
+
+
+class RateLimiter(object):
+    """Token-bucket rate limiter, shared by the threads of a connection.
+
+    :type rate: float
+    :param rate: The number of requests allowed per second.
+
+    :type burst: float
+    :param burst: (Optional) The number of requests which may be sent at
+                  once after a quiet period. Defaults to ``rate`` (but at
+                  least one).
+
+    :type method_rates: dict
+    :param method_rates: (Optional) Rates (requests per second) of API
+                         methods limited separately, by ``'METHOD /path'``
+                         pattern, e.g. ``{'POST /images:annotate': 2.0}``.
+                         If several patterns match a request, the longest
+                         one applies.
+
+    :type adaptive: bool
+    :param adaptive: (Optional) Whether to lower the rate when requests
+                     are throttled by the server.
+
+    :type decrease: float
+    :param decrease: (Optional) In adaptive mode, the factor applied to
+                     the rate on each ``429`` response.
+
+    :type increase: float
+    :param increase: (Optional) In adaptive mode, the fraction of the
+                     configured rate added back on each other response.
+    """
+
+    def __init__(self, rate, burst=None, method_rates=None, adaptive=False,
+                 decrease=0.5, increase=0.05):
+        self.adaptive = adaptive
+        self.decrease = decrease
+        self.increase = increase
+        self._lock = threading.Lock()
+        self._buckets = {DEFAULT_KEY: self._make_bucket(rate, burst)}
+        self._patterns = []
+        for key, method_rate in (method_rates or {}).items():
+            key, pattern = _parse_key(key)
+            self._buckets[key] = self._make_bucket(method_rate, burst)
+            self._patterns.append((key, pattern))
+        # Most specific (longest) pattern first.
+        self._patterns.sort(key=lambda item: (-len(item[0]), item[0]))
+
+    @staticmethod
+    def _make_bucket(rate, burst):
+        """Create a token bucket.
+
+        :type rate: float
+        :param rate: The number of requests allowed per second.
+
+        :type burst: float
+        :param burst: The size of the bucket, or :data:`None` to derive it
+                      from ``rate``.
+
+        :rtype: :class:`_TokenBucket`
+        :returns: The new (full) bucket.
+        """
+        if rate <= 0:
+            raise ValueError('Rate must be positive', rate)
+        if burst is None:
+            burst = max(1.0, rate)
+        return _TokenBucket(rate, burst)
+
+    def _bucket(self, method, path):
+        """Find the bucket limiting an API method.
+
+        :type method: str
+        :param method: The HTTP method of a request.
+
+        :type path: str
+        :param path: The path of the request, or :data:`None`.
+
+        :rtype: :class:`_TokenBucket`
+        :returns: The bucket of the API method, or the default one.
+        """
+        if self._patterns:
+            request = '%s %s' % (method.upper(), path or '')
+            for key, pattern in self._patterns:
+                if pattern.match(request):
+                    return self._buckets[key]
+        return self._buckets[DEFAULT_KEY]
+
+    def reserve(self, method, deadline=None, path=None):
+        """Reserve the sending of a request, without waiting.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type deadline: :class:`~google.cloud.deadline.Deadline`
+        :param deadline: (Optional) The deadline of the request.
+
+        :type path: str
+        :param path: (Optional) The path of the request, relative to the
+                     API version.
+
+        :rtype: float
+        :returns: The number of seconds to wait before sending the request.
+        :raises: :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 deadline would expire before the request may be sent.
+        """
+        with self._lock:
+            return self._bucket(method, path).reserve(deadline)
+
+    def acquire(self, method, deadline=None, path=None):
+        """Wait until a request may be sent.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type deadline: :class:`~google.cloud.deadline.Deadline`
+        :param deadline: (Optional) The deadline of the request.
+
+        :type path: str
+        :param path: (Optional) The path of the request, relative to the
+                     API version.
+
+        :rtype: float
+        :returns: The number of seconds waited.
+        :raises: :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 deadline would expire before the request may be sent.
+        """
+        wait = self.reserve(method, deadline, path)
+        if wait > 0.0:
+            _SLEEP(wait)
+        return wait
+
+    def record(self, method, status, path=None):
+        """Account for a response, adapting the rate if enabled.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type status: int
+        :param status: The HTTP status of the response.
+
+        :type path: str
+        :param path: (Optional) The path of the request, relative to the
+                     API version.
+        """
+        throttled = status == _TOO_MANY_REQUESTS
+        if not (self.adaptive or throttled):
+            return
+        with self._lock:
+            bucket = self._bucket(method, path)
+            if self.adaptive:
+                bucket.adapt(throttled, self.decrease, self.increase)
+            else:
+                bucket.throttled += 1
+
+    def call(self, send, method, deadline=None, path=None):
+        """Send a request once the rate limit allows it.
+
+        :type send: callable
+        :param send: Callable taking no arguments, sending the request and
+                     returning a ``(response, content)`` pair.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :type deadline: :class:`~google.cloud.deadline.Deadline`
+        :param deadline: (Optional) The deadline of the request.
+
+        :type path: str
+        :param path: (Optional) The path of the request, relative to the
+                     API version.
+
+        :rtype: tuple of ``response`` (a dictionary of sorts)
+                and ``content`` (a string).
+        :returns: The HTTP response object and the content of the response.
+        """
+        self.acquire(method, deadline, path)
+        response, content = send()
+        self.record(method, response.status, path)
+        return response, content
+
+    def snapshot(self, reset=False):
+        """Get the statistics of the limiter.
+
+        :type reset: bool
+        :param reset: (Optional) If True, reset the counters once the
+                      snapshot is taken (the rates are kept).
+
+        :rtype: dict
+        :returns: A mapping from each API method limited separately (and
+                  :data:`DEFAULT_KEY`) to a dictionary holding its current
+                  ``rate``, the number of ``requests`` sent, of requests
+                  ``delayed``, the total ``wait_seconds`` and the number of
+                  ``throttled`` (``429``) responses.
+        """
+        result = {}
+        with self._lock:
+            for key, bucket in self._buckets.items():
+                result[key] = {
+                    'rate': bucket.rate,
+                    'requests': bucket.requests,
+                    'delayed': bucket.delayed,
+                    'wait_seconds': bucket.wait_seconds,
+                    'throttled': bucket.throttled,
+                }
+                if reset:
+                    bucket.requests = bucket.delayed = bucket.throttled = 0
+                    bucket.wait_seconds = 0.0
+        return result
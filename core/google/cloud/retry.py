@@ -0,0 +1,225 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Retry policies for API requests.
+
+A :class:`Retry` describes when and how long to wait before re-sending a
+request which failed with a transient error.  It can be set as the default
+for every request sent by a connection, or passed to a single call::
+
+    >>> from google.cloud.retry import Retry
+    >>> client._connection.retry = Retry(deadline=30.0)
+    >>> client._connection.api_request(
+    ...     'GET', '/b/my-bucket', retry=Retry(deadline=5.0))
+
+Waits grow exponentially with "full jitter" (a random delay between zero
+and the exponential bound), honor any ``Retry-After`` header sent by the
+server, and stop once the overall ``deadline`` would be exceeded.  By
+default, only idempotent HTTP methods are retried.
+"""
+
+import random
+import socket
+import time
+
+from six.moves import http_client
+
+from google.cloud.streaming.http_wrapper import _parse_retry_after
+
+
+DEFAULT_RETRY_STATUS_CODES = frozenset([
+    429,
+    http_client.INTERNAL_SERVER_ERROR,
+    http_client.BAD_GATEWAY,
+    http_client.SERVICE_UNAVAILABLE,
+    http_client.GATEWAY_TIMEOUT,
+])
+"""HTTP status codes indicating a transient error."""
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+"""HTTP methods which may safely be sent more than once."""
+
+_RETRYABLE_EXCEPTIONS = (socket.error, http_client.HTTPException)
+
+_NOW = time.time  # To be replaced by tests.
+_SLEEP = time.sleep  # To be replaced by tests.
+
+
+class Retry(object):
+    """Policy describing how to retry a failed request.
+
+    :type deadline: float
+    :param deadline: (Optional) Overall number of seconds, measured from
+                     the first attempt, after which no new attempt is made.
+                     If :data:`None`, attempts are made until one succeeds.
+
+    :type initial: float
+    :param initial: (Optional) Upper bound of the delay before the first
+                    retry, in seconds.
+
+    :type maximum: float
+    :param maximum: (Optional) Upper bound of the delay before any retry,
+                    in seconds.
+
+    :type multiplier: float
+    :param multiplier: (Optional) Factor by which the bound on the delay
+                       grows after each attempt.
+
+    :type status_codes: set of int
+    :param status_codes: (Optional) Response status codes to retry.
+
+    :type methods: set of str
+    :param methods: (Optional) HTTP methods which may be retried. If
+                    :data:`None`, requests are retried whatever their
+                    method.
+    """
+
+    def __init__(self, deadline=120.0, initial=1.0, maximum=60.0,
+                 multiplier=2.0, status_codes=DEFAULT_RETRY_STATUS_CODES,
+                 methods=IDEMPOTENT_METHODS):
+        self.deadline = deadline
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.status_codes = status_codes
+        self.methods = methods
+
+    def __repr__(self):
+        return '<Retry deadline=%r initial=%r maximum=%r multiplier=%r>' % (
+            self.deadline, self.initial, self.maximum, self.multiplier)
+
+    def with_deadline(self, deadline):
+        """Copy this policy, changing its deadline.
+
+        :type deadline: float
+        :param deadline: The new deadline, in seconds.
+
+        :rtype: :class:`Retry`
+        :returns: The new policy.
+        """
+        return Retry(deadline=deadline, initial=self.initial,
+                     maximum=self.maximum, multiplier=self.multiplier,
+                     status_codes=self.status_codes, methods=self.methods)
+
+    def compute_delay(self, attempt):
+        """Compute the delay before a retry, using "full jitter".
+
+        :type attempt: int
+        :param attempt: The number of retries already made.
+
+        :rtype: float
+        :returns: A random number of seconds between zero and the
+                  exponential bound for ``attempt``.
+        """
+        bound = min(self.maximum, self.initial * self.multiplier ** attempt)
+        return random.uniform(0, bound)
+
+    def allows_method(self, method):
+        """Check if requests with a given method may be retried.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :rtype: bool
+        :returns: True if the method is idempotent (or any method may be
+                  retried).
+        """
+        return self.methods is None or method.upper() in self.methods
+
+    def _exceeds_deadline(self, start, delay):
+        """Check if a retry after a delay would be past the deadline.
+
+        :type start: float
+        :param start: The time of the first attempt.
+
+        :type delay: float
+        :param delay: The number of seconds before the retry.
+
+        :rtype: bool
+        :returns: True if the retry must not be made.
+        """
+        if self.deadline is None:
+            return False
+        return _NOW() + delay - start > self.deadline
+
+    def _delay_before_retry(self, allowed, start, attempt, response=None):
+        """Compute the delay before retrying a request, if it may be retried.
+
+        :type allowed: bool
+        :param allowed: Whether the method of the request may be retried.
+
+        :type start: float
+        :param start: The time of the first attempt.
+
+        :type attempt: int
+        :param attempt: The number of retries already made.
+
+        :type response: :class:`httplib2.Response`
+        :param response: (Optional) The response received, or :data:`None`
+                         if the request failed with a transport error.
+
+        :rtype: float
+        :returns: The number of seconds before the retry, or :data:`None`
+                  if the request must not be retried.
+        """
+        if not allowed:
+            return None
+        if response is None:
+            delay = self.compute_delay(attempt)
+        else:
+            if response.status not in self.status_codes:
+                return None
+            # An HTTP date falls back to our own backoff.
+            delay = _parse_retry_after(response)
+            if delay is None:
+                delay = self.compute_delay(attempt)
+        if self._exceeds_deadline(start, delay):
+            return None
+        return delay
+
+    def call(self, send, method):
+        """Send a request, retrying it according to this policy.
+
+        :type send: callable
+        :param send: Callable taking no arguments, sending the request and
+                     returning a ``(response, content)`` pair.
+
+        :type method: str
+        :param method: The HTTP method of the request.
+
+        :rtype: tuple of ``response`` (a dictionary of sorts)
+                and ``content`` (a string).
+        :returns: The last response received, which may still hold an
+                  error if the deadline was exhausted.
+        :raises: The last transport error, if the deadline was exhausted
+                 (or the method may not be retried) before a response was
+                 received.
+        """
+        allowed = self.allows_method(method)
+        start = _NOW()
+        attempt = 0
+        while True:
+            try:
+                response, content = send()
+            except _RETRYABLE_EXCEPTIONS:
+                delay = self._delay_before_retry(allowed, start, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._delay_before_retry(
+                    allowed, start, attempt, response)
+                if delay is None:
+                    return response, content
+            attempt += 1
+            _SLEEP(delay)
@@ -252,8 +252,7 @@ class Response(_ResponseTuple):
         :rtype: int
         :returns: interval in seconds
         """
-        if 'retry-after' in self.info:
-            return int(self.info['retry-after'])
+        return _parse_retry_after(self.info)
 
     @property
     def is_redirect(self):
@@ -267,6 +266,25 @@ class Response(_ResponseTuple):
                 'location' in self.info)
 
 
+def _parse_retry_after(info):
+    """Parse the ``Retry-After`` header of a response, if any.
+
+    :type info: dict
+    :param info: The headers of the response.
+
+    :rtype: int or ``NoneType``
+    :returns: The number of seconds the server asked to wait for, or
+              :data:`None` if the header is missing or holds an HTTP date.
+    """
+    value = info.get('retry-after')
+    if value is None:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        return None
+
+
 def _check_response(response):
     """Validate a response
 
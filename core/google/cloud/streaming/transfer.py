@@ -15,15 +15,23 @@
 
 """Upload and download support for apitools."""
 
+import base64
 import email.generator as email_generator
 import email.mime.multipart as mime_multipart
 import email.mime.nonmultipart as mime_nonmultipart
+import hashlib
+import io
 import mimetypes
+import mmap
 import os
+import threading
+import time
+import uuid
 
 import httplib2
 import six
 from six.moves import http_client
+from six.moves import queue
 
 from google.cloud._helpers import _to_bytes
 from google.cloud.streaming.buffered_stream import BufferedStream
@@ -45,6 +53,288 @@ RESUMABLE_UPLOAD = 'resumable'
 
 _DEFAULT_CHUNKSIZE = 1 << 20
 
+_NOW = time.time  # To be replaced by tests.
+
+
+def _is_seekable(stream):
+    """Check whether a stream supports positional writes.
+
+    :type stream: file-like object
+    :param stream: The stream to check.
+
+    :rtype: bool
+    :returns: True if ``stream`` can ``seek`` and ``tell``.
+    """
+    if not (hasattr(stream, 'seek') and hasattr(stream, 'tell')):
+        return False
+    return not hasattr(stream, 'seekable') or stream.seekable()
+
+
+def _map_stream(stream):
+    """Map the file underlying a stream into memory, if possible.
+
+    :type stream: file-like object
+    :param stream: The stream to map.
+
+    :rtype: memoryview or None
+    :returns: A read-only view of the whole file, or None unless ``stream``
+              is a raw (or buffered) non-empty regular file.
+    """
+    if six.PY2:  # pragma: NO COVER  Python2
+        # Python 2's ``httplib`` cannot send a list of buffers anyway.
+        return None
+    raw = stream
+    if isinstance(stream, (io.BufferedReader, io.BufferedRandom)):
+        raw = stream.raw
+    if not isinstance(raw, io.FileIO):
+        # Wrappers such as ``gzip.GzipFile`` return the descriptor of the
+        # file they decode:  its bytes are not those read from the stream.
+        return None
+    try:
+        mapping = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, EnvironmentError, ValueError):
+        return None
+    return memoryview(mapping)
+
+
+class _BufferList(list):
+    """Request body made of several buffers, sent one after the other.
+
+    :mod:`http.client` sends each item of an iterable body in turn, so the
+    buffers are never concatenated.
+    """
+
+    @property
+    def length(self):
+        """Total number of bytes in the buffers.
+
+        :rtype: int
+        :returns: The length of the body.
+        """
+        return sum(len(buf) for buf in self)
+
+
+class ChunkSizeTuner(object):
+    """Adapt the chunk size of transfers to the observed throughput.
+
+    Each chunk sent or received is timed, and the next chunk size is
+    chosen so that a chunk takes about ``target_seconds``:  on a fast
+    link, fewer (larger) chunks pay the per-request overhead.  The chunk
+    size changes by at most a factor of four at a time, and stays a
+    multiple of ``multiple``.
+
+    A tuner may be shared by successive transfers (and by threads), which
+    then start from the chunk size and bandwidth learned so far::
+
+        >>> tuner = ChunkSizeTuner(target_seconds=2.0)
+        >>> blob.chunk_tuner = tuner
+        >>> blob.upload_from_filename('big.tar')
+        >>> tuner.snapshot()
+        {'bandwidth': ..., 'chunksize': ..., 'rtt': ..., ...}
+
+    :type target_seconds: float
+    :param target_seconds: (Optional) The intended duration of a chunk.
+
+    :type min_size: int
+    :param min_size: (Optional) The smallest chunk size chosen.
+
+    :type max_size: int
+    :param max_size: (Optional) The largest chunk size chosen.
+
+    :type multiple: int
+    :param multiple: (Optional) The number which must divide the chunk
+                     size (256 KB, as required by resumable uploads).
+
+    :type smoothing: float
+    :param smoothing: (Optional) The weight of the latest chunk in the
+                      moving average of the bandwidth.
+    """
+
+    def __init__(self, target_seconds=2.0, min_size=256 * 1024,
+                 max_size=256 << 20, multiple=256 * 1024, smoothing=0.3):
+        self.target_seconds = target_seconds
+        self.min_size = min_size
+        self.max_size = max_size
+        self.multiple = multiple
+        self.smoothing = smoothing
+        self.chunksize = _DEFAULT_CHUNKSIZE
+        self.bandwidth = None
+        self.rtt = None
+        self.strategy = None
+        self.chunks = 0
+        self._lock = threading.Lock()
+
+    def _size_for(self, bandwidth):
+        """Compute the chunk size taking ``target_seconds`` to transfer.
+
+        :type bandwidth: float
+        :param bandwidth: The estimated bandwidth, in bytes per second.
+
+        :rtype: int
+        :returns: The new chunk size.
+        """
+        size = bandwidth * self.target_seconds
+        size = min(max(size, self.chunksize / 4.0), self.chunksize * 4.0)
+        size = int(size) - int(size) % self.multiple
+        return int(min(max(size, self.min_size, self.multiple),
+                       self.max_size))
+
+    def record(self, nbytes, seconds):
+        """Account for a chunk transferred, and pick the next chunk size.
+
+        :type nbytes: int
+        :param nbytes: The number of bytes transferred.
+
+        :type seconds: float
+        :param seconds: The duration of the request.
+
+        :rtype: int
+        :returns: The chunk size to use next.
+        """
+        with self._lock:
+            if nbytes > 0 and seconds > 0:
+                rate = nbytes / float(seconds)
+                if self.bandwidth is None:
+                    self.bandwidth = rate
+                else:
+                    self.bandwidth += self.smoothing * (rate - self.bandwidth)
+                self.chunks += 1
+                self.chunksize = self._size_for(self.bandwidth)
+            return self.chunksize
+
+    def record_rtt(self, seconds):
+        """Account for the duration of a request without payload.
+
+        :type seconds: float
+        :param seconds: The duration of the request.
+        """
+        with self._lock:
+            if self.rtt is None or seconds < self.rtt:
+                self.rtt = seconds
+
+    def resumable_threshold(self):
+        """The size above which an upload should be resumable.
+
+        Uploads which would take less than ``target_seconds`` are sent
+        in a single request.
+
+        :rtype: int
+        :returns: The threshold, at least ``RESUMABLE_UPLOAD_THRESHOLD``.
+        """
+        with self._lock:
+            if self.bandwidth is None:
+                return RESUMABLE_UPLOAD_THRESHOLD
+            return max(RESUMABLE_UPLOAD_THRESHOLD,
+                       min(int(self.bandwidth * self.target_seconds),
+                           self.max_size))
+
+    def snapshot(self):
+        """Get the values learned (and chosen) so far.
+
+        :rtype: dict
+        :returns: The current ``chunksize``, the estimated ``bandwidth``
+                  (bytes per second), the shortest ``rtt`` seen, the
+                  ``resumable_threshold``, the ``strategy`` of the last
+                  upload and the number of ``chunks`` timed.
+        """
+        threshold = self.resumable_threshold()
+        with self._lock:
+            return {
+                'chunksize': self.chunksize,
+                'bandwidth': self.bandwidth,
+                'rtt': self.rtt,
+                'resumable_threshold': threshold,
+                'strategy': self.strategy,
+                'chunks': self.chunks,
+            }
+
+
+class _ChunkReader(object):
+    """Read the chunks of a stream ahead of their upload, in a thread.
+
+    Yields ``(start, data)`` pairs through :meth:`get`, ending with an
+    empty ``data`` at the end of the stream.  At most ``depth`` chunks are
+    held in memory at once.
+
+    :type stream: file-like object
+    :param stream: The stream to read, from its current position.
+
+    :type chunksize: int or callable
+    :param chunksize: The size of each chunk, or a callable taking no
+                      arguments and returning it, called before reading
+                      each chunk.
+
+    :type total_size: int
+    :param total_size: (Optional) The number of bytes to read, if known.
+
+    :type depth: int
+    :param depth: (Optional) The number of chunks read ahead.
+
+    :type checksum: bool
+    :param checksum: (Optional) Whether to compute the MD5 hash of the
+                     data read.  It is only computed if the stream is read
+                     from its start: the hash of a resumed upload would
+                     miss the data sent before.
+    """
+
+    def __init__(self, stream, chunksize, total_size=None, depth=2,
+                 checksum=False):
+        self._stream = stream
+        self._chunksize = chunksize
+        self._total_size = total_size
+        self._chunks = queue.Queue(maxsize=max(1, depth))
+        self._stopping = False
+        self._start = stream.tell()
+        self.md5 = None
+        if checksum and self._start == 0:
+            self.md5 = hashlib.md5()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        """The entry point of the reader thread."""
+        try:
+            position = self._start
+            while not self._stopping:
+                size = self._chunksize
+                if callable(size):
+                    size = size()
+                if self._total_size is not None:
+                    size = min(size, self._total_size - position)
+                data = self._stream.read(size) if size > 0 else b''
+                if self.md5 is not None:
+                    self.md5.update(data)
+                self._chunks.put((position, data))
+                if not data:
+                    return
+                position += len(data)
+        except Exception as exc:  # pylint: disable=broad-except
+            self._chunks.put(exc)
+
+    def get(self):
+        """Wait for the next chunk.
+
+        :rtype: tuple
+        :returns: The start byte and the data of the chunk.
+        :raises: the exception raised while reading the stream, if any.
+        """
+        chunk = self._chunks.get()
+        if isinstance(chunk, Exception):
+            raise chunk
+        return chunk
+
+    def close(self):
+        """Stop reading, and wait for the thread to exit."""
+        self._stopping = True
+        try:
+            while True:
+                # Unblock the thread, if waiting for room in the queue.
+                self._chunks.get_nowait()
+        except queue.Empty:
+            pass
+        self._thread.join()
+
 
 class _Transfer(object):
     """Generic bits common to Uploads and Downloads.
@@ -67,13 +357,17 @@ class _Transfer(object):
 
     :type num_retries: int
     :param num_retries: how many retries should the transfer attempt
+
+    :type chunk_tuner: :class:`ChunkSizeTuner`
+    :param chunk_tuner: (Optional) adapts :attr:`chunksize` to the observed
+                        throughput (and starts from its chunk size).
     """
 
     _num_retries = None
 
     def __init__(self, stream, close_stream=False,
                  chunksize=_DEFAULT_CHUNKSIZE, auto_transfer=True,
-                 http=None, num_retries=5):
+                 http=None, num_retries=5, chunk_tuner=None):
         self._bytes_http = None
         self._close_stream = close_stream
         self._http = http
@@ -85,10 +379,33 @@ class _Transfer(object):
 
         self.auto_transfer = auto_transfer
         self.chunksize = chunksize
+        self.chunk_tuner = chunk_tuner
+        if chunk_tuner is not None:
+            self.chunksize = chunk_tuner.chunksize
 
     def __repr__(self):
         return str(self)
 
+    def _adapt_chunksize(self, nbytes, started, granularity=None):
+        """Time a chunk, and let :attr:`chunk_tuner` pick the next size.
+
+        :type nbytes: int
+        :param nbytes: The number of bytes transferred.
+
+        :type started: float
+        :param started: The time at which the request was sent.
+
+        :type granularity: int
+        :param granularity: (Optional) The number which must divide the
+                            chunk size.
+        """
+        if self.chunk_tuner is None:
+            return
+        chunksize = self.chunk_tuner.record(nbytes, _NOW() - started)
+        if granularity:
+            chunksize = max(granularity, chunksize - chunksize % granularity)
+        self.chunksize = chunksize
+
     @property
     def close_stream(self):
         """Should this instance close the stream when deleted.
@@ -228,8 +545,18 @@ class Download(_Transfer):
     :param stream: stream to/from which data is downloaded/uploaded.
 
     :type kwds: dict
-    :param kwds:  keyword arguments:  all except ``total_size`` are passed
+    :param kwds:  keyword arguments:  all except ``total_size``,
+                  ``parallelism`` and ``progress_callback`` are passed
                   through to :meth:`_Transfer.__init__()`.
+
+    If ``parallelism`` is greater than one and :attr:`stream` is seekable,
+    the chunks following the first one are fetched by that many threads at
+    once, and written at their offset in the stream.  The threads share
+    :attr:`bytes_http`, which must then be safe to use from several threads
+    (e.g. a :class:`google.cloud.transport.PooledHttp`).
+
+    ``progress_callback``, if passed, is called with the number of bytes
+    downloaded so far and :attr:`total_size` after each chunk.
     """
     _ACCEPTABLE_STATUSES = set((
         http_client.OK,
@@ -240,11 +567,14 @@ class Download(_Transfer):
 
     def __init__(self, stream, **kwds):
         total_size = kwds.pop('total_size', None)
+        self.parallelism = kwds.pop('parallelism', 1)
+        self.progress_callback = kwds.pop('progress_callback', None)
         super(Download, self).__init__(stream, **kwds)
         self._initial_response = None
         self._progress = 0
         self._total_size = total_size
         self._encoding = None
+        self._progress_lock = threading.Lock()
 
     @classmethod
     def from_file(cls, filename, overwrite=False, auto_transfer=True, **kwds):
@@ -376,10 +706,12 @@ class Download(_Transfer):
         if self.auto_transfer:
             end_byte = self._compute_end_byte(0)
             self._set_range_header(http_request, 0, end_byte)
+            started = _NOW()
             response = make_api_request(
                 self.bytes_http or http, http_request)
             if response.status_code not in self._ACCEPTABLE_STATUSES:
                 raise HttpError.from_response(response)
+            self._adapt_chunksize(response.length, started)
             self._initial_response = response
             self._set_total(response.info)
             url = response.info.get('content-location', response.request_url)
@@ -503,7 +835,8 @@ class Download(_Transfer):
         :returns: response from the chunk request.
         """
         self._ensure_initialized()
-        request = Request(url=self.url, headers=headers)
+        # Copy the headers, which are shared by concurrent requests.
+        request = Request(url=self.url, headers=dict(headers or {}))
         self._set_range_header(request, start, end=end)
         return make_api_request(
             self.bytes_http, request, retries=self.num_retries)
@@ -532,9 +865,8 @@ class Download(_Transfer):
         if response.status_code in (http_client.OK,
                                     http_client.PARTIAL_CONTENT):
             self.stream.write(response.content)
-            self._progress += response.length
-            if response.info and 'content-encoding' in response.info:
-                self._encoding = response.info['content-encoding']
+            self._set_encoding(response)
+            self._add_progress(response.length)
         elif response.status_code == http_client.NO_CONTENT:
             # It's important to write something to the stream for the case
             # of a 0-byte download to a file, as otherwise python won't
@@ -542,6 +874,131 @@ class Download(_Transfer):
             self.stream.write('')
         return response
 
+    def _set_encoding(self, response):
+        """Record the 'Content-Encoding' of a response, if any.
+
+        :type response: :class:`google.cloud.streaming.http_wrapper.Response`
+        :param response: response from a download request.
+        """
+        if response.info and 'content-encoding' in response.info:
+            self._encoding = response.info['content-encoding']
+
+    def _add_progress(self, length):
+        """Account for downloaded bytes, and report the progress.
+
+        :type length: int
+        :param length: The number of bytes just written.
+        """
+        with self._progress_lock:
+            self._progress += length
+            progress = self._progress
+        if self.progress_callback is not None:
+            self.progress_callback(progress, self.total_size)
+
+    def _fetch_range(self, start, end, write, headers=None):
+        """Fetch a byte range, retrying the requests which fall short.
+
+        :type start: int
+        :param start: start byte of the range.
+
+        :type end: int
+        :param end: end byte of the range (inclusive).
+
+        :type write: callable
+        :param write: Callable taking the offset and content of each part
+                      of the range received.
+
+        :type headers: dict
+        :param headers: (Optional) Headers to be used for the ``Request``.
+
+        :raises: :exc:`google.cloud.streaming.exceptions.HttpError` for
+                 missing / unauthorized responses;
+                 :exc:`google.cloud.streaming.exceptions.TransferRetryError`
+                 once ``num_retries`` failed attempts have been made.
+        """
+        failures = 0
+        while start <= end:
+            response = self._get_chunk(start, end, headers=headers)
+            status = response.status_code
+            content = b''
+            if status in (http_client.FORBIDDEN, http_client.NOT_FOUND):
+                raise HttpError.from_response(response)
+            elif status == http_client.PARTIAL_CONTENT:
+                content = response.content[:end - start + 1]
+            elif status == http_client.OK:
+                # The server ignored the range and sent the whole object.
+                content = response.content[start:end + 1]
+            if content:
+                write(start, content)
+                self._set_encoding(response)
+                self._add_progress(len(content))
+                start += len(content)
+                continue
+            failures += 1
+            if failures > self.num_retries:
+                raise TransferRetryError(
+                    'Failed to download bytes %d-%d: status %s' % (
+                        start, end, status))
+
+    def _stream_file_parallel(self, headers=None):
+        """Fetch the rest of the download in concurrent ranged requests.
+
+        Helper for :meth:`stream_file`, once :attr:`total_size` is known:
+        each range of :attr:`chunksize` bytes is written at its offset in
+        :attr:`stream`, which is left positioned after the last byte.
+        Ranges are claimed as workers become free, so that each one is
+        sized by :attr:`chunk_tuner` from the ranges fetched before it.
+
+        :type headers: dict
+        :param headers: (Optional) Headers to be used for the ``Request``.
+        """
+        base = self.stream.tell() - self.progress
+        next_start = [self.progress]
+        range_lock = threading.Lock()
+        write_lock = threading.Lock()
+        errors = []
+
+        def claim():
+            with range_lock:
+                start = next_start[0]
+                if start >= self.total_size:
+                    return None
+                end = min(start + self.chunksize, self.total_size) - 1
+                next_start[0] = end + 1
+                return start, end
+
+        def write(offset, content):
+            with write_lock:
+                self.stream.seek(base + offset)
+                self.stream.write(content)
+
+        def worker():
+            while not errors:
+                claimed = claim()
+                if claimed is None:
+                    return
+                start, end = claimed
+                started = _NOW()
+                try:
+                    self._fetch_range(start, end, write, headers=headers)
+                except Exception as exc:  # pylint: disable=broad-except
+                    errors.append(exc)
+                else:
+                    self._adapt_chunksize(end - start + 1, started)
+
+        num_ranges = -(-(self.total_size - self.progress) // self.chunksize)
+        threads = [threading.Thread(target=worker)
+                   for _ in six.moves.range(
+                       min(self.parallelism, num_ranges))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        self.stream.seek(base + self.total_size)
+
     def get_range(self, start, end=None, use_chunks=True):
         """Retrieve a given byte range from this download, inclusive.
 
@@ -606,6 +1063,8 @@ class Download(_Transfer):
         :param headers: (Optional) Headers to be used for the ``Request``.
         """
         self._ensure_initialized()
+        parallel = (use_chunks and self.parallelism > 1 and
+                    _is_seekable(self.stream))
         while True:
             if self._initial_response is not None:
                 response = self._initial_response
@@ -613,14 +1072,19 @@ class Download(_Transfer):
             else:
                 end_byte = self._compute_end_byte(self.progress,
                                                   use_chunks=use_chunks)
+                started = _NOW()
                 response = self._get_chunk(self.progress, end_byte,
                                            headers=headers)
+                self._adapt_chunksize(response.length, started)
             if self.total_size is None:
                 self._set_total(response.info)
             response = self._process_response(response)
             if (response.status_code == http_client.OK or
                     self.progress >= self.total_size):
                 break
+            if parallel:
+                self._stream_file_parallel(headers=headers)
+                break
 
 
 class Upload(_Transfer):
@@ -646,8 +1110,22 @@ class Upload(_Transfer):
                           data when initialized
 
     :type kwds: dict
-    :param kwds:  keyword arguments:  all except ``total_size`` are passed
-                  through to :meth:`_Transfer.__init__()`.
+    :param kwds:  keyword arguments:  all except ``total_size``,
+                  ``pipeline_depth``, ``checksum`` and ``zero_copy`` are
+                  passed through to :meth:`_Transfer.__init__()`.
+
+    If ``pipeline_depth`` is set, chunked resumable uploads read up to
+    that many chunks ahead in a thread, while the previous chunk is being
+    sent.  With ``checksum``, chunked resumable uploads are always read by
+    that thread (one chunk ahead, unless ``pipeline_depth`` is set), which
+    also computes the MD5 hash of the data, available as :attr:`md5_hash`
+    once the upload is complete.  Callers compare it with the hash reported
+    by the server.
+
+    If ``zero_copy`` is set and :attr:`stream` is a regular file, the file
+    is memory-mapped and its contents are sent as :class:`memoryview`
+    slices of the mapping (rather than read into new ``bytes``), by the
+    non-pipelined modes.
     """
     _REQUIRED_SERIALIZATION_KEYS = set((
         'auto_transfer', 'mime_type', 'total_size', 'url'))
@@ -655,6 +1133,11 @@ class Upload(_Transfer):
     def __init__(self, stream, mime_type, total_size=None, http=None,
                  close_stream=False, auto_transfer=True,
                  **kwds):
+        self.pipeline_depth = kwds.pop('pipeline_depth', None)
+        self.checksum = kwds.pop('checksum', False)
+        self.zero_copy = kwds.pop('zero_copy', False)
+        self._md5 = None
+        self._view = None
         super(Upload, self).__init__(
             stream, close_stream=close_stream, auto_transfer=auto_transfer,
             http=http, **kwds)
@@ -737,6 +1220,18 @@ class Upload(_Transfer):
         """
         return self._complete
 
+    @property
+    def md5_hash(self):
+        """Base64-encoded MD5 hash of the data uploaded with ``checksum``.
+
+        :rtype: str or None
+        :returns: The hash, or None if not computed (e.g. if the upload
+                  was resumed) or not complete.
+        """
+        if self._md5 is None or not self.complete:
+            return None
+        return base64.b64encode(self._md5.digest()).decode('ascii')
+
     @property
     def mime_type(self):
         """MIMEtype of the file being uploaded.
@@ -826,14 +1321,18 @@ class Upload(_Transfer):
         if self.strategy is not None:
             return
         strategy = SIMPLE_UPLOAD
-        if (self.total_size is not None and
-                self.total_size > RESUMABLE_UPLOAD_THRESHOLD):
+        threshold = RESUMABLE_UPLOAD_THRESHOLD
+        if self.chunk_tuner is not None:
+            threshold = self.chunk_tuner.resumable_threshold()
+        if self.total_size is not None and self.total_size > threshold:
             strategy = RESUMABLE_UPLOAD
         if http_request.body and not upload_config.simple_multipart:
             strategy = RESUMABLE_UPLOAD
         if not upload_config.simple_path:
             strategy = RESUMABLE_UPLOAD
         self.strategy = strategy
+        if self.chunk_tuner is not None:
+            self.chunk_tuner.strategy = strategy
 
     def configure_request(self, upload_config, http_request, url_builder):
         """Configure the request and url for this upload.
@@ -878,14 +1377,81 @@ class Upload(_Transfer):
             url_builder.query_params['uploadType'] = 'resumable'
             self._configure_resumable_request(http_request)
 
+    def _media_view(self, size=None):
+        """Take the next bytes of the stream from its memory mapping.
+
+        Advances :attr:`stream` past the bytes taken.
+
+        :type size: int
+        :param size: (Optional) The number of bytes to take, else up to
+                     the end of the stream.
+
+        :rtype: memoryview or None
+        :returns: A view of the bytes, or None unless :attr:`zero_copy` is
+                  set and :attr:`stream` could be mapped.
+        :raises: :exc:`IncompleteRead` if fewer than ``size`` bytes remain.
+        """
+        if not self.zero_copy:
+            return None
+        if self._view is None:
+            self._view = _map_stream(self.stream) or False
+        if self._view is False:
+            return None
+        start = self.stream.tell()
+        end = len(self._view)
+        if size is not None:
+            if start + size > end:
+                raise http_client.IncompleteRead(end - start, size)
+            end = start + size
+        self.stream.seek(end)
+        return self._view[start:end]
+
     def _configure_media_request(self, http_request):
         """Helper for 'configure_request': set up simple request."""
         http_request.headers['content-type'] = self.mime_type
-        http_request.body = self.stream.read()
+        body = self._media_view()
+        if body is None:
+            body = self.stream.read()
+        http_request.body = body
         http_request.loggable_body = '<media body>'
 
+    def _configure_buffered_multipart_request(self, http_request, media):
+        """Helper for 'configure_request': set up multipart request.
+
+        The body is a list of buffers, the media being sent as is.
+
+        :type http_request: :class:`~.streaming.http_wrapper.Request`
+        :param http_request: the request to be updated
+
+        :type media: memoryview
+        :param media: the contents of the upload.
+        """
+        boundary = '===============%s==' % (uuid.uuid4().hex,)
+        delimiter = _to_bytes('--%s\n' % (boundary,))
+        head = b''.join([
+            delimiter,
+            _to_bytes('Content-Type: %s\nMIME-Version: 1.0\n\n' % (
+                http_request.headers['content-type'],)),
+            _to_bytes(http_request.body or b'', encoding='utf-8'),
+            b'\n',
+            delimiter,
+            _to_bytes('Content-Type: %s\nMIME-Version: 1.0\n'
+                      'Content-Transfer-Encoding: binary\n\n' % (
+                          self.mime_type,)),
+        ])
+        tail = _to_bytes('\n--%s--\n' % (boundary,))
+        http_request.body = _BufferList([head, media, tail])
+        http_request.headers['content-type'] = (
+            'multipart/related; boundary="%s"' % boundary)
+        http_request.loggable_body = b''.join([head, b'<media body>', tail])
+
     def _configure_multipart_request(self, http_request):
         """Helper for 'configure_request': set up multipart request."""
+        media = self._media_view()
+        if media is not None:
+            self._configure_buffered_multipart_request(http_request, media)
+            return
+
         # This is a multipart/related upload.
         msg_root = mime_multipart.MIMEMultipart('related')
         # msg_root should not write out its own headers
@@ -1020,10 +1586,13 @@ class Upload(_Transfer):
         if self.strategy != RESUMABLE_UPLOAD:
             return
         self._ensure_uninitialized()
+        started = _NOW()
         http_response = make_api_request(http, http_request,
                                          retries=self.num_retries)
         if http_response.status_code != http_client.OK:
             raise HttpError.from_response(http_response)
+        if self.chunk_tuner is not None:
+            self.chunk_tuner.record_rtt(_NOW() - started)
 
         granularity = http_response.info.get('X-Goog-Upload-Chunk-Granularity')
         if granularity is not None:
@@ -1090,8 +1659,16 @@ class Upload(_Transfer):
         if use_chunks:
             self._validate_chunksize(self.chunksize)
         self._ensure_initialized()
+        if (use_chunks and (self.pipeline_depth or self.checksum) and
+                not self.complete):
+            response = self._stream_file_pipelined()
         while not self.complete:
-            response = send_func(self.stream.tell())
+            start = self.stream.tell()
+            started = _NOW()
+            response = send_func(start)
+            if use_chunks:
+                self._adapt_chunksize(self.stream.tell() - start, started,
+                                      self._server_chunk_granularity)
             if response.status_code in (http_client.OK, http_client.CREATED):
                 self._complete = True
                 break
@@ -1113,6 +1690,63 @@ class Upload(_Transfer):
                         (int(end_pos) - int(current_pos)))
         return response
 
+    def _stream_file_pipelined(self):
+        """Send the stream in chunks, read ahead by a :class:`_ChunkReader`.
+
+        Helper for :meth:`stream_file`.
+
+        :rtype: :class:`google.cloud.streaming.http_wrapper.Response`
+        :returns: The response for the final request made.
+        :raises: :exc:`~.streaming.exceptions.HttpError` if the status
+                 code from a response indicates an error;
+                 :exc:`~.streaming.exceptions.CommunicationError` if the
+                 server did not receive a whole chunk.
+        """
+        # Chunks are cut with the size picked by the chunk tuner when they
+        # are read, so a new size applies after the chunks read ahead.
+        reader = _ChunkReader(self.stream, lambda: self.chunksize,
+                              self.total_size, self.pipeline_depth or 1,
+                              self.checksum)
+        no_log_body = self.total_size is None
+        try:
+            chunk = reader.get()
+            while True:
+                start, data = chunk
+                end = start + len(data)
+                following = None
+                if self.total_size is None:
+                    if data:
+                        following = reader.get()
+                    if following is None or not following[1]:
+                        self._total_size = end
+                request = self._chunk_request(start, end, data, no_log_body)
+                started = _NOW()
+                response = make_api_request(
+                    self.bytes_http, request, retries=self.num_retries)
+                self._adapt_chunksize(len(data), started,
+                                      self._server_chunk_granularity)
+                if response.status_code in (http_client.OK,
+                                            http_client.CREATED):
+                    self._complete = True
+                    break
+                if response.status_code != RESUME_INCOMPLETE:
+                    reader.close()
+                    self.refresh_upload_state()
+                    raise HttpError.from_response(response)
+                self._progress = self._last_byte(
+                    self._get_range_header(response))
+                if self.progress + 1 != end:
+                    reader.close()
+                    self.stream.seek(self.progress + 1)
+                    raise CommunicationError(
+                        'Failed to transfer all bytes in chunk, upload '
+                        'paused at byte %d' % self.progress)
+                chunk = following if following is not None else reader.get()
+        finally:
+            reader.close()
+        self._md5 = reader.md5
+        return response
+
     def _send_media_request(self, request, end):
         """Peform API upload request.
 
@@ -1159,7 +1793,9 @@ class Upload(_Transfer):
         if self.total_size is None:
             raise TransferInvalidError(
                 'Total size must be known for SendMediaBody')
-        body_stream = StreamSlice(self.stream, self.total_size - start)
+        body_stream = self._media_view(self.total_size - start)
+        if body_stream is None:
+            body_stream = StreamSlice(self.stream, self.total_size - start)
 
         request = Request(url=self.url, http_method='PUT', body=body_stream)
         request.headers['Content-Type'] = self.mime_type
@@ -1202,8 +1838,31 @@ class Upload(_Transfer):
             body_stream = body_stream.read(self.chunksize)
         else:
             end = min(start + self.chunksize, self.total_size)
-            body_stream = StreamSlice(self.stream, end - start)
-        request = Request(url=self.url, http_method='PUT', body=body_stream)
+            body_stream = self._media_view(end - start)
+            if body_stream is None:
+                body_stream = StreamSlice(self.stream, end - start)
+        request = self._chunk_request(start, end, body_stream, no_log_body)
+        return self._send_media_request(request, end)
+
+    def _chunk_request(self, start, end, body, no_log_body=False):
+        """Build the request sending a chunk of the stream.
+
+        :type start: int
+        :param start: start byte of the chunk.
+
+        :type end: int
+        :param end: end byte of the chunk (exclusive).
+
+        :type body: bytes or file-like object
+        :param body: the content of the chunk.
+
+        :type no_log_body: bool
+        :param no_log_body: (Optional) If True, do not log the body.
+
+        :rtype: :class:`google.cloud.streaming.http_wrapper.Request`
+        :returns: The request for the chunk.
+        """
+        request = Request(url=self.url, http_method='PUT', body=body)
         request.headers['Content-Type'] = self.mime_type
         if no_log_body:
             # Disable logging of streaming body.
@@ -1219,5 +1878,4 @@ class Upload(_Transfer):
             range_string = 'bytes %s-%s/%s' % (start, end - 1, self.total_size)
 
         request.headers['Content-Range'] = range_string
-
-        return self._send_media_request(request, end)
+        return request
@@ -0,0 +1,351 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Access tokens shared by all clients, refreshed in the background.
+
+By default, each client scopes its own copy of the credentials, and
+fetches a new access token on the first request after the previous one
+expired.  Once enabled, a process-wide :class:`TokenCache` hands out a
+single scoped copy per credentials and scopes, and a daemon thread
+renews their tokens ahead of expiry, so that requests never wait for a
+token::
+
+    >>> from google.cloud import token_cache
+    >>> token_cache.enable(refresh_margin=300.0)
+    >>> client = storage.Client()
+
+Only the clients created after :func:`enable` share their credentials.
+Credentials which cannot be refreshed ahead of time (e.g. those without
+an ``expiry``) are still refreshed on demand.  The cache only holds weak
+references: a scoped copy is forgotten (and no longer refreshed) once no
+client uses it.
+"""
+
+import datetime
+import logging
+import threading
+import weakref
+
+import google.auth.credentials
+
+from google.cloud import _fork
+
+
+_LOGGER = logging.getLogger(__name__)
+_REFRESH_THREAD_NAME = 'google.cloud.token_cache.Refresher'
+_UTCNOW = datetime.datetime.utcnow  # To be replaced by tests.
+
+_SHARED = {'cache': None}
+
+
+def _default_request():
+    """Create the transport used to refresh tokens.
+
+    :rtype: :class:`google_auth_httplib2.Request`
+    :returns: A request object with its own HTTP transport.
+    """
+    import google_auth_httplib2
+    import httplib2
+
+    return google_auth_httplib2.Request(httplib2.Http())
+
+
+class _Entry(object):
+    """Scoped credentials shared under a cache key.
+
+    Holds weak references, so that the cache does not keep credentials
+    alive once no client uses them.
+
+    :type credentials: :class:`google.auth.credentials.Credentials`
+    :param credentials: The credentials passed by the clients.
+
+    :type scoped: :class:`google.auth.credentials.Credentials`
+    :param scoped: The scoped copy handed out to the clients.
+
+    :raises: :class:`TypeError` if either cannot be weakly referenced.
+    """
+
+    def __init__(self, credentials, scoped):
+        self._credentials = weakref.ref(credentials)
+        self._scoped = weakref.ref(scoped)
+        self.retry_at = None
+
+    @property
+    def credentials(self):
+        """The credentials passed by the clients.
+
+        :rtype: :class:`google.auth.credentials.Credentials`
+        :returns: The credentials, or :data:`None` once garbage collected.
+        """
+        return self._credentials()
+
+    @property
+    def scoped(self):
+        """The scoped copy handed out to the clients.
+
+        :rtype: :class:`google.auth.credentials.Credentials`
+        :returns: The copy, or :data:`None` once garbage collected.
+        """
+        return self._scoped()
+
+
+class TokenCache(object):
+    """Thread-safe cache of scoped credentials, refreshed before expiry.
+
+    :type refresh_margin: float
+    :param refresh_margin: (Optional) The number of seconds before expiry
+                           at which a token is renewed.
+
+    :type retry_interval: float
+    :param retry_interval: (Optional) The number of seconds before a
+                           failed refresh is attempted again.
+
+    :type request_factory: callable
+    :param request_factory: (Optional) Callable taking no arguments and
+                            returning the :class:`google.auth.transport.
+                            Request` used to refresh tokens.
+    """
+
+    def __init__(self, refresh_margin=300.0, retry_interval=30.0,
+                 request_factory=_default_request):
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self._request_factory = request_factory
+        self._request = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        # Entries by key, for lookups, and all those still refreshed: an
+        # entry outlives its key if the clients outlive the credentials.
+        self._entries = {}
+        self._live = []
+        self._thread = None
+        self._stopping = False
+        self._generation = _fork.generation()
+
+    def __len__(self):
+        with self._lock:
+            self._prune()
+            return len(self._live)
+
+    def _prune(self):
+        """Forget the entries whose credentials were garbage collected.
+
+        Must be called with the lock held.
+        """
+        self._live = [entry for entry in self._live
+                      if entry.scoped is not None]
+        for key, entry in list(self._entries.items()):
+            if entry.credentials is None or entry.scoped is None:
+                del self._entries[key]
+
+    def scoped_credentials(self, credentials, scopes):
+        """Get the shared, scoped copy of some credentials.
+
+        :type credentials: :class:`google.auth.credentials.Credentials`
+        :param credentials: The credentials passed to a client.
+
+        :type scopes: tuple of str
+        :param scopes: The scopes required by the client's API.
+
+        :rtype: :class:`google.auth.credentials.Credentials`
+        :returns: The copy shared by every client using the same
+                  credentials and scopes.
+        """
+        key = (id(credentials), tuple(sorted(scopes or ())))
+        forked = self._check_fork()
+        with self._lock:
+            entry = self._entries.get(key)
+            scoped = None
+            # The id of garbage collected credentials may be reused.
+            if entry is not None and entry.credentials is credentials:
+                scoped = entry.scoped
+            added = scoped is None
+            if added:
+                scoped = google.auth.credentials.with_scopes_if_required(
+                    credentials, scopes)
+                try:
+                    entry = _Entry(credentials, scoped)
+                except TypeError:
+                    # Cannot be tracked without keeping it alive.
+                    return scoped
+                self._prune()
+                self._entries[key] = entry
+                self._live.append(entry)
+                self._wakeup.notify()
+        # The thread only needs starting for new entries, or in a child.
+        if added or forked:
+            self.start()
+        return scoped
+
+    def _seconds_left(self, entry, now):
+        """Compute the time before an entry's token must be renewed.
+
+        :type entry: :class:`_Entry`
+        :param entry: The entry to check.
+
+        :type now: :class:`datetime.datetime`
+        :param now: The current (naive, UTC) time.
+
+        :rtype: float
+        :returns: The number of seconds until the token must be renewed
+                  (zero or less if due), or :data:`None` if it cannot be
+                  renewed ahead of time (or is no longer used).
+        """
+        credentials = entry.scoped
+        if credentials is None:
+            return None
+        if entry.retry_at is not None and now < entry.retry_at:
+            return (entry.retry_at - now).total_seconds()
+        if not credentials.valid:
+            return 0.0
+        expiry = getattr(credentials, 'expiry', None)
+        if expiry is None:
+            return None
+        return (expiry - now).total_seconds() - self.refresh_margin
+
+    def refresh_due(self):
+        """Renew the tokens which expire within ``refresh_margin``.
+
+        Called by the background thread; failures are logged and retried
+        after ``retry_interval``.
+
+        :rtype: float
+        :returns: The number of seconds until the next token is due, or
+                  :data:`None` if no token can be renewed ahead of time.
+        """
+        with self._lock:
+            self._prune()
+            entries = list(self._live)
+        next_due = None
+        for entry in entries:
+            # Keep the credentials alive while refreshing them.
+            scoped = entry.scoped
+            now = _UTCNOW()
+            left = self._seconds_left(entry, now)
+            if left is not None and left <= 0.0:
+                entry.retry_at = None
+                try:
+                    if self._request is None:
+                        self._request = self._request_factory()
+                    scoped.refresh(self._request)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception('Failed to refresh credentials')
+                    left = 0.0
+                else:
+                    left = self._seconds_left(entry, _UTCNOW())
+                if left is not None and left <= 0.0:
+                    # Failed, or the new token expires within the margin.
+                    entry.retry_at = now + datetime.timedelta(
+                        seconds=self.retry_interval)
+                    left = self.retry_interval
+            if left is not None:
+                next_due = left if next_due is None else min(next_due, left)
+        return next_due
+
+    def _run(self):
+        """The entry point of the background thread."""
+        while True:
+            delay = self.refresh_due()
+            with self._lock:
+                if self._stopping:
+                    return
+                if delay is None or delay > 0.0:
+                    self._wakeup.wait(delay)
+                if self._stopping:
+                    return
+
+    def _check_fork(self):
+        """Forget the state inherited from a parent process, if forked.
+
+        The thread (and transport) of the parent are gone, and the lock
+        may have been held by one of its other threads.
+
+        :rtype: bool
+        :returns: True if the process was forked since the last check.
+        """
+        current = _fork.generation()
+        if self._generation == current:
+            return False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._request = None
+        self._thread = None
+        self._generation = current
+        return True
+
+    def start(self):
+        """Start the background thread, unless already running."""
+        self._check_fork()
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name=_REFRESH_THREAD_NAME)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread.
+
+        Tokens are then only refreshed on demand.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+            self._wakeup.notify()
+        if thread is not None and thread.is_alive():
+            thread.join()
+
+
+def enable(**kwargs):
+    """Share the credentials of the clients created from now on.
+
+    :type kwargs: dict
+    :param kwargs: (Optional) Arguments passed to :class:`TokenCache`.
+
+    :rtype: :class:`TokenCache`
+    :returns: The process-wide cache.
+    """
+    disable()
+    cache = _SHARED['cache'] = TokenCache(**kwargs)
+    return cache
+
+
+def disable():
+    """Stop sharing the credentials of the clients created from now on."""
+    cache, _SHARED['cache'] = _SHARED['cache'], None
+    if cache is not None:
+        cache.stop()
+
+
+def scoped_credentials(credentials, scopes):
+    """Scope the credentials of a client, sharing them if enabled.
+
+    :type credentials: :class:`google.auth.credentials.Credentials`
+    :param credentials: The credentials passed to a client, or
+                        :data:`None`.
+
+    :type scopes: tuple of str
+    :param scopes: The scopes required by the client's API.
+
+    :rtype: :class:`google.auth.credentials.Credentials`
+    :returns: The scoped credentials (shared with other clients if
+              :func:`enable` was called).
+    """
+    cache = _SHARED['cache']
+    if cache is None or credentials is None:
+        return google.auth.credentials.with_scopes_if_required(
+            credentials, scopes)
+    return cache.scoped_credentials(credentials, scopes)
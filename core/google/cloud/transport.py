@@ -0,0 +1,339 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Thread-safe HTTP transports shared between connections.
+
+A single :class:`httplib2.Http` instance may not be used from more than
+one thread at a time.  :class:`PooledHttp` keeps a bounded pool of them
+per host, handing an instance out for the duration of one request, so
+that a single client can be shared by many threads::
+
+    >>> from google.cloud import storage
+    >>> from google.cloud.transport import authorized_pooled_http
+    >>> http = authorized_pooled_http(credentials, max_per_host=32)
+    >>> client = storage.Client(credentials=credentials, http=http)
+
+The pool can also be handed directly to the ``streaming`` helpers, e.g.
+:func:`google.cloud.streaming.http_wrapper.make_api_request`, since it
+implements the same ``request()`` interface as :class:`httplib2.Http`.
+"""
+
+import threading
+import time
+
+import google_auth_httplib2
+import httplib2
+from six.moves.urllib.parse import urlsplit
+
+from google.cloud._http import _set_http_timeout
+
+
+DEFAULT_MAX_PER_HOST = 10
+"""Default maximum number of concurrent requests sent to a single host."""
+
+DEFAULT_IDLE_TIMEOUT = 60.0
+"""Default number of seconds an unused connection is kept alive."""
+
+_NOW = time.time  # To be replaced by tests.
+
+
+def _close_http(http):
+    """Close all of the open connections held by an HTTP object.
+
+    :type http: :class:`httplib2.Http`
+    :param http: The instance whose connections should be closed.
+    """
+    connections = getattr(http, 'connections', None) or {}
+    for conn_key, connection in list(connections.items()):
+        # httplib2 stores both connection classes (keyed by scheme) and
+        # connection instances (keyed by scheme + authority).
+        if ':' in conn_key:
+            connection.close()
+            del connections[conn_key]
+
+
+class _HostPool(object):
+    """Book-keeping for the HTTP objects talking to a single host.
+
+    Must only be used while holding the lock of the owning
+    :class:`PooledHttp`.
+    """
+
+    def __init__(self):
+        self.idle = []
+        self.in_use = 0
+
+
+class PooledHttp(object):
+    """Bounded, keep-alive pool of HTTP objects safe to share across threads.
+
+    Each call to :meth:`request` checks out an idle :class:`httplib2.Http`
+    for the target host (creating one if the per-host limit allows it, or
+    waiting for one to be returned otherwise), sends the request and
+    returns the object to the pool so that its keep-alive connection can
+    be reused.  Objects which raise while sending a request are discarded
+    rather than returned, since their socket may be in an unknown state.
+
+    :type max_per_host: int
+    :param max_per_host: (Optional) The maximum number of concurrent
+                         requests (and hence open connections) per host.
+
+    :type idle_timeout: float
+    :param idle_timeout: (Optional) Number of seconds an unused connection
+                         may stay in the pool before it is closed.
+
+    :type http_factory: callable
+    :param http_factory: (Optional) Callable taking no arguments and
+                         returning a new :class:`httplib2.Http` (or
+                         workalike).  Defaults to :class:`httplib2.Http`.
+
+    :raises: :class:`ValueError` if ``max_per_host`` is not positive.
+    """
+
+    def __init__(self, max_per_host=DEFAULT_MAX_PER_HOST,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT, http_factory=None):
+        if max_per_host < 1:
+            raise ValueError('max_per_host must be positive', max_per_host)
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self._http_factory = http_factory or httplib2.Http
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._hosts = {}
+        self._stats = {
+            'requests': 0,
+            'created': 0,
+            'reused': 0,
+            'discarded': 0,
+            'evicted': 0,
+            'waits': 0,
+        }
+
+    @staticmethod
+    def _host_key(uri):
+        """Compute the pool key for a request URI.
+
+        :type uri: str
+        :param uri: The URI of a request.
+
+        :rtype: str
+        :returns: The scheme and authority of ``uri``.
+        """
+        parts = urlsplit(uri)
+        return '%s://%s' % (parts.scheme, parts.netloc)
+
+    def _evict_idle(self, now):
+        """Close connections which have been idle for too long.
+
+        Must be called while holding the pool lock.
+
+        :type now: float
+        :param now: The current timestamp.
+
+        :rtype: list
+        :returns: The HTTP objects evicted from the pool, to be closed
+                  by the caller once the lock is released.
+        """
+        evicted = []
+        if self.idle_timeout is None:
+            return evicted
+        cutoff = now - self.idle_timeout
+        for host_key, host in list(self._hosts.items()):
+            keep = [(stamp, http) for stamp, http in host.idle
+                    if stamp >= cutoff]
+            evicted.extend(http for stamp, http in host.idle
+                           if stamp < cutoff)
+            host.idle = keep
+            if not host.idle and not host.in_use:
+                del self._hosts[host_key]
+        self._stats['evicted'] += len(evicted)
+        return evicted
+
+    def _acquire(self, host_key):
+        """Check out an HTTP object for a host, blocking if at the limit.
+
+        :type host_key: str
+        :param host_key: The pool key, as returned by :meth:`_host_key`.
+
+        :rtype: :class:`httplib2.Http`
+        :returns: An HTTP object reserved for the caller.
+        """
+        with self._available:
+            evicted = self._evict_idle(_NOW())
+            host = self._hosts.setdefault(host_key, _HostPool())
+            while not host.idle and host.in_use >= self.max_per_host:
+                self._stats['waits'] += 1
+                self._available.wait()
+                # The host entry may have been evicted while waiting.
+                host = self._hosts.setdefault(host_key, _HostPool())
+            host.in_use += 1
+            self._stats['requests'] += 1
+            if host.idle:
+                _, http = host.idle.pop()
+                self._stats['reused'] += 1
+            else:
+                http = None
+                self._stats['created'] += 1
+
+        for stale in evicted:
+            _close_http(stale)
+
+        if http is None:
+            try:
+                http = self._http_factory()
+            except:
+                self._release(host_key, None)
+                raise
+        return http
+
+    def _release(self, host_key, http):
+        """Return an HTTP object to the pool.
+
+        :type host_key: str
+        :param host_key: The pool key, as returned by :meth:`_host_key`.
+
+        :type http: :class:`httplib2.Http`
+        :param http: The object to return; if :data:`None`, the slot it
+                     occupied is freed without returning an object.
+        """
+        with self._available:
+            host = self._hosts.setdefault(host_key, _HostPool())
+            host.in_use -= 1
+            if http is None:
+                self._stats['discarded'] += 1
+            else:
+                host.idle.append((_NOW(), http))
+            self._available.notify()
+
+    ACCEPTS_TIMEOUT = True
+    """:meth:`request` takes a ``timeout`` for each request."""
+
+    def request(self, uri, method='GET', body=None, headers=None,
+                redirections=httplib2.DEFAULT_MAX_REDIRECTS,
+                connection_type=None, timeout=None):
+        """Send a request using a pooled HTTP object.
+
+        Same signature as :meth:`httplib2.Http.request`, plus ``timeout``.
+
+        :type uri: str
+        :param uri: The URI to send the request to.
+
+        :type method: str
+        :param method: The HTTP method to use.
+
+        :type body: str
+        :param body: (Optional) The body of the request.
+
+        :type headers: dict
+        :param headers: (Optional) The headers to send.
+
+        :type redirections: int
+        :param redirections: (Optional) Number of redirects to follow.
+
+        :type connection_type: type
+        :param connection_type: (Optional) Connection class to use.
+
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out. Defaults to the timeout of the pooled
+                        HTTP object.
+
+        :rtype: tuple of ``response`` (a dictionary of sorts)
+                and ``content`` (a string).
+        :returns: The HTTP response object and the content of the response.
+        """
+        host_key = self._host_key(uri)
+        http = self._acquire(host_key)
+        try:
+            if timeout is not None:
+                previous = _set_http_timeout(http, timeout)
+            try:
+                result = http.request(
+                    uri, method=method, body=body, headers=headers,
+                    redirections=redirections,
+                    connection_type=connection_type)
+            finally:
+                if timeout is not None:
+                    _set_http_timeout(http, previous)
+        except:
+            self._release(host_key, None)
+            _close_http(http)
+            raise
+        self._release(host_key, http)
+        return result
+
+    def stats(self):
+        """Statistics describing the use of the pool.
+
+        :rtype: dict
+        :returns: Counters for ``requests`` sent, HTTP objects ``created``,
+                  ``reused``, ``discarded`` after errors and ``evicted``
+                  after being idle, the number of ``waits`` for a free
+                  slot, as well as the current number of ``in_use`` and
+                  ``idle`` objects (in total and per ``hosts``).
+        """
+        with self._lock:
+            result = dict(self._stats)
+            result['hosts'] = {
+                host_key: {'in_use': host.in_use, 'idle': len(host.idle)}
+                for host_key, host in self._hosts.items()
+            }
+        result['in_use'] = sum(
+            host['in_use'] for host in result['hosts'].values())
+        result['idle'] = sum(
+            host['idle'] for host in result['hosts'].values())
+        return result
+
+    def clear(self):
+        """Close all idle connections held by the pool.
+
+        Objects checked out by in-flight requests are unaffected and are
+        returned to the pool as usual.
+        """
+        with self._lock:
+            idle = []
+            for host_key, host in list(self._hosts.items()):
+                idle.extend(http for _, http in host.idle)
+                host.idle = []
+                if not host.in_use:
+                    del self._hosts[host_key]
+        for http in idle:
+            _close_http(http)
+
+    def reset_after_fork(self):
+        """Forget the connections inherited from a parent process.
+
+        Called in a forked child: the connections are still used by the
+        parent, so they are dropped without being closed, and the lock
+        (which may have been held by a thread of the parent) is replaced.
+        """
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._hosts = {}
+
+
+def authorized_pooled_http(credentials, **kwargs):
+    """Create a :class:`PooledHttp` which authorizes its requests.
+
+    :type credentials: :class:`google.auth.credentials.Credentials`
+    :param credentials: The credentials used to authorize requests.
+
+    :type kwargs: dict
+    :param kwargs: Keyword arguments passed to :class:`PooledHttp`.
+
+    :rtype: :class:`google_auth_httplib2.AuthorizedHttp`
+    :returns: An authorized HTTP object backed by a connection pool.
+    """
+    return google_auth_httplib2.AuthorizedHttp(
+        credentials, http=PooledHttp(**kwargs))
@@ -213,6 +213,27 @@ class Test_Response(unittest.TestCase):
         self.assertTrue(response.is_redirect)
 
 
+class Test__parse_retry_after(unittest.TestCase):
+
+    def _call_fut(self, info):
+        from google.cloud.streaming.http_wrapper import _parse_retry_after
+
+        return _parse_retry_after(info)
+
+    def test_missing(self):
+        self.assertIsNone(self._call_fut({}))
+
+    def test_seconds(self):
+        self.assertEqual(self._call_fut({'retry-after': '7'}), 7)
+
+    def test_negative(self):
+        self.assertEqual(self._call_fut({'retry-after': '-3'}), 0)
+
+    def test_http_date(self):
+        info = {'retry-after': 'Fri, 31 Dec 1999 23:59:59 GMT'}
+        self.assertIsNone(self._call_fut(info))
+
+
 class Test__check_response(unittest.TestCase):
 
     def _call_fut(self, *args, **kw):
@@ -15,6 +15,151 @@
 import unittest
 
 
+class TestChunkSizeTuner(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.streaming.transfer import ChunkSizeTuner
+        return ChunkSizeTuner
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        from google.cloud.streaming.transfer import _DEFAULT_CHUNKSIZE
+        tuner = self._make_one()
+        self.assertEqual(tuner.target_seconds, 2.0)
+        self.assertEqual(tuner.min_size, 256 * 1024)
+        self.assertEqual(tuner.max_size, 256 << 20)
+        self.assertEqual(tuner.multiple, 256 * 1024)
+        self.assertEqual(tuner.chunksize, _DEFAULT_CHUNKSIZE)
+        self.assertIsNone(tuner.bandwidth)
+        self.assertIsNone(tuner.rtt)
+        self.assertIsNone(tuner.strategy)
+        self.assertEqual(tuner.chunks, 0)
+
+    def test_record_grows_chunksize(self):
+        MULTIPLE = 256 * 1024
+        tuner = self._make_one(target_seconds=1.0)
+        # 1 MB in 0.125 seconds:  8 MB per second, but at most 4x growth.
+        found = tuner.record(1 << 20, 0.125)
+        self.assertEqual(found, 4 << 20)
+        self.assertEqual(tuner.chunksize, 4 << 20)
+        self.assertEqual(tuner.bandwidth, 8 << 20)
+        self.assertEqual(tuner.chunks, 1)
+        found = tuner.record(4 << 20, 0.5)
+        self.assertEqual(found, 8 << 20)
+        self.assertEqual(found % MULTIPLE, 0)
+
+    def test_record_shrinks_chunksize(self):
+        MULTIPLE = 256 * 1024
+        tuner = self._make_one(target_seconds=1.0)
+        tuner.chunksize = 8 << 20
+        # 8 MB in 4 seconds:  2 MB per second.
+        found = tuner.record(8 << 20, 4.0)
+        self.assertEqual(found, 2 << 20)
+        # 2 MB in 20 seconds:  bounded by the minimum chunk size.
+        tuner.bandwidth = None
+        tuner.chunksize = MULTIPLE
+        found = tuner.record(2 << 20, 20.0)
+        self.assertEqual(found, MULTIPLE)
+
+    def test_record_rounds_to_multiple_and_clamps(self):
+        tuner = self._make_one(target_seconds=1.0, min_size=4,
+                               max_size=20, multiple=4)
+        tuner.chunksize = 8
+        self.assertEqual(tuner.record(10, 1.0), 8)
+        self.assertEqual(tuner.record(100, 1.0), 20)
+
+    def test_record_smooths_bandwidth(self):
+        tuner = self._make_one(smoothing=0.5)
+        tuner.record(100, 1.0)
+        tuner.record(300, 1.0)
+        self.assertEqual(tuner.bandwidth, 200.0)
+
+    def test_record_ignores_empty_or_instant_chunks(self):
+        from google.cloud.streaming.transfer import _DEFAULT_CHUNKSIZE
+        tuner = self._make_one()
+        self.assertEqual(tuner.record(0, 1.0), _DEFAULT_CHUNKSIZE)
+        self.assertEqual(tuner.record(100, 0.0), _DEFAULT_CHUNKSIZE)
+        self.assertIsNone(tuner.bandwidth)
+        self.assertEqual(tuner.chunks, 0)
+
+    def test_record_rtt_keeps_minimum(self):
+        tuner = self._make_one()
+        tuner.record_rtt(0.5)
+        tuner.record_rtt(0.25)
+        tuner.record_rtt(1.0)
+        self.assertEqual(tuner.rtt, 0.25)
+
+    def test_resumable_threshold(self):
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD_THRESHOLD
+        tuner = self._make_one(target_seconds=2.0)
+        self.assertEqual(tuner.resumable_threshold(),
+                         RESUMABLE_UPLOAD_THRESHOLD)
+        tuner.bandwidth = 1024.0
+        self.assertEqual(tuner.resumable_threshold(),
+                         RESUMABLE_UPLOAD_THRESHOLD)
+        tuner.bandwidth = float(50 << 20)
+        self.assertEqual(tuner.resumable_threshold(), 100 << 20)
+        tuner.bandwidth = float(1 << 30)
+        self.assertEqual(tuner.resumable_threshold(), tuner.max_size)
+
+    def test_snapshot(self):
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+        tuner = self._make_one(target_seconds=1.0)
+        tuner.record(1 << 20, 0.5)
+        tuner.record_rtt(0.125)
+        tuner.strategy = RESUMABLE_UPLOAD
+        self.assertEqual(tuner.snapshot(), {
+            'chunksize': 2 << 20,
+            'bandwidth': float(2 << 20),
+            'rtt': 0.125,
+            'resumable_threshold': tuner.resumable_threshold(),
+            'strategy': RESUMABLE_UPLOAD,
+            'chunks': 1,
+        })
+
+
+class Test_ChunkReader(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.streaming.transfer import _ChunkReader
+
+        return _ChunkReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_w_chunksize_callable(self):
+        import io
+
+        sizes = iter([2, 3, 5, 5])
+        reader = self._make_one(io.BytesIO(b'ABCDEFGHIJ'),
+                                lambda: next(sizes), depth=1)
+        try:
+            chunks = [reader.get() for _ in range(4)]
+        finally:
+            reader.close()
+
+        self.assertEqual(chunks, [(0, b'AB'), (2, b'CDE'),
+                                  (5, b'FGHIJ'), (10, b'')])
+
+    def test_w_checksum_from_middle_of_stream(self):
+        import io
+
+        stream = io.BytesIO(b'ABCDEFGHIJ')
+        stream.seek(4)
+        reader = self._make_one(stream, 10, checksum=True)
+        try:
+            self.assertEqual(reader.get(), (4, b'EFGHIJ'))
+        finally:
+            reader.close()
+
+        self.assertIsNone(reader.md5)
+
+
 class Test__Transfer(unittest.TestCase):
     URL = 'http://example.com/api'
 
@@ -59,6 +204,34 @@ class Test__Transfer(unittest.TestCase):
         self.assertIs(xfer.http, HTTP)
         self.assertEqual(xfer.num_retries, NUM_RETRIES)
 
+    def test_ctor_w_chunk_tuner(self):
+        tuner = _Dummy(chunksize=1 << 19)
+        xfer = self._make_one(_Stream(), chunksize=1 << 18, chunk_tuner=tuner)
+        self.assertIs(xfer.chunk_tuner, tuner)
+        self.assertEqual(xfer.chunksize, 1 << 19)
+
+    def test__adapt_chunksize_wo_chunk_tuner(self):
+        xfer = self._make_one(_Stream(), chunksize=100)
+        xfer._adapt_chunksize(1000, 0.0)
+        self.assertEqual(xfer.chunksize, 100)
+
+    def test__adapt_chunksize_w_chunk_tuner(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        tuner = _Tuner(chunksize=100, record=350)
+        xfer = self._make_one(_Stream(), chunk_tuner=tuner)
+        with _Monkey(MUT, _NOW=lambda: 12.5):
+            xfer._adapt_chunksize(1000, 10.0)
+        self.assertEqual(tuner._recorded, [(1000, 2.5)])
+        self.assertEqual(xfer.chunksize, 350)
+        with _Monkey(MUT, _NOW=lambda: 12.5):
+            xfer._adapt_chunksize(1000, 10.0, granularity=100)
+        self.assertEqual(xfer.chunksize, 300)
+        tuner._next = 50
+        with _Monkey(MUT, _NOW=lambda: 12.5):
+            xfer._adapt_chunksize(1000, 10.0, granularity=100)
+        self.assertEqual(xfer.chunksize, 100)
+
     def test_bytes_http_fallback_to_http(self):
         stream = _Stream()
         HTTP = object()
@@ -765,6 +938,46 @@ class Test_Download(unittest.TestCase):
                          [CONTENT[:CHUNK_SIZE], CONTENT[CHUNK_SIZE:]])
         self.assertEqual(download.total_size, LEN)
 
+    def test_stream_file_w_chunk_tuner(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        CONTENT = b'ABCDEFGHIJ'
+        LEN = len(CONTENT)
+        stream = _Stream()
+        http = object()
+        tuner = _Tuner(chunksize=4, record=2)
+        download = self._make_one(stream, chunk_tuner=tuner)
+        self.assertEqual(download.chunksize, 4)
+        info_1 = {'content-range': 'bytes 0-2/%d' % (LEN,)}
+        download._initial_response = _makeResponse(
+            http_client.PARTIAL_CONTENT, info_1, CONTENT[:3])
+        info_2 = {'content-range': 'bytes 3-6/%d' % (LEN,)}
+        response_2 = _makeResponse(
+            http_client.PARTIAL_CONTENT, info_2, CONTENT[3:7])
+        info_3 = {'content-range': 'bytes 7-8/%d' % (LEN,)}
+        response_3 = _makeResponse(
+            http_client.PARTIAL_CONTENT, info_3, CONTENT[7:9])
+        info_4 = {'content-range': 'bytes 9-9/%d' % (LEN,)}
+        response_4 = _makeResponse(http_client.OK, info_4, CONTENT[9:])
+        requester = _MakeRequest(response_2, response_3, response_4)
+        download._initialize(http, _Request.URL)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester,
+                     _NOW=_Clock(0.0, 0.5, 1.0, 2.0, 3.0, 3.25)):
+            download.stream_file()
+
+        self.assertEqual(
+            [request.headers for request, _, _ in requester._requested],
+            [{'range': 'bytes=3-6'},
+             {'range': 'bytes=7-8'},
+             {'range': 'bytes=9-9'}])
+        self.assertEqual(tuner._recorded, [(4, 0.5), (2, 1.0), (1, 0.25)])
+        self.assertEqual(download.chunksize, 2)
+        self.assertEqual(b''.join(stream._written), CONTENT)
+
     def test_stream_file_wo_initial_response_wo_total_size(self):
         from six.moves import http_client
         from google.cloud._testing import _Monkey
@@ -795,6 +1008,140 @@ class Test_Download(unittest.TestCase):
         self.assertEqual(stream._written, [CONTENT])
         self.assertEqual(download.total_size, LEN)
 
+    def _make_parallel(self, content, chunk_size, **kw):
+        import io
+        from six.moves import http_client
+
+        stream = io.BytesIO()
+        download = self._make_one(stream, chunksize=chunk_size,
+                                  total_size=len(content), **kw)
+        info = {'content-range': 'bytes 0-%d/%d' % (
+            chunk_size - 1, len(content))}
+        download._initial_response = _makeResponse(
+            http_client.PARTIAL_CONTENT, info, content[:chunk_size])
+        download._initialize(object(), _Request.URL)
+        return download, stream
+
+    def test_stream_file_parallel(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+
+        CONTENT = b'ABCDEFGHIJ'
+        progress = []
+        download, stream = self._make_parallel(
+            CONTENT, 3, parallelism=4,
+            progress_callback=lambda done, total: progress.append(total))
+        requester = _RangeRequester(CONTENT)
+
+        with _Monkey(MUT, Request=_Request, make_api_request=requester):
+            download.stream_file(headers={'foo': 'bar'})
+
+        self.assertEqual(stream.getvalue(), CONTENT)
+        self.assertEqual(stream.tell(), len(CONTENT))
+        self.assertEqual(download.progress, len(CONTENT))
+        self.assertEqual(sorted(requester._ranges),
+                         ['bytes=3-5', 'bytes=6-8', 'bytes=9-9'])
+        self.assertEqual(progress, [len(CONTENT)] * 4)
+
+    def test_stream_file_parallel_w_chunk_tuner(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+
+        CONTENT = b'ABCDEFGHIJ'
+        tuner = _Tuner(3, record=4)
+        download, stream = self._make_parallel(
+            CONTENT, 3, parallelism=1, chunk_tuner=tuner)
+        requester = _RangeRequester(CONTENT)
+
+        with _Monkey(MUT, Request=_Request, make_api_request=requester):
+            download._stream_file_parallel()
+
+        self.assertEqual(stream.getvalue(), CONTENT)
+        # A single worker: each range is sized after the previous one.
+        self.assertEqual(requester._ranges,
+                         ['bytes=0-2', 'bytes=3-6', 'bytes=7-9'])
+        self.assertEqual([nbytes for nbytes, _ in tuner._recorded],
+                         [3, 4, 3])
+        self.assertEqual(download.chunksize, 4)
+
+    def test_stream_file_parallel_w_short_response(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+
+        CONTENT = b'ABCDEFGHIJ'
+        download, stream = self._make_parallel(CONTENT, 5, parallelism=2)
+        requester = _RangeRequester(CONTENT, max_length=2)
+
+        with _Monkey(MUT, Request=_Request, make_api_request=requester):
+            download.stream_file()
+
+        self.assertEqual(stream.getvalue(), CONTENT)
+        self.assertEqual(requester._ranges,
+                         ['bytes=5-9', 'bytes=7-9', 'bytes=9-9'])
+
+    def test_stream_file_parallel_w_retries_exhausted(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.exceptions import TransferRetryError
+
+        CONTENT = b'ABCDEFGHIJ'
+        download, _ = self._make_parallel(
+            CONTENT, 5, parallelism=2, num_retries=1)
+        requester = _RangeRequester(
+            CONTENT, status_code=http_client.SERVICE_UNAVAILABLE)
+
+        with _Monkey(MUT, Request=_Request, make_api_request=requester):
+            with self.assertRaises(TransferRetryError):
+                download.stream_file()
+
+        self.assertEqual(len(requester._ranges), 2)
+
+    def test_stream_file_parallel_w_not_found(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.exceptions import HttpError
+
+        CONTENT = b'ABCDEFGHIJ'
+        download, _ = self._make_parallel(CONTENT, 3, parallelism=2)
+        requester = _RangeRequester(
+            CONTENT, status_code=http_client.NOT_FOUND)
+
+        with _Monkey(MUT, Request=_Request, make_api_request=requester):
+            with self.assertRaises(HttpError):
+                download.stream_file()
+
+    def test_stream_file_parallel_w_full_response(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+
+        CONTENT = b'ABCDEFGHIJ'
+        download, stream = self._make_parallel(CONTENT, 4, parallelism=2)
+        requester = _RangeRequester(CONTENT, status_code=http_client.OK)
+
+        with _Monkey(MUT, Request=_Request, make_api_request=requester):
+            download.stream_file()
+
+        self.assertEqual(stream.getvalue(), CONTENT)
+
+    def test_stream_file_parallel_w_unseekable_stream(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+
+        CONTENT = b'ABCDEF'
+        stream = _StreamWithSeekableMethod(seekable=False)
+        download, _ = self._make_parallel(CONTENT, 3, parallelism=2)
+        download._stream = stream
+        requester = _RangeRequester(CONTENT)
+
+        with _Monkey(MUT, Request=_Request, make_api_request=requester):
+            download.stream_file()
+
+        self.assertEqual(stream._written, [b'ABC', b'DEF'])
+        self.assertEqual(requester._ranges, ['bytes=3-5'])
+
 
 class Test_Upload(unittest.TestCase):
     URL = "http://example.com/api"
@@ -984,6 +1331,24 @@ class Test_Upload(unittest.TestCase):
         upload._set_default_strategy(config, request)
         self.assertEqual(upload.strategy, RESUMABLE_UPLOAD)
 
+    def test__set_default_strategy_w_chunk_tuner(self):
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+        from google.cloud.streaming.transfer import SIMPLE_UPLOAD
+        config = _UploadConfig()
+        request = _Request()
+        tuner = _Tuner(chunksize=100, threshold=1000)
+        upload = self._make_one(
+            _Stream(), total_size=1000, chunk_tuner=tuner)
+        upload._set_default_strategy(config, request)
+        self.assertEqual(upload.strategy, SIMPLE_UPLOAD)
+        self.assertEqual(tuner.strategy, SIMPLE_UPLOAD)
+
+        upload = self._make_one(
+            _Stream(), total_size=1001, chunk_tuner=tuner)
+        upload._set_default_strategy(config, request)
+        self.assertEqual(upload.strategy, RESUMABLE_UPLOAD)
+        self.assertEqual(tuner.strategy, RESUMABLE_UPLOAD)
+
     def test__set_default_strategy_w_body_wo_multipart(self):
         from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
         CONTENT = b'ABCDEFGHIJ'
@@ -1050,6 +1415,115 @@ class Test_Upload(unittest.TestCase):
         self.assertEqual(request.body, CONTENT)
         self.assertEqual(request.loggable_body, '<media body>')
 
+    def test_configure_request_w_simple_zero_copy(self):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.streaming.transfer import SIMPLE_UPLOAD
+        CONTENT = b'CONTENT'
+        config = _UploadConfig()
+        request = _Request()
+        url_builder = _Dummy(query_params={})
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(CONTENT)
+            with open(temp.name, 'rb') as file_obj:
+                file_obj.seek(2)
+                upload = self._make_one(file_obj, zero_copy=True)
+                upload.strategy = SIMPLE_UPLOAD
+                upload.configure_request(config, request, url_builder)
+                self.assertEqual(file_obj.tell(), len(CONTENT))
+
+                self.assertIsInstance(request.body, memoryview)
+                self.assertEqual(request.body.tobytes(), CONTENT[2:])
+                self.assertEqual(request.loggable_body, '<media body>')
+                request.body.release()
+                upload._view.release()
+
+    def test_configure_request_w_simple_w_body_zero_copy(self):
+        from google.cloud._helpers import _to_bytes
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.streaming.transfer import SIMPLE_UPLOAD
+        from google.cloud.streaming.transfer import _BufferList
+        CONTENT = b'CONTENT'
+        BODY = b'BODY'
+        config = _UploadConfig()
+        request = _Request(body=BODY)
+        request.headers['content-type'] = 'text/plain'
+        url_builder = _Dummy(query_params={})
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(CONTENT)
+            with open(temp.name, 'rb') as file_obj:
+                upload = self._make_one(file_obj, zero_copy=True)
+                upload.strategy = SIMPLE_UPLOAD
+                upload.configure_request(config, request, url_builder)
+
+                self.assertEqual(url_builder.query_params,
+                                 {'uploadType': 'multipart'})
+                self.assertIsInstance(request.body, _BufferList)
+                head, media, tail = request.body
+                self.assertIsInstance(media, memoryview)
+                self.assertEqual(media.tobytes(), CONTENT)
+                body = b''.join([head, media.tobytes(), tail])
+                media.release()
+                upload._view.release()
+
+        ctype, boundary = [x.strip()
+                           for x in request.headers['content-type'].split(';')]
+        self.assertEqual(ctype, 'multipart/related')
+        divider = b'--' + _to_bytes(boundary[len('boundary="'):-1])
+        chunks = body.split(divider)[1:-1]  # discard prolog / epilog
+        self.assertEqual(len(chunks), 2)
+
+        parse_chunk = _email_chunk_parser()
+        text_msg = parse_chunk(chunks[0].strip())
+        self.assertEqual(dict(text_msg._headers),
+                         {'Content-Type': 'text/plain',
+                          'MIME-Version': '1.0'})
+        self.assertEqual(text_msg._payload, BODY.decode('ascii'))
+
+        app_msg = parse_chunk(chunks[1].strip())
+        self.assertEqual(dict(app_msg._headers),
+                         {'Content-Type': self.MIME_TYPE,
+                          'Content-Transfer-Encoding': 'binary',
+                          'MIME-Version': '1.0'})
+        self.assertEqual(app_msg._payload, CONTENT.decode('ascii'))
+        self.assertEqual(request.loggable_body,
+                         head + b'<media body>' + tail)
+
+    def test_configure_request_w_simple_zero_copy_unmappable(self):
+        from google.cloud.streaming.transfer import SIMPLE_UPLOAD
+        CONTENT = b'CONTENT'
+        request = _Request()
+        upload = self._make_one(_Stream(CONTENT), zero_copy=True)
+        upload.strategy = SIMPLE_UPLOAD
+
+        upload.configure_request(
+            _UploadConfig(), request, _Dummy(query_params={}))
+
+        self.assertEqual(request.body, CONTENT)
+        self.assertIs(upload._view, False)
+
+    def test_configure_request_w_simple_zero_copy_gzip_file(self):
+        import gzip
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.streaming.transfer import SIMPLE_UPLOAD
+        CONTENT = b'CONTENT' * 100
+        request = _Request()
+
+        with _NamedTemporaryFile() as temp:
+            with gzip.open(temp.name, 'wb') as file_obj:
+                file_obj.write(CONTENT)
+            with gzip.open(temp.name, 'rb') as file_obj:
+                upload = self._make_one(file_obj, zero_copy=True)
+                upload.strategy = SIMPLE_UPLOAD
+                upload.configure_request(
+                    _UploadConfig(), request, _Dummy(query_params={}))
+
+        self.assertEqual(request.body, CONTENT)
+        self.assertIs(upload._view, False)
+
     def test_configure_request_w_simple_w_body(self):
         from google.cloud._helpers import _to_bytes
         from google.cloud.streaming.transfer import SIMPLE_UPLOAD
@@ -1379,6 +1853,30 @@ class Test_Upload(unittest.TestCase):
         self.assertEqual(chunk_request.http_method, 'PUT')
         self.assertEqual(chunk_request.body, CONTENT)
 
+    def test_initialize_upload_w_chunk_tuner(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+        http = object()
+        request = _Request()
+        tuner = _Tuner(chunksize=100)
+        upload = self._make_one(_Stream(b'ABC'), auto_transfer=False,
+                                chunk_tuner=tuner)
+        upload.strategy = RESUMABLE_UPLOAD
+        info = {'location': self.UPLOAD_URL}
+        requester = _MakeRequest(_makeResponse(http_client.OK, info))
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester,
+                     _NOW=_Clock(1.0, 1.25)):
+            upload.initialize_upload(request, http)
+
+        self.assertEqual(upload.url, self.UPLOAD_URL)
+        self.assertEqual(tuner._rtts, [0.25])
+        self.assertEqual(tuner._recorded, [])
+
     def test__last_byte(self):
         upload = self._make_one(_Stream())
         self.assertEqual(upload._last_byte('123-456'), 456)
@@ -1544,6 +2042,41 @@ class Test_Upload(unittest.TestCase):
                           'Content-Type': self.MIME_TYPE})
         self.assertEqual(request_2.body, CONTENT[6:])
 
+    def test_stream_file_incomplete_w_chunk_tuner(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+        CONTENT = b'ABCDEFGHIJ'
+        http = object()
+        stream = _Stream(CONTENT)
+        tuner = _Tuner(chunksize=4, record=7)
+        upload = self._make_one(stream, chunk_tuner=tuner)
+        upload.strategy = RESUMABLE_UPLOAD
+        upload._server_chunk_granularity = 2
+        upload._initialize(http, self.UPLOAD_URL)
+
+        info_1 = {'content-length': '0', 'range': 'bytes=0-3'}
+        response_1 = _makeResponse(RESUME_INCOMPLETE, info_1)
+        info_2 = {'content-length': '0', 'range': 'bytes=0-9'}
+        response_2 = _makeResponse(http_client.OK, info_2)
+        requester = _MakeRequest(response_1, response_2)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester,
+                     _NOW=_Clock(0.0, 2.0, 2.0, 3.0)):
+            response = upload.stream_file()
+
+        self.assertIs(response, response_2)
+        self.assertEqual(tuner._recorded, [(4, 2.0), (6, 1.0)])
+        self.assertEqual(upload.chunksize, 6)
+        request_1, request_2 = [
+            request for request, _, _ in requester._requested]
+        self.assertEqual(request_1.body, CONTENT[:4])
+        self.assertEqual(request_2.body, CONTENT[4:])
+
     def test_stream_file_incomplete_w_transfer_error(self):
         from google.cloud._testing import _Monkey
         from google.cloud.streaming import transfer as MUT
@@ -1582,6 +2115,282 @@ class Test_Upload(unittest.TestCase):
                           'Content-Type': self.MIME_TYPE})
         self.assertEqual(request.body, CONTENT[:6])
 
+    def _make_pipelined(self, content, total_size=None, pipeline_depth=2,
+                        **kw):
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+        stream = _Stream(content)
+        upload = self._make_one(stream, chunksize=6, total_size=total_size,
+                                pipeline_depth=pipeline_depth, **kw)
+        upload.strategy = RESUMABLE_UPLOAD
+        upload._server_chunk_granularity = 6
+        upload._initialize(object(), self.UPLOAD_URL)
+        return upload, stream
+
+    def test_stream_file_pipelined(self):
+        import base64
+        import hashlib
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        CONTENT = b'ABCDEFGHIJ'
+        upload, stream = self._make_pipelined(CONTENT, checksum=True)
+
+        info_1 = {'content-length': '0', 'range': 'bytes=0-5'}
+        response_1 = _makeResponse(RESUME_INCOMPLETE, info_1)
+        response_2 = _makeResponse(http_client.OK, {'content-length': '0'})
+        requester = _MakeRequest(response_1, response_2)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester):
+            response = upload.stream_file()
+
+        self.assertIs(response, response_2)
+        self.assertTrue(upload.complete)
+        self.assertEqual(upload.total_size, len(CONTENT))
+        self.assertEqual(stream.tell(), len(CONTENT))
+        expected_md5 = base64.b64encode(hashlib.md5(CONTENT).digest())
+        self.assertEqual(upload.md5_hash, expected_md5.decode('ascii'))
+
+        request_1 = requester._requested[0][0]
+        self.assertEqual(request_1.headers,
+                         {'Content-Range': 'bytes 0-5/*',
+                          'Content-Type': self.MIME_TYPE})
+        self.assertEqual(request_1.body, CONTENT[:6])
+        request_2 = requester._requested[1][0]
+        self.assertEqual(request_2.headers,
+                         {'Content-Range': 'bytes 6-9/10',
+                          'Content-Type': self.MIME_TYPE})
+        self.assertEqual(request_2.body, CONTENT[6:])
+
+    def test_stream_file_w_checksum_wo_pipeline_depth(self):
+        import base64
+        import hashlib
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        CONTENT = b'ABCDEFGHIJ'
+        upload, _ = self._make_pipelined(CONTENT, pipeline_depth=None,
+                                         checksum=True)
+
+        info_1 = {'content-length': '0', 'range': 'bytes=0-5'}
+        response_1 = _makeResponse(RESUME_INCOMPLETE, info_1)
+        response_2 = _makeResponse(http_client.OK, {'content-length': '0'})
+        requester = _MakeRequest(response_1, response_2)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester):
+            upload.stream_file()
+
+        expected_md5 = base64.b64encode(hashlib.md5(CONTENT).digest())
+        self.assertEqual(upload.md5_hash, expected_md5.decode('ascii'))
+        self.assertEqual(len(requester._requested), 2)
+
+    def test_stream_file_w_checksum_resumed(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.exceptions import CommunicationError
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        CONTENT = b'ABCDEFGHIJ'
+        upload, stream = self._make_pipelined(
+            CONTENT, total_size=len(CONTENT), checksum=True)
+
+        info_1 = {'content-length': '0', 'range': 'bytes=0-3'}
+        response_1 = _makeResponse(RESUME_INCOMPLETE, info_1)
+        response_2 = _makeResponse(http_client.OK, {'content-length': '0'})
+        requester = _MakeRequest(response_1, response_2)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester):
+            with self.assertRaises(CommunicationError):
+                upload.stream_file()
+            self.assertEqual(stream.tell(), 4)
+            upload.stream_file()
+
+        self.assertTrue(upload.complete)
+        request_2 = requester._requested[1][0]
+        self.assertEqual(request_2.body, CONTENT[4:])
+        # The hash would only cover the data sent after resuming.
+        self.assertIsNone(upload.md5_hash)
+
+    def test_stream_file_pipelined_w_chunk_tuner(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+        CONTENT = b'ABCDEFGHIJKLMNOPQRSTUVWX'
+        tuner = _Tuner(chunksize=4, record=8)
+        upload = self._make_one(_Stream(CONTENT), total_size=len(CONTENT),
+                                pipeline_depth=1, chunk_tuner=tuner)
+        upload.strategy = RESUMABLE_UPLOAD
+        upload._server_chunk_granularity = 2
+        upload._initialize(object(), self.UPLOAD_URL)
+        requested = []
+
+        def requester(http, request, **kw):
+            requested.append(request)
+            byte_range = request.headers['Content-Range'].split(' ')[1]
+            last = int(byte_range.split('/')[0].split('-')[1])
+            if last + 1 == len(CONTENT):
+                return _makeResponse(http_client.OK, {'content-length': '0'})
+            info = {'content-length': '0', 'range': 'bytes=0-%d' % last}
+            return _makeResponse(RESUME_INCOMPLETE, info)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester,
+                     _NOW=lambda: 0.0):
+            upload.stream_file()
+
+        self.assertTrue(upload.complete)
+        sizes = [len(request.body) for request in requested]
+        self.assertEqual(b''.join(request.body for request in requested),
+                         CONTENT)
+        # Each chunk sent is timed.
+        self.assertEqual([nbytes for nbytes, _ in tuner._recorded], sizes)
+        # The chunks read ahead keep the initial size; later ones use the
+        # size picked by the tuner.
+        self.assertEqual(sizes[:2], [4, 4])
+        self.assertEqual(sizes[-2], 8)
+        self.assertEqual(upload.chunksize, 8)
+
+    def test_stream_file_pipelined_w_total_size(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        CONTENT = b'ABCDEFGHIJ'
+        upload, _ = self._make_pipelined(CONTENT, total_size=len(CONTENT))
+
+        info_1 = {'content-length': '0', 'range': 'bytes=0-5'}
+        response_1 = _makeResponse(RESUME_INCOMPLETE, info_1)
+        response_2 = _makeResponse(http_client.OK, {'content-length': '0'})
+        requester = _MakeRequest(response_1, response_2)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester):
+            upload.stream_file()
+
+        self.assertIsNone(upload.md5_hash)
+        ranges = [request.headers['Content-Range']
+                  for request, _, _ in requester._requested]
+        self.assertEqual(ranges, ['bytes 0-5/10', 'bytes 6-9/10'])
+
+    def test_stream_file_pipelined_empty_stream(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        upload, _ = self._make_pipelined(b'')
+        response = _makeResponse(http_client.OK, {'content-length': '0'})
+        requester = _MakeRequest(response)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester):
+            upload.stream_file()
+
+        request = requester._requested[0][0]
+        self.assertEqual(request.headers['Content-Range'], 'bytes */0')
+
+    def test_stream_file_pipelined_w_transfer_error(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.exceptions import CommunicationError
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        CONTENT = b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+        upload, stream = self._make_pipelined(CONTENT)
+
+        info = {'content-length': '0', 'range': 'bytes=0-4'}
+        response = _makeResponse(RESUME_INCOMPLETE, info)
+        requester = _MakeRequest(response)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester):
+            with self.assertRaises(CommunicationError):
+                upload.stream_file()
+
+        self.assertEqual(len(requester._requested), 1)
+        self.assertEqual(stream.tell(), 5)
+
+    def test_stream_file_pipelined_w_http_error(self):
+        from six.moves import http_client
+        from google.cloud._testing import _Monkey
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.exceptions import HttpError
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        CONTENT = b'ABCDEFGHIJ'
+        upload, stream = self._make_pipelined(CONTENT)
+
+        response = _makeResponse(http_client.FORBIDDEN)
+        refresh_response = _makeResponse(
+            RESUME_INCOMPLETE, {'range': 'bytes=0-2'})
+        requester = _MakeRequest(response, refresh_response)
+
+        with _Monkey(MUT,
+                     Request=_Request,
+                     make_api_request=requester):
+            with self.assertRaises(HttpError):
+                upload.stream_file()
+
+        self.assertEqual(upload.progress, 3)
+        self.assertEqual(stream.tell(), 3)
+
+    def test_stream_file_pipelined_w_read_error(self):
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+
+        class _BrokenStream(_Stream):
+            def read(self, size=None):
+                raise IOError('disk on fire')
+
+        upload = self._make_one(_BrokenStream(), chunksize=6,
+                                pipeline_depth=2)
+        upload.strategy = RESUMABLE_UPLOAD
+        upload._server_chunk_granularity = 6
+        upload._initialize(object(), self.UPLOAD_URL)
+
+        with self.assertRaises(IOError):
+            upload.stream_file()
+
+    def test__send_chunk_zero_copy(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.streaming import transfer as MUT
+        from google.cloud.streaming.http_wrapper import RESUME_INCOMPLETE
+        CONTENT = b'ABCDEFGHIJ'
+        info = {'content-length': '0', 'range': 'bytes=0-5'}
+        requester = _MakeRequest(_makeResponse(RESUME_INCOMPLETE, info))
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(CONTENT)
+            with open(temp.name, 'rb') as file_obj:
+                upload = self._make_one(file_obj, chunksize=6,
+                                        total_size=len(CONTENT),
+                                        zero_copy=True)
+                upload._initialize(object(), self.UPLOAD_URL)
+                with _Monkey(MUT,
+                             Request=_Request,
+                             make_api_request=requester):
+                    upload._send_chunk(0)
+                self.assertEqual(file_obj.tell(), 6)
+                body = requester._requested[0][0].body
+                self.assertIsInstance(body, memoryview)
+                self.assertEqual(body.tobytes(), CONTENT[:6])
+                body.release()
+
+                file_obj.seek(8)
+                with self.assertRaises(MUT.http_client.IncompleteRead):
+                    upload._media_view(6)
+                upload._view.release()
+
     def test__send_media_request_wo_error(self):
         from google.cloud._testing import _Monkey
         from google.cloud.streaming import transfer as MUT
@@ -1838,6 +2647,63 @@ class Test_Upload(unittest.TestCase):
         self.assertEqual(end, SIZE)
 
 
+class Test__map_stream(unittest.TestCase):
+
+    def _call_fut(self, stream):
+        from google.cloud.streaming.transfer import _map_stream
+        return _map_stream(stream)
+
+    def test_w_bytes_io(self):
+        import io
+        self.assertIsNone(self._call_fut(io.BytesIO(b'CONTENT')))
+
+    def test_w_empty_file(self):
+        from google.cloud._testing import _NamedTemporaryFile
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb'):
+                pass
+            with open(temp.name, 'rb') as file_obj:
+                self.assertIsNone(self._call_fut(file_obj))
+
+    def test_w_file(self):
+        from google.cloud._testing import _NamedTemporaryFile
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'CONTENT')
+            with open(temp.name, 'rb') as file_obj:
+                view = self._call_fut(file_obj)
+                self.assertEqual(view.tobytes(), b'CONTENT')
+                self.assertTrue(view.readonly)
+                view.release()
+
+    def test_w_raw_file(self):
+        from google.cloud._testing import _NamedTemporaryFile
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'CONTENT')
+            with open(temp.name, 'rb', buffering=0) as file_obj:
+                view = self._call_fut(file_obj)
+                self.assertEqual(view.tobytes(), b'CONTENT')
+                view.release()
+
+    def test_w_gzip_file(self):
+        import gzip
+        from google.cloud._testing import _NamedTemporaryFile
+        with _NamedTemporaryFile() as temp:
+            with gzip.open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'CONTENT' * 100)
+            with gzip.open(temp.name, 'rb') as file_obj:
+                self.assertIsNone(self._call_fut(file_obj))
+
+
+class Test__BufferList(unittest.TestCase):
+
+    def test_length(self):
+        from google.cloud.streaming.transfer import _BufferList
+        body = _BufferList([b'AB', memoryview(b'CDE'), b''])
+        self.assertEqual(body.length, 5)
+
+
 def _email_chunk_parser():
     import six
     if six.PY3:  # pragma: NO COVER  Python3
@@ -1855,6 +2721,37 @@ class _Dummy(object):
         self.__dict__.update(kw)
 
 
+class _Tuner(object):
+
+    strategy = None
+
+    def __init__(self, chunksize, record=None, threshold=None):
+        self.chunksize = chunksize
+        self._next = record
+        self._threshold = threshold
+        self._recorded = []
+        self._rtts = []
+
+    def record(self, nbytes, seconds):
+        self._recorded.append((nbytes, seconds))
+        return self._next
+
+    def record_rtt(self, seconds):
+        self._rtts.append(seconds)
+
+    def resumable_threshold(self):
+        return self._threshold
+
+
+class _Clock(object):
+
+    def __init__(self, *times):
+        self._times = list(times)
+
+    def __call__(self):
+        return self._times.pop(0)
+
+
 class _UploadConfig(object):
     accept = ('*/*',)
     max_size = None
@@ -1923,6 +2820,34 @@ class _MakeRequest(object):
         return self._responses.pop(0)
 
 
+class _RangeRequester(object):
+
+    def __init__(self, content, max_length=None, status_code=None):
+        import threading
+        self._content = content
+        self._max_length = max_length
+        self._status_code = status_code
+        self._lock = threading.Lock()
+        self._ranges = []
+
+    def __call__(self, http, request, **kw):
+        from six.moves import http_client
+        range_ = request.headers['range']
+        with self._lock:
+            self._ranges.append(range_)
+        if self._status_code == http_client.OK:
+            return _makeResponse(http_client.OK, {}, self._content)
+        elif self._status_code is not None:
+            return _makeResponse(self._status_code)
+        start, end = [int(byte) for byte in range_[6:].split('-')]
+        if self._max_length is not None:
+            end = min(end, start + self._max_length - 1)
+        info = {'content-range': 'bytes %d-%d/%d' % (
+            start, end, len(self._content))}
+        return _makeResponse(http_client.PARTIAL_CONTENT, info,
+                             self._content[start:end + 1])
+
+
 def _makeResponse(status_code, info=None, content='',
                   request_url=_Request.URL):
     if info is None:
@@ -0,0 +1,138 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+import mock
+
+
+class Test_generation(unittest.TestCase):
+
+    def _call_fut(self):
+        from google.cloud._fork import generation
+
+        return generation()
+
+    def test_stable(self):
+        self.assertEqual(self._call_fut(), self._call_fut())
+
+    def test_w_pid_check(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import _fork as MUT
+
+        state = {'pid': -1, 'generation': 3}
+        with _Monkey(MUT, _STATE=state, _GETPID=os.getpid):
+            self.assertEqual(self._call_fut(), 4)
+            self.assertEqual(self._call_fut(), 4)
+        self.assertEqual(state['pid'], os.getpid())
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'Requires os.fork')
+    def test_in_child(self):
+        parent = self._call_fut()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: NO COVER  Child process.
+            try:
+                os.write(write_fd, str(self._call_fut()).encode('ascii'))
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd, 'rb') as pipe:
+            child = int(pipe.read())
+        self.assertEqual(child, parent + 1)
+        self.assertEqual(self._call_fut(), parent)
+
+
+class Test_reset_http(unittest.TestCase):
+
+    def _call_fut(self, http):
+        from google.cloud._fork import reset_http
+
+        return reset_http(http)
+
+    def test_w_connections(self):
+        http = mock.Mock(spec=['request', 'connections'])
+        http.connections = {'https:www.googleapis.com': object()}
+        self._call_fut(http)
+        self.assertEqual(http.connections, {})
+
+    def test_w_authorized_http(self):
+        http = mock.Mock(spec=['request', 'reset_after_fork'])
+        authorized = mock.Mock(spec=['request', 'http'], http=http)
+        self._call_fut(authorized)
+        http.reset_after_fork.assert_called_once_with()
+
+    def test_wo_connections(self):
+        http = object()
+        self._call_fut(http)
+
+
+class TestForkSafeChannel(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud._fork import ForkSafeChannel
+
+        return ForkSafeChannel
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _forked(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import _fork
+
+        generation = _fork.generation() + 1
+        return _Monkey(_fork, generation=lambda: generation)
+
+    def test_channel(self):
+        channels = [mock.Mock(), mock.Mock()]
+        channel = self._make_one(lambda: channels.pop(0))
+        parent = channel.channel
+        self.assertIs(channel.channel, parent)
+        with self._forked():
+            child = channel.channel
+            self.assertIsNot(child, parent)
+            self.assertIs(channel.channel, child)
+
+    def test_multi_callables(self):
+        channels = [mock.Mock(), mock.Mock()]
+        parent, child = channels
+        channel = self._make_one(lambda: channels.pop(0))
+        for kind in ('unary_unary', 'unary_stream', 'stream_unary',
+                     'stream_stream'):
+            rpc = getattr(channel, kind)(
+                '/Service/Method', request_serializer=None)
+            rpc('REQUEST', timeout=5.0)
+            factory = getattr(parent, kind)
+            factory.assert_called_once_with(
+                '/Service/Method', request_serializer=None)
+            factory.return_value.assert_called_once_with(
+                'REQUEST', timeout=5.0)
+            self.assertIs(rpc.future, factory.return_value.future)
+
+        with self._forked():
+            rpc = channel.unary_unary('/Service/Method')
+            rpc.with_call('REQUEST')
+        child.unary_unary.return_value.with_call.assert_called_once_with(
+            'REQUEST')
+
+    def test_other_attributes(self):
+        grpc_channel = mock.Mock(spec=['subscribe'])
+        channel = self._make_one(lambda: grpc_channel)
+        self.assertIs(channel.subscribe, grpc_channel.subscribe)
+        with self.assertRaises(AttributeError):
+            getattr(channel, '_private')
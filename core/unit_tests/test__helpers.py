@@ -253,6 +253,38 @@ class Test__datetime_from_microseconds(unittest.TestCase):
         self.assertEqual(self._call_fut(NOW_MICROS), NOW)
 
 
+class Test__datetimes_from_microseconds(unittest.TestCase):
+
+    def _call_fut(self, values, **kw):
+        from google.cloud._helpers import _datetimes_from_microseconds
+        return _datetimes_from_microseconds(values, **kw)
+
+    def test_it(self):
+        import datetime
+        from google.cloud._helpers import UTC
+        from google.cloud._helpers import _microseconds_from_datetime
+
+        NOW = datetime.datetime(2015, 7, 29, 17, 45, 21, 123456,
+                                tzinfo=UTC)
+        NOW_MICROS = _microseconds_from_datetime(NOW)
+        self.assertEqual(self._call_fut(iter([NOW_MICROS, 0.0])),
+                         [NOW, datetime.datetime(1970, 1, 1, tzinfo=UTC)])
+        self.assertEqual(self._call_fut([]), [])
+
+    def test_as_numpy(self):
+        try:
+            import numpy
+        except ImportError:  # pragma: NO COVER
+            self.skipTest('numpy not installed')
+
+        result = self._call_fut([1438191921123456, 1.4], as_numpy=True)
+        expected = numpy.array(['2015-07-29T17:45:21.123456',
+                                '1970-01-01T00:00:00.000001'],
+                               dtype='datetime64[us]')
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertEqual(result.tolist(), expected.tolist())
+
+
 class Test___date_from_iso8601_date(unittest.TestCase):
 
     def _call_fut(self, value):
@@ -330,6 +362,15 @@ class Test__rfc3339_to_datetime(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._call_fut(dt_str)
 
+    def test_w_unpadded_month(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        # Not the fixed shape, but accepted by strptime.
+        result = self._call_fut('2009-1-17T12:44:32.12345Z')
+        self.assertEqual(
+            result, datetime.datetime(2009, 1, 17, 12, 44, 32, 123450, UTC))
+
 
 class Test__rfc3339_nanos_to_datetime(unittest.TestCase):
 
@@ -419,6 +460,112 @@ class Test__rfc3339_nanos_to_datetime(unittest.TestCase):
         self.assertEqual(result, expected_result)
 
 
+class Test__rfc3339_fixed_to_datetime(unittest.TestCase):
+
+    def _call_fut(self, dt_str):
+        from google.cloud._helpers import _rfc3339_fixed_to_datetime
+        return _rfc3339_fixed_to_datetime(dt_str)
+
+    def test_w_nanos(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        result = self._call_fut('2009-12-17T12:44:32.123456789Z')
+        self.assertEqual(
+            result, datetime.datetime(2009, 12, 17, 12, 44, 32, 123456, UTC))
+
+    def test_w_truncated_fraction(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        result = self._call_fut(u'2009-12-17T12:44:32.12Z')
+        self.assertEqual(
+            result, datetime.datetime(2009, 12, 17, 12, 44, 32, 120000, UTC))
+
+    def test_without_fraction(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        result = self._call_fut('1988-04-29T12:12:12Z')
+        self.assertEqual(
+            result, datetime.datetime(1988, 4, 29, 12, 12, 12, 0, UTC))
+
+    def test_other_shapes(self):
+        dt_strs = [
+            '',
+            '2009-12-17T12:44:32',
+            '2009-12-17T12:44:32.Z',
+            '2009-12-17T12:44:32.1234567890Z',
+            '2009-12-17 12:44:32.123Z',
+            '2009-12-17T12:44:32,123Z',
+            '2009-12-17T12:44:32.123BOGUS',
+            '2009-12-17T12:44:32.1-3Z',
+            '2009-12-1xT12:44:32.123Z',
+        ]
+        for dt_str in dt_strs:
+            self.assertIsNone(self._call_fut(dt_str), dt_str)
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            self._call_fut('2009-13-17T12:44:32.123Z')
+
+
+class Test__rfc3339_nanos_to_datetimes(unittest.TestCase):
+
+    def _call_fut(self, dt_strs, **kw):
+        from google.cloud._helpers import _rfc3339_nanos_to_datetimes
+        return _rfc3339_nanos_to_datetimes(dt_strs, **kw)
+
+    def test_it(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        dt_strs = [
+            '2009-12-17T12:44:32.123456789Z',
+            '1988-04-29T12:12:12Z',
+            # Not the fixed shape, but matched by the regex.
+            '2009-12-17T12:44:32.1ZTRAILING',
+        ]
+        self.assertEqual(self._call_fut(iter(dt_strs)), [
+            datetime.datetime(2009, 12, 17, 12, 44, 32, 123456, UTC),
+            datetime.datetime(1988, 4, 29, 12, 12, 12, 0, UTC),
+            datetime.datetime(2009, 12, 17, 12, 44, 32, 100000, UTC),
+        ])
+
+    def test_w_bogus_zone(self):
+        with self.assertRaises(ValueError):
+            self._call_fut(['2009-12-17T12:44:32.123BOGUS'])
+
+    def _get_numpy(self):
+        try:
+            import numpy
+        except ImportError:  # pragma: NO COVER
+            self.skipTest('numpy not installed')
+        return numpy
+
+    def test_as_numpy(self):
+        numpy = self._get_numpy()
+
+        dt_strs = [
+            '2009-12-17T12:44:32.123456789Z',
+            '1988-04-29T12:12:12Z',
+            '2009-12-17T12:44:32.1ZTRAILING',
+        ]
+        result = self._call_fut(dt_strs, as_numpy=True)
+        expected = numpy.array(['2009-12-17T12:44:32.123456789',
+                                '1988-04-29T12:12:12',
+                                '2009-12-17T12:44:32.1'],
+                               dtype='datetime64[ns]')
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertTrue((result == expected).all())
+
+    def test_as_numpy_w_bogus_zone(self):
+        self._get_numpy()
+
+        with self.assertRaises(ValueError):
+            self._call_fut(['2009-12-17T12:44:32.123BOGUS'], as_numpy=True)
+
+
 class Test__datetime_to_rfc3339(unittest.TestCase):
 
     def _call_fut(self, *args, **kwargs):
@@ -632,11 +779,16 @@ class Test_make_secure_channel(unittest.TestCase):
         secure_authorized_channel_patch = mock.patch(
             'google.auth.transport.grpc.secure_authorized_channel',
             autospec=True)
+        instrument_channel_patch = mock.patch(
+            'google.cloud.instrumentation.instrument_channel', autospec=True)
 
         with secure_authorized_channel_patch as secure_authorized_channel:
-            result = self._call_fut(credentials, user_agent, host)
+            with instrument_channel_patch as instrument_channel:
+                result = self._call_fut(credentials, user_agent, host)
 
-        self.assertIs(result, secure_authorized_channel.return_value)
+        self.assertIs(result.channel, instrument_channel.return_value)
+        instrument_channel.assert_called_once_with(
+            secure_authorized_channel.return_value, host)
 
         expected_target = '%s:%d' % (host, http_client.HTTPS_PORT)
         expected_options = (('grpc.primary_user_agent', user_agent),)
@@ -644,6 +796,28 @@ class Test_make_secure_channel(unittest.TestCase):
         secure_authorized_channel.assert_called_once_with(
             credentials, mock.ANY, expected_target, options=expected_options)
 
+    def test_w_timeout(self):
+        credentials = object()
+        secure_authorized_channel_patch = mock.patch(
+            'google.auth.transport.grpc.secure_authorized_channel',
+            autospec=True)
+        with_default_timeout_patch = mock.patch(
+            'google.cloud.deadline.with_default_timeout', autospec=True)
+        instrument_channel_patch = mock.patch(
+            'google.cloud.instrumentation.instrument_channel', autospec=True)
+
+        with secure_authorized_channel_patch as secure_authorized_channel:
+            with with_default_timeout_patch as with_default_timeout:
+                with instrument_channel_patch as instrument_channel:
+                    result = self._call_fut(
+                        credentials, 'USER_AGENT', 'HOST', timeout=5.0)
+
+        self.assertIs(result.channel, instrument_channel.return_value)
+        instrument_channel.assert_called_once_with(
+            with_default_timeout.return_value, 'HOST')
+        with_default_timeout.assert_called_once_with(
+            secure_authorized_channel.return_value, 5.0)
+
 
 class Test_make_secure_stub(unittest.TestCase):
 
@@ -664,8 +838,8 @@ class Test_make_secure_stub(unittest.TestCase):
             channels.append(channel)
             return result
 
-        def mock_channel(*args):
-            channel_args.append(args)
+        def mock_channel(*args, **kwargs):
+            channel_args.append((args, kwargs))
             return channel_obj
 
         credentials = object()
@@ -673,12 +847,13 @@ class Test_make_secure_stub(unittest.TestCase):
         host = 'localhost'
         with _Monkey(MUT, make_secure_channel=mock_channel):
             stub = self._call_fut(credentials, user_agent,
-                                  stub_class, host)
+                                  stub_class, host, timeout=5.0)
 
         self.assertIs(stub, result)
         self.assertEqual(channels, [channel_obj])
         self.assertEqual(channel_args,
-                         [(credentials, user_agent, host)])
+                         [((credentials, user_agent, host),
+                           {'timeout': 5.0})])
 
 
 class Test_make_insecure_stub(unittest.TestCase):
@@ -723,3 +898,197 @@ class Test_make_insecure_stub(unittest.TestCase):
     def test_without_port_argument(self):
         host = 'HOST:1114'
         self._helper(host, host)
+
+    def test_w_timeout(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import _helpers as MUT
+        from google.cloud import deadline
+
+        CHANNEL = object()
+        WRAPPED = object()
+        wrapped = []
+
+        class _GRPCModule(object):
+
+            @staticmethod
+            def insecure_channel(target):
+                return CHANNEL
+
+        def with_default_timeout(channel, timeout):
+            wrapped.append((channel, timeout))
+            return WRAPPED
+
+        with _Monkey(MUT, grpc=_GRPCModule()):
+            with _Monkey(deadline,
+                         with_default_timeout=with_default_timeout):
+                result = self._call_fut(lambda channel: channel, 'HOST',
+                                        timeout=5.0)
+
+        self.assertIs(result, WRAPPED)
+        self.assertEqual(wrapped, [(CHANNEL, 5.0)])
+
+
+class Test_LazyModule(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud._helpers import _LazyModule
+        return _LazyModule
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_it(self):
+        import json
+
+        lazy = self._make_one('json')
+        self.assertIs(lazy.dumps, json.dumps)
+        self.assertEqual(repr(lazy), "<_LazyModule 'json'>")
+
+    def test_missing(self):
+        lazy = self._make_one('google.cloud._not_a_module')
+        with self.assertRaises(ImportError):
+            getattr(lazy, 'attr')
+
+
+class Test_LazyAttributesModule(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud._helpers import _LazyAttributesModule
+        return _LazyAttributesModule
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_module(self):
+        import types
+
+        module = types.ModuleType('fake_module', 'Fake module.')
+        module.__file__ = 'fake_module.py'
+        module.EAGER = 'eager'
+        return module
+
+    def test_lazy_attribute(self):
+        module = self._make_module()
+        calls = []
+
+        def factory():
+            calls.append(None)
+            return 'lazy'
+
+        lazy = self._make_one(module, {'LAZY': factory})
+        self.assertEqual(calls, [])
+        self.assertEqual(lazy.LAZY, 'lazy')
+        self.assertEqual(lazy.LAZY, 'lazy')
+        self.assertEqual(calls, [None])
+        self.assertEqual(module.LAZY, 'lazy')
+
+    def test_wrapped_attributes(self):
+        module = self._make_module()
+        lazy = self._make_one(module, {'LAZY': lambda: 'lazy'})
+        self.assertEqual(lazy.__name__, 'fake_module')
+        self.assertEqual(lazy.__doc__, 'Fake module.')
+        self.assertEqual(lazy.__file__, 'fake_module.py')
+        self.assertEqual(lazy.EAGER, 'eager')
+        with self.assertRaises(AttributeError):
+            getattr(lazy, 'MISSING')
+
+        lazy.OTHER = 'other'
+        self.assertEqual(module.OTHER, 'other')
+        del lazy.EAGER
+        self.assertFalse(hasattr(module, 'EAGER'))
+        self.assertIn('LAZY', dir(lazy))
+        self.assertIn('OTHER', dir(lazy))
+
+    def test_lazy_attribute_set_first(self):
+        module = self._make_module()
+        lazy = self._make_one(module, {'LAZY': lambda: 'lazy'})
+        lazy.LAZY = 'patched'
+        self.assertEqual(lazy.LAZY, 'patched')
+
+
+class Test__lazy_attributes(unittest.TestCase):
+
+    def _call_fut(self, module_name, **factories):
+        from google.cloud._helpers import _lazy_attributes
+        return _lazy_attributes(module_name, **factories)
+
+    def test_it(self):
+        import sys
+        import types
+        from google.cloud._helpers import _LazyAttributesModule
+
+        name = 'google.cloud._fake_lazy_module'
+        module = sys.modules[name] = types.ModuleType(name)
+        try:
+            self._call_fut(name, LAZY=lambda: 'lazy')
+            lazy = sys.modules[name]
+        finally:
+            del sys.modules[name]
+
+        self.assertIsInstance(lazy, _LazyAttributesModule)
+        self.assertEqual(lazy.LAZY, 'lazy')
+        self.assertEqual(module.LAZY, 'lazy')
+
+
+class Test__lazy_import(unittest.TestCase):
+
+    NAME = 'google.cloud._fake_lazy_module'
+
+    def _call_fut(self, source_name, **names):
+        import sys
+        import types
+        from google.cloud._helpers import _lazy_import
+
+        module = sys.modules[self.NAME] = types.ModuleType(self.NAME)
+        try:
+            load = _lazy_import(self.NAME, source_name, **names)
+            lazy = sys.modules[self.NAME]
+        finally:
+            del sys.modules[self.NAME]
+        return module, lazy, load
+
+    def test_attribute(self):
+        import json
+
+        module, lazy, load = self._call_fut('json', DUMPS='dumps')
+        self.assertNotIn('DUMPS', module.__dict__)
+        self.assertIs(lazy.DUMPS, json.dumps)
+        self.assertIs(module.DUMPS, json.dumps)
+        self.assertTrue(load())
+
+    def test_load(self):
+        import json
+
+        module, lazy, load = self._call_fut(
+            'json', DUMPS='dumps', LOADS='loads')
+        self.assertTrue(load())
+        self.assertIs(module.DUMPS, json.dumps)
+        self.assertIs(module.LOADS, json.loads)
+        self.assertIs(lazy.LOADS, json.loads)
+
+    def test_patched_before_load(self):
+        import json
+
+        module, lazy, load = self._call_fut(
+            'json', DUMPS='dumps', LOADS='loads')
+        lazy.DUMPS = 'patched'
+        self.assertTrue(load())
+        self.assertEqual(module.DUMPS, 'patched')
+        self.assertIs(module.LOADS, json.loads)
+
+    def test_deleted_after_load(self):
+        import json
+
+        module, lazy, load = self._call_fut('json', DUMPS='dumps')
+        self.assertTrue(load())
+        del lazy.DUMPS
+        self.assertIs(lazy.DUMPS, json.dumps)
+
+    def test_import_error(self):
+        module, lazy, load = self._call_fut(
+            'google.cloud._not_a_module', ATTR='attr')
+        self.assertIsNone(lazy.ATTR)
+        self.assertFalse(load())
+        self.assertIsNone(module.ATTR)
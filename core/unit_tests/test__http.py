@@ -15,6 +15,7 @@
 import unittest
 
 import mock
+import six
 
 
 class TestConnection(unittest.TestCase):
@@ -60,6 +61,19 @@ class TestConnection(unittest.TestCase):
         conn._http = http = object()
         self.assertIs(conn.http, http)
 
+    def test_http_after_fork(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import _fork
+
+        conn = self._make_one()
+        http = conn._http = mock.Mock(spec=['request', 'connections'])
+        http.connections = {'https:www.googleapis.com': object()}
+        generation = _fork.generation() + 1
+        with _Monkey(_fork, generation=lambda: generation):
+            self.assertIs(conn.http, http)
+        self.assertEqual(http.connections, {})
+        self.assertEqual(conn._http_generation, generation)
+
     def test_http_wo_creds(self):
         import httplib2
         conn = self._make_one()
@@ -82,6 +96,27 @@ class TestConnection(unittest.TestCase):
             get_distribution('google-cloud-core').version)
         conn = self._make_one()
         self.assertEqual(conn.USER_AGENT, expected_ua)
+        self.assertEqual(self._get_target_class().USER_AGENT, expected_ua)
+
+
+class Test_default_user_agent(unittest.TestCase):
+
+    def test_module_attribute(self):
+        from google.cloud import _http as MUT
+
+        self.assertEqual(MUT.DEFAULT_USER_AGENT,
+                         MUT._get_default_user_agent())
+        self.assertTrue(MUT.DEFAULT_USER_AGENT.startswith('gcloud-python/'))
+        with self.assertRaises(AttributeError):
+            getattr(MUT, 'NOT_AN_ATTRIBUTE')
+
+    def test_cached(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import _http as MUT
+
+        cache = {'google-cloud-core': 'CACHED'}
+        with _Monkey(MUT, _USER_AGENT_CACHE=cache):
+            self.assertEqual(MUT._get_default_user_agent(), 'CACHED')
 
 
 class TestJSONConnection(unittest.TestCase):
@@ -207,6 +242,33 @@ class TestJSONConnection(unittest.TestCase):
         }
         self.assertEqual(http._called_with['headers'], expected_headers)
 
+    def test__make_request_w_bytes_and_text_data(self):
+        conn = self._make_one()
+        URI = 'http://example.com/test'
+        http = conn._http = _Http(
+            {'status': '200', 'content-type': 'text/plain'},
+            b'',
+        )
+        conn._make_request('POST', URI, b'abc')
+        self.assertEqual(http._called_with['headers']['Content-Length'], '3')
+        conn._make_request('POST', URI, u'\u00e9t\u00e9')
+        self.assertEqual(http._called_with['headers']['Content-Length'], '5')
+
+    def test__make_request_w_dict_data(self):
+        conn = self._make_one()
+        URI = 'http://example.com/test'
+        http = conn._http = _Http(
+            {'status': '200', 'content-type': 'text/plain'},
+            b'',
+        )
+        data = {'name': u'\u00e9t\u00e9', 'size': 1}
+        conn._make_request('POST', URI, data)
+        body = conn.codec.dumps(data)
+        self.assertEqual(http._called_with['body'], body)
+        headers = http._called_with['headers']
+        self.assertEqual(headers['Content-Length'], str(len(body)))
+        self.assertEqual(headers['Content-Type'], 'application/json')
+
     def test__make_request_w_extra_headers(self):
         conn = self._make_one()
         URI = 'http://example.com/test'
@@ -333,7 +395,7 @@ class TestJSONConnection(unittest.TestCase):
     def test_api_request_w_data(self):
         import json
         DATA = {'foo': 'bar'}
-        DATAJ = json.dumps(DATA)
+        DATAJ = json.dumps(DATA).encode('utf-8')
         conn = self._makeMockOne()
         # Intended to emulate self.mock_template
         URI = '/'.join([
@@ -358,6 +420,66 @@ class TestJSONConnection(unittest.TestCase):
         }
         self.assertEqual(http._called_with['headers'], expected_headers)
 
+    def test_api_request_w_codec(self):
+        conn = self._makeMockOne()
+        codec = conn.codec = _Codec()
+        http = conn._http = _Http(
+            {'status': '200', 'content-type': 'application/json'},
+            b'RESPONSE',
+        )
+        result = conn.api_request('POST', '/', data={'foo': 'bar'})
+        self.assertEqual(result, 'DECODED')
+        self.assertEqual(codec._dumped, [{'foo': 'bar'}])
+        self.assertEqual(codec._loaded, [b'RESPONSE'])
+        self.assertEqual(http._called_with['body'], b'ENCODED')
+        self.assertEqual(http._called_with['headers']['Content-Length'], '7')
+
+    def _compress_request(self, data, compress=None, threshold=None):
+        conn = self._makeMockOne()
+        conn.compress_threshold = threshold
+        http = conn._http = _Http(
+            {'status': '200', 'content-type': 'application/json'},
+            b'{}',
+        )
+        conn.api_request('POST', '/', data=data, compress=compress)
+        return http._called_with
+
+    def test_api_request_w_compress_threshold(self):
+        import json
+        import zlib
+
+        data = {'rows': ['abc'] * 100}
+        called_with = self._compress_request(data, threshold=100)
+        headers = called_with['headers']
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        self.assertEqual(headers['Content-Type'], 'application/json')
+        body = called_with['body']
+        self.assertEqual(headers['Content-Length'], str(len(body)))
+        self.assertEqual(zlib.decompress(body, 16 + zlib.MAX_WBITS),
+                         json.dumps(data).encode('utf-8'))
+
+    def test_api_request_below_compress_threshold(self):
+        called_with = self._compress_request({'a': 1}, threshold=100)
+        self.assertNotIn('Content-Encoding', called_with['headers'])
+        self.assertEqual(called_with['body'], b'{"a": 1}')
+
+    def test_api_request_w_compress(self):
+        import gzip
+        import io
+
+        data = u'x' * 2048
+        called_with = self._compress_request(data, compress=True)
+        self.assertEqual(called_with['headers']['Content-Encoding'], 'gzip')
+        body = gzip.GzipFile(fileobj=io.BytesIO(called_with['body'])).read()
+        self.assertEqual(body, data.encode('utf-8'))
+
+    def test_api_request_wo_compress(self):
+        data = u'x' * 2048
+        called_with = self._compress_request(
+            data, compress=False, threshold=10)
+        self.assertNotIn('Content-Encoding', called_with['headers'])
+        self.assertEqual(called_with['body'], data)
+
     def test_api_request_w_404(self):
         from google.cloud.exceptions import NotFound
         conn = self._makeMockOne()
@@ -402,6 +524,511 @@ class TestJSONConnection(unittest.TestCase):
         self.assertEqual(http._called_with['headers'], expected_headers)
 
 
+    def test_api_request_w_retry(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import retry as MUT
+        from google.cloud.retry import Retry
+
+        conn = self._makeMockOne()
+        http = conn._http = _HttpSequence(
+            ({'status': '503', 'retry-after': '2'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'},
+             b'{"ok": true}'),
+        )
+        slept = []
+        with _Monkey(MUT, _SLEEP=slept.append):
+            result = conn.api_request('GET', '/', retry=Retry())
+        self.assertEqual(result, {'ok': True})
+        self.assertEqual(slept, [2.0])
+        self.assertEqual(len(http._called_with), 2)
+
+    def test_api_request_w_connection_retry(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import retry as MUT
+        from google.cloud.exceptions import ServiceUnavailable
+        from google.cloud.retry import Retry
+
+        conn = self._makeMockOne()
+        conn.retry = Retry()
+        http = conn._http = _HttpSequence(({'status': '503'}, b'{}'))
+        slept = []
+        with _Monkey(MUT, _SLEEP=slept.append):
+            with self.assertRaises(ServiceUnavailable):
+                conn.api_request('POST', '/', data={})
+        # POST is not idempotent, hence not retried.
+        self.assertEqual(slept, [])
+        self.assertEqual(len(http._called_with), 1)
+
+    def test_api_request_w_rate_limiter(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import rate_limit
+        from google.cloud import retry
+        from google.cloud.rate_limit import RateLimiter
+        from google.cloud.retry import Retry
+
+        conn = self._makeMockOne()
+        conn._http = _HttpSequence(
+            ({'status': '429', 'retry-after': '1'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'},
+             b'{"ok": true}'),
+        )
+        slept = []
+        with _Monkey(rate_limit, _NOW=lambda: 100.0, _SLEEP=slept.append):
+            conn.rate_limiter = RateLimiter(2.0, burst=1.0)
+            with _Monkey(retry, _SLEEP=slept.append):
+                result = conn.api_request('GET', '/', retry=Retry())
+        self.assertEqual(result, {'ok': True})
+        # The retry waits for 'Retry-After', then for a second token.
+        self.assertEqual(slept, [1.0, 0.5])
+        stats = conn.rate_limiter.snapshot()['*']
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['delayed'], 1)
+        self.assertEqual(stats['throttled'], 1)
+
+    def test_api_request_w_rate_limiter_by_path(self):
+        from google.cloud.rate_limit import RateLimiter
+
+        conn = self._makeMockOne()
+        conn._http = _HttpSequence(
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'),
+        )
+        conn.rate_limiter = RateLimiter(
+            10.0, method_rates={'POST /images:annotate': 2.0})
+        conn.api_request('POST', '/images:annotate', data={})
+        stats = conn.rate_limiter.snapshot()
+        self.assertEqual(stats['POST /images:annotate']['requests'], 1)
+        self.assertEqual(stats['*']['requests'], 0)
+
+
+    def test_api_request_w_timeout(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+
+        conn = self._makeMockOne()
+        http = conn._http = _TimedHttp(
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'))
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            conn.api_request('GET', '/', timeout=5.0)
+        self.assertEqual(http._timeouts, [5.0])
+        # Restored after the request.
+        self.assertIsNone(http.timeout)
+
+    def test_api_request_w_connection_timeout(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+
+        conn = self._makeMockOne()
+        conn.timeout = 30.0
+        http = conn._http = _TimedHttp(
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'))
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            conn.api_request('GET', '/')
+        self.assertEqual(http._timeouts, [30.0])
+
+    def test_api_request_w_shared_deadline(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+        from google.cloud.deadline import Deadline
+        from google.cloud.exceptions import DeadlineExceeded
+
+        clock = [100.0]
+        conn = self._makeMockOne()
+        http = conn._http = _TimedHttp(
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'),
+            clock=clock, elapsed=3.0)
+        with _Monkey(MUT, _NOW=lambda: clock[0]):
+            deadline = Deadline(5.0)
+            conn.api_request('GET', '/', timeout=deadline)
+            conn.api_request('GET', '/', timeout=deadline)
+            with self.assertRaises(DeadlineExceeded):
+                conn.api_request('GET', '/', timeout=deadline)
+        self.assertEqual(http._timeouts, [5.0, 2.0])
+
+    def test_api_request_w_socket_timeout(self):
+        import socket
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+        from google.cloud.exceptions import DeadlineExceeded
+
+        clock = [100.0]
+        conn = self._makeMockOne()
+        conn._http = _TimedHttp(
+            socket.timeout(), clock=clock, elapsed=5.0)
+        with _Monkey(MUT, _NOW=lambda: clock[0]):
+            with self.assertRaises(DeadlineExceeded):
+                conn.api_request('GET', '/', timeout=5.0)
+
+    def test_api_request_w_socket_timeout_before_deadline(self):
+        import socket
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+
+        conn = self._makeMockOne()
+        conn._http = _TimedHttp(socket.timeout())
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            with self.assertRaises(socket.timeout):
+                conn.api_request('GET', '/', timeout=5.0)
+
+    def test_api_request_w_timeout_bounds_retry(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+        from google.cloud import retry as retry_mod
+        from google.cloud.exceptions import ServiceUnavailable
+        from google.cloud.retry import Retry
+
+        conn = self._makeMockOne()
+        http = conn._http = _TimedHttp(
+            ({'status': '503', 'retry-after': '2'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'))
+        slept = []
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            with _Monkey(retry_mod, _NOW=lambda: 100.0,
+                         _SLEEP=slept.append):
+                with self.assertRaises(ServiceUnavailable):
+                    conn.api_request('GET', '/', retry=Retry(), timeout=1.0)
+        # Waiting two seconds would exceed the deadline.
+        self.assertEqual(slept, [])
+        self.assertEqual(http._timeouts, [1.0])
+
+    def test_api_request_w_timeout_unbounded_retry(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+        from google.cloud import retry as retry_mod
+        from google.cloud.exceptions import ServiceUnavailable
+        from google.cloud.retry import Retry
+
+        conn = self._makeMockOne()
+        conn._http = _TimedHttp(
+            ({'status': '503', 'retry-after': '2'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'))
+        slept = []
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            with _Monkey(retry_mod, _NOW=lambda: 100.0,
+                         _SLEEP=slept.append):
+                with self.assertRaises(ServiceUnavailable):
+                    conn.api_request('GET', '/', retry=Retry(deadline=None),
+                                     timeout=1.0)
+        # The request timeout still bounds a policy without a deadline.
+        self.assertEqual(slept, [])
+
+    def test_api_request_w_timeout_transport_accepts_timeout(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+
+        conn = self._makeMockOne()
+        http = conn._http = _HttpSequence(
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'))
+        http.ACCEPTS_TIMEOUT = True
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            conn.api_request('GET', '/', timeout=5.0)
+        self.assertEqual(http._called_with[0]['timeout'], 5.0)
+
+    def test_api_request_w_timeout_authorized_pooled_http(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+        from google.cloud.transport import authorized_pooled_http
+
+        import httplib2
+
+        credentials = mock.Mock(spec=['before_request'])
+        conn = self._makeMockOne()
+        conn._http = authorized_pooled_http(credentials)
+        response = httplib2.Response(
+            {'status': '200', 'content-type': 'application/json'})
+        request = mock.Mock(return_value=(response, b'{}'))
+        with mock.patch.object(conn._http.http, 'request', new=request):
+            with _Monkey(MUT, _NOW=lambda: 100.0):
+                conn.api_request('GET', '/', timeout=5.0)
+        self.assertEqual(request.call_args[1]['timeout'], 5.0)
+
+    def test_api_request_w_timeout_transport_wo_timeout(self):
+        conn = self._makeMockOne()
+        http = conn._http = _HttpSequence(
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'))
+        conn.api_request('GET', '/', timeout=5.0)
+        self.assertNotIn('timeout', http._called_with[0])
+
+    def test_api_request_w_coalesce_shares_response(self):
+        import threading
+        import time
+
+        from google.cloud import _http as MUT
+
+        waiting = []
+
+        class _CountingEvent(threading.Event if six.PY3
+                             else threading._Event):
+            def wait(self, timeout=None):
+                waiting.append(None)
+                return super(_CountingEvent, self).wait(timeout)
+
+        class _InFlight(MUT._InFlight):
+            def __init__(self):
+                super(_InFlight, self).__init__()
+                self.done = _CountingEvent()
+
+        conn = self._makeMockOne()
+        conn.coalesce_gets = True
+        http = conn._http = _BlockingHttp(
+            {'status': '200', 'content-type': 'application/json'},
+            b'{"name": "bucket"}')
+        results = []
+
+        def _get():
+            results.append(conn.api_request('GET', '/b/bucket',
+                                            query_params={'a': 'b'}))
+
+        with mock.patch('google.cloud._http._InFlight', new=_InFlight):
+            leader = threading.Thread(target=_get)
+            leader.start()
+            http.sending.wait()
+            followers = [threading.Thread(target=_get) for _ in range(3)]
+            for follower in followers:
+                follower.start()
+            # Wait until the followers are blocked on the request in flight.
+            while len(waiting) < len(followers):
+                time.sleep(0.001)  # pragma: NO COVER
+            http.release.set()
+            for thread in [leader] + followers:
+                thread.join()
+
+        self.assertEqual(len(http._called_with), 1)
+        self.assertEqual(results, [{'name': 'bucket'}] * 4)
+        # Each caller decodes its own copy.
+        self.assertEqual(len(set(id(result) for result in results)), 4)
+        self.assertEqual(conn._single_flight._in_flight, {})
+
+    def test_api_request_w_coalesce_distinct_requests(self):
+        conn = self._makeMockOne()
+        conn.coalesce_gets = True
+        http = conn._http = _HttpSequence(
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'),
+        )
+        conn.api_request('GET', '/b/bucket')
+        conn.api_request('GET', '/b/bucket')
+        # Sequential requests are not coalesced.
+        self.assertEqual(len(http._called_with), 2)
+
+    def test_api_request_coalesce_not_get(self):
+        conn = self._makeMockOne()
+        conn._single_flight = mock.Mock(spec=['send'])
+        conn._http = _Http(
+            {'status': '200', 'content-type': 'application/json'}, b'{}')
+        conn.api_request('POST', '/b', data={}, coalesce=True)
+        conn._single_flight.send.assert_not_called()
+
+    def test_api_request_coalesce_key(self):
+        conn = self._makeMockOne()
+        conn._single_flight = mock.Mock(spec=['send'])
+        conn._single_flight.send.return_value = (
+            _Http({'status': '200'}, b'')._response, b'')
+        conn.api_request('GET', '/b', query_params={'a': 'b'},
+                         headers={'X-Foo': 'foo'}, coalesce=True,
+                         expect_json=False)
+        (key, _, deadline), _ = conn._single_flight.send.call_args
+        self.assertEqual(key, ('http://mock/mock/vMOCK/b?a=b',
+                               (('X-Foo', 'foo'),)))
+        self.assertIsNone(deadline)
+
+    def test_api_request_w_hooks(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+        from google.cloud import retry as retry_mod
+        from google.cloud.retry import Retry
+
+        conn = self._makeMockOne()
+        conn._http = _HttpSequence(
+            ({'status': '503'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'},
+             b'{"ok": true}'),
+        )
+        events = []
+        hooks = MUT.Hooks()
+        hooks.register(_Hook(events))
+        with _Monkey(MUT, HOOKS=hooks):
+            with _Monkey(retry_mod, _SLEEP=lambda delay: None):
+                conn.api_request('PUT', '/foo', data='abc', retry=Retry())
+
+        self.assertEqual(len(events), 2)
+        (before, event), (after, same) = events
+        self.assertEqual((before, after), ('before', 'after'))
+        self.assertIs(same, event)
+        self.assertEqual(event.api, 'http://mock/mock/vMOCK')
+        self.assertEqual(event.method, 'PUT')
+        self.assertEqual(event.url, 'http://mock/mock/vMOCK/foo')
+        self.assertEqual(event.url_template, conn.API_URL_TEMPLATE)
+        self.assertEqual(event.request_bytes, 3)
+        self.assertEqual(event.response_bytes, 12)
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.retries, 1)
+        self.assertIsNone(event.error)
+
+    def test_api_request_w_hooks_failure(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+        from google.cloud.exceptions import NotFound
+
+        conn = self._makeMockOne()
+        conn._http = _Http({'status': '404'}, b'{}')
+        events = []
+        hooks = MUT.Hooks()
+        hooks.register(_Hook(events))
+        with _Monkey(MUT, HOOKS=hooks):
+            with self.assertRaises(NotFound):
+                conn.api_request('GET', '/')
+
+        _, event = events[-1]
+        self.assertEqual(event.status, 404)
+        self.assertEqual(event.retries, 0)
+        self.assertIsNone(event.error)
+
+
+class Test__set_http_timeout(unittest.TestCase):
+
+    def _call_fut(self, http, timeout):
+        from google.cloud._http import _set_http_timeout
+
+        return _set_http_timeout(http, timeout)
+
+    def test_w_open_connections(self):
+        import httplib2
+
+        http = httplib2.Http(timeout=1.0)
+        connection = mock.Mock(timeout=1.0)
+        closed = mock.Mock(timeout=1.0, sock=None)
+        http.connections = {
+            'https': object,
+            'https:www.googleapis.com': connection,
+            'https:pubsub.googleapis.com': closed,
+        }
+        previous = self._call_fut(http, 5.0)
+
+        self.assertEqual(previous, 1.0)
+        self.assertEqual(http.timeout, 5.0)
+        self.assertEqual(connection.timeout, 5.0)
+        connection.sock.settimeout.assert_called_once_with(5.0)
+        self.assertEqual(closed.timeout, 5.0)
+
+    def test_w_authorized_http(self):
+        import google_auth_httplib2
+        import httplib2
+
+        inner = httplib2.Http()
+        connection = mock.Mock(timeout=None)
+        inner.connections = {'https:www.googleapis.com': connection}
+        http = google_auth_httplib2.AuthorizedHttp(
+            mock.Mock(spec=[]), http=inner)
+        previous = self._call_fut(http, 5.0)
+
+        self.assertIsNone(previous)
+        self.assertEqual(inner.timeout, 5.0)
+        self.assertEqual(connection.timeout, 5.0)
+
+
+class Test_SingleFlight(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud._http import _SingleFlight
+
+        return _SingleFlight
+
+    def _make_one(self):
+        return self._get_target_class()()
+
+    @staticmethod
+    def _start_leader(single_flight):
+        from google.cloud._http import _InFlight
+
+        # Pretend a leader is already in flight.
+        in_flight = single_flight._in_flight['KEY'] = _InFlight()
+        return in_flight
+
+    def test_send_leader(self):
+        single_flight = self._make_one()
+        result = single_flight.send('KEY', lambda: ('RESPONSE', b'CONTENT'))
+        self.assertEqual(result, ('RESPONSE', b'CONTENT'))
+        self.assertEqual(single_flight._in_flight, {})
+
+    def test_send_leader_error(self):
+        single_flight = self._make_one()
+
+        def send():
+            raise ValueError('boom')
+
+        with self.assertRaises(ValueError):
+            single_flight.send('KEY', send)
+        self.assertEqual(single_flight._in_flight, {})
+
+    def test_send_follower_result(self):
+        single_flight = self._make_one()
+        in_flight = self._start_leader(single_flight)
+        in_flight.result = ('RESPONSE', b'CONTENT')
+        in_flight.done.set()
+
+        result = single_flight.send('KEY', self.fail)
+        self.assertEqual(result, ('RESPONSE', b'CONTENT'))
+
+    def test_send_follower_error(self):
+        single_flight = self._make_one()
+        in_flight = self._start_leader(single_flight)
+        in_flight.error = ValueError('boom')
+        in_flight.done.set()
+
+        with self.assertRaises(ValueError):
+            single_flight.send('KEY', self.fail)
+
+    def test_send_follower_after_leader_deadline(self):
+        from google.cloud.exceptions import DeadlineExceeded
+
+        single_flight = self._make_one()
+        in_flight = self._start_leader(single_flight)
+        in_flight.error = DeadlineExceeded('leader')
+        in_flight.done.set()
+
+        result = single_flight.send('KEY', lambda: ('OWN', b''))
+        self.assertEqual(result, ('OWN', b''))
+
+    def test_send_follower_deadline(self):
+        from google.cloud.deadline import Deadline
+        from google.cloud.exceptions import DeadlineExceeded
+
+        single_flight = self._make_one()
+        self._start_leader(single_flight)
+
+        with self.assertRaises(DeadlineExceeded):
+            single_flight.send('KEY', self.fail, Deadline(0.01))
+
+
+class _Codec(object):
+
+    def __init__(self):
+        self._dumped = []
+        self._loaded = []
+
+    def dumps(self, value):
+        self._dumped.append(value)
+        return b'ENCODED'
+
+    def loads(self, content):
+        self._loaded.append(content)
+        return 'DECODED'
+
+
+class _Hook(object):
+
+    def __init__(self, events):
+        self._events = events
+
+    def before_request(self, event):
+        self._events.append(('before', event))
+
+    def after_request(self, event):
+        self._events.append(('after', event))
+
+
 class _Http(object):
 
     _called_with = None
@@ -414,3 +1041,58 @@ class _Http(object):
     def request(self, **kw):
         self._called_with = kw
         return self._response, self._content
+
+
+class _HttpSequence(object):
+
+    def __init__(self, *responses):
+        from httplib2 import Response
+        self._responses = [
+            (Response(headers), content) for headers, content in responses]
+        self._called_with = []
+
+    def request(self, **kw):
+        self._called_with.append(kw)
+        return self._responses.pop(0)
+
+
+class _TimedHttp(object):
+    """Record the ``timeout`` set while sending each request."""
+
+    timeout = None
+
+    def __init__(self, *responses, **kw):
+        self._responses = list(responses)
+        self._clock = kw.pop('clock', None)
+        self._elapsed = kw.pop('elapsed', 0.0)
+        self._timeouts = []
+
+    def request(self, **kw):
+        from httplib2 import Response
+
+        self._timeouts.append(self.timeout)
+        if self._clock is not None:
+            self._clock[0] += self._elapsed
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        headers, content = response
+        return Response(headers), content
+
+
+class _BlockingHttp(_Http):
+    """Block each request until released."""
+
+    def __init__(self, headers, content):
+        import threading
+
+        super(_BlockingHttp, self).__init__(headers, content)
+        self._called_with = []
+        self.sending = threading.Event()
+        self.release = threading.Event()
+
+    def request(self, **kw):
+        self._called_with.append(kw)
+        self.sending.set()
+        self.release.wait()
+        return self._response, self._content
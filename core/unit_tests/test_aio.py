@@ -0,0 +1,588 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+
+import mock
+
+
+_NO_ASYNCIO = sys.version_info < (3, 5)
+
+
+class _LoopTestCase(unittest.TestCase):
+
+    def setUp(self):
+        import asyncio
+
+        self._loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self._loop.close()
+
+    def _run(self, awaitable):
+        return self._loop.run_until_complete(awaitable)
+
+    def _collect(self, aiterable):
+        aiterator = aiterable.__aiter__()
+        result = []
+        while True:
+            try:
+                result.append(self._run(aiterator.__anext__()))
+            except StopAsyncIteration:
+                return result
+
+
+@unittest.skipIf(_NO_ASYNCIO, 'asyncio requires Python 3.5')
+class TestAiohttpTransport(_LoopTestCase):
+
+    URI = 'https://www.googleapis.com/storage/v1/b/name'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.aio import AiohttpTransport
+
+        return AiohttpTransport
+
+    def _make_one(self, *args, **kw):
+        from google.cloud._testing import _Monkey
+        from google.cloud import aio as MUT
+
+        with _Monkey(MUT, aiohttp=object()):
+            return self._get_target_class()(*args, **kw)
+
+    def test_ctor_wo_aiohttp(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import aio as MUT
+
+        with _Monkey(MUT, aiohttp=None):
+            with self.assertRaises(ImportError):
+                self._get_target_class()()
+
+    def test_request_wo_credentials(self):
+        session = _Session((200, {'Content-Type': 'text/plain'}, b'abc'))
+        transport = self._make_one(session=session)
+
+        response, content = self._run(transport.request(
+            self.URI, method='POST', body=b'xyz',
+            headers={'Content-Length': '3', 'foo': 'bar'}))
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response['content-type'], 'text/plain')
+        self.assertEqual(content, b'abc')
+        method, uri, kw = session._requested[0]
+        self.assertEqual(method, 'POST')
+        self.assertEqual(uri, self.URI)
+        self.assertEqual(kw, {'data': b'xyz', 'headers': {'foo': 'bar'}})
+
+    def test_request_w_credentials(self):
+        credentials = _Credentials(valid=True)
+        session = _Session((200, {}, b''))
+        transport = self._make_one(credentials, session=session)
+
+        self._run(transport.request(self.URI))
+
+        _, _, kw = session._requested[0]
+        self.assertEqual(kw['headers'], {'authorization': 'Bearer token'})
+        self.assertEqual(credentials._refreshed, 0)
+
+    def test_request_w_invalid_credentials(self):
+        credentials = _Credentials(valid=False)
+        session = _Session((200, {}, b''))
+        transport = self._make_one(credentials, session=session)
+
+        self._run(transport.request(self.URI))
+
+        self.assertEqual(credentials._refreshed, 1)
+
+    def test_request_refresh_on_401(self):
+        credentials = _Credentials(valid=True)
+        session = _Session((401, {}, b''), (200, {}, b'ok'))
+        transport = self._make_one(credentials, session=session)
+
+        response, content = self._run(transport.request(self.URI))
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(content, b'ok')
+        self.assertEqual(credentials._refreshed, 1)
+        self.assertEqual(len(session._requested), 2)
+
+    def test_close(self):
+        session = _Session()
+        transport = self._make_one(session=session)
+        self._run(transport.close())
+        self.assertTrue(session._closed)
+        self.assertIsNone(transport._session)
+        # Closing twice is a no-op.
+        self._run(transport.close())
+
+
+@unittest.skipIf(_NO_ASYNCIO, 'asyncio requires Python 3.5')
+class TestExecutorTransport(_LoopTestCase):
+
+    def test_request(self):
+        from google.cloud.aio import ExecutorTransport
+
+        http = mock.Mock()
+        http.request.return_value = (mock.sentinel.response, b'abc')
+        transport = ExecutorTransport(http)
+
+        result = self._run(transport.request(
+            'http://example.com', method='PUT', body=b'xyz', headers={}))
+
+        self.assertEqual(result, (mock.sentinel.response, b'abc'))
+        http.request.assert_called_once_with(
+            uri='http://example.com', method='PUT', body=b'xyz', headers={})
+
+
+@unittest.skipIf(_NO_ASYNCIO, 'asyncio requires Python 3.5')
+class Test__default_transport(unittest.TestCase):
+
+    def _call_fut(self, credentials):
+        from google.cloud.aio import _default_transport
+
+        return _default_transport(credentials)
+
+    def test_w_aiohttp(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import aio as MUT
+
+        credentials = object()
+        with _Monkey(MUT, aiohttp=object()):
+            transport = self._call_fut(credentials)
+        self.assertIsInstance(transport, MUT.AiohttpTransport)
+        self.assertIs(transport.credentials, credentials)
+
+    def test_wo_aiohttp_wo_credentials(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import aio as MUT
+        from google.cloud.transport import PooledHttp
+
+        with _Monkey(MUT, aiohttp=None):
+            transport = self._call_fut(None)
+        self.assertIsInstance(transport, MUT.ExecutorTransport)
+        self.assertIsInstance(transport.http, PooledHttp)
+
+    def test_wo_aiohttp_w_credentials(self):
+        import google_auth_httplib2
+        from google.cloud._testing import _Monkey
+        from google.cloud import aio as MUT
+
+        credentials = object()
+        with _Monkey(MUT, aiohttp=None):
+            transport = self._call_fut(credentials)
+        self.assertIsInstance(transport, MUT.ExecutorTransport)
+        self.assertIsInstance(
+            transport.http, google_auth_httplib2.AuthorizedHttp)
+        self.assertIs(transport.http.credentials, credentials)
+
+
+@unittest.skipIf(_NO_ASYNCIO, 'asyncio requires Python 3.5')
+class TestAsyncJSONConnection(_LoopTestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.aio import AsyncJSONConnection
+
+        return AsyncJSONConnection
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_connection():
+        from google.cloud._http import JSONConnection
+
+        class MockConnection(JSONConnection):
+            API_URL_TEMPLATE = '{api_base_url}/mock/{api_version}{path}'
+            API_BASE_URL = 'http://mock'
+            API_VERSION = 'vMOCK'
+
+        return MockConnection()
+
+    def test_ctor_default_transport(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import aio as MUT
+
+        connection = self._make_connection()
+        with _Monkey(MUT, aiohttp=None):
+            async_conn = self._make_one(connection)
+        self.assertIs(async_conn.connection, connection)
+        self.assertIsInstance(async_conn.transport, MUT.ExecutorTransport)
+
+    def test_api_request_w_data(self):
+        import json
+
+        connection = self._make_connection()
+        transport = _Transport(
+            ({'status': '200', 'content-type': 'application/json'},
+             b'{"foo": "bar"}'))
+        async_conn = self._make_one(connection, transport=transport)
+
+        result = self._run(async_conn.api_request(
+            'POST', '/rainbow', query_params={'a': 'b'}, data={'c': 'd'}))
+
+        self.assertEqual(result, {'foo': 'bar'})
+        kw, = transport._requested
+        self.assertEqual(kw['method'], 'POST')
+        self.assertEqual(kw['uri'], 'http://mock/mock/vMOCK/rainbow?a=b')
+        self.assertEqual(json.loads(kw['body']), {'c': 'd'})
+        self.assertEqual(kw['headers']['Content-Type'], 'application/json')
+        self.assertEqual(kw['headers']['User-Agent'], connection.USER_AGENT)
+
+    def test_api_request_w_error(self):
+        from google.cloud.exceptions import NotFound
+
+        connection = self._make_connection()
+        transport = _Transport(({'status': '404'}, b'{}'))
+        async_conn = self._make_one(connection, transport=transport)
+
+        with self.assertRaises(NotFound):
+            self._run(async_conn.api_request('GET', '/'))
+
+    def test_api_request_w_retry(self):
+        from google.cloud.retry import Retry
+
+        connection = self._make_connection()
+        connection.retry = Retry(initial=0.0, maximum=0.0)
+        transport = _Transport(
+            ({'status': '503'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'},
+             b'{"ok": true}'))
+        async_conn = self._make_one(connection, transport=transport)
+
+        result = self._run(async_conn.api_request('GET', '/'))
+
+        self.assertEqual(result, {'ok': True})
+        self.assertEqual(len(transport._requested), 2)
+
+    def test_api_request_w_retry_non_idempotent(self):
+        from google.cloud.exceptions import ServiceUnavailable
+        from google.cloud.retry import Retry
+
+        connection = self._make_connection()
+        transport = _Transport(({'status': '503'}, b'{}'))
+        async_conn = self._make_one(connection, transport=transport)
+
+        with self.assertRaises(ServiceUnavailable):
+            self._run(async_conn.api_request(
+                'POST', '/', retry=Retry(initial=0.0, maximum=0.0)))
+        self.assertEqual(len(transport._requested), 1)
+
+    def test_api_request_w_hooks(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+        from google.cloud.retry import Retry
+
+        connection = self._make_connection()
+        transport = _Transport(
+            ({'status': '503'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'},
+             b'{"ok": true}'))
+        async_conn = self._make_one(connection, transport=transport)
+        events = []
+        hooks = MUT.Hooks()
+        hooks.register(_Hook(events))
+        with _Monkey(MUT, HOOKS=hooks):
+            self._run(async_conn.api_request(
+                'PUT', '/foo', data='abc',
+                retry=Retry(initial=0.0, maximum=0.0)))
+
+        (before, event), (after, same) = events
+        self.assertEqual((before, after), ('before', 'after'))
+        self.assertIs(same, event)
+        self.assertEqual(event.method, 'PUT')
+        self.assertEqual(event.url, 'http://mock/mock/vMOCK/foo')
+        self.assertEqual(event.request_bytes, 3)
+        self.assertEqual(event.response_bytes, 12)
+        self.assertEqual(event.status, 200)
+        self.assertEqual(event.retries, 1)
+
+    def test_api_request_w_rate_limiter(self):
+        from google.cloud.exceptions import TooManyRequests
+
+        connection = self._make_connection()
+        connection.rate_limiter = mock.Mock(spec=['reserve', 'record'])
+        connection.rate_limiter.reserve.return_value = 0.0
+        transport = _Transport(({'status': '429'}, b'{}'))
+        async_conn = self._make_one(connection, transport=transport)
+
+        with self.assertRaises(TooManyRequests):
+            self._run(async_conn.api_request('GET', '/foo'))
+
+        connection.rate_limiter.reserve.assert_called_once_with(
+            'GET', None, '/foo')
+        connection.rate_limiter.record.assert_called_once_with(
+            'GET', 429, '/foo')
+
+    def test_api_request_w_timeout(self):
+        import asyncio
+        from google.cloud.exceptions import DeadlineExceeded
+
+        connection = self._make_connection()
+        transport = _Transport()
+        transport.request = lambda **kw: asyncio.sleep(10.0)
+        async_conn = self._make_one(connection, transport=transport)
+
+        with self.assertRaises(DeadlineExceeded):
+            self._run(async_conn.api_request('GET', '/', timeout=0.01))
+
+    def test_api_request_does_not_coalesce_gets(self):
+        import asyncio
+
+        connection = self._make_connection()
+        connection.coalesce_gets = True
+        transport = _Transport(
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'),
+            ({'status': '200', 'content-type': 'application/json'}, b'{}'))
+        async_conn = self._make_one(connection, transport=transport)
+
+        self._run(asyncio.gather(
+            self._loop.create_task(async_conn.api_request('GET', '/')),
+            self._loop.create_task(async_conn.api_request('GET', '/'))))
+
+        self.assertEqual(len(transport._requested), 2)
+
+    def test_close(self):
+        transport = _Transport()
+        async_conn = self._make_one(
+            self._make_connection(), transport=transport)
+        self._run(async_conn.close())
+        self.assertTrue(transport._closed)
+
+    def test_close_wo_transport_close(self):
+        async_conn = self._make_one(
+            self._make_connection(), transport=object())
+        self._run(async_conn.close())
+
+
+@unittest.skipIf(_NO_ASYNCIO, 'asyncio requires Python 3.5')
+class TestAsyncHTTPIterator(_LoopTestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.aio import AsyncHTTPIterator
+
+        return AsyncHTTPIterator
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _item_to_value(iterator, item):  # pylint: disable=unused-argument
+        return item['name']
+
+    def test_constructor(self):
+        client = object()
+        connection = _AsyncConnection()
+        iterator = self._make_one(client, connection, '/foo', None)
+        self.assertIs(iterator.client, client)
+        self.assertIs(iterator.connection, connection)
+        self.assertEqual(iterator.path, '/foo')
+        self.assertFalse(iterator._started)
+
+    def test_iter_unsupported(self):
+        iterator = self._make_one(None, None, '/foo', None)
+        with self.assertRaises(TypeError):
+            iter(iterator)
+
+    def test_aiter_items(self):
+        connection = _AsyncConnection(
+            {'items': [{'name': 'a'}, {'name': 'b'}], 'nextPageToken': 't'},
+            {'items': []},
+        )
+        iterator = self._make_one(
+            None, connection, '/foo', self._item_to_value)
+        iterator.next_page_token = None
+
+        self.assertEqual(self._collect(iterator), ['a', 'b'])
+        self.assertEqual(iterator.num_results, 2)
+        self.assertEqual(iterator.page_number, 2)
+        self.assertEqual(
+            connection._requested,
+            [{'method': 'GET', 'path': '/foo', 'query_params': {}},
+             {'method': 'GET', 'path': '/foo',
+              'query_params': {'pageToken': 't'}}])
+        with self.assertRaises(ValueError):
+            iterator.__aiter__()
+
+    def test_pages(self):
+        connection = _AsyncConnection(
+            {'items': [{'name': 'a'}], 'nextPageToken': 't'},
+            {'items': [{'name': 'b'}, {'name': 'c'}]},
+        )
+        iterator = self._make_one(
+            None, connection, '/foo', self._item_to_value)
+
+        pages = self._collect(iterator.pages)
+
+        self.assertEqual([list(page) for page in pages], [['a'], ['b', 'c']])
+        self.assertEqual(iterator.num_results, 3)
+        self.assertEqual(iterator.page_number, 2)
+        with self.assertRaises(ValueError):
+            getattr(iterator, 'pages')
+
+    def test_checkpoint_and_resume(self):
+        responses = (
+            {'items': [{'name': 'a'}, {'name': 'b'}], 'nextPageToken': 't'},
+            {'items': [{'name': 'c'}, {'name': 'd'}]},
+        )
+        iterator = self._make_one(
+            None, _AsyncConnection(*responses), '/foo', self._item_to_value)
+
+        aiterator = iterator.__aiter__()
+        items = [self._run(aiterator.__anext__()) for _ in range(3)]
+        self.assertEqual(items, ['a', 'b', 'c'])
+        state = iterator.checkpoint()
+        self.assertEqual(
+            state, {'page_token': 't', 'offset': 1, 'num_results': 3})
+
+        connection = _AsyncConnection(responses[1])
+        iterator = self._make_one(
+            None, connection, '/foo', self._item_to_value).resume(state)
+        self.assertEqual(self._collect(iterator), ['d'])
+        self.assertEqual(iterator.num_results, 4)
+        self.assertEqual(
+            connection._requested,
+            [{'method': 'GET', 'path': '/foo',
+              'query_params': {'pageToken': 't'}}])
+
+    def test_pages_checkpoint_and_resume(self):
+        iterator = self._make_one(
+            None, _AsyncConnection({'items': [{'name': 'a'}]}), '/foo',
+            self._item_to_value)
+        iterator.resume({'page_token': None, 'offset': 0, 'num_results': 0})
+
+        pages = self._collect(iterator.pages)
+
+        self.assertEqual([list(page) for page in pages], [['a']])
+        self.assertEqual(
+            iterator.checkpoint(),
+            {'page_token': None, 'offset': 1, 'num_results': 1})
+
+    def test_post(self):
+        connection = _AsyncConnection({'items': [{'name': 'a'}]})
+        iterator = self._make_one(
+            None, connection, '/foo', self._item_to_value)
+        iterator._HTTP_METHOD = 'POST'
+        self.assertEqual(self._collect(iterator), ['a'])
+        self.assertEqual(
+            connection._requested,
+            [{'method': 'POST', 'path': '/foo', 'data': {}}])
+
+    def test_bad_http_method(self):
+        iterator = self._make_one(
+            None, _AsyncConnection(), '/foo', self._item_to_value)
+        iterator._HTTP_METHOD = 'NOT-A-VERB'
+        with self.assertRaises(ValueError):
+            self._collect(iterator)
+
+
+def _done(result):
+    import asyncio
+
+    future = asyncio.get_event_loop().create_future()
+    future.set_result(result)
+    return future
+
+
+class _Credentials(object):
+
+    def __init__(self, valid):
+        self.valid = valid
+        self._refreshed = 0
+
+    def refresh(self, request):  # pylint: disable=unused-argument
+        self._refreshed += 1
+        self.valid = True
+
+    def apply(self, headers):
+        headers['authorization'] = 'Bearer token'
+
+
+class _Response(object):
+
+    def __init__(self, status, headers, content):
+        self.status = status
+        self.headers = headers
+        self._content = content
+
+    def read(self):
+        return _done(self._content)
+
+    def __aenter__(self):
+        return _done(self)
+
+    def __aexit__(self, exc_type, exc_val, exc_tb):
+        return _done(None)
+
+
+class _Session(object):
+
+    _closed = False
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self._requested = []
+
+    def request(self, method, uri, **kw):
+        self._requested.append((method, uri, kw))
+        return _Response(*self._responses.pop(0))
+
+    def close(self):
+        self._closed = True
+        return _done(None)
+
+
+class _Transport(object):
+
+    _closed = False
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self._requested = []
+
+    def request(self, **kw):
+        from httplib2 import Response
+
+        self._requested.append(kw)
+        headers, content = self._responses.pop(0)
+        return _done((Response(headers), content))
+
+    def close(self):
+        self._closed = True
+        return _done(None)
+
+
+class _Hook(object):
+
+    def __init__(self, events):
+        self._events = events
+
+    def before_request(self, event):
+        self._events.append(('before', event))
+
+    def after_request(self, event):
+        self._events.append(('after', event))
+
+
+class _AsyncConnection(object):
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self._requested = []
+
+    def api_request(self, **kw):
+        self._requested.append(kw)
+        return _done(self._responses.pop(0))
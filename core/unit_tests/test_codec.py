@@ -0,0 +1,78 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+
+class TestJSONCodec(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.codec import JSONCodec
+
+        return JSONCodec
+
+    def _make_one(self):
+        return self._get_target_class()()
+
+    def test_dumps(self):
+        codec = self._make_one()
+        self.assertEqual(codec.dumps({'foo': [1, u'é']}),
+                         b'{"foo": [1, "\\u00e9"]}')
+
+    def test_loads_bytes(self):
+        codec = self._make_one()
+        self.assertEqual(codec.loads(b'{"foo": "\xc3\xa9"}'),
+                         {'foo': u'é'})
+
+    def test_loads_text(self):
+        codec = self._make_one()
+        self.assertEqual(codec.loads(u'[1, 2]'), [1, 2])
+
+    def test_default(self):
+        from google.cloud.codec import DEFAULT_CODEC
+
+        self.assertIsInstance(DEFAULT_CODEC, self._get_target_class())
+
+
+class TestOrjsonCodec(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.codec import OrjsonCodec
+
+        return OrjsonCodec
+
+    def _make_one(self):
+        try:
+            return self._get_target_class()()
+        except ImportError:  # pragma: NO COVER
+            self.skipTest('orjson not installed')
+
+    def test_ctor_wo_orjson(self):
+        import sys
+
+        import mock
+
+        with mock.patch.dict(sys.modules, {'orjson': None}):
+            with self.assertRaises(ImportError):
+                self._get_target_class()()
+
+    def test_round_trip(self):
+        codec = self._make_one()
+        value = {'foo': [1, 2.5, u'é', None, True]}
+        encoded = codec.dumps(value)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(codec.loads(encoded), value)
+        self.assertEqual(codec.loads(encoded.decode('utf-8')), value)
@@ -226,3 +226,251 @@ class Test__get_expiration_seconds(unittest.TestCase):
             result = self._call_fut(expiration_as_delta)
 
         self.assertEqual(result, utc_seconds + 86400)
+
+
+def _make_signing_credentials():
+    import google.auth.credentials
+
+    credentials = mock.Mock(spec=google.auth.credentials.Signing)
+    credentials.signer_email = 'service@example.com'
+    credentials.sign_bytes.side_effect = lambda string: (
+        b'SIGNED:' + string.encode('utf-8'))
+    return credentials
+
+
+class Test__worker(unittest.TestCase):
+
+    def test_it(self):
+        from google.cloud.credentials import _WORKER_STATE
+        from google.cloud.credentials import _init_worker
+        from google.cloud.credentials import _sign_in_worker
+
+        info = {'private_key': 'KEY'}
+        signer = mock.Mock()
+        signer.sign.return_value = b'SIGNATURE'
+        patch = mock.patch(
+            'google.auth.crypt.RSASigner.from_service_account_info',
+            return_value=signer)
+        with patch as from_info:
+            _init_worker(info)
+        try:
+            self.assertEqual(_sign_in_worker('STRING'), b'SIGNATURE')
+        finally:
+            _WORKER_STATE.clear()
+
+        from_info.assert_called_once_with(info)
+        signer.sign.assert_called_once_with('STRING')
+
+
+class TestURLSigner(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.credentials import URLSigner
+
+        return URLSigner
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _parse(self, url):
+        import base64
+        from six.moves.urllib.parse import parse_qs
+        from six.moves.urllib.parse import urlsplit
+
+        _, netloc, path, qs, _ = urlsplit(url)
+        params = parse_qs(qs)
+        signature = base64.b64decode(params.pop('Signature')[0])
+        return netloc, path, signature, params
+
+    def test_ctor_wo_signing_credentials(self):
+        import google.auth.credentials
+
+        credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+        with self.assertRaises(AttributeError):
+            self._make_one(credentials)
+
+    def test_sign_matches_generate_signed_url(self):
+        from google.cloud.credentials import generate_signed_url
+
+        credentials = _make_signing_credentials()
+        signer = self._make_one(credentials, 'http://api.example.com')
+        url = signer.sign('/name/path', 1000, method='PUT',
+                          response_type='text/plain',
+                          response_disposition='attachment')
+
+        self.assertEqual(url, generate_signed_url(
+            credentials, '/name/path', 1000,
+            api_access_endpoint='http://api.example.com', method='PUT',
+            response_type='text/plain', response_disposition='attachment'))
+
+    def test_sign_many(self):
+        credentials = _make_signing_credentials()
+        signer = self._make_one(credentials, 'http://api.example.com')
+        urls = signer.sign_many([
+            ('/name/a', 1000),
+            ('/name/b', 2000, 'PUT'),
+            ('/name/a', 1000),
+        ])
+
+        self.assertEqual(len(urls), 3)
+        self.assertEqual(urls[0], urls[2])
+        netloc, path, signature, params = self._parse(urls[0])
+        self.assertEqual(netloc, 'api.example.com')
+        self.assertEqual(path, '/name/a')
+        self.assertEqual(signature, b'SIGNED:GET\n\n\n1000\n/name/a')
+        self.assertEqual(params, {
+            'GoogleAccessId': ['service@example.com'],
+            'Expires': ['1000'],
+        })
+        _, path, signature, params = self._parse(urls[1])
+        self.assertEqual(path, '/name/b')
+        self.assertEqual(signature, b'SIGNED:PUT\n\n\n2000\n/name/b')
+        self.assertEqual(params['Expires'], ['2000'])
+        # Duplicates are signed once.
+        self.assertEqual(credentials.sign_bytes.call_count, 2)
+
+    def test_sign_many_w_expiration_bucket_caches(self):
+        credentials = _make_signing_credentials()
+        signer = self._make_one(credentials, expiration_bucket=300)
+        first = signer.sign_many([('/name/a', 1001), ('/name/b', 1200)])
+        second = signer.sign_many([('/name/a', 1199), ('/name/b', 1201)])
+
+        self.assertEqual(first[0], second[0])
+        self.assertEqual(self._parse(first[0])[3]['Expires'], ['1200'])
+        self.assertEqual(self._parse(first[1])[3]['Expires'], ['1200'])
+        self.assertEqual(self._parse(second[1])[3]['Expires'], ['1500'])
+        self.assertEqual(credentials.sign_bytes.call_count, 3)
+
+    def test_sign_many_w_timedelta(self):
+        import datetime
+        from google.cloud._testing import _Monkey
+        from google.cloud import credentials as MUT
+
+        credentials = _make_signing_credentials()
+        signer = self._make_one(credentials, expiration_bucket=60)
+        now = datetime.datetime(2004, 8, 19, 0, 0, 10)
+        with _Monkey(MUT, _NOW=lambda: now):
+            url = signer.sign('/name/a', datetime.timedelta(seconds=10))
+
+        self.assertEqual(self._parse(url)[3]['Expires'], ['1092873660'])
+
+    def test_cache_size(self):
+        credentials = _make_signing_credentials()
+        signer = self._make_one(credentials, cache_size=2)
+        signer.sign_many([('/name/a', 1000), ('/name/b', 1000)])
+        # Refresh '/name/a', so that '/name/b' is evicted.
+        signer.sign('/name/a', 1000)
+        signer.sign('/name/c', 1000)
+        self.assertEqual(credentials.sign_bytes.call_count, 3)
+        signer.sign('/name/a', 1000)
+        self.assertEqual(credentials.sign_bytes.call_count, 3)
+        signer.sign('/name/b', 1000)
+        self.assertEqual(credentials.sign_bytes.call_count, 4)
+
+    def test_cache_disabled(self):
+        credentials = _make_signing_credentials()
+        signer = self._make_one(credentials, cache_size=0)
+        signer.sign('/name/a', 1000)
+        signer.sign('/name/a', 1000)
+        self.assertEqual(credentials.sign_bytes.call_count, 2)
+        self.assertEqual(len(signer._cache), 0)
+
+    def test_from_service_account_info(self):
+        info = {'client_email': 'service@example.com'}
+        credentials = _make_signing_credentials()
+        patch = mock.patch(
+            'google.oauth2.service_account.Credentials.'
+            'from_service_account_info', return_value=credentials)
+        with patch as from_info:
+            signer = self._get_target_class().from_service_account_info(
+                info, processes=2)
+
+        from_info.assert_called_once_with(info)
+        self.assertIs(signer.credentials, credentials)
+        self.assertEqual(signer.processes, 2)
+        self.assertIs(signer._service_account_info, info)
+
+    def test_from_service_account_json(self):
+        import json
+        import tempfile
+
+        info = {'client_email': 'service@example.com'}
+        klass = self._get_target_class()
+        with tempfile.NamedTemporaryFile(mode='w') as file_obj:
+            json.dump(info, file_obj)
+            file_obj.flush()
+            patch = mock.patch.object(klass, 'from_service_account_info')
+            with patch as from_info:
+                signer = klass.from_service_account_json(
+                    file_obj.name, cache_size=1)
+
+        self.assertIs(signer, from_info.return_value)
+        from_info.assert_called_once_with(info, cache_size=1)
+
+    def test_processes_wo_service_account_info(self):
+        signer = self._make_one(_make_signing_credentials(), processes=2)
+        with self.assertRaises(ValueError):
+            signer.sign('/name/a', 1000)
+
+    def test_processes(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import credentials as MUT
+
+        multiprocessing = _Multiprocessing()
+        info = {'client_email': 'service@example.com'}
+        signer = self._make_one(_make_signing_credentials(), processes=2)
+        signer._service_account_info = info
+        with _Monkey(MUT, multiprocessing=multiprocessing):
+            with signer:
+                urls = signer.sign_many(
+                    [('/name/%d' % (index,), 1000) for index in range(20)])
+                signer.sign('/name/20', 1000)
+
+        pool, = multiprocessing.pools
+        self.assertEqual(pool.processes, 2)
+        self.assertIs(pool.initializer, MUT._init_worker)
+        self.assertEqual(pool.initargs, (info,))
+        self.assertEqual([chunksize for _, chunksize in pool.mapped], [2, 1])
+        self.assertEqual(len(pool.mapped[0][0]), 20)
+        self.assertTrue(pool.closed)
+        self.assertTrue(pool.joined)
+        self.assertIsNone(signer._pool)
+        _, path, signature, _ = self._parse(urls[3])
+        self.assertEqual(path, '/name/3')
+        self.assertEqual(signature, b'WORKER:GET\n\n\n1000\n/name/3')
+
+
+class _Pool(object):
+
+    closed = joined = False
+
+    def __init__(self, processes, initializer, initargs):
+        self.processes = processes
+        self.initializer = initializer
+        self.initargs = initargs
+        self.mapped = []
+
+    def map(self, func, strings, chunksize):
+        from google.cloud import credentials as MUT
+
+        self.mapped.append((strings, chunksize))
+        assert func is MUT._sign_in_worker
+        return [b'WORKER:' + string.encode('utf-8') for string in strings]
+
+    def close(self):
+        self.closed = True
+
+    def join(self):
+        self.joined = True
+
+
+class _Multiprocessing(object):
+
+    def __init__(self):
+        self.pools = []
+
+    def Pool(self, *args, **kw):
+        pool = _Pool(*args, **kw)
+        self.pools.append(pool)
+        return pool
@@ -0,0 +1,140 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class TestDeadline(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.deadline import Deadline
+
+        return Deadline
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _run(self, func):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+
+        with _Monkey(MUT, _NOW=lambda: self._clock[0]):
+            return func()
+
+    def setUp(self):
+        self._clock = [100.0]
+
+    def test_ctor(self):
+        deadline = self._run(lambda: self._make_one(5.0))
+        self.assertEqual(deadline.timeout, 5.0)
+        self.assertEqual(deadline.expires_at, 105.0)
+
+    def test___repr__(self):
+        deadline = self._run(lambda: self._make_one(5.0))
+        self._clock[0] += 2.0
+        self.assertEqual(self._run(lambda: repr(deadline)),
+                         '<Deadline timeout=5.0 remaining=3.0>')
+
+    def test_remaining(self):
+        deadline = self._run(lambda: self._make_one(5.0))
+        self._clock[0] += 2.0
+        self.assertEqual(self._run(deadline.remaining), 3.0)
+        self.assertFalse(self._run(lambda: deadline.expired))
+        self._clock[0] += 4.0
+        self.assertEqual(self._run(deadline.remaining), 0.0)
+        self.assertTrue(self._run(lambda: deadline.expired))
+
+    def test_check(self):
+        from google.cloud.exceptions import DeadlineExceeded
+
+        deadline = self._run(lambda: self._make_one(5.0))
+        self._clock[0] += 1.5
+        self.assertEqual(self._run(deadline.check), 3.5)
+        self._clock[0] += 3.5
+        with self.assertRaises(DeadlineExceeded):
+            self._run(deadline.check)
+
+
+class Test_as_deadline(unittest.TestCase):
+
+    def _call_fut(self, timeout):
+        from google.cloud.deadline import as_deadline
+
+        return as_deadline(timeout)
+
+    def test_none(self):
+        self.assertIsNone(self._call_fut(None))
+
+    def test_deadline(self):
+        from google.cloud.deadline import Deadline
+
+        deadline = Deadline(5.0)
+        self.assertIs(self._call_fut(deadline), deadline)
+
+    def test_number(self):
+        from google.cloud.deadline import Deadline
+
+        deadline = self._call_fut(5.0)
+        self.assertIsInstance(deadline, Deadline)
+        self.assertEqual(deadline.timeout, 5.0)
+
+
+class Test_with_default_timeout(unittest.TestCase):
+
+    def _call_fut(self, channel, timeout):
+        from google.cloud.deadline import with_default_timeout
+
+        return with_default_timeout(channel, timeout)
+
+    def test_wo_timeout(self):
+        channel = object()
+        self.assertIs(self._call_fut(channel, None), channel)
+
+    def _intercept(self, timeout, streaming=False):
+        import grpc
+
+        channel = grpc.insecure_channel('localhost:1')
+        intercepted = self._call_fut(channel, 5.0)
+        self.assertIsNot(intercepted, channel)
+
+        interceptor = intercepted._interceptor
+        details = mock.Mock(
+            spec=['method', 'timeout', 'metadata', 'credentials'],
+            method='/Service/Method', timeout=timeout, metadata=(),
+            credentials=None)
+        continuation = mock.Mock()
+        if streaming:
+            interceptor.intercept_unary_stream(continuation, details, 'REQ')
+        else:
+            interceptor.intercept_unary_unary(continuation, details, 'REQ')
+        (called_details, request), _ = continuation.call_args
+        self.assertEqual(request, 'REQ')
+        return details, called_details
+
+    def test_default_timeout(self):
+        details, called_details = self._intercept(None)
+        self.assertEqual(called_details.method, details.method)
+        self.assertEqual(called_details.timeout, 5.0)
+        self.assertIsNone(called_details.wait_for_ready)
+
+    def test_default_timeout_streaming(self):
+        _, called_details = self._intercept(None, streaming=True)
+        self.assertEqual(called_details.timeout, 5.0)
+
+    def test_explicit_timeout(self):
+        details, called_details = self._intercept(1.0)
+        self.assertIs(called_details, details)
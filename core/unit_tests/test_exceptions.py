@@ -138,6 +138,29 @@ class Test_make_exception(unittest.TestCase):
         self.assertEqual(list(exception.errors), [])
 
 
+class Test_grpc_rendezvous(unittest.TestCase):
+
+    def test_lookup(self):
+        from grpc._channel import _Rendezvous
+        from google.cloud import exceptions as MUT
+
+        self.assertIs(MUT.GrpcRendezvous, _Rendezvous)
+
+    def test_not_imported_eagerly(self):
+        import subprocess
+        import sys
+
+        code = ('import sys; import google.cloud.exceptions; '
+                'sys.exit("grpc" in sys.modules)')
+        self.assertEqual(subprocess.call([sys.executable, '-c', code]), 0)
+
+    def test_unknown_attribute(self):
+        from google.cloud import exceptions as MUT
+
+        with self.assertRaises(AttributeError):
+            getattr(MUT, 'NotAnAttribute')
+
+
 class _Response(object):
     def __init__(self, status):
         self.status = status
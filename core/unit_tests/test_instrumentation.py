@@ -0,0 +1,517 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+
+class TestRequestEvent(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.instrumentation import RequestEvent
+
+        return RequestEvent
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        event = self._make_one('API', 'GET', 'URL')
+        self.assertEqual(event.api, 'API')
+        self.assertEqual(event.method, 'GET')
+        self.assertEqual(event.url, 'URL')
+        self.assertIsNone(event.url_template)
+        self.assertEqual(event.request_bytes, 0)
+        self.assertIsNone(event.status)
+        self.assertEqual(event.response_bytes, 0)
+        self.assertEqual(event.retries, 0)
+        self.assertIsNone(event.latency)
+        self.assertIsNone(event.error)
+
+    def test___repr__(self):
+        event = self._make_one('API', 'GET', 'URL')
+        event.status = 200
+        self.assertEqual(repr(event),
+                         '<RequestEvent GET URL status=200 latency=None>')
+
+
+class TestHooks(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.instrumentation import Hooks
+
+        return Hooks
+
+    def _make_one(self):
+        return self._get_target_class()()
+
+    def test_register_unregister(self):
+        hooks = self._make_one()
+        self.assertEqual(len(hooks), 0)
+        hook = _Hook()
+        hooks.register(hook)
+        self.assertEqual(len(hooks), 1)
+        hooks.unregister(hook)
+        self.assertEqual(len(hooks), 0)
+        with self.assertRaises(ValueError):
+            hooks.unregister(hook)
+
+    def test_fire_skips_missing_methods(self):
+        hooks = self._make_one()
+        hook = _Hook()
+        hooks.register(object())
+        hooks.register(hook)
+        hooks.before_request('EVENT')
+        hooks.after_request('EVENT')
+        self.assertEqual(hook._events, [('before', 'EVENT'),
+                                        ('after', 'EVENT')])
+
+    def test_request_wo_hooks(self):
+        hooks = self._make_one()
+        with hooks.request('API', 'GET', 'URL') as event:
+            event.status = 200
+        self.assertIsNone(event.latency)
+
+    def test_request_success(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        hooks = self._make_one()
+        hook = _Hook()
+        hooks.register(hook)
+        clock = iter([10.0, 12.5])
+        with _Monkey(MUT, _NOW=lambda: next(clock)):
+            with hooks.request('API', 'POST', 'URL', url_template='TMPL',
+                               request_bytes=3) as event:
+                self.assertEqual(hook._events, [('before', event)])
+                event.status = 200
+
+        self.assertEqual(hook._events[-1], ('after', event))
+        self.assertEqual(event.url_template, 'TMPL')
+        self.assertEqual(event.request_bytes, 3)
+        self.assertEqual(event.latency, 2.5)
+        self.assertIsNone(event.error)
+
+    def test_request_failure(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        hooks = self._make_one()
+        hook = _Hook()
+        hooks.register(hook)
+        error = KeyError('nope')
+        with _Monkey(MUT, _NOW=lambda: 1.0):
+            with self.assertRaises(KeyError):
+                with hooks.request('API', 'GET', 'URL'):
+                    raise error
+
+        (_, event), (_, same) = hook._events
+        self.assertIs(same, event)
+        self.assertIs(event.error, error)
+        self.assertEqual(event.latency, 0.0)
+
+
+class Test_register(unittest.TestCase):
+
+    def test_register_unregister(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        hooks = MUT.Hooks()
+        hook = _Hook()
+        with _Monkey(MUT, HOOKS=hooks):
+            MUT.register(hook)
+            self.assertEqual(len(hooks), 1)
+            MUT.unregister(hook)
+        self.assertEqual(len(hooks), 0)
+
+
+class TestRequestMetrics(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.instrumentation import RequestMetrics
+
+        return RequestMetrics
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_event(api='API', status=200, latency=0.2, **kw):
+        from google.cloud.instrumentation import RequestEvent
+
+        event = RequestEvent(api, 'GET', 'URL', **kw)
+        event.status = status
+        event.latency = latency
+        return event
+
+    def test_ctor_defaults(self):
+        from google.cloud.instrumentation import DEFAULT_LATENCY_BUCKETS
+
+        metrics = self._make_one()
+        self.assertEqual(metrics.buckets, DEFAULT_LATENCY_BUCKETS)
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_snapshot(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            metrics = self._make_one(buckets=(1.0, 0.1))
+        self.assertEqual(metrics.buckets, (0.1, 1.0))
+
+        metrics.after_request(self._make_event(
+            latency=0.05, request_bytes=10))
+        first = self._make_event(latency=0.5, status=503)
+        first.retries = 2
+        first.response_bytes = 7
+        metrics.after_request(first)
+        failed = self._make_event(latency=5.0, status=None)
+        failed.error = KeyError('nope')
+        metrics.after_request(failed)
+        metrics.after_request(self._make_event(api='OTHER'))
+
+        with _Monkey(MUT, _NOW=lambda: 102.0):
+            snapshot = metrics.snapshot()
+
+        self.assertEqual(sorted(snapshot), ['API', 'OTHER'])
+        api = snapshot['API']
+        self.assertEqual(api['count'], 3)
+        self.assertEqual(api['errors'], 2)
+        self.assertEqual(api['retries'], 2)
+        self.assertEqual(api['request_bytes'], 10)
+        self.assertEqual(api['response_bytes'], 7)
+        self.assertAlmostEqual(api['latency_sum'], 5.55)
+        self.assertEqual(api['latency_max'], 5.0)
+        self.assertEqual(api['latency_histogram'],
+                         [(0.1, 1), (1.0, 1), (float('inf'), 1)])
+        self.assertEqual(api['throughput'], 1.5)
+        self.assertEqual(snapshot['OTHER']['count'], 1)
+
+        # Not reset.
+        self.assertEqual(metrics.snapshot()['API']['count'], 3)
+
+    def test_snapshot_w_reset(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            metrics = self._make_one()
+            metrics.after_request(self._make_event())
+            snapshot = metrics.snapshot(reset=True)
+
+        self.assertEqual(snapshot['API']['count'], 1)
+        self.assertEqual(snapshot['API']['throughput'], 0.0)
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_start_stop_export(self):
+        import threading
+
+        metrics = self._make_one()
+        metrics.after_request(self._make_event())
+        exported = []
+        done = threading.Event()
+
+        def export(snapshot):
+            exported.append(snapshot)
+            done.set()
+
+        metrics.start_export(export, interval=0.01)
+        with self.assertRaises(ValueError):
+            metrics.start_export(export)
+        self.assertTrue(done.wait(5.0))
+        metrics.stop_export()
+        self.assertIsNone(metrics._exporter)
+        self.assertEqual(exported[0]['API']['count'], 1)
+        # Stopping twice is harmless.
+        metrics.stop_export()
+
+
+class Test_instrument_channel(unittest.TestCase):
+
+    def _call_fut(self, channel, api):
+        from google.cloud.instrumentation import instrument_channel
+
+        return instrument_channel(channel, api)
+
+    def test_wo_hooks(self):
+        import mock
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        if MUT._interceptor_class() is None:  # pragma: NO COVER
+            self.skipTest('gRPC interceptors not available')
+
+        channel = object()
+        # Hooks may be registered once the channel exists.
+        with _Monkey(MUT, HOOKS=MUT.Hooks()):
+            with mock.patch('grpc.intercept_channel') as intercept:
+                result = self._call_fut(channel, 'API')
+
+        self.assertIs(result, intercept.return_value)
+        intercepted, interceptor = intercept.call_args[0]
+        self.assertIs(intercepted, channel)
+        self.assertIsInstance(interceptor, MUT._interceptor_class())
+        self.assertEqual(interceptor._api, 'API')
+
+
+class Test_Interceptor(unittest.TestCase):
+
+    def _make_one(self, api):
+        from google.cloud.instrumentation import _interceptor_class
+
+        interceptor_class = _interceptor_class()
+        if interceptor_class is None:  # pragma: NO COVER
+            self.skipTest('gRPC interceptors not available')
+        return interceptor_class(api)
+
+    def _intercept(self, future):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        interceptor = self._make_one('API')
+        hooks = MUT.Hooks()
+        hook = _Hook()
+        hooks.register(hook)
+        details = _CallDetails('/google.Service/Method')
+        calls = []
+
+        def continuation(client_call_details, request):
+            calls.append((client_call_details, request))
+            return future
+
+        clock = iter([1.0, 3.0])
+        with _Monkey(MUT, HOOKS=hooks, _NOW=lambda: next(clock)):
+            result = interceptor.intercept_unary_unary(
+                continuation, details, _Message(4))
+            self.assertEqual(len(hook._events), 1)
+            future._fire()
+
+        self.assertIs(result, future)
+        self.assertEqual(len(calls), 1)
+        self.assertIs(calls[0][0], details)
+        (_, event), (_, same) = hook._events
+        self.assertIs(same, event)
+        self.assertEqual(event.api, 'API')
+        self.assertEqual(event.method, 'Method')
+        self.assertEqual(event.url, '/google.Service/Method')
+        self.assertEqual(event.request_bytes, 4)
+        self.assertEqual(event.latency, 2.0)
+        return event
+
+    def test_success(self):
+        import grpc
+
+        event = self._intercept(_Future(grpc.StatusCode.OK, _Message(9)))
+        self.assertEqual(event.status, grpc.StatusCode.OK)
+        self.assertEqual(event.response_bytes, 9)
+        self.assertIsNone(event.error)
+
+    def test_failure(self):
+        import grpc
+
+        error = KeyError('nope')
+        event = self._intercept(
+            _Future(grpc.StatusCode.UNAVAILABLE, exception=error))
+        self.assertEqual(event.status, grpc.StatusCode.UNAVAILABLE)
+        self.assertEqual(event.response_bytes, 0)
+        self.assertIs(event.error, error)
+
+    def _intercept_stream(self, method_name, request, responses):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        interceptor = self._make_one('API')
+        hooks = MUT.Hooks()
+        hook = _Hook()
+        hooks.register(hook)
+        details = _CallDetails('/google.Service/Method')
+        call = _StreamingCall(responses)
+
+        def continuation(client_call_details, request):
+            self.assertIs(client_call_details, details)
+            if method_name.startswith('intercept_stream'):
+                list(request)
+            return call
+
+        clock = iter([1.0, 3.0])
+        with _Monkey(MUT, HOOKS=hooks, _NOW=lambda: next(clock)):
+            result = getattr(interceptor, method_name)(
+                continuation, details, request)
+            self.assertEqual(len(hook._events), 1)
+            received = []
+            try:
+                for response in result:
+                    received.append(response)
+            except KeyError:
+                pass
+            # Exhausting the stream again does not fire the hooks twice.
+            self.assertEqual(list(result), [])
+
+        self.assertEqual(result.cancel(), 'cancelled')
+        (_, event), (_, same) = hook._events
+        self.assertIs(same, event)
+        self.assertEqual(event.method, 'Method')
+        self.assertEqual(event.latency, 2.0)
+        return event, received
+
+    def test_unary_stream(self):
+        import grpc
+
+        responses = [_Message(2), _Message(3)]
+        event, received = self._intercept_stream(
+            'intercept_unary_stream', _Message(4), responses)
+        self.assertEqual(received, responses)
+        self.assertEqual(event.status, grpc.StatusCode.OK)
+        self.assertEqual(event.request_bytes, 4)
+        self.assertEqual(event.response_bytes, 5)
+        self.assertIsNone(event.error)
+
+    def test_stream_stream_failure(self):
+        import grpc
+
+        error = KeyError('nope')
+        event, received = self._intercept_stream(
+            'intercept_stream_stream', iter([_Message(4), _Message(1)]),
+            [_Message(2), error])
+        self.assertEqual(len(received), 1)
+        self.assertEqual(event.request_bytes, 5)
+        self.assertEqual(event.response_bytes, 2)
+        self.assertEqual(event.status, grpc.StatusCode.UNAVAILABLE)
+        self.assertIs(event.error, error)
+
+    def test_stream_unary(self):
+        import grpc
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        interceptor = self._make_one('API')
+        hooks = MUT.Hooks()
+        hook = _Hook()
+        hooks.register(hook)
+        future = _Future(grpc.StatusCode.OK, _Message(9))
+
+        def continuation(client_call_details, request_iterator):
+            future._requests = list(request_iterator)
+            return future
+
+        with _Monkey(MUT, HOOKS=hooks):
+            result = interceptor.intercept_stream_unary(
+                continuation, _CallDetails('/google.Service/Method'),
+                iter([_Message(4), _Message(1)]))
+            future._fire()
+
+        self.assertIs(result, future)
+        self.assertEqual(len(future._requests), 2)
+        _, event = hook._events[-1]
+        self.assertEqual(event.request_bytes, 5)
+        self.assertEqual(event.response_bytes, 9)
+
+    def test_wo_hooks(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation as MUT
+
+        interceptor = self._make_one('API')
+        details = _CallDetails('/google.Service/Method')
+        request = _Message(4)
+
+        def continuation(client_call_details, request):
+            return client_call_details, request
+
+        with _Monkey(MUT, HOOKS=MUT.Hooks()):
+            for name in ('intercept_unary_unary', 'intercept_unary_stream',
+                         'intercept_stream_unary',
+                         'intercept_stream_stream'):
+                result = getattr(interceptor, name)(
+                    continuation, details, request)
+                self.assertEqual(result, (details, request))
+
+
+class _Hook(object):
+
+    def __init__(self):
+        self._events = []
+
+    def before_request(self, event):
+        self._events.append(('before', event))
+
+    def after_request(self, event):
+        self._events.append(('after', event))
+
+
+class _CallDetails(object):
+
+    def __init__(self, method):
+        self.method = method
+
+
+class _Message(object):
+
+    def __init__(self, size):
+        self._size = size
+
+    def ByteSize(self):
+        return self._size
+
+
+class _Future(object):
+
+    def __init__(self, code, result=None, exception=None):
+        self._code = code
+        self._result = result
+        self._exception = exception
+        self._callbacks = []
+
+    def add_done_callback(self, callback):
+        self._callbacks.append(callback)
+
+    def _fire(self):
+        for callback in self._callbacks:
+            callback(self)
+
+    def code(self):
+        return self._code
+
+    def result(self):
+        return self._result
+
+    def exception(self):
+        return self._exception
+
+
+class _StreamingCall(object):
+
+    def __init__(self, responses):
+        self._responses = iter(responses)
+
+    def __next__(self):
+        import grpc
+
+        response = next(self._responses)
+        if isinstance(response, Exception):
+            response.code = lambda: grpc.StatusCode.UNAVAILABLE
+            raise response
+        return response
+
+    next = __next__
+
+    def code(self):
+        import grpc
+
+        return grpc.StatusCode.OK
+
+    def cancel(self):
+        return 'cancelled'
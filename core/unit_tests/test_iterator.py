@@ -89,6 +89,66 @@ class TestPage(unittest.TestCase):
         self.assertEqual(parent.calls, 3)
         self.assertEqual(page.remaining, 97)
 
+    def test_iterator_calls_items_to_values(self):
+        import six
+
+        batches = []
+
+        def items_to_values(parent, items):
+            batches.append(items)
+            return [item * 2 for item in items]
+
+        page = self._make_one(None, (10, 11, 12), None,
+                              items_to_values=items_to_values)
+        self.assertEqual(batches, [])
+        self.assertEqual(six.next(page), 20)
+        self.assertEqual(batches, [[10, 11, 12]])
+        self.assertEqual(page.remaining, 2)
+        self.assertEqual(list(page), [22, 24])
+        self.assertEqual(batches, [[10, 11, 12]])
+        self.assertEqual(page.remaining, 0)
+
+    def test_items_to_values_empty(self):
+        def items_to_values(parent, items):
+            raise AssertionError('Not called for empty pages')
+
+        page = self._make_one(None, (), None,
+                              items_to_values=items_to_values)
+        self.assertEqual(list(page), [])
+
+
+class TestPageOffset(unittest.TestCase):
+
+    @staticmethod
+    def _do_nothing(parent, value):
+        return value
+
+    def test_page(self):
+        import six
+        from google.cloud.iterator import Page
+
+        page = Page(None, (1, 2, 3, 4), self._do_nothing)
+        self.assertEqual(page._offset, 0)
+        self.assertEqual(six.next(page), 1)
+        page._skip(2)
+        self.assertEqual(page._offset, 3)
+        self.assertEqual(page.remaining, 1)
+        page._skip(5)
+        self.assertEqual(page._offset, 4)
+        self.assertEqual(list(page), [])
+
+    def test_page_w_items_to_values(self):
+        import six
+        from google.cloud.iterator import Page
+
+        page = Page(None, (1, 2, 3, 4), None,
+                    items_to_values=lambda parent, items: items)
+        self.assertEqual(six.next(page), 1)
+        # Skips the values already converted.
+        page._skip(2)
+        self.assertEqual(page._offset, 3)
+        self.assertEqual(list(page), [4])
+
 
 class TestIterator(unittest.TestCase):
 
@@ -117,6 +177,11 @@ class TestIterator(unittest.TestCase):
         self.assertEqual(iterator.page_number, 0)
         self.assertEqual(iterator.next_page_token, token)
         self.assertEqual(iterator.num_results, 0)
+        self.assertEqual(iterator.prefetch, 0)
+
+    def test_constructor_w_prefetch(self):
+        iterator = self._make_one(None, None, prefetch=3)
+        self.assertEqual(iterator.prefetch, 3)
 
     def test_pages_property(self):
         iterator = self._make_one(None, None)
@@ -232,6 +297,117 @@ class TestIterator(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             iterator._next_page()
 
+    def test_checkpoint_not_started(self):
+        iterator = self._make_one(None, None, page_token=b'abc')
+        self.assertEqual(iterator.checkpoint(), {
+            'page_token': u'abc', 'offset': 0, 'num_results': 0})
+
+    def test_resume_started(self):
+        iterator = self._make_one(None, None)
+        iter(iterator)
+        with self.assertRaises(ValueError):
+            iterator.resume(
+                {'page_token': None, 'offset': 0, 'num_results': 0})
+
+    def test_checkpoint_pages_w_prefetch(self):
+        import six
+        from google.cloud.iterator import Page
+
+        page1 = Page(None, (1, 2), self._do_nothing)
+        page2 = Page(None, (3, 4, 5), self._do_nothing)
+        iterator, _ = self._make_prefetching([page1, page2])
+
+        pages_iter = iterator.pages
+        six.next(pages_iter)
+        page = six.next(pages_iter)
+        six.next(page)
+        self.assertEqual(iterator.checkpoint(), {
+            'page_token': None, 'offset': 1, 'num_results': 3})
+        pages_iter.close()
+
+    def _make_prefetching(self, pages, prefetch=2):
+        import six
+
+        iterator = self._make_one(None, self._do_nothing, prefetch=prefetch)
+        pages = iter(pages)
+        fetched = []
+
+        def next_page():
+            page = six.next(pages, None)
+            if isinstance(page, Exception):
+                raise page
+            fetched.append(page)
+            return page
+
+        iterator._next_page = next_page
+        return iterator, fetched
+
+    def test_pages_w_prefetch(self):
+        from google.cloud.iterator import Page
+
+        page1 = Page(None, (1, 2), self._do_nothing)
+        page2 = Page(None, (3,), self._do_nothing)
+        iterator, _ = self._make_prefetching([page1, page2])
+
+        self.assertEqual(list(iterator.pages), [page1, page2])
+        self.assertEqual(iterator.page_number, 2)
+        self.assertEqual(iterator.num_results, 3)
+
+    def test___iter___w_prefetch(self):
+        from google.cloud.iterator import Page
+
+        page1 = Page(None, (1, 2), self._do_nothing)
+        page2 = Page(None, (3,), self._do_nothing)
+        iterator, _ = self._make_prefetching([page1, page2])
+
+        items = list(iterator)
+
+        self.assertEqual(items, [(None, 1), (None, 2), (None, 3)])
+        self.assertEqual(iterator.page_number, 2)
+        # Results are counted once, by the prefetching thread.
+        self.assertEqual(iterator.num_results, 3)
+
+    def test_pages_w_prefetch_error(self):
+        import six
+        from google.cloud.iterator import Page
+
+        page1 = Page(None, (1,), self._do_nothing)
+        iterator, _ = self._make_prefetching([page1, KeyError('boom')])
+
+        pages_iter = iterator.pages
+        self.assertIs(six.next(pages_iter), page1)
+        with self.assertRaises(KeyError):
+            six.next(pages_iter)
+
+    def test_pages_w_prefetch_stopped_early(self):
+        import itertools
+        import six
+        from google.cloud._testing import _Monkey
+        from google.cloud import iterator as MUT
+
+        pages = (MUT.Page(None, (index,), self._do_nothing)
+                 for index in itertools.count())
+        iterator, fetched = self._make_prefetching(pages, prefetch=1)
+        workers = []
+
+        class _Worker(MUT._PrefetchWorker):
+
+            def __init__(self, *args):
+                super(_Worker, self).__init__(*args)
+                workers.append(self)
+
+        with _Monkey(MUT, _PrefetchWorker=_Worker):
+            pages_iter = iterator.pages
+            first = six.next(pages_iter)
+            pages_iter.close()
+
+        worker, = workers
+        worker._thread.join()
+        self.assertIs(fetched[0], first)
+        # At most the queue depth, plus one page in flight and one put
+        # after the stop was requested.
+        self.assertLessEqual(len(fetched), 4)
+
 
 class TestHTTPIterator(unittest.TestCase):
 
@@ -263,6 +439,116 @@ class TestHTTPIterator(unittest.TestCase):
         self.assertIsNone(iterator.next_page_token)
         self.assertEqual(iterator.num_results, 0)
 
+    def test_constructor_w_prefetch(self):
+        iterator = self._make_one(None, '/foo', None, prefetch=2)
+        self.assertEqual(iterator.prefetch, 2)
+
+    def test_iterate_w_prefetch(self):
+        path = '/foo'
+        connection = _Connection(
+            {'items': [{'name': 'a'}, {'name': 'b'}], 'nextPageToken': 't1'},
+            {'items': [{'name': 'c'}], 'nextPageToken': 't2'},
+            {'items': [{'name': 'd'}]})
+        client = _Client(connection)
+
+        def item_to_value(iterator, item):  # pylint: disable=unused-argument
+            return item['name']
+
+        iterator = self._make_one(client, path=path,
+                                  item_to_value=item_to_value,
+                                  max_results=10, prefetch=2)
+
+        self.assertEqual(list(iterator), ['a', 'b', 'c', 'd'])
+        self.assertEqual(iterator.num_results, 4)
+        self.assertEqual(iterator.page_number, 3)
+        self.assertIsNone(iterator.next_page_token)
+        self.assertEqual(
+            [kw['query_params'] for kw in connection._requested],
+            [{'maxResults': 10},
+             {'maxResults': 8, 'pageToken': 't1'},
+             {'maxResults': 7, 'pageToken': 't2'}])
+
+    def _make_listing(self, **kw):
+        import json
+
+        connection = _Connection(
+            {'items': [{'name': 'a'}, {'name': 'b'}], 'nextPageToken': 't1'},
+            {'items': [{'name': 'c'}, {'name': 'd'}, {'name': 'e'}],
+             'nextPageToken': 't2'},
+            {'items': [{'name': 'f'}]})
+        client = _Client(connection)
+
+        def item_to_value(iterator, item):  # pylint: disable=unused-argument
+            return item['name']
+
+        iterator = self._make_one(client, path='/foo',
+                                  item_to_value=item_to_value, **kw)
+        # Round-trip states through JSON.
+        iterator.checkpoint = lambda checkpoint=iterator.checkpoint: (
+            json.loads(json.dumps(checkpoint())))
+        return iterator, connection
+
+    def test_checkpoint_and_resume(self):
+        import itertools
+
+        iterator, _ = self._make_listing(max_results=10)
+        items_iter = iter(iterator)
+        self.assertEqual(list(itertools.islice(items_iter, 3)),
+                         ['a', 'b', 'c'])
+        state = iterator.checkpoint()
+        self.assertEqual(state, {
+            'page_token': 't1', 'offset': 1, 'num_results': 3})
+
+        resumed, connection = self._make_listing(max_results=10)
+        connection._responses = connection._responses[1:]
+        resumed.resume(state)
+        self.assertEqual(resumed.checkpoint(), state)
+        self.assertEqual(resumed.num_results, 2)
+        items_iter = iter(resumed)
+        self.assertEqual(next(items_iter), 'd')
+        self.assertEqual(resumed.num_results, 4)
+        self.assertEqual(resumed.checkpoint(), {
+            'page_token': 't1', 'offset': 2, 'num_results': 4})
+        self.assertEqual(list(items_iter), ['e', 'f'])
+        self.assertEqual(resumed.checkpoint(), {
+            'page_token': 't2', 'offset': 1, 'num_results': 6})
+        self.assertEqual(
+            [kw['query_params'] for kw in connection._requested],
+            [{'maxResults': 8, 'pageToken': 't1'},
+             {'maxResults': 5, 'pageToken': 't2'}])
+
+    def test_checkpoint_and_resume_pages(self):
+        import six
+
+        iterator, _ = self._make_listing()
+        pages_iter = iterator.pages
+        page = six.next(pages_iter)
+        self.assertEqual(iterator.checkpoint(), {
+            'page_token': None, 'offset': 0, 'num_results': 0})
+        page = six.next(pages_iter)
+        six.next(page)
+        state = iterator.checkpoint()
+        self.assertEqual(state, {
+            'page_token': 't1', 'offset': 1, 'num_results': 3})
+
+        resumed, connection = self._make_listing()
+        connection._responses = connection._responses[1:]
+        pages = list(resumed.resume(state).pages)
+        self.assertEqual([list(page) for page in pages], [['d', 'e'], ['f']])
+        self.assertEqual(resumed.num_results, 6)
+
+    def test_checkpoint_w_prefetch(self):
+        import itertools
+
+        iterator, _ = self._make_listing(prefetch=2)
+        items_iter = iter(iterator)
+        self.assertEqual(list(itertools.islice(items_iter, 4)),
+                         ['a', 'b', 'c', 'd'])
+        # The worker thread may be ahead, but the checkpoint is not.
+        self.assertEqual(iterator.checkpoint(), {
+            'page_token': 't1', 'offset': 2, 'num_results': 4})
+        items_iter.close()
+
     def test_constructor_w_extra_param_collision(self):
         connection = _Connection()
         client = _Client(connection)
@@ -457,6 +743,47 @@ class TestHTTPIterator(unittest.TestCase):
             'data': {},
         })
 
+    def test__get_next_page_response_w_timeout(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+
+        clock = [100.0]
+        connection = _Connection({}, {})
+        client = _Client(connection)
+        iterator = self._make_one(client, '/foo', None, timeout=10.0)
+        clock[0] += 50.0
+        with _Monkey(MUT, _NOW=lambda: clock[0]):
+            iterator._get_next_page_response()
+            clock[0] += 4.0
+            iterator._get_next_page_response()
+            first_kw, second_kw = connection._requested
+            # The pages share a single deadline, set at the first request.
+            self.assertIs(first_kw['timeout'], second_kw['timeout'])
+            self.assertEqual(first_kw['timeout'].remaining(), 6.0)
+
+    def test__get_next_page_response_wo_timeout(self):
+        connection = _Connection({})
+        client = _Client(connection)
+        iterator = self._make_one(client, '/foo', None)
+        iterator._get_next_page_response()
+        kw, = connection._requested
+        self.assertNotIn('timeout', kw)
+
+    def test__make_page_w_items_to_values(self):
+        client = _Client(None)
+        iterator = self._make_one(
+            client, '/foo', None,
+            items_to_values=lambda iterator, items: [-item for item in items])
+        page = iterator._make_page({'items': [1, 2, 3]})
+        self.assertEqual(list(page), [-1, -2, -3])
+
+    def test_next_page_token_setter(self):
+        client = _Client(None)
+        iterator = self._make_one(client, '/foo', None)
+        iterator._make_page({'nextPageToken': 'FROM-RESPONSE'})
+        iterator.next_page_token = 'SET'
+        self.assertEqual(iterator.next_page_token, 'SET')
+
     def test__get_next_page_bad_http_method(self):
         path = '/foo'
         client = _Client(None)
@@ -576,6 +903,22 @@ class TestGAXIterator(unittest.TestCase):
             six.next(items_iter)
 
 
+    def test_resume(self):
+        from google.cloud._testing import _GAXPageIterator
+
+        page_iter = _GAXPageIterator((4, 5, 6), page_token='token2')
+        iterator = self._make_one(None, page_iter, self._do_nothing)
+        state = {'page_token': 'token1', 'offset': 2, 'num_results': 5}
+
+        self.assertIs(iterator.resume(state), iterator)
+        self.assertEqual(page_iter.page_token, 'token1')
+        self.assertEqual(iterator.next_page_token, 'token1')
+        self.assertEqual(list(iterator), [(iterator, 6)])
+        self.assertEqual(iterator.num_results, 6)
+        self.assertEqual(iterator.checkpoint(), {
+            'page_token': 'token1', 'offset': 3, 'num_results': 6})
+
+
 class _Connection(object):
 
     def __init__(self, *responses):
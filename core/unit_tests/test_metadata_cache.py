@@ -0,0 +1,230 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+
+class TestMetadataCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.metadata_cache import MetadataCache
+
+        return MetadataCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def setUp(self):
+        from google.cloud import metadata_cache as MUT
+
+        self._clock = [100.0]
+        self._saved_now = MUT._NOW
+        MUT._NOW = lambda: self._clock[0]
+
+    def tearDown(self):
+        from google.cloud import metadata_cache as MUT
+
+        MUT._NOW = self._saved_now
+
+    def test_ctor_defaults(self):
+        cache = self._make_one()
+        self.assertEqual(cache.max_size, 1000)
+        self.assertEqual(cache.ttl, 300.0)
+        self.assertEqual(len(cache), 0)
+
+    def test_get_resource_miss_stores(self):
+        resource = {'etag': 'ETAG', 'name': 'foo'}
+        connection = _Connection(resource)
+        cache = self._make_one()
+        result = cache.get_resource(
+            connection, '/foo', query_params={'projection': 'noAcl'},
+            timeout=5.0)
+        self.assertIs(result, resource)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(connection._requested, [{
+            'method': 'GET',
+            'path': '/foo',
+            'query_params': {'projection': 'noAcl'},
+            'headers': None,
+            'timeout': 5.0,
+        }])
+
+    def test_get_resource_not_modified(self):
+        from google.cloud.exceptions import NotModified
+
+        resource = {'etag': 'ETAG', 'nested': {'name': 'foo'}}
+        connection = _Connection(resource, NotModified('unchanged'))
+        cache = self._make_one()
+        cache.get_resource(connection, '/foo')
+        # Callers own the properties returned.
+        resource['nested']['name'] = 'changed'
+
+        result = cache.get_resource(connection, '/foo')
+        self.assertEqual(result, {'etag': 'ETAG', 'nested': {'name': 'foo'}})
+        self.assertEqual(connection._requested[1]['headers'],
+                         {'If-None-Match': 'ETAG'})
+
+    def test_get_resource_modified(self):
+        connection = _Connection(
+            {'etag': 'ETAG', 'name': 'foo'}, {'etag': 'ETAG2', 'name': 'bar'})
+        cache = self._make_one()
+        cache.get_resource(connection, '/foo')
+        result = cache.get_resource(connection, '/foo')
+        self.assertEqual(result, {'etag': 'ETAG2', 'name': 'bar'})
+        self.assertEqual(cache._entries['/foo'].etag, 'ETAG2')
+
+    def test_get_resource_wo_etag(self):
+        connection = _Connection({'name': 'foo'}, {'name': 'foo'})
+        cache = self._make_one()
+        cache.get_resource(connection, '/foo')
+        cache.get_resource(connection, '/foo')
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(connection._requested[1]['headers'])
+
+    def test_get_resource_other_query_params(self):
+        connection = _Connection({'etag': 'ETAG'}, {'etag': 'ETAG'})
+        cache = self._make_one()
+        cache.get_resource(connection, '/foo', query_params={'a': 'b'})
+        cache.get_resource(connection, '/foo', query_params={'a': 'c'})
+        self.assertIsNone(connection._requested[1]['headers'])
+
+    def test_get_resource_expired(self):
+        connection = _Connection({'etag': 'ETAG'}, {'etag': 'ETAG'})
+        cache = self._make_one(ttl=10.0)
+        cache.get_resource(connection, '/foo')
+        self._clock[0] += 10.0
+        cache.get_resource(connection, '/foo')
+        self.assertIsNone(connection._requested[1]['headers'])
+
+    def test_get_resource_not_modified_refreshes_ttl(self):
+        from google.cloud.exceptions import NotModified
+
+        connection = _Connection(
+            {'etag': 'ETAG'}, NotModified('unchanged'),
+            NotModified('unchanged'))
+        cache = self._make_one(ttl=10.0)
+        cache.get_resource(connection, '/foo')
+        self._clock[0] += 8.0
+        cache.get_resource(connection, '/foo')
+        self._clock[0] += 8.0
+        self.assertEqual(cache.get_resource(connection, '/foo'),
+                         {'etag': 'ETAG'})
+
+    def test_get_resource_not_modified_wo_entry(self):
+        from google.cloud.exceptions import NotModified
+
+        connection = _Connection(NotModified('unexpected'))
+        cache = self._make_one()
+        with self.assertRaises(NotModified):
+            cache.get_resource(connection, '/foo')
+
+    def test_lru_eviction(self):
+        connection = _Connection(
+            {'etag': 'A'}, {'etag': 'B'}, {'etag': 'A'}, {'etag': 'C'})
+        cache = self._make_one(max_size=2)
+        cache.get_resource(connection, '/a')
+        cache.get_resource(connection, '/b')
+        # Using '/a' again makes '/b' the least recently used.
+        cache.get_resource(connection, '/a')
+        cache.get_resource(connection, '/c')
+        self.assertEqual(list(cache._entries), ['/a', '/c'])
+
+    def test_invalidate_and_clear(self):
+        connection = _Connection({'etag': 'A'}, {'etag': 'B'})
+        cache = self._make_one()
+        cache.get_resource(connection, '/a')
+        cache.get_resource(connection, '/b')
+        cache.invalidate('/a')
+        cache.invalidate('/missing')
+        self.assertEqual(list(cache._entries), ['/b'])
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class Test_reload_resource(unittest.TestCase):
+
+    def _call_fut(self, client, path, **kwargs):
+        from google.cloud.metadata_cache import reload_resource
+
+        return reload_resource(client, path, **kwargs)
+
+    def test_wo_cache(self):
+        connection = _Connection({'etag': 'ETAG'})
+        client = _Client(connection)
+        self._call_fut(client, '/foo')
+        self.assertEqual(connection._requested,
+                         [{'method': 'GET', 'path': '/foo'}])
+
+    def test_w_cache(self):
+        from google.cloud.metadata_cache import MetadataCache
+
+        connection = _Connection({'etag': 'ETAG'})
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        self._call_fut(client, '/foo', query_params={'a': 'b'})
+        self.assertEqual(len(client.metadata_cache), 1)
+
+    def test_w_cache_connection_opted_out(self):
+        from google.cloud.metadata_cache import MetadataCache
+
+        connection = _Connection({'etag': 'ETAG'})
+        connection.cache_metadata = False
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        self._call_fut(client, '/foo', query_params={'a': 'b'})
+        self.assertEqual(len(client.metadata_cache), 0)
+        self.assertEqual(connection._requested, [
+            {'method': 'GET', 'path': '/foo', 'query_params': {'a': 'b'}}])
+
+
+class Test_invalidate_resource(unittest.TestCase):
+
+    def _call_fut(self, client, path):
+        from google.cloud.metadata_cache import invalidate_resource
+
+        return invalidate_resource(client, path)
+
+    def test_wo_cache(self):
+        client = _Client(_Connection())
+        self._call_fut(client, '/foo')
+
+    def test_w_cache(self):
+        from google.cloud.metadata_cache import MetadataCache
+
+        client = _Client(_Connection({'etag': 'ETAG'}))
+        client.metadata_cache = MetadataCache()
+        client.metadata_cache.get_resource(client._connection, '/foo')
+        self._call_fut(client, '/foo')
+        self.assertEqual(len(client.metadata_cache), 0)
+
+
+class _Connection(object):
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self._requested = []
+
+    def api_request(self, **kw):
+        self._requested.append(kw)
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class _Client(object):
+
+    def __init__(self, connection):
+        self._connection = connection
@@ -284,6 +284,58 @@ class TestOperation(unittest.TestCase):
         self.assertIsInstance(request_pb, operations_pb2.GetOperationRequest)
         self.assertEqual(request_pb.name, self.OPERATION_NAME)
 
+    def test_poll_w_timeout(self):
+        from google.longrunning import operations_pb2
+
+        response_pb = operations_pb2.Operation(done=False)
+        client = _Client()
+        stub = client._operations_stub
+        stub._get_operation_response = response_pb
+        operation = self._make_one(self.OPERATION_NAME, client)
+
+        self.assertFalse(operation.poll(timeout=5.0))
+        self.assertEqual(stub._get_operation_timeout, 5.0)
+
+    def test_poll_w_deadline_exceeded(self):
+        from grpc import StatusCode
+        from google.cloud.exceptions import DeadlineExceeded
+
+        client = _Client()
+        stub = client._operations_stub
+        stub._get_operation_error = _make_rpc_error(
+            StatusCode.DEADLINE_EXCEEDED)
+        operation = self._make_one(self.OPERATION_NAME, client)
+
+        with self.assertRaises(DeadlineExceeded):
+            operation.poll(timeout=5.0)
+        self.assertFalse(operation.complete)
+
+    def test_poll_w_other_grpc_error(self):
+        from grpc import RpcError
+        from grpc import StatusCode
+
+        client = _Client()
+        stub = client._operations_stub
+        stub._get_operation_error = _make_rpc_error(StatusCode.NOT_FOUND)
+        operation = self._make_one(self.OPERATION_NAME, client)
+
+        with self.assertRaises(RpcError):
+            operation.poll(timeout=5.0)
+
+    def test_poll_http_w_timeout(self):
+        connection = _Connection({'name': 'name', 'done': False})
+        client = _Client(connection)
+        operation = self._make_one('name', client)
+        operation._from_grpc = False
+
+        self.assertFalse(operation.poll(timeout=5.0))
+
+        self.assertEqual(connection._requested, [{
+            'method': 'GET',
+            'path': 'operations/name',
+            'timeout': 5.0,
+        }])
+
     def test_poll_http(self):
         from google.protobuf.struct_pb2 import Struct
         from google.cloud._testing import _Monkey
@@ -396,10 +448,187 @@ class TestOperation(unittest.TestCase):
         self.assertIsNone(operation.response)
 
 
+class _WaiterTestBase(unittest.TestCase):
+
+    def _run(self, func, *args, **kw):
+        from google.cloud._testing import _Monkey
+        from google.cloud import operation as MUT
+
+        clock = self._clock = [0.0]
+        self._slept = []
+
+        def sleep(delay):
+            self._slept.append(delay)
+            clock[0] += delay
+
+        with _Monkey(MUT, _NOW=lambda: clock[0], _SLEEP=sleep):
+            return func(*args, **kw)
+
+
+class Test_as_completed(_WaiterTestBase):
+
+    def _call_fut(self, *args, **kw):
+        from google.cloud.operation import as_completed
+
+        return self._run(lambda: list(as_completed(*args, **kw)))
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut([]), [])
+        self.assertEqual(self._slept, [])
+
+    def test_already_complete(self):
+        op = _Pollable('op', 0, self)
+        self.assertEqual(self._call_fut([op]), [op])
+        self.assertEqual(op.polls, [])
+
+    def test_order_and_backoff(self):
+        slow = _Pollable('slow', 3, self)
+        fast = _Pollable('fast', 1, self)
+        result = self._call_fut([slow, fast], initial_delay=1.0,
+                                multiplier=2.0, max_delay=3.0)
+        self.assertEqual(result, [fast, slow])
+        self.assertEqual(fast.polls, [1.0])
+        # Delays of 1, 2, then capped at 3.
+        self.assertEqual(slow.polls, [1.0, 3.0, 6.0])
+
+    def test_coalesces_polls(self):
+        first = _Pollable('first', 2, self)
+        second = _Pollable('second', 2, self)
+        self._call_fut([first, second], initial_delay=10.0)
+        self.assertEqual(first.polls, second.polls)
+        self.assertEqual(self._slept, [10.0, 20.0])
+
+    def test_w_executor(self):
+        op = _Pollable('op', 1, self)
+        executor = _Executor()
+        self.assertEqual(self._call_fut([op], executor=executor), [op])
+        self.assertEqual(executor.mapped, [[op]])
+
+    def test_timeout(self):
+        from google.cloud.exceptions import DeadlineExceeded
+
+        done = _Pollable('done', 1, self)
+        slow = _Pollable('slow', 10, self)
+        with self.assertRaises(DeadlineExceeded):
+            self._call_fut([done, slow], timeout=5.0)
+        self.assertEqual(done.polls, [1.0])
+        self.assertEqual(slow.polls, [1.0, 3.0])
+        # Each poll only gets the time remaining.
+        self.assertEqual(done.timeouts, [4.0])
+        self.assertEqual(slow.timeouts, [4.0, 2.0])
+        # Slept until the timeout expired.
+        self.assertEqual(self._clock[0], 5.0)
+
+    def test_timeout_poll_deadline_exceeded(self):
+        from google.cloud.exceptions import DeadlineExceeded
+
+        slow = _Pollable('slow', 10, self, exc=DeadlineExceeded('slow'))
+        with self.assertRaises(DeadlineExceeded):
+            self._call_fut([slow], timeout=5.0)
+        # The timed out polls count as incomplete.
+        self.assertEqual(slow.polls, [1.0, 3.0])
+
+    def test_wo_timeout(self):
+        op = _Pollable('op', 1, self)
+        self._call_fut([op])
+        self.assertEqual(op.timeouts, [None])
+
+
+class Test_wait(_WaiterTestBase):
+
+    def _call_fut(self, *args, **kw):
+        from google.cloud.operation import wait
+
+        return self._run(wait, *args, **kw)
+
+    def test_all_completed(self):
+        first = _Pollable('first', 1, self)
+        second = _Pollable('second', 2, self)
+        done, not_done = self._call_fut([first, second])
+        self.assertEqual(done, set([first, second]))
+        self.assertEqual(not_done, set())
+
+    def test_first_completed(self):
+        from google.cloud.operation import FIRST_COMPLETED
+
+        first = _Pollable('first', 1, self)
+        second = _Pollable('second', 1, self)
+        third = _Pollable('third', 3, self)
+        done, not_done = self._call_fut(
+            [first, second, third], return_when=FIRST_COMPLETED)
+        # Polled together with the first one, the second one completed too.
+        self.assertEqual(done, set([first, second]))
+        self.assertEqual(not_done, set([third]))
+        self.assertEqual(third.polls, [1.0])
+
+    def test_timeout(self):
+        first = _Pollable('first', 1, self)
+        slow = _Pollable('slow', 10, self)
+        done, not_done = self._call_fut([first, slow], timeout=2.0)
+        self.assertEqual(done, set([first]))
+        self.assertEqual(not_done, set([slow]))
+
+    def test_invalid_return_when(self):
+        with self.assertRaises(ValueError):
+            self._call_fut([], return_when='WHENEVER')
+
+
+class _Pollable(object):
+
+    def __init__(self, name, polls_needed, test_case, exc=None):
+        self.name = name
+        self._polls_needed = polls_needed
+        self._test_case = test_case
+        self._exc = exc
+        self.polls = []
+        self.timeouts = []
+
+    @property
+    def complete(self):
+        return len(self.polls) >= self._polls_needed
+
+    def poll(self, timeout=None):
+        self.polls.append(self._test_case._clock[0])
+        self.timeouts.append(timeout)
+        if self._exc is not None:
+            raise self._exc
+        return self.complete
+
+
+class _Executor(object):
+
+    def __init__(self):
+        self.mapped = []
+
+    def map(self, func, items):
+        self.mapped.append(items)
+        return [func(item) for item in items]
+
+
+def _make_rpc_error(status_code):
+    from grpc import RpcError
+
+    class _RpcError(RpcError):
+
+        def code(self):
+            return status_code
+
+        def details(self):
+            return 'Some error details.'
+
+    return _RpcError()
+
+
 class _OperationsStub(object):
 
-    def GetOperation(self, request_pb):
+    _get_operation_timeout = None
+    _get_operation_error = None
+
+    def GetOperation(self, request_pb, timeout=None):
         self._get_operation_requested = request_pb
+        self._get_operation_timeout = timeout
+        if self._get_operation_error is not None:
+            raise self._get_operation_error
         return self._get_operation_response
 
 
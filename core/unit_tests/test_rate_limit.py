@@ -0,0 +1,190 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.rate_limit import RateLimiter
+
+        return RateLimiter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def setUp(self):
+        from google.cloud import rate_limit as MUT
+
+        self._clock = [100.0]
+        self._slept = []
+        self._saved = MUT._NOW, MUT._SLEEP
+        MUT._NOW = lambda: self._clock[0]
+        MUT._SLEEP = self._slept.append
+
+    def tearDown(self):
+        from google.cloud import rate_limit as MUT
+
+        MUT._NOW, MUT._SLEEP = self._saved
+
+    def test_ctor_defaults(self):
+        limiter = self._make_one(10.0)
+        self.assertFalse(limiter.adaptive)
+        bucket = limiter._buckets['*']
+        self.assertEqual(bucket.rate, 10.0)
+        self.assertEqual(bucket.burst, 10.0)
+        self.assertEqual(bucket.tokens, 10.0)
+
+    def test_ctor_small_rate(self):
+        limiter = self._make_one(0.5)
+        self.assertEqual(limiter._buckets['*'].burst, 1.0)
+
+    def test_ctor_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            self._make_one(0.0)
+
+    def test_acquire_burst_then_delay(self):
+        limiter = self._make_one(2.0, burst=2.0)
+        self.assertEqual(limiter.acquire('GET'), 0.0)
+        self.assertEqual(limiter.acquire('GET'), 0.0)
+        self.assertEqual(limiter.acquire('GET'), 0.5)
+        # Each waiting request is scheduled after the previous one.
+        self.assertEqual(limiter.acquire('GET'), 1.0)
+        self.assertEqual(self._slept, [0.5, 1.0])
+
+    def test_reserve_does_not_sleep(self):
+        limiter = self._make_one(2.0, burst=1.0)
+        self.assertEqual(limiter.reserve('GET'), 0.0)
+        self.assertEqual(limiter.reserve('GET'), 0.5)
+        self.assertEqual(self._slept, [])
+
+    def test_acquire_refills(self):
+        limiter = self._make_one(2.0, burst=1.0)
+        limiter.acquire('GET')
+        self._clock[0] += 0.5
+        self.assertEqual(limiter.acquire('GET'), 0.0)
+        self._clock[0] += 10.0
+        limiter.acquire('GET')
+        # The bucket holds at most ``burst`` tokens.
+        self.assertEqual(limiter.acquire('GET'), 0.5)
+
+    def test_acquire_w_method_rates(self):
+        limiter = self._make_one(
+            10.0, burst=1.0, method_rates={'post': 1.0})
+        limiter.acquire('POST')
+        self.assertEqual(limiter.acquire('post'), 1.0)
+        self.assertEqual(limiter.acquire('GET'), 0.0)
+        stats = limiter.snapshot()
+        self.assertEqual(stats['POST']['requests'], 2)
+        self.assertEqual(stats['*']['requests'], 1)
+
+    def test_acquire_w_path_patterns(self):
+        limiter = self._make_one(10.0, burst=1.0, method_rates={
+            'post /images:annotate': 1.0,
+            'POST /projects/*/managedZones/*/changes': 1.0,
+            'POST': 5.0,
+        })
+        limiter.acquire('POST', path='/images:annotate')
+        limiter.acquire('POST', path='/projects/p/managedZones/z/changes')
+        limiter.acquire('POST', path='/projects/p/managedZones')
+        limiter.acquire('POST')
+        limiter.acquire('GET', path='/images:annotate')
+        stats = limiter.snapshot()
+        self.assertEqual(stats['POST /images:annotate']['requests'], 1)
+        self.assertEqual(
+            stats['POST /projects/*/managedZones/*/changes']['requests'], 1)
+        self.assertEqual(stats['POST']['requests'], 2)
+        self.assertEqual(stats['*']['requests'], 1)
+
+    def test_record_w_path(self):
+        limiter = self._make_one(
+            10.0, method_rates={'POST /images:annotate': 2.0},
+            adaptive=True)
+        limiter.record('POST', 429, path='/images:annotate')
+        stats = limiter.snapshot()
+        self.assertEqual(stats['POST /images:annotate']['rate'], 1.0)
+        self.assertEqual(stats['*']['rate'], 10.0)
+
+    def test_acquire_past_deadline(self):
+        import mock
+        from google.cloud.exceptions import DeadlineExceeded
+
+        limiter = self._make_one(1.0, burst=1.0)
+        limiter.acquire('GET')
+        deadline = mock.Mock(spec=['remaining', 'timeout'], timeout=30.0)
+        deadline.remaining.return_value = 0.5
+        with self.assertRaises(DeadlineExceeded):
+            limiter.acquire('GET', deadline)
+        self.assertEqual(self._slept, [])
+        # The token was not taken.
+        self.assertEqual(limiter.snapshot()['*']['requests'], 1)
+
+    def test_record_wo_adaptive(self):
+        limiter = self._make_one(10.0)
+        limiter.record('GET', 200)
+        limiter.record('GET', 429)
+        stats = limiter.snapshot()['*']
+        self.assertEqual(stats['throttled'], 1)
+        self.assertEqual(stats['rate'], 10.0)
+
+    def test_record_adaptive(self):
+        limiter = self._make_one(10.0, adaptive=True)
+        limiter.record('GET', 429)
+        limiter.record('GET', 429)
+        self.assertEqual(limiter.snapshot()['*']['rate'], 2.5)
+        limiter.record('GET', 200)
+        self.assertEqual(limiter.snapshot()['*']['rate'], 3.0)
+        for _ in range(20):
+            limiter.record('GET', 200)
+        # Never above the configured rate.
+        self.assertEqual(limiter.snapshot()['*']['rate'], 10.0)
+
+    def test_record_adaptive_floor(self):
+        limiter = self._make_one(1.0, adaptive=True)
+        for _ in range(20):
+            limiter.record('GET', 429)
+        self.assertEqual(limiter.snapshot()['*']['rate'], 0.01)
+
+    def test_call(self):
+        limiter = self._make_one(10.0, adaptive=True)
+        response = _Response(429)
+
+        def send():
+            return response, b'{}'
+
+        self.assertEqual(limiter.call(send, 'GET'), (response, b'{}'))
+        stats = limiter.snapshot()['*']
+        self.assertEqual(stats['requests'], 1)
+        self.assertEqual(stats['rate'], 5.0)
+
+    def test_snapshot_reset(self):
+        limiter = self._make_one(1.0, burst=1.0)
+        limiter.acquire('GET')
+        limiter.acquire('GET')
+        self.assertEqual(limiter.snapshot(reset=True)['*'], {
+            'rate': 1.0,
+            'requests': 2,
+            'delayed': 1,
+            'wait_seconds': 1.0,
+            'throttled': 0,
+        })
+        self.assertEqual(limiter.snapshot()['*']['requests'], 0)
+
+
+class _Response(object):
+
+    def __init__(self, status):
+        self.status = status
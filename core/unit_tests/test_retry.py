@@ -0,0 +1,212 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+
+class TestRetry(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.retry import Retry
+
+        return Retry
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        from google.cloud.retry import DEFAULT_RETRY_STATUS_CODES
+        from google.cloud.retry import IDEMPOTENT_METHODS
+
+        retry = self._make_one()
+        self.assertEqual(retry.deadline, 120.0)
+        self.assertEqual(retry.initial, 1.0)
+        self.assertEqual(retry.maximum, 60.0)
+        self.assertEqual(retry.multiplier, 2.0)
+        self.assertIs(retry.status_codes, DEFAULT_RETRY_STATUS_CODES)
+        self.assertIs(retry.methods, IDEMPOTENT_METHODS)
+
+    def test___repr__(self):
+        retry = self._make_one(deadline=5.0)
+        self.assertEqual(
+            repr(retry),
+            '<Retry deadline=5.0 initial=1.0 maximum=60.0 multiplier=2.0>')
+
+    def test_with_deadline(self):
+        retry = self._make_one(initial=0.5, methods=None)
+        other = retry.with_deadline(3.0)
+        self.assertIsNot(other, retry)
+        self.assertEqual(other.deadline, 3.0)
+        self.assertEqual(other.initial, 0.5)
+        self.assertIsNone(other.methods)
+
+    def test_compute_delay(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import retry as MUT
+
+        retry = self._make_one(initial=1.0, maximum=5.0, multiplier=2.0)
+        bounds = []
+
+        def uniform(low, high):
+            bounds.append((low, high))
+            return high
+
+        with _Monkey(MUT.random, uniform=uniform):
+            delays = [retry.compute_delay(attempt) for attempt in range(4)]
+
+        self.assertEqual(delays, [1.0, 2.0, 4.0, 5.0])
+        self.assertEqual([low for low, _ in bounds], [0, 0, 0, 0])
+
+    def test_allows_method(self):
+        retry = self._make_one()
+        self.assertTrue(retry.allows_method('GET'))
+        self.assertTrue(retry.allows_method('delete'))
+        self.assertFalse(retry.allows_method('POST'))
+        retry.methods = None
+        self.assertTrue(retry.allows_method('POST'))
+
+    def _call_with_clock(self, retry, send, method='GET', now=0.0):
+        from google.cloud._testing import _Monkey
+        from google.cloud import retry as MUT
+
+        clock = [now]
+        slept = []
+
+        def sleep(delay):
+            slept.append(delay)
+            clock[0] += delay
+
+        retry.compute_delay = lambda attempt: 2.0 ** attempt
+        with _Monkey(MUT, _NOW=lambda: clock[0], _SLEEP=sleep):
+            result = retry.call(send, method)
+        return result, slept
+
+    def test_call_success(self):
+        retry = self._make_one()
+        send = _Send(({'status': 200}, b'ok'))
+        result, slept = self._call_with_clock(retry, send)
+        self.assertEqual(result, (_Response(200), b'ok'))
+        self.assertEqual(slept, [])
+
+    def test_call_retries_status(self):
+        retry = self._make_one()
+        send = _Send(({'status': 503}, b''), ({'status': 500}, b''),
+                     ({'status': 200}, b'ok'))
+        result, slept = self._call_with_clock(retry, send)
+        self.assertEqual(result, (_Response(200), b'ok'))
+        self.assertEqual(slept, [1.0, 2.0])
+
+    def test_call_honors_retry_after(self):
+        retry = self._make_one()
+        send = _Send(({'status': 429, 'retry-after': '7'}, b''),
+                     ({'status': 200}, b'ok'))
+        result, slept = self._call_with_clock(retry, send)
+        self.assertEqual(result, (_Response(200), b'ok'))
+        self.assertEqual(slept, [7.0])
+
+    def test_call_non_idempotent(self):
+        retry = self._make_one()
+        send = _Send(({'status': 503}, b'error'))
+        result, slept = self._call_with_clock(retry, send, method='POST')
+        self.assertEqual(result[0].status, 503)
+        self.assertEqual(slept, [])
+
+    def test_call_non_retryable_status(self):
+        retry = self._make_one()
+        send = _Send(({'status': 404}, b'error'))
+        result, slept = self._call_with_clock(retry, send)
+        self.assertEqual(result[0].status, 404)
+        self.assertEqual(slept, [])
+
+    def test_call_deadline_exhausted(self):
+        retry = self._make_one(deadline=4.0)
+        send = _Send(*[({'status': 503}, b'')] * 5)
+        result, slept = self._call_with_clock(retry, send)
+        self.assertEqual(result[0].status, 503)
+        # Waits of 1 and 2 fit in the deadline, the next one (4) does not.
+        self.assertEqual(slept, [1.0, 2.0])
+        self.assertEqual(send._calls, 3)
+
+    def test_call_wo_deadline(self):
+        retry = self._make_one(deadline=None)
+        send = _Send(*([({'status': 503}, b'')] * 8 +
+                       [({'status': 200}, b'ok')]))
+        result, slept = self._call_with_clock(retry, send)
+        self.assertEqual(result, (_Response(200), b'ok'))
+        self.assertEqual(len(slept), 8)
+
+    def test_call_exception_wo_deadline(self):
+        import socket
+
+        retry = self._make_one(deadline=None)
+        send = _Send(socket.error('reset'), ({'status': 200}, b'ok'))
+        result, slept = self._call_with_clock(retry, send)
+        self.assertEqual(result, (_Response(200), b'ok'))
+        self.assertEqual(slept, [1.0])
+
+    def test_call_retries_exception(self):
+        import socket
+
+        retry = self._make_one()
+        send = _Send(socket.error('reset'), ({'status': 200}, b'ok'))
+        result, slept = self._call_with_clock(retry, send)
+        self.assertEqual(result, (_Response(200), b'ok'))
+        self.assertEqual(slept, [1.0])
+
+    def test_call_exception_deadline_exhausted(self):
+        import socket
+
+        retry = self._make_one(deadline=0.5)
+        send = _Send(socket.error('reset'))
+        with self.assertRaises(socket.error):
+            self._call_with_clock(retry, send)
+
+    def test_call_exception_non_idempotent(self):
+        import socket
+
+        retry = self._make_one()
+        send = _Send(socket.error('reset'))
+        with self.assertRaises(socket.error):
+            self._call_with_clock(retry, send, method='POST')
+
+    def test_call_other_exception(self):
+        retry = self._make_one()
+        send = _Send(KeyError('nope'))
+        with self.assertRaises(KeyError):
+            self._call_with_clock(retry, send)
+
+
+class _Response(dict):
+
+    def __init__(self, status, **headers):
+        super(_Response, self).__init__(headers)
+        self.status = status
+
+
+class _Send(object):
+
+    def __init__(self, *results):
+        self._results = list(results)
+        self._calls = 0
+
+    def __call__(self):
+        self._calls += 1
+        result = self._results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        info, content = result
+        info = dict(info)
+        response = _Response(info.pop('status'), **info)
+        return response, content
@@ -0,0 +1,291 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import unittest
+
+import google.auth.credentials
+import mock
+
+
+_NOW = datetime.datetime(2016, 12, 1, 12, 0, 0)
+
+
+class TestTokenCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.token_cache import TokenCache
+
+        return TokenCache
+
+    def _make_one(self, *args, **kw):
+        kw.setdefault('request_factory', lambda: self._request)
+        cache = self._get_target_class()(*args, **kw)
+        # Threads are tested on their own.
+        cache.start = lambda: None
+        return cache
+
+    def setUp(self):
+        from google.cloud import token_cache as MUT
+
+        self._request = object()
+        self._clock = [_NOW]
+        self._saved_now = MUT._UTCNOW
+        MUT._UTCNOW = lambda: self._clock[0]
+
+    def tearDown(self):
+        from google.cloud import token_cache as MUT
+
+        MUT._UTCNOW = self._saved_now
+
+    def test_scoped_credentials_shared(self):
+        credentials = _make_credentials()
+        cache = self._make_one()
+        scoped = cache.scoped_credentials(credentials, ('b', 'a'))
+        self.assertIs(scoped, credentials.with_scopes.return_value)
+        self.assertIs(cache.scoped_credentials(credentials, ('a', 'b')),
+                      scoped)
+        self.assertEqual(credentials.with_scopes.call_count, 1)
+        (scopes,), _ = credentials.with_scopes.call_args
+        self.assertEqual(scopes, ('b', 'a'))
+        self.assertEqual(len(cache), 1)
+
+    def test_scoped_credentials_other_scopes(self):
+        credentials = _make_credentials()
+        cache = self._make_one()
+        cache.scoped_credentials(credentials, ('a',))
+        cache.scoped_credentials(credentials, ('b',))
+        self.assertEqual(credentials.with_scopes.call_count, 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_scoped_credentials_starts_thread_once(self):
+        credentials = _make_credentials()
+        cache = self._make_one()
+        cache.start = mock.Mock()
+        cache.scoped_credentials(credentials, ('a',))
+        cache.scoped_credentials(credentials, ('a',))
+        cache.start.assert_called_once_with()
+
+    def test_scoped_credentials_forgotten_once_unused(self):
+        import gc
+
+        credentials = _Credentials()
+        cache = self._make_one()
+        scoped = cache.scoped_credentials(credentials, ('a',))
+        self.assertIs(cache.scoped_credentials(credentials, ('a',)), scoped)
+        self.assertEqual(len(cache), 1)
+
+        del scoped
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.refresh_due())
+        self.assertEqual(cache._entries, {})
+
+    def test_scoped_credentials_outlive_credentials(self):
+        import gc
+
+        credentials = _Credentials()
+        cache = self._make_one()
+        scoped = cache.scoped_credentials(credentials, ('a',))
+        scoped.valid = False
+
+        del credentials
+        gc.collect()
+        # Still used by clients, so still refreshed.
+        self.assertEqual(len(cache), 1)
+        cache.refresh_due()
+        self.assertEqual(scoped.refreshed, 1)
+
+        other = _Credentials()
+        other_scoped = cache.scoped_credentials(other, ('a',))
+        self.assertIsNot(other_scoped, scoped)
+        self.assertEqual(len(cache), 2)
+
+    def test_scoped_credentials_wo_weak_references(self):
+        credentials = _make_credentials()
+        cache = self._make_one()
+        with mock.patch('weakref.ref', side_effect=TypeError):
+            scoped = cache.scoped_credentials(credentials, ('a',))
+        self.assertIs(scoped, credentials.with_scopes.return_value)
+        self.assertEqual(len(cache), 0)
+
+    def test_refresh_due_invalid(self):
+        credentials = _make_credentials()
+        scoped = credentials.with_scopes.return_value
+        scoped.valid = False
+
+        def refresh(request):
+            self.assertIs(request, self._request)
+            scoped.valid = True
+            scoped.expiry = _NOW + datetime.timedelta(hours=1)
+
+        scoped.refresh.side_effect = refresh
+        cache = self._make_one(refresh_margin=300.0)
+        cache.scoped_credentials(credentials, ('a',))
+        self.assertEqual(cache.refresh_due(), 3300.0)
+        self.assertEqual(scoped.refresh.call_count, 1)
+
+    def test_refresh_due_ahead_of_expiry(self):
+        credentials = _make_credentials()
+        scoped = credentials.with_scopes.return_value
+        scoped.expiry = _NOW + datetime.timedelta(seconds=600)
+        cache = self._make_one(refresh_margin=300.0)
+        cache.scoped_credentials(credentials, ('a',))
+        self.assertEqual(cache.refresh_due(), 300.0)
+        scoped.refresh.assert_not_called()
+
+        self._clock[0] += datetime.timedelta(seconds=400)
+        cache.refresh_due()
+        scoped.refresh.assert_called_once_with(self._request)
+
+    def test_refresh_due_wo_expiry(self):
+        credentials = _make_credentials()
+        credentials.with_scopes.return_value.expiry = None
+        cache = self._make_one()
+        cache.scoped_credentials(credentials, ('a',))
+        self.assertIsNone(cache.refresh_due())
+
+    def test_refresh_due_failure(self):
+        credentials = _make_credentials()
+        scoped = credentials.with_scopes.return_value
+        scoped.valid = False
+        scoped.refresh.side_effect = ValueError('offline')
+        cache = self._make_one(retry_interval=30.0)
+        cache.scoped_credentials(credentials, ('a',))
+        self.assertEqual(cache.refresh_due(), 30.0)
+        self._clock[0] += datetime.timedelta(seconds=10)
+        self.assertEqual(cache.refresh_due(), 20.0)
+        self.assertEqual(scoped.refresh.call_count, 1)
+        self._clock[0] += datetime.timedelta(seconds=20)
+        cache.refresh_due()
+        self.assertEqual(scoped.refresh.call_count, 2)
+
+    def test_refresh_due_short_lived_token(self):
+        credentials = _make_credentials()
+        scoped = credentials.with_scopes.return_value
+        scoped.expiry = _NOW + datetime.timedelta(seconds=60)
+        cache = self._make_one(refresh_margin=300.0, retry_interval=30.0)
+        cache.scoped_credentials(credentials, ('a',))
+        # Refreshing again right away would not help.
+        self.assertEqual(cache.refresh_due(), 30.0)
+        self.assertEqual(scoped.refresh.call_count, 1)
+
+    def test_background_thread(self):
+        import threading
+
+        credentials = _make_credentials()
+        scoped = credentials.with_scopes.return_value
+        scoped.valid = False
+        refreshed = threading.Event()
+
+        def refresh(request):
+            scoped.valid = True
+            scoped.expiry = None
+            refreshed.set()
+
+        scoped.refresh.side_effect = refresh
+        cache = self._get_target_class()(
+            request_factory=lambda: self._request)
+        try:
+            cache.scoped_credentials(credentials, ('a',))
+            self.assertTrue(refreshed.wait(5.0))
+        finally:
+            cache.stop()
+        self.assertIsNone(cache._thread)
+
+    def test_start_after_fork(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import _fork
+
+        cache = self._get_target_class()()
+        thread = cache._thread = mock.Mock()
+        # Held by a thread which does not exist in the child.
+        cache._lock.acquire()
+        generation = _fork.generation() + 1
+        with _Monkey(_fork, generation=lambda: generation):
+            with mock.patch('threading.Thread') as thread_class:
+                cache.start()
+        self.assertIsNot(cache._thread, thread)
+        self.assertIs(cache._thread, thread_class.return_value)
+        thread_class.return_value.start.assert_called_once_with()
+
+
+class Test_scoped_credentials(unittest.TestCase):
+
+    def _call_fut(self, credentials, scopes):
+        from google.cloud.token_cache import scoped_credentials
+
+        return scoped_credentials(credentials, scopes)
+
+    def tearDown(self):
+        from google.cloud import token_cache
+
+        token_cache.disable()
+
+    def test_disabled(self):
+        credentials = _make_credentials()
+        first = self._call_fut(credentials, ('a',))
+        self.assertIs(first, credentials.with_scopes.return_value)
+        self._call_fut(credentials, ('a',))
+        self.assertEqual(credentials.with_scopes.call_count, 2)
+
+    def test_wo_credentials(self):
+        from google.cloud import token_cache
+
+        token_cache.enable()
+        self.assertIsNone(self._call_fut(None, ('a',)))
+
+    def test_enabled(self):
+        from google.cloud import token_cache
+
+        cache = token_cache.enable()
+        cache.start = lambda: None
+        credentials = _make_credentials()
+        first = self._call_fut(credentials, ('a',))
+        self.assertIs(self._call_fut(credentials, ('a',)), first)
+        self.assertEqual(len(cache), 1)
+
+    def test_disable_stops_thread(self):
+        from google.cloud import token_cache
+
+        cache = token_cache.enable()
+        cache.stop = mock.Mock()
+        token_cache.disable()
+        cache.stop.assert_called_once_with()
+        self.assertIsNone(token_cache._SHARED['cache'])
+
+
+def _make_credentials():
+    credentials = mock.Mock(spec=google.auth.credentials.Scoped)
+    credentials.requires_scopes = True
+    scoped = credentials.with_scopes.return_value
+    scoped.valid = True
+    scoped.expiry = _NOW + datetime.timedelta(hours=1)
+    return credentials
+
+
+class _Credentials(google.auth.credentials.Scoped):
+
+    requires_scopes = True
+    valid = True
+    expiry = None
+    refreshed = 0
+
+    def with_scopes(self, scopes, **kwargs):
+        return _Credentials()
+
+    def refresh(self, request):
+        self.refreshed += 1
+        self.valid = True
@@ -0,0 +1,310 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+class Test__close_http(unittest.TestCase):
+
+    def _call_fut(self, http):
+        from google.cloud.transport import _close_http
+
+        return _close_http(http)
+
+    def test_wo_connections(self):
+        self._call_fut(object())
+
+    def test_w_connections(self):
+        connection = mock.Mock()
+        connection_class = object()
+        http = _Http()
+        http.connections = {
+            'https': connection_class,
+            'https:www.googleapis.com': connection,
+        }
+        self._call_fut(http)
+        connection.close.assert_called_once_with()
+        self.assertEqual(http.connections, {'https': connection_class})
+
+
+class TestPooledHttp(unittest.TestCase):
+
+    URI = 'https://www.googleapis.com/storage/v1/b/name'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.transport import PooledHttp
+
+        return PooledHttp
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        import httplib2
+        from google.cloud.transport import DEFAULT_IDLE_TIMEOUT
+        from google.cloud.transport import DEFAULT_MAX_PER_HOST
+
+        pool = self._make_one()
+        self.assertEqual(pool.max_per_host, DEFAULT_MAX_PER_HOST)
+        self.assertEqual(pool.idle_timeout, DEFAULT_IDLE_TIMEOUT)
+        self.assertIs(pool._http_factory, httplib2.Http)
+
+    def test_ctor_invalid_max_per_host(self):
+        with self.assertRaises(ValueError):
+            self._make_one(max_per_host=0)
+
+    def test_request_reuses_http(self):
+        created = []
+
+        def factory():
+            http = _Http()
+            created.append(http)
+            return http
+
+        pool = self._make_one(http_factory=factory)
+        response, content = pool.request(
+            self.URI, method='POST', body=b'abc', headers={'foo': 'bar'})
+        self.assertEqual(content, b'')
+        self.assertEqual(response['status'], '200')
+        pool.request(self.URI)
+
+        self.assertEqual(len(created), 1)
+        http, = created
+        self.assertEqual(len(http._requested), 2)
+        uri, kw = http._requested[0]
+        self.assertEqual(uri, self.URI)
+        self.assertEqual(kw['method'], 'POST')
+        self.assertEqual(kw['body'], b'abc')
+        self.assertEqual(kw['headers'], {'foo': 'bar'})
+
+        stats = pool.stats()
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(stats['reused'], 1)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['idle'], 1)
+        self.assertEqual(
+            stats['hosts'],
+            {'https://www.googleapis.com': {'in_use': 0, 'idle': 1}})
+
+    def test_request_w_timeout(self):
+        connection = mock.Mock(timeout=None)
+        http = _Http()
+        http.connections = {'https:www.googleapis.com': connection}
+        pool = self._make_one(http_factory=lambda: http)
+
+        def request(uri, **kw):
+            self.assertEqual(http.timeout, 2.5)
+            self.assertEqual(connection.timeout, 2.5)
+            return _Http.request(http, uri, **kw)
+
+        http.request = request
+        pool.request(self.URI, timeout=2.5)
+
+        self.assertIsNone(http.timeout)
+        connection.sock.settimeout.assert_has_calls(
+            [mock.call(2.5), mock.call(None)])
+        self.assertEqual(len(http._requested), 1)
+        self.assertNotIn('timeout', http._requested[0][1])
+
+    def test_request_separate_hosts(self):
+        created = []
+
+        def factory():
+            http = _Http()
+            created.append(http)
+            return http
+
+        pool = self._make_one(http_factory=factory)
+        pool.request(self.URI)
+        pool.request('https://pubsub.googleapis.com/v1/topics')
+        self.assertEqual(len(created), 2)
+        self.assertEqual(len(pool.stats()['hosts']), 2)
+
+    def test_request_failure_discards_http(self):
+        connection = mock.Mock()
+        http = _Http(exc=ValueError('boom'))
+        http.connections = {'https:www.googleapis.com': connection}
+        pool = self._make_one(http_factory=lambda: http)
+
+        with self.assertRaises(ValueError):
+            pool.request(self.URI)
+
+        connection.close.assert_called_once_with()
+        stats = pool.stats()
+        self.assertEqual(stats['discarded'], 1)
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['idle'], 0)
+
+    def test_factory_failure_frees_slot(self):
+        def factory():
+            raise RuntimeError('nope')
+
+        pool = self._make_one(max_per_host=1, http_factory=factory)
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                pool.request(self.URI)
+        self.assertEqual(pool.stats()['in_use'], 0)
+
+    def test_idle_eviction(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import transport as MUT
+
+        connection = mock.Mock()
+        created = []
+
+        def factory():
+            http = _Http()
+            http.connections = {'https:www.googleapis.com': connection}
+            created.append(http)
+            return http
+
+        pool = self._make_one(idle_timeout=10, http_factory=factory)
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            pool.request(self.URI)
+        with _Monkey(MUT, _NOW=lambda: 111.0):
+            pool.request(self.URI)
+
+        self.assertEqual(len(created), 2)
+        connection.close.assert_called_once_with()
+        stats = pool.stats()
+        self.assertEqual(stats['evicted'], 1)
+        self.assertEqual(stats['reused'], 0)
+
+    def test_idle_eviction_disabled(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import transport as MUT
+
+        pool = self._make_one(idle_timeout=None, http_factory=_Http)
+        with _Monkey(MUT, _NOW=lambda: 100.0):
+            pool.request(self.URI)
+        with _Monkey(MUT, _NOW=lambda: 1e6):
+            pool.request(self.URI)
+        self.assertEqual(pool.stats()['reused'], 1)
+
+    def test_max_per_host_blocks(self):
+        import threading
+
+        started = threading.Event()
+        proceed = threading.Event()
+        created = []
+
+        class _BlockingHttp(_Http):
+
+            def request(self, uri, **kw):
+                started.set()
+                proceed.wait()
+                return super(_BlockingHttp, self).request(uri, **kw)
+
+        def factory():
+            http = _BlockingHttp()
+            created.append(http)
+            return http
+
+        pool = self._make_one(max_per_host=1, http_factory=factory)
+        first = threading.Thread(target=pool.request, args=(self.URI,))
+        first.start()
+        started.wait()
+        second = threading.Thread(target=pool.request, args=(self.URI,))
+        second.start()
+
+        while pool.stats()['waits'] == 0:
+            second.join(0.001)
+        proceed.set()
+        first.join()
+        second.join()
+
+        self.assertEqual(len(created), 1)
+        stats = pool.stats()
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['reused'], 1)
+        self.assertEqual(stats['in_use'], 0)
+
+    def test_clear(self):
+        connection = mock.Mock()
+        http = _Http()
+        http.connections = {'https:www.googleapis.com': connection}
+        pool = self._make_one(http_factory=lambda: http)
+        pool.request(self.URI)
+
+        pool.clear()
+
+        connection.close.assert_called_once_with()
+        stats = pool.stats()
+        self.assertEqual(stats['idle'], 0)
+        self.assertEqual(stats['hosts'], {})
+
+    def test_reset_after_fork(self):
+        connection = mock.Mock()
+        http = _Http()
+        http.connections = {'https:www.googleapis.com': connection}
+        pool = self._make_one(http_factory=lambda: http)
+        pool.request(self.URI)
+        # Held by a thread which does not exist in the child.
+        pool._lock.acquire()
+
+        pool.reset_after_fork()
+
+        connection.close.assert_not_called()
+        stats = pool.stats()
+        self.assertEqual(stats['idle'], 0)
+        self.assertEqual(stats['hosts'], {})
+
+    def test_w_make_api_request(self):
+        from google.cloud.streaming.http_wrapper import make_api_request
+        from google.cloud.streaming.http_wrapper import Request
+
+        pool = self._make_one(http_factory=_Http)
+        response = make_api_request(pool, Request(url=self.URI))
+        self.assertEqual(response.status_code, 200)
+
+
+class Test_authorized_pooled_http(unittest.TestCase):
+
+    def _call_fut(self, credentials, **kwargs):
+        from google.cloud.transport import authorized_pooled_http
+
+        return authorized_pooled_http(credentials, **kwargs)
+
+    def test_it(self):
+        import google_auth_httplib2
+        from google.cloud.transport import PooledHttp
+
+        credentials = object()
+        http = self._call_fut(credentials, max_per_host=3)
+        self.assertIsInstance(http, google_auth_httplib2.AuthorizedHttp)
+        self.assertIs(http.credentials, credentials)
+        self.assertIsInstance(http.http, PooledHttp)
+        self.assertEqual(http.http.max_per_host, 3)
+
+
+class _Http(object):
+
+    connections = None
+    timeout = None
+
+    def __init__(self, exc=None):
+        self._exc = exc
+        self._requested = []
+
+    def request(self, uri, **kw):
+        import httplib2
+
+        self._requested.append((uri, kw))
+        if self._exc is not None:
+            raise self._exc
+        return httplib2.Response({'status': '200'}), b''
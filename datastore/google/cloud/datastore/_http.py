@@ -22,6 +22,7 @@ from google.rpc import status_pb2
 from google.cloud._helpers import make_insecure_stub
 from google.cloud._helpers import make_secure_stub
 from google.cloud import _http as connection_module
+from google.cloud import instrumentation
 from google.cloud.environment_vars import DISABLE_GRPC
 from google.cloud.environment_vars import GCD_HOST
 from google.cloud import exceptions
@@ -79,7 +80,7 @@ class _DatastoreAPIOverHttp(object):
     def __init__(self, connection):
         self.connection = connection
 
-    def _request(self, project, method, data):
+    def _request(self, project, method, data, timeout=None):
         """Make a request over the Http transport to the Cloud Datastore API.
 
         :type project: str
@@ -93,6 +94,10 @@ class _DatastoreAPIOverHttp(object):
         :param data: The data to send with the API call.
                      Typically this is a serialized Protobuf string.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: str
         :returns: The string response content from the API call.
         :raises: :class:`google.cloud.exceptions.GoogleCloudError` if the
@@ -103,9 +108,18 @@ class _DatastoreAPIOverHttp(object):
             'Content-Length': str(len(data)),
             'User-Agent': self.connection.USER_AGENT,
         }
-        headers, content = self.connection.http.request(
-            uri=self.connection.build_api_url(project=project, method=method),
-            method='POST', headers=headers, body=data)
+        url = self.connection.build_api_url(project=project, method=method)
+        api = '%s/%s' % (self.connection.api_base_url,
+                         self.connection.API_VERSION)
+        with instrumentation.HOOKS.request(
+                api, method, url,
+                url_template=self.connection.API_URL_TEMPLATE,
+                request_bytes=len(data)) as event:
+            headers, content = connection_module._request_with_timeout(
+                self.connection.http, timeout, uri=url, method='POST',
+                headers=headers, body=data)
+            event.status = int(headers['status'])
+            event.response_bytes = len(content)
 
         status = headers['status']
         if status != '200':
@@ -115,7 +129,8 @@ class _DatastoreAPIOverHttp(object):
 
         return content
 
-    def _rpc(self, project, method, request_pb, response_pb_cls):
+    def _rpc(self, project, method, request_pb, response_pb_cls,
+             timeout=None):
         """Make a protobuf RPC request.
 
         :type project: str
@@ -133,14 +148,19 @@ class _DatastoreAPIOverHttp(object):
         :param response_pb_cls: The class used to unmarshall the response
                                 protobuf.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: :class:`google.protobuf.message.Message`
         :returns: The RPC message parsed from the response.
         """
         response = self._request(project=project, method=method,
-                                 data=request_pb.SerializeToString())
+                                 data=request_pb.SerializeToString(),
+                                 timeout=timeout)
         return response_pb_cls.FromString(response)
 
-    def lookup(self, project, request_pb):
+    def lookup(self, project, request_pb, timeout=None):
         """Perform a ``lookup`` request.
 
         :type project: str
@@ -150,11 +170,15 @@ class _DatastoreAPIOverHttp(object):
         :type request_pb: :class:`.datastore_pb2.LookupRequest`
         :param request_pb: The request protobuf object.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: :class:`.datastore_pb2.LookupResponse`
         :returns: The returned protobuf response object.
         """
         return self._rpc(project, 'lookup', request_pb,
-                         _datastore_pb2.LookupResponse)
+                         _datastore_pb2.LookupResponse, timeout=timeout)
 
     def run_query(self, project, request_pb):
         """Perform a ``runQuery`` request.
@@ -281,12 +305,14 @@ class _DatastoreAPIOverGRPC(object):
             self._stub = make_secure_stub(connection.credentials,
                                           connection.USER_AGENT,
                                           datastore_pb2_grpc.DatastoreStub,
-                                          connection.host)
+                                          connection.host,
+                                          timeout=connection.timeout)
         else:
             self._stub = make_insecure_stub(datastore_pb2_grpc.DatastoreStub,
-                                            connection.host)
+                                            connection.host,
+                                            timeout=connection.timeout)
 
-    def lookup(self, project, request_pb):
+    def lookup(self, project, request_pb, timeout=None):
         """Perform a ``lookup`` request.
 
         :type project: str
@@ -296,12 +322,19 @@ class _DatastoreAPIOverGRPC(object):
         :type request_pb: :class:`.datastore_pb2.LookupRequest`
         :param request_pb: The request protobuf object.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: :class:`.datastore_pb2.LookupResponse`
         :returns: The returned protobuf response object.
         """
         request_pb.project_id = project
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
         with _grpc_catch_rendezvous():
-            return self._stub.Lookup(request_pb)
+            return self._stub.Lookup(request_pb, **kwargs)
 
     def run_query(self, project, request_pb):
         """Perform a ``runQuery`` request.
@@ -402,6 +435,11 @@ class Connection(connection_module.Connection):
 
     :type http: :class:`httplib2.Http` or class that defines ``request()``.
     :param http: An optional HTTP object to make requests.
+
+    :type timeout: float
+    :param timeout: (Optional) The default number of seconds before a request
+                    times out, over either HTTP or gRPC. If not passed, the
+                    class-level :attr:`timeout` applies.
     """
 
     API_BASE_URL = 'https://' + DATASTORE_API_HOST
@@ -417,8 +455,10 @@ class Connection(connection_module.Connection):
     SCOPE = ('https://www.googleapis.com/auth/datastore',)
     """The scopes required for authenticating as a Cloud Datastore consumer."""
 
-    def __init__(self, credentials=None, http=None):
+    def __init__(self, credentials=None, http=None, timeout=None):
         super(Connection, self).__init__(credentials=credentials, http=http)
+        if timeout is not None:
+            self.timeout = timeout
         try:
             self.host = os.environ[GCD_HOST]
             self.api_base_url = 'http://' + self.host
@@ -463,7 +503,7 @@ class Connection(connection_module.Connection):
             project=project, method=method)
 
     def lookup(self, project, key_pbs,
-               eventual=False, transaction_id=None):
+               eventual=False, transaction_id=None, timeout=None):
         """Lookup keys from a project in the Cloud Datastore.
 
         Maps the ``DatastoreService.Lookup`` protobuf RPC.
@@ -505,6 +545,10 @@ class Connection(connection_module.Connection):
                                the given transaction.  Incompatible with
                                ``eventual==True``.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out. Defaults to :attr:`timeout`.
+
         :rtype: tuple
         :returns: A triple of (``results``, ``missing``, ``deferred``) where
                   both ``results`` and ``missing`` are lists of
@@ -516,7 +560,10 @@ class Connection(connection_module.Connection):
         _set_read_options(lookup_request, eventual, transaction_id)
         _add_keys_to_request(lookup_request.keys, key_pbs)
 
-        lookup_response = self._datastore_api.lookup(project, lookup_request)
+        if timeout is None:
+            timeout = self.timeout
+        lookup_response = self._datastore_api.lookup(
+            project, lookup_request, timeout=timeout)
 
         results = [result.entity for result in lookup_response.found]
         missing = [result.entity for result in lookup_response.missing]
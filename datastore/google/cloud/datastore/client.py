@@ -27,6 +27,7 @@ from google.cloud.datastore.entity import Entity
 from google.cloud.datastore.key import Key
 from google.cloud.datastore.query import Query
 from google.cloud.datastore.transaction import Transaction
+from google.cloud.deadline import as_deadline
 from google.cloud.environment_vars import GCD_DATASET
 
 
@@ -67,7 +68,7 @@ def _determine_default_project(project=None):
 
 def _extended_lookup(connection, project, key_pbs,
                      missing=None, deferred=None,
-                     eventual=False, transaction_id=None):
+                     eventual=False, transaction_id=None, timeout=None):
     """Repeat lookup until all keys found (unless stop requested).
 
     Helper function for :meth:`Client.get_multi`.
@@ -100,10 +101,16 @@ def _extended_lookup(connection, project, key_pbs,
                            the given transaction.  Incompatible with
                            ``eventual==True``.
 
+    :type timeout: float or :class:`~google.cloud.deadline.Deadline`
+    :param timeout: (Optional) The number of seconds before the lookups
+                    time out. Each lookup only gets the time remaining.
+
     :rtype: list of :class:`.entity_pb2.Entity`
     :returns: The requested entities.
     :raises: :class:`ValueError` if missing / deferred are not null or
-             empty list.
+             empty list, or
+             :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+             timeout expired before all keys were looked up.
     """
     if missing is not None and missing != []:
         raise ValueError('missing must be None or an empty list')
@@ -112,16 +119,21 @@ def _extended_lookup(connection, project, key_pbs,
         raise ValueError('deferred must be None or an empty list')
 
     results = []
+    deadline = as_deadline(timeout)
 
     loop_num = 0
     while loop_num < _MAX_LOOPS:  # loop against possible deferred.
         loop_num += 1
 
+        kwargs = {}
+        if deadline is not None:
+            kwargs['timeout'] = deadline.check()
         results_found, missing_found, deferred_found = connection.lookup(
             project=project,
             key_pbs=key_pbs,
             eventual=eventual,
             transaction_id=transaction_id,
+            **kwargs
         )
 
         results.extend(results_found)
@@ -169,14 +181,20 @@ class Client(_BaseClient, _ClientProjectMixin):
                  :meth:`~httplib2.Http.request`. If not passed, an
                  ``http`` object is created that is bound to the
                  ``credentials`` for the current object.
+
+    :type timeout: float
+    :param timeout: (Optional) The default number of seconds before a
+                    request times out. Calls passing their own ``timeout``
+                    are unaffected. If not passed, requests may block
+                    indefinitely.
     """
 
     def __init__(self, project=None, namespace=None,
-                 credentials=None, http=None):
+                 credentials=None, http=None, timeout=None):
         _ClientProjectMixin.__init__(self, project=project)
         _BaseClient.__init__(self, credentials=credentials, http=http)
         self._connection = Connection(
-            credentials=self._credentials, http=self._http)
+            credentials=self._credentials, http=self._http, timeout=timeout)
 
         self.namespace = namespace
         self._batch_stack = _LocalStack()
@@ -232,7 +250,8 @@ class Client(_BaseClient, _ClientProjectMixin):
         if isinstance(transaction, Transaction):
             return transaction
 
-    def get(self, key, missing=None, deferred=None, transaction=None):
+    def get(self, key, missing=None, deferred=None, transaction=None,
+            timeout=None):
         """Retrieve an entity from a single key (if it exists).
 
         .. note::
@@ -257,15 +276,21 @@ class Client(_BaseClient, _ClientProjectMixin):
         :param transaction: (Optional) Transaction to use for read consistency.
                             If not passed, uses current transaction, if set.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the lookup
+                        times out.
+
         :rtype: :class:`google.cloud.datastore.entity.Entity` or ``NoneType``
         :returns: The requested entity if it exists.
         """
         entities = self.get_multi(keys=[key], missing=missing,
-                                  deferred=deferred, transaction=transaction)
+                                  deferred=deferred, transaction=transaction,
+                                  timeout=timeout)
         if entities:
             return entities[0]
 
-    def get_multi(self, keys, missing=None, deferred=None, transaction=None):
+    def get_multi(self, keys, missing=None, deferred=None, transaction=None,
+                  timeout=None):
         """Retrieve entities, along with their attributes.
 
         :type keys: list of :class:`google.cloud.datastore.key.Key`
@@ -285,10 +310,18 @@ class Client(_BaseClient, _ClientProjectMixin):
         :param transaction: (Optional) Transaction to use for read consistency.
                             If not passed, uses current transaction, if set.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the lookups
+                        (repeated while the backend defers keys) time out.
+                        If not passed, each lookup times out after the
+                        connection's ``timeout``.
+
         :rtype: list of :class:`google.cloud.datastore.entity.Entity`
         :returns: The requested entities.
         :raises: :class:`ValueError` if one or more of ``keys`` has a project
-                 which does not match our project.
+                 which does not match our project, or
+                 :class:`~google.cloud.exceptions.DeadlineExceeded` if the
+                 timeout expired.
         """
         if not keys:
             return []
@@ -308,6 +341,7 @@ class Client(_BaseClient, _ClientProjectMixin):
             missing=missing,
             deferred=deferred,
             transaction_id=transaction and transaction.id,
+            timeout=timeout,
         )
 
         if missing is not None:
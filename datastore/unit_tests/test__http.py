@@ -63,6 +63,33 @@ class Test_DatastoreAPIOverHttp(unittest.TestCase):
         self.assertEqual(conn.build_kwargs,
                          [{'method': METHOD, 'project': PROJECT}])
 
+    def test__request_w_hooks(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import instrumentation
+
+        PROJECT = 'PROJECT'
+        METHOD = 'METHOD'
+        DATA = b'DATA'
+        URI = 'http://api-url'
+        conn = _Connection(URI)
+        datastore_api = self._make_one(conn)
+        conn.http = Http({'status': '200'}, b'CONTENT')
+        events = []
+        hooks = instrumentation.Hooks()
+        hooks.register(_Hook(events))
+        with _Monkey(instrumentation, HOOKS=hooks):
+            datastore_api._request(PROJECT, METHOD, DATA)
+
+        self.assertEqual(len(events), 1)
+        event = events[0]
+        self.assertEqual(event.api, 'http://api-base/v1')
+        self.assertEqual(event.method, METHOD)
+        self.assertEqual(event.url, URI)
+        self.assertEqual(event.url_template, conn.API_URL_TEMPLATE)
+        self.assertEqual(event.request_bytes, 4)
+        self.assertEqual(event.response_bytes, 7)
+        self.assertEqual(event.status, 200)
+
     def test__request_w_200(self):
         PROJECT = 'PROJECT'
         METHOD = 'METHOD'
@@ -180,7 +207,8 @@ class Test_DatastoreAPIOverGRPC(unittest.TestCase):
         from google.cloud.datastore._http import _DatastoreAPIOverGRPC
         return _DatastoreAPIOverGRPC
 
-    def _make_one(self, stub, connection=None, secure=True, mock_args=None):
+    def _make_one(self, stub, connection=None, secure=True, mock_args=None,
+                  mock_kwargs=None):
         import mock
 
         if connection is None:
@@ -190,9 +218,12 @@ class Test_DatastoreAPIOverGRPC(unittest.TestCase):
 
         if mock_args is None:
             mock_args = []
+        if mock_kwargs is None:
+            mock_kwargs = []
 
-        def mock_make_stub(*args):
+        def mock_make_stub(*args, **kwargs):
             mock_args.append(args)
+            mock_kwargs.append(kwargs)
             return stub
 
         if secure:
@@ -216,8 +247,10 @@ class Test_DatastoreAPIOverGRPC(unittest.TestCase):
 
         stub = _GRPCStub()
         mock_args = []
+        mock_kwargs = []
         datastore_api = self._make_one(stub, connection=conn,
-                                       mock_args=mock_args)
+                                       mock_args=mock_args,
+                                       mock_kwargs=mock_kwargs)
         self.assertIs(datastore_api._stub, stub)
 
         self.assertEqual(mock_args, [(
@@ -226,6 +259,17 @@ class Test_DatastoreAPIOverGRPC(unittest.TestCase):
             MUT.datastore_pb2_grpc.DatastoreStub,
             conn.host,
         )])
+        self.assertEqual(mock_kwargs, [{'timeout': None}])
+
+    def test_constructor_w_timeout(self):
+        conn = _Connection(None)
+        conn.credentials = object()
+        conn.host = 'CURR_HOST'
+        conn.timeout = 5.0
+
+        mock_kwargs = []
+        self._make_one(_GRPCStub(), connection=conn, mock_kwargs=mock_kwargs)
+        self.assertEqual(mock_kwargs, [{'timeout': 5.0}])
 
     def test_constructor_insecure(self):
         from google.cloud.datastore import _http as MUT
@@ -233,18 +277,22 @@ class Test_DatastoreAPIOverGRPC(unittest.TestCase):
         conn = _Connection(None)
         conn.credentials = object()
         conn.host = 'CURR_HOST:1234'
+        conn.timeout = 5.0
 
         stub = _GRPCStub()
         mock_args = []
+        mock_kwargs = []
         datastore_api = self._make_one(stub, connection=conn,
                                        secure=False,
-                                       mock_args=mock_args)
+                                       mock_args=mock_args,
+                                       mock_kwargs=mock_kwargs)
         self.assertIs(datastore_api._stub, stub)
 
         self.assertEqual(mock_args, [(
             MUT.datastore_pb2_grpc.DatastoreStub,
             conn.host,
         )])
+        self.assertEqual(mock_kwargs, [{'timeout': 5.0}])
 
     def test_lookup(self):
         return_val = object()
@@ -259,6 +307,13 @@ class Test_DatastoreAPIOverGRPC(unittest.TestCase):
         self.assertEqual(stub.method_calls,
                          [(request_pb, 'Lookup')])
 
+    def test_lookup_w_timeout(self):
+        stub = _GRPCStub(object())
+        datastore_api = self._make_one(stub=stub)
+
+        datastore_api.lookup('PROJECT', _RequestPB(), timeout=5.0)
+        self.assertEqual(stub.lookup_timeout, 5.0)
+
     def test_run_query(self):
         return_val = object()
         stub = _GRPCStub(return_val)
@@ -375,12 +430,14 @@ class TestConnection(unittest.TestCase):
         pb.kind.add().name = kind
         return pb
 
-    def _make_one(self, credentials=None, http=None, use_grpc=False):
+    def _make_one(self, credentials=None, http=None, use_grpc=False,
+                  **kw):
         import mock
 
         with mock.patch('google.cloud.datastore._http._USE_GRPC',
                         new=use_grpc):
-            return self._get_target_class()(credentials=credentials, http=http)
+            return self._get_target_class()(credentials=credentials, http=http,
+                                            **kw)
 
     def _verifyProtobufCall(self, called_with, URI, conn):
         self.assertEqual(called_with['uri'], URI)
@@ -461,6 +518,27 @@ class TestConnection(unittest.TestCase):
         conn = self._make_one(creds)
         self.assertIs(conn.credentials, creds)
 
+    def test_ctor_w_timeout(self):
+        conn = self._make_one(timeout=5.0)
+        self.assertEqual(conn.timeout, 5.0)
+        self.assertIsNone(self._get_target_class().timeout)
+
+    def test_ctor_w_timeout_before_grpc_stub(self):
+        import mock
+
+        timeouts = []
+
+        def mock_api(connection, secure):
+            timeouts.append(connection.timeout)
+
+        patch = mock.patch(
+            'google.cloud.datastore._http._DatastoreAPIOverGRPC',
+            new=mock_api)
+        with patch:
+            self._make_one(use_grpc=True, timeout=5.0)
+
+        self.assertEqual(timeouts, [5.0])
+
     def test_http_w_existing(self):
         conn = self._make_one()
         conn._http = http = object()
@@ -534,6 +612,19 @@ class TestConnection(unittest.TestCase):
         self.assertEqual(len(keys), 1)
         self.assertEqual(key_pb, keys[0])
 
+    def test_lookup_w_timeout(self):
+        from google.cloud.grpc.datastore.v1 import datastore_pb2
+
+        rsp_pb = datastore_pb2.LookupResponse()
+        conn = self._make_one()
+        conn.timeout = 30.0
+        http = conn._http = _TimedHttp(
+            {'status': '200'}, rsp_pb.SerializeToString())
+        conn.lookup('PROJECT', [self._make_key_pb('PROJECT')])
+        conn.lookup('PROJECT', [self._make_key_pb('PROJECT')], timeout=5.0)
+        self.assertEqual(http._timeouts, [30.0, 5.0])
+        self.assertIsNone(http.timeout)
+
     def test_lookup_single_key_empty_response_w_eventual(self):
         from google.cloud.grpc.datastore.v1 import datastore_pb2
 
@@ -1143,10 +1234,27 @@ class Http(object):
         return self._response, self._content
 
 
+class _TimedHttp(Http):
+
+    timeout = None
+
+    def __init__(self, headers, content):
+        super(_TimedHttp, self).__init__(headers, content)
+        self._timeouts = []
+
+    def request(self, **kw):
+        self._timeouts.append(self.timeout)
+        return super(_TimedHttp, self).request(**kw)
+
+
 class _Connection(object):
 
     host = None
+    timeout = None
     USER_AGENT = 'you-sir-age-int'
+    API_URL_TEMPLATE = '{api_base}/{api_version}/projects/{project}:{method}'
+    API_VERSION = 'v1'
+    api_base_url = 'http://api-base'
 
     def __init__(self, api_url):
         self.api_url = api_url
@@ -1157,6 +1265,15 @@ class _Connection(object):
         return self.api_url
 
 
+class _Hook(object):
+
+    def __init__(self, events):
+        self._events = events
+
+    def after_request(self, event):
+        self._events.append(event)
+
+
 class _GRPCStub(object):
 
     def __init__(self, return_val=None, side_effect=Exception):
@@ -1171,7 +1288,8 @@ class _GRPCStub(object):
         else:
             raise self.side_effect
 
-    def Lookup(self, request_pb):
+    def Lookup(self, request_pb, timeout=None):
+        self.lookup_timeout = timeout
         return self._method(request_pb, 'Lookup')
 
     def RunQuery(self, request_pb):
@@ -192,9 +192,16 @@ class TestClient(unittest.TestCase):
         self.assertIsInstance(client._connection, _MockConnection)
         self.assertIs(client._connection.credentials, creds)
         self.assertIs(client._connection.http, http)
+        self.assertIsNone(client._connection.timeout)
         self.assertIsNone(client.current_batch)
         self.assertEqual(list(client._batch_stack), [])
 
+    def test_ctor_w_timeout(self):
+        creds = _make_credentials()
+        client = self._get_target_class()(
+            project='other', credentials=creds, timeout=5.0)
+        self.assertEqual(client._connection.timeout, 5.0)
+
     def test__push_batch_and__pop_batch(self):
         creds = _make_credentials()
         client = self._make_one(credentials=creds)
@@ -258,6 +265,60 @@ class TestClient(unittest.TestCase):
         self.assertIs(_called_with[0][1]['deferred'], deferred)
         self.assertEqual(_called_with[0][1]['transaction'], TXN_ID)
 
+    def test_get_w_timeout(self):
+        _called_with = []
+
+        def _get_multi(*args, **kw):
+            _called_with.append((args, kw))
+            return []
+
+        creds = _make_credentials()
+        client = self._make_one(credentials=creds)
+        client.get_multi = _get_multi
+
+        client.get(object(), timeout=5.0)
+
+        self.assertEqual(_called_with[0][1]['timeout'], 5.0)
+
+    def test_get_multi_w_timeout_and_deferred(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import deadline as MUT
+        from google.cloud.datastore.key import Key
+        from google.cloud.exceptions import DeadlineExceeded
+
+        key1 = Key('Kind', 1234, project=self.PROJECT)
+        key2 = Key('Kind', 2345, project=self.PROJECT)
+        clock = [100.0]
+        creds = _make_credentials()
+        client = self._make_one(credentials=creds)
+        connection = client._connection
+        lookup = connection.lookup
+
+        def _slow_lookup(*args, **kw):
+            clock[0] += 3.0
+            return lookup(*args, **kw)
+
+        connection.lookup = _slow_lookup
+        connection._add_lookup_result(deferred=[key1.to_protobuf()])
+        connection._add_lookup_result(deferred=[key2.to_protobuf()])
+
+        with _Monkey(MUT, _NOW=lambda: clock[0]):
+            with self.assertRaises(DeadlineExceeded):
+                client.get_multi([key1, key2], timeout=5.0)
+
+        # The second lookup only got the time remaining, and no third
+        # lookup was attempted.
+        self.assertEqual(connection._lookup_timeouts, [5.0, 2.0])
+
+    def test_get_multi_wo_timeout(self):
+        from google.cloud.datastore.key import Key
+
+        creds = _make_credentials()
+        client = self._make_one(credentials=creds)
+        client._connection._add_lookup_result()
+        client.get_multi([Key('Kind', 1234, project=self.PROJECT)])
+        self.assertEqual(client._connection._lookup_timeouts, [None])
+
     def test_get_multi_no_keys(self):
         creds = _make_credentials()
         client = self._make_one(credentials=creds)
@@ -917,10 +978,12 @@ class _Dummy(object):
 
 class _MockConnection(object):
 
-    def __init__(self, credentials=None, http=None):
+    def __init__(self, credentials=None, http=None, timeout=None):
         self.credentials = credentials
         self.http = http
+        self.timeout = timeout
         self._lookup_cw = []
+        self._lookup_timeouts = []
         self._lookup = []
         self._commit_cw = []
         self._commit = []
@@ -931,8 +994,10 @@ class _MockConnection(object):
     def _add_lookup_result(self, results=(), missing=(), deferred=()):
         self._lookup.append((list(results), list(missing), list(deferred)))
 
-    def lookup(self, project, key_pbs, eventual=False, transaction_id=None):
+    def lookup(self, project, key_pbs, eventual=False, transaction_id=None,
+               timeout=None):
         self._lookup_cw.append((project, key_pbs, eventual, transaction_id))
+        self._lookup_timeouts.append(timeout)
         triple, self._lookup = self._lookup[0], self._lookup[1:]
         results, missing, deferred = triple
         return results, missing, deferred
@@ -21,6 +21,8 @@ from google.cloud.exceptions import NotFound
 from google.cloud.dns.changes import Changes
 from google.cloud.dns.resource_record_set import ResourceRecordSet
 from google.cloud.iterator import HTTPIterator
+from google.cloud.metadata_cache import invalidate_resource
+from google.cloud.metadata_cache import reload_resource
 
 
 class ManagedZone(object):
@@ -301,8 +303,7 @@ class ManagedZone(object):
         """
         client = self._require_client(client)
 
-        api_response = client._connection.api_request(
-            method='GET', path=self.path)
+        api_response = reload_resource(client, self.path)
         self._set_properties(api_response)
 
     def delete(self, client=None):
@@ -318,6 +319,7 @@ class ManagedZone(object):
         """
         client = self._require_client(client)
         client._connection.api_request(method='DELETE', path=self.path)
+        invalidate_resource(client, self.path)
 
     def list_resource_record_sets(self, max_results=None, page_token=None,
                                   client=None):
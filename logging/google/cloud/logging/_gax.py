@@ -101,7 +101,10 @@ class _LoggingAPI(object):
         loggers = {}
         item_to_value = functools.partial(
             _item_to_entry, loggers=loggers)
-        return GAXIterator(self._client, page_iter, item_to_value)
+        items_to_values = functools.partial(
+            _items_to_entries, loggers=loggers)
+        return GAXIterator(self._client, page_iter, item_to_value,
+                           items_to_values=items_to_values)
 
     def write_entries(self, entries, logger_name=None, resource=None,
                       labels=None):
@@ -488,6 +491,29 @@ def _item_to_entry(iterator, entry_pb, loggers):
     return entry_from_resource(resource, iterator.client, loggers)
 
 
+def _items_to_entries(iterator, entry_pbs, loggers):
+    """Convert a batch of log entry protobufs to native objects.
+
+    Patched with a mutable ``loggers`` argument, like
+    :func:`_item_to_entry`.
+
+    :type iterator: :class:`~google.cloud.iterator.Iterator`
+    :param iterator: The iterator that is currently in use.
+
+    :type entry_pbs: list of :class:`.log_entry_pb2.LogEntry`
+    :param entry_pbs: Log entry protobufs returned from the API.
+
+    :type loggers: dict
+    :param loggers: A mapping of logger fullnames -> loggers.
+
+    :rtype: list of :class:`~google.cloud.logging.entries._BaseEntry`
+    :returns: The log entries, in the same order.
+    """
+    client = iterator.client
+    return [entry_from_resource(MessageToDict(entry_pb), client, loggers)
+            for entry_pb in entry_pbs]
+
+
 def _item_to_sink(iterator, log_sink_pb):
     """Convert a sink protobuf to the native object.
 
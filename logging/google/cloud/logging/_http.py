@@ -120,10 +120,13 @@ class _LoggingAPI(object):
         loggers = {}
         item_to_value = functools.partial(
             _item_to_entry, loggers=loggers)
+        items_to_values = functools.partial(
+            _items_to_entries, loggers=loggers)
         iterator = HTTPIterator(
             client=self._client, path=path,
             item_to_value=item_to_value, items_key='entries',
-            page_token=page_token, extra_params=extra_params)
+            page_token=page_token, extra_params=extra_params,
+            items_to_values=items_to_values)
         # This method uses POST to make a read-only request.
         iterator._HTTP_METHOD = 'POST'
         return iterator
@@ -481,6 +484,29 @@ def _item_to_entry(iterator, resource, loggers):
     return entry_from_resource(resource, iterator.client, loggers)
 
 
+def _items_to_entries(iterator, resources, loggers):
+    """Convert a batch of log entry resources to native objects.
+
+    Patched with a mutable ``loggers`` argument, like
+    :func:`_item_to_entry`.
+
+    :type iterator: :class:`~google.cloud.iterator.Iterator`
+    :param iterator: The iterator that is currently in use.
+
+    :type resources: list of dict
+    :param resources: Log entry JSON resources returned from the API.
+
+    :type loggers: dict
+    :param loggers: A mapping of logger fullnames -> loggers.
+
+    :rtype: list of :class:`~google.cloud.logging.entries._BaseEntry`
+    :returns: The log entries, in the same order.
+    """
+    client = iterator.client
+    return [entry_from_resource(resource, client, loggers)
+            for resource in resources]
+
+
 def _item_to_sink(iterator, resource):
     """Convert a sink resource to the native object.
 
@@ -17,18 +17,7 @@
 import logging
 import os
 
-try:
-    from google.cloud.logging._gax import make_gax_logging_api
-    from google.cloud.logging._gax import make_gax_metrics_api
-    from google.cloud.logging._gax import make_gax_sinks_api
-except ImportError:  # pragma: NO COVER
-    _HAVE_GAX = False
-    make_gax_logging_api = None
-    make_gax_metrics_api = None
-    make_gax_sinks_api = None
-else:
-    _HAVE_GAX = True
-
+from google.cloud._helpers import _lazy_import
 from google.cloud.client import JSONClient
 from google.cloud.environment_vars import DISABLE_GRPC
 from google.cloud.logging._http import Connection
@@ -46,8 +35,16 @@ from google.cloud.logging.metric import Metric
 from google.cloud.logging.sink import Sink
 
 
+# The GAX module is only imported when first needed: by ``_load_gax()``,
+# which returns False (and HTTP is used) if it cannot be imported.
+_load_gax = _lazy_import(
+    __name__, 'google.cloud.logging._gax',
+    make_gax_logging_api='make_gax_logging_api',
+    make_gax_metrics_api='make_gax_metrics_api',
+    make_gax_sinks_api='make_gax_sinks_api')
+
 _DISABLE_GAX = os.getenv(DISABLE_GRPC, False)
-_USE_GAX = _HAVE_GAX and not _DISABLE_GAX
+_USE_GAX = not _DISABLE_GAX
 
 _APPENGINE_FLEXIBLE_ENV_VM = 'GAE_APPENGINE_HOSTNAME'
 """Environment variable set in App Engine when vm:true is set."""
@@ -84,7 +81,7 @@ class Client(JSONClient):
     :param use_gax: (Optional) Explicitly specifies whether
                     to use the gRPC transport (via GAX) or HTTP. If unset,
                     falls back to the ``GOOGLE_CLOUD_DISABLE_GRPC`` environment
-                    variable
+                    variable. HTTP is used if GAX cannot be imported.
     """
 
     _logging_api = None
@@ -111,7 +108,8 @@ class Client(JSONClient):
         https://cloud.google.com/logging/docs/api/reference/rest/v2/projects.logs
         """
         if self._logging_api is None:
-            if self._use_gax:
+            if self._use_gax and _load_gax():
+                # pylint: disable=undefined-variable
                 self._logging_api = make_gax_logging_api(self)
             else:
                 self._logging_api = JSONLoggingAPI(self)
@@ -125,7 +123,8 @@ class Client(JSONClient):
         https://cloud.google.com/logging/docs/api/reference/rest/v2/projects.sinks
         """
         if self._sinks_api is None:
-            if self._use_gax:
+            if self._use_gax and _load_gax():
+                # pylint: disable=undefined-variable
                 self._sinks_api = make_gax_sinks_api(self)
             else:
                 self._sinks_api = JSONSinksAPI(self)
@@ -139,7 +138,8 @@ class Client(JSONClient):
         https://cloud.google.com/logging/docs/api/reference/rest/v2/projects.metrics
         """
         if self._metrics_api is None:
-            if self._use_gax:
+            if self._use_gax and _load_gax():
+                # pylint: disable=undefined-variable
                 self._metrics_api = make_gax_metrics_api(self)
             else:
                 self._metrics_api = JSONMetricsAPI(self)
@@ -21,6 +21,7 @@ import atexit
 import copy
 import threading
 
+from google.cloud import _fork
 from google.cloud.logging.handlers.transports.base import Transport
 
 _WORKER_THREAD_NAME = 'google.cloud.logging.handlers.transport.Worker'
@@ -39,9 +40,25 @@ class _Worker(object):
     """
 
     def __init__(self, logger):
+        self.logger = logger
+
+        # Number in seconds of  how long to wait for worker to send remaining
+        self._stop_timeout = 5
+
+        self._reset()
+        self._start()
+
+    def _reset(self):
+        """Set up the state shared with the worker thread.
+
+        Also called in a process forked from the one which created the
+        worker, where the thread does not exist and the conditions may
+        be held.
+        """
         self.started = False
         self.stopping = False
         self.stopped = False
+        self._generation = _fork.generation()
 
         # _entries_condition is used to signal from the main thread whether
         # there are any waiting queued logger entries to be written
@@ -53,16 +70,10 @@ class _Worker(object):
 
         # This object continually reuses the same :class:`Batch` object to
         # write multiple entries at the same time.
-        self.logger = logger
         self.batch = self.logger.batch()
 
         self._thread = None
 
-        # Number in seconds of  how long to wait for worker to send remaining
-        self._stop_timeout = 5
-
-        self._start()
-
     def _run(self):
         """The entry point for the worker thread.
 
@@ -131,7 +142,14 @@ class _Worker(object):
         self.stopped = True
 
     def enqueue(self, record, message):
-        """Queues up a log entry to be written by the background thread."""
+        """Queues up a log entry to be written by the background thread.
+
+        After a fork, the worker is restarted in the child process (the
+        entries queued in the parent are left to the parent).
+        """
+        if self._generation != _fork.generation():
+            self._reset()
+            self._start()
         try:
             self._entries_condition.acquire()
             if self.stopping:
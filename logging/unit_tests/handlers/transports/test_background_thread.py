@@ -141,6 +141,37 @@ class TestWorker(unittest.TestCase):
         worker._stop()
         self.assertTrue(worker.stopped)
 
+    def test_enqueue_after_fork(self):
+        from google.cloud._testing import _Monkey
+        from google.cloud import _fork
+
+        NAME = 'python_logger'
+        logger = _Logger(NAME)
+        worker = self._make_one(logger)
+        while not worker.started:
+            time.sleep(1)  # pragma: NO COVER
+        # Threads do not survive a fork.
+        worker._stop_timeout = None
+        worker._stop()
+        parent_batch = worker.batch
+        parent_thread = worker._thread
+        record = logging.LogRecord('mylogger', logging.INFO, None, None,
+                                   'hello world', None, None)
+
+        generation = _fork.generation() + 1
+        with _Monkey(_fork, generation=lambda: generation):
+            worker.enqueue(record, 'hello world')
+
+        self.assertIsNot(worker._thread, parent_thread)
+        self.assertIsNot(worker.batch, parent_batch)
+        self.assertEqual(parent_batch.entries, [])
+        self.assertEqual(worker._generation, generation)
+        self.assertFalse(worker.stopping)
+        while not worker.started:
+            time.sleep(1)  # pragma: NO COVER
+        worker._stop()
+        self.assertTrue(worker.batch.commit_called)
+
 
 class _Batch(object):
 
@@ -74,9 +74,10 @@ class TestClient(unittest.TestCase):
         client = self._make_one(project=self.PROJECT, credentials=creds,
                                 use_gax=True)
 
-        patch = mock.patch(
-            'google.cloud.logging.client.make_gax_logging_api',
-            new=make_api)
+        patch = mock.patch.multiple(
+            'google.cloud.logging.client',
+            _load_gax=lambda: True,
+            make_gax_logging_api=make_api)
         with patch:
             api = client.logging_api
 
@@ -86,6 +87,21 @@ class TestClient(unittest.TestCase):
         again = client.logging_api
         self.assertIs(again, api)
 
+    def test_logging_api_w_gax_unavailable(self):
+        from google.cloud.logging._http import _LoggingAPI
+
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds,
+                                use_gax=True)
+
+        patch = mock.patch(
+            'google.cloud.logging.client._load_gax',
+            new=lambda: False)
+        with patch:
+            api = client.logging_api
+
+        self.assertIsInstance(api, _LoggingAPI)
+
     def test_no_gax_ctor(self):
         from google.cloud.logging._http import _LoggingAPI
 
@@ -128,9 +144,10 @@ class TestClient(unittest.TestCase):
         client = self._make_one(project=self.PROJECT, credentials=creds,
                                 use_gax=True)
 
-        patch = mock.patch(
-            'google.cloud.logging.client.make_gax_sinks_api',
-            new=make_api)
+        patch = mock.patch.multiple(
+            'google.cloud.logging.client',
+            _load_gax=lambda: True,
+            make_gax_sinks_api=make_api)
         with patch:
             api = client.sinks_api
 
@@ -168,9 +185,10 @@ class TestClient(unittest.TestCase):
         client = self._make_one(project=self.PROJECT, credentials=creds,
                                 use_gax=True)
 
-        patch = mock.patch(
-            'google.cloud.logging.client.make_gax_metrics_api',
-            new=make_api)
+        patch = mock.patch.multiple(
+            'google.cloud.logging.client',
+            _load_gax=lambda: True,
+            make_gax_metrics_api=make_api)
         with patch:
             api = client.metrics_api
 
@@ -385,7 +385,7 @@ class _SubscriberAPI(object):
             raise
 
     def subscription_pull(self, subscription_path, return_immediately=False,
-                          max_messages=1):
+                          max_messages=1, timeout=None):
         """API call:  retrieve messages for a subscription
 
         See:
@@ -405,13 +405,20 @@ class _SubscriberAPI(object):
         :type max_messages: int
         :param max_messages: the maximum number of messages to return.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: list of dict
         :returns:  the ``receivedMessages`` element of the response.
         """
+        options = None
+        if timeout is not None:
+            options = CallOptions(timeout=timeout)
         try:
             response_pb = self._gax_api.pull(
                 subscription_path, max_messages,
-                return_immediately=return_immediately)
+                return_immediately=return_immediately, options=options)
         except GaxError as exc:
             code = exc_to_code(exc.cause)
             if code == StatusCode.NOT_FOUND:
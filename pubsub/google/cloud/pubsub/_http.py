@@ -388,7 +388,7 @@ class _SubscriberAPI(object):
         self.api_request(method='POST', path=path, data=resource)
 
     def subscription_pull(self, subscription_path, return_immediately=False,
-                          max_messages=1):
+                          max_messages=1, timeout=None):
         """API call:  retrieve messages for a subscription
 
         See:
@@ -408,6 +408,10 @@ class _SubscriberAPI(object):
         :type max_messages: int
         :param max_messages: the maximum number of messages to return.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: list of dict
         :returns:  the ``receivedMessages`` element of the response.
         """
@@ -416,7 +420,11 @@ class _SubscriberAPI(object):
             'returnImmediately': return_immediately,
             'maxMessages': max_messages,
         }
-        response = self.api_request(method='POST', path=path, data=data)
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        response = self.api_request(method='POST', path=path, data=data,
+                                    **kwargs)
         messages = response.get('receivedMessages', ())
         _transform_messages_base64(messages, base64.b64decode, 'message')
         return messages
@@ -16,6 +16,7 @@
 
 import os
 
+from google.cloud._helpers import _lazy_import
 from google.cloud.client import JSONClient
 from google.cloud.environment_vars import DISABLE_GRPC
 from google.cloud.pubsub._http import Connection
@@ -24,23 +25,18 @@ from google.cloud.pubsub._http import _SubscriberAPI as JSONSubscriberAPI
 from google.cloud.pubsub._http import _IAMPolicyAPI
 from google.cloud.pubsub.topic import Topic
 
-try:
-    from google.cloud.pubsub._gax import _PublisherAPI as GAXPublisherAPI
-    from google.cloud.pubsub._gax import _SubscriberAPI as GAXSubscriberAPI
-    from google.cloud.pubsub._gax import make_gax_publisher_api
-    from google.cloud.pubsub._gax import make_gax_subscriber_api
-except ImportError:  # pragma: NO COVER
-    _HAVE_GAX = False
-    GAXPublisherAPI = None
-    GAXSubscriberAPI = None
-    make_gax_publisher_api = None
-    make_gax_subscriber_api = None
-else:
-    _HAVE_GAX = True
 
+# The GAX module is only imported when first needed: by ``_load_gax()``,
+# which returns False (and HTTP is used) if it cannot be imported.
+_load_gax = _lazy_import(
+    __name__, 'google.cloud.pubsub._gax',
+    GAXPublisherAPI='_PublisherAPI',
+    GAXSubscriberAPI='_SubscriberAPI',
+    make_gax_publisher_api='make_gax_publisher_api',
+    make_gax_subscriber_api='make_gax_subscriber_api')
 
 _DISABLE_GAX = os.getenv(DISABLE_GRPC, False)
-_USE_GAX = _HAVE_GAX and not _DISABLE_GAX
+_USE_GAX = not _DISABLE_GAX
 
 
 class Client(JSONClient):
@@ -68,7 +64,7 @@ class Client(JSONClient):
     :param use_gax: (Optional) Explicitly specifies whether
                     to use the gRPC transport (via GAX) or HTTP. If unset,
                     falls back to the ``GOOGLE_CLOUD_DISABLE_GRPC`` environment
-                    variable
+                    variable. HTTP is used if GAX cannot be imported.
     """
 
     _publisher_api = None
@@ -90,7 +86,8 @@ class Client(JSONClient):
     def publisher_api(self):
         """Helper for publisher-related API calls."""
         if self._publisher_api is None:
-            if self._use_gax:
+            # pylint: disable=undefined-variable
+            if self._use_gax and _load_gax():
                 if self._connection.in_emulator:
                     generated = make_gax_publisher_api(
                         host=self._connection.host)
@@ -106,7 +103,8 @@ class Client(JSONClient):
     def subscriber_api(self):
         """Helper for subscriber-related API calls."""
         if self._subscriber_api is None:
-            if self._use_gax:
+            # pylint: disable=undefined-variable
+            if self._use_gax and _load_gax():
                 if self._connection.in_emulator:
                     generated = make_gax_subscriber_api(
                         host=self._connection.host)
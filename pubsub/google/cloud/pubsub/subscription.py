@@ -290,7 +290,8 @@ class Subscription(object):
         api.subscription_modify_push_config(self.full_name, push_endpoint)
         self.push_endpoint = push_endpoint
 
-    def pull(self, return_immediately=False, max_messages=1, client=None):
+    def pull(self, return_immediately=False, max_messages=1, client=None,
+             timeout=None):
         """API call:  retrieve messages for the subscription.
 
         See:
@@ -316,6 +317,10 @@ class Subscription(object):
         :param client: the client to use.  If not passed, falls back to the
                        ``client`` stored on the current subscription's topic.
 
+        :type timeout: float
+        :param timeout: (Optional) The number of seconds before the request
+                        times out.
+
         :rtype: list of (ack_id, message) tuples
         :returns: sequence of tuples: ``ack_id`` is the ID to be used in a
                   subsequent call to :meth:`acknowledge`, and ``message``
@@ -324,8 +329,11 @@ class Subscription(object):
         """
         client = self._require_client(client)
         api = client.subscriber_api
+        kwargs = {}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
         response = api.subscription_pull(
-            self.full_name, return_immediately, max_messages)
+            self.full_name, return_immediately, max_messages, **kwargs)
         return [(info['ackId'], Message.from_api_repr(info['message']))
                 for info in response]
 
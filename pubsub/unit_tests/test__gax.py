@@ -758,6 +758,18 @@ class Test_SubscriberAPI(_Base, unittest.TestCase):
         self.assertFalse(return_immediately)
         self.assertIsNone(options)
 
+    def test_subscription_pull_w_timeout(self):
+        response_pb = _PullResponsePB([])
+        gax_api = _GAXSubscriberAPI(_pull_response=response_pb)
+        client = _Client(self.PROJECT)
+        api = self._make_one(gax_api, client)
+
+        self.assertEqual(api.subscription_pull(self.SUB_PATH, timeout=5.0),
+                         [])
+
+        _, _, _, options = gax_api._pull_called_with
+        self.assertEqual(options.timeout, 5.0)
+
     def test_subscription_pull_defaults_error(self):
         from google.gax.errors import GaxError
         gax_api = _GAXSubscriberAPI(_random_gax_error=True)
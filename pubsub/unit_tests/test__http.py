@@ -670,6 +670,16 @@ class Test_SubscriberAPI(_Base):
         self.assertEqual(connection._called_with['path'], path)
         self.assertEqual(connection._called_with['data'], BODY)
 
+    def test_subscription_pull_w_timeout(self):
+        connection = _Connection({})
+        client = _Client(connection, self.PROJECT)
+        api = self._make_one(client)
+
+        self.assertEqual(api.subscription_pull(self.SUB_PATH, timeout=5.0),
+                         ())
+
+        self.assertEqual(connection._called_with['timeout'], 5.0)
+
     def test_subscription_pull_explicit(self):
         import base64
         PAYLOAD = b'This is the message text'
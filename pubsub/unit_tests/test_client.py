@@ -68,6 +68,18 @@ class TestClient(unittest.TestCase):
         api = client.publisher_api
         self.assertIsInstance(api, _PublisherAPI)
 
+    def test_publisher_api_w_gax_unavailable(self):
+        from google.cloud.pubsub._http import _PublisherAPI
+
+        creds = _make_credentials()
+        client = self._make_one(
+            project=self.PROJECT, credentials=creds, use_gax=True)
+        with mock.patch('google.cloud.pubsub.client._load_gax',
+                        new=lambda: False):
+            api = client.publisher_api
+
+        self.assertIsInstance(api, _PublisherAPI)
+
     def _publisher_api_w_gax_helper(self, emulator=False):
         from google.cloud.pubsub import _http
 
@@ -92,6 +104,7 @@ class TestClient(unittest.TestCase):
 
         patch = mock.patch.multiple(
             'google.cloud.pubsub.client',
+            _load_gax=lambda: True,
             make_gax_publisher_api=_generated_api,
             GAXPublisherAPI=_GaxPublisherAPI)
         with patch:
@@ -156,6 +169,7 @@ class TestClient(unittest.TestCase):
 
         patch = mock.patch.multiple(
             'google.cloud.pubsub.client',
+            _load_gax=lambda: True,
             make_gax_subscriber_api=_generated_api,
             GAXSubscriberAPI=_GaxSubscriberAPI)
         with patch:
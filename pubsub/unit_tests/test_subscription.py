@@ -377,6 +377,18 @@ class TestSubscription(unittest.TestCase):
         self.assertEqual(api._subscription_pulled,
                          (self.SUB_PATH, True, 3))
 
+    def test_pull_w_timeout(self):
+        client = _Client(project=self.PROJECT)
+        api = client.subscriber_api = _FauxSubscribererAPI()
+        api._subscription_pull_response = []
+        topic = _Topic(self.TOPIC_NAME, client=client)
+        subscription = self._make_one(self.SUB_NAME, topic)
+
+        self.assertEqual(subscription.pull(timeout=5.0), [])
+        self.assertEqual(api._subscription_pulled,
+                         (self.SUB_PATH, False, 1))
+        self.assertEqual(api._subscription_pull_timeout, 5.0)
+
     def test_pull_wo_receivedMessages(self):
         client = _Client(project=self.PROJECT)
         api = client.subscriber_api = _FauxSubscribererAPI()
@@ -656,9 +668,10 @@ class _FauxSubscribererAPI(object):
         return self._subscription_modify_push_config_response
 
     def subscription_pull(self, subscription_path, return_immediately,
-                          max_messages):
+                          max_messages, timeout=None):
         self._subscription_pulled = (
             subscription_path, return_immediately, max_messages)
+        self._subscription_pull_timeout = timeout
         return self._subscription_pull_response
 
     def subscription_acknowledge(self, subscription_path, ack_ids):
@@ -0,0 +1,144 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the startup time of the google.cloud packages.
+
+Measures, in a fresh interpreter, the time to ``import google.cloud.<pkg>``
+and then to build a client (with anonymous credentials, so that no
+credentials or network are needed)::
+
+    $ python scripts/benchmark_startup.py --repeat 5 storage logging
+
+With ``--budget``, exits with an error if the import plus client time of a
+package exceeds the budget, so that regressions can be caught in CI::
+
+    $ python scripts/benchmark_startup.py --budget 500
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+# Expression building a client of each package, with ``credentials``.
+CLIENTS = {
+    'bigquery': 'google.cloud.bigquery.Client('
+                'project="p", credentials=credentials)',
+    'bigtable': 'google.cloud.bigtable.Client('
+                'project="p", credentials=credentials)',
+    'datastore': 'google.cloud.datastore.Client('
+                 'project="p", credentials=credentials)',
+    'dns': 'google.cloud.dns.Client(project="p", credentials=credentials)',
+    'error_reporting': 'google.cloud.error_reporting.Client('
+                       'project="p", credentials=credentials)',
+    'language': 'google.cloud.language.Client(credentials=credentials)',
+    'logging': 'google.cloud.logging.Client('
+               'project="p", credentials=credentials)',
+    'monitoring': 'google.cloud.monitoring.Client('
+                  'project="p", credentials=credentials)',
+    'pubsub': 'google.cloud.pubsub.Client('
+              'project="p", credentials=credentials)',
+    'resource_manager': 'google.cloud.resource_manager.Client('
+                        'credentials=credentials)',
+    'runtimeconfig': 'google.cloud.runtimeconfig.Client('
+                     'project="p", credentials=credentials)',
+    'speech': 'google.cloud.speech.Client(credentials=credentials)',
+    'storage': 'google.cloud.storage.Client('
+               'project="p", credentials=credentials)',
+    'translate': 'google.cloud.translate.Client(credentials=credentials)',
+    'vision': 'google.cloud.vision.Client('
+              'project="p", credentials=credentials)',
+}
+
+# Run in a fresh interpreter: prints the timings as JSON.
+_PROBE = """
+import json
+import time
+
+start = time.time()
+import google.cloud.{package}
+imported = time.time()
+from google.auth.credentials import AnonymousCredentials
+credentials = AnonymousCredentials()
+{client}
+built = time.time()
+print(json.dumps([imported - start, built - imported]))
+"""
+
+
+def _probe(package):
+    """Time the import of a package and the creation of a client.
+
+    :type package: str
+    :param package: The name of the package, e.g. ``'storage'``.
+
+    :rtype: tuple
+    :returns: The import and client creation times, in seconds.
+    :raises: :class:`subprocess.CalledProcessError` if the probe fails.
+    """
+    code = _PROBE.format(package=package, client=CLIENTS[package])
+    output = subprocess.check_output(
+        [sys.executable, '-c', code], stderr=subprocess.STDOUT,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE='1'))
+    return tuple(json.loads(output.decode('utf-8').splitlines()[-1]))
+
+
+def _median(values):
+    """Compute the median of a list of numbers."""
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('packages', nargs='*', metavar='PACKAGE',
+                        help='Packages to measure (default: all).')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of runs; the median is reported.')
+    parser.add_argument('--budget', type=float, default=None,
+                        help='Maximum import plus client time, in ms.')
+    args = parser.parse_args()
+
+    over_budget = []
+    print('%-18s %10s %10s %10s' % ('package', 'import', 'client', 'total'))
+    for package in args.packages or sorted(CLIENTS):
+        try:
+            timings = [_probe(package) for _ in range(args.repeat)]
+        except subprocess.CalledProcessError as exc:
+            last_line = exc.output.decode('utf-8').strip().splitlines()[-1:]
+            print('%-18s failed: %s' % (package, ''.join(last_line)))
+            continue
+        imported = 1e3 * _median([timing[0] for timing in timings])
+        built = 1e3 * _median([timing[1] for timing in timings])
+        total = 1e3 * _median([sum(timing) for timing in timings])
+        print('%-18s %7.1f ms %7.1f ms %7.1f ms' % (
+            package, imported, built, total))
+        if args.budget is not None and total > args.budget:
+            over_budget.append(package)
+
+    if over_budget:
+        sys.exit('Over the budget of %g ms: %s' % (
+            args.budget, ', '.join(over_budget)))
+
+
+if __name__ == '__main__':
+    main()
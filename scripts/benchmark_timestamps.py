@@ -0,0 +1,127 @@
+# Copyright 2016 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the timestamp conversion helpers in google.cloud._helpers.
+
+Compares the regex / strptime based conversions with the fixed-format
+parser and the bulk (optionally NumPy) variants::
+
+    $ python scripts/benchmark_timestamps.py --count 100000
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import re
+import timeit
+
+from google.cloud import _helpers
+
+
+def _regex_nanos_to_datetime(dt_str):
+    """The per-value conversion, without the fixed-format fast path."""
+    with_nanos = _helpers._RFC3339_NANOS.match(dt_str)
+    bare_seconds = datetime.datetime.strptime(
+        with_nanos.group('no_fraction'), _helpers._RFC3339_NO_FRACTION)
+    fraction = with_nanos.group('nanos')
+    micros = int(fraction) * (10 ** (9 - len(fraction))) // 1000
+    return bare_seconds.replace(microsecond=micros, tzinfo=_helpers.UTC)
+
+
+def _strptime_to_datetime(dt_str):
+    """The per-value conversion, without the fixed-format fast path."""
+    return datetime.datetime.strptime(
+        dt_str, _helpers._RFC3339_MICROS).replace(tzinfo=_helpers.UTC)
+
+
+def _make_data(count):
+    """Build ``count`` distinct timestamps in each format.
+
+    :type count: int
+    :param count: The number of timestamps.
+
+    :rtype: tuple
+    :returns: Lists of nanosecond strings, microsecond strings and
+              integer microseconds.
+    """
+    start = datetime.datetime(2016, 11, 1, tzinfo=_helpers.UTC)
+    nanos, micros, ints = [], [], []
+    for index in range(count):
+        value = start + datetime.timedelta(seconds=index * 7.654321)
+        micros.append(value.strftime(_helpers._RFC3339_MICROS))
+        nanos.append(re.sub(r'Z$', '789Z', micros[-1]))
+        ints.append(_helpers._microseconds_from_datetime(value))
+    return nanos, micros, ints
+
+
+def _report(name, func, repeat, count):
+    """Time a conversion of all the timestamps and print the results."""
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    print('%-45s %9.1f ms %9.0f ns/value' % (
+        name, best * 1e3, best * 1e9 / count))
+
+
+def main():
+    """Run the benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=100000,
+                        help='Number of timestamps converted per run.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of runs; the best one is reported.')
+    args = parser.parse_args()
+    nanos, micros, ints = _make_data(args.count)
+
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    benchmarks = [
+        ('regex: _rfc3339_nanos_to_datetime (before)',
+         lambda: [_regex_nanos_to_datetime(value) for value in nanos]),
+        ('_rfc3339_nanos_to_datetime',
+         lambda: [_helpers._rfc3339_nanos_to_datetime(value)
+                  for value in nanos]),
+        ('_rfc3339_fixed_to_datetime',
+         lambda: [_helpers._rfc3339_fixed_to_datetime(value)
+                  for value in nanos]),
+        ('_rfc3339_nanos_to_datetimes',
+         lambda: _helpers._rfc3339_nanos_to_datetimes(nanos)),
+        ('strptime: _rfc3339_to_datetime (before)',
+         lambda: [_strptime_to_datetime(value) for value in micros]),
+        ('_rfc3339_to_datetime',
+         lambda: [_helpers._rfc3339_to_datetime(value) for value in micros]),
+        ('_datetime_from_microseconds',
+         lambda: [_helpers._datetime_from_microseconds(value)
+                  for value in ints]),
+        ('_datetimes_from_microseconds',
+         lambda: _helpers._datetimes_from_microseconds(ints)),
+    ]
+    if numpy is not None:
+        benchmarks.extend([
+            ('_rfc3339_nanos_to_datetimes(as_numpy=True)',
+             lambda: _helpers._rfc3339_nanos_to_datetimes(
+                 nanos, as_numpy=True)),
+            ('_datetimes_from_microseconds(as_numpy=True)',
+             lambda: _helpers._datetimes_from_microseconds(
+                 ints, as_numpy=True)),
+        ])
+
+    for name, func in benchmarks:
+        _report(name, func, args.repeat, args.count)
+
+
+if __name__ == '__main__':
+    main()
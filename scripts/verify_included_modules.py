@@ -31,6 +31,8 @@ DOCS_DIR = os.path.join(PROJECT_ROOT, 'docs')
 IGNORED_PREFIXES = ('test_', '_')
 IGNORED_MODULES = frozenset([
     'google.cloud',
+    # Python 3.5+ only:  not importable by the (Python 2.7) docs build.
+    'google.cloud.aio',
     'google.cloud.bigquery',
     'google.cloud.bigtable',
     'google.cloud.dns',
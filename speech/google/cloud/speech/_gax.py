@@ -40,15 +40,17 @@ class GAPICSpeechAPI(object):
     def __init__(self, client=None):
         self._client = client
         credentials = self._client._connection.credentials
+        timeout = self._client._connection.timeout
         channel = make_secure_channel(
             credentials, DEFAULT_USER_AGENT,
-            SpeechClient.SERVICE_ADDRESS)
+            SpeechClient.SERVICE_ADDRESS, timeout=timeout)
         self._gapic_api = SpeechClient(channel=channel)
         self._operations_stub = make_secure_stub(
             credentials,
             DEFAULT_USER_AGENT,
             operations_grpc.OperationsStub,
-            OPERATIONS_API_HOST)
+            OPERATIONS_API_HOST,
+            timeout=timeout)
 
     def async_recognize(self, sample, language_code=None,
                         max_alternatives=None, profanity_filter=None,
@@ -18,17 +18,22 @@ from base64 import b64encode
 import os
 
 from google.cloud._helpers import _bytes_to_unicode
+from google.cloud._helpers import _lazy_import
 from google.cloud._helpers import _to_bytes
 from google.cloud.client import Client as BaseClient
 from google.cloud.environment_vars import DISABLE_GRPC
 
-from google.cloud.speech._gax import GAPICSpeechAPI
 from google.cloud.speech.alternative import Alternative
 from google.cloud.speech.connection import Connection
 from google.cloud.speech.operation import Operation
 from google.cloud.speech.sample import Sample
 
 
+# The GAX module is only imported when first needed: by ``_load_gax()``,
+# which returns False (and HTTP is used) if it cannot be imported.
+_load_gax = _lazy_import(
+    __name__, 'google.cloud.speech._gax', GAPICSpeechAPI='GAPICSpeechAPI')
+
 _USE_GAX = not os.getenv(DISABLE_GRPC, False)
 
 
@@ -52,15 +57,24 @@ class Client(BaseClient):
     :param use_gax: (Optional) Explicitly specifies whether
                     to use the gRPC transport (via GAX) or HTTP. If unset,
                     falls back to the ``GOOGLE_CLOUD_DISABLE_GRPC`` environment
-                    variable
+                    variable. HTTP is used if GAX cannot be imported.
+
+    :type timeout: float
+    :param timeout: (Optional) The default number of seconds before a
+                    request times out, over either HTTP or gRPC. Calls
+                    passing their own ``timeout`` are unaffected. If not
+                    passed, requests may block indefinitely.
     """
 
     _speech_api = None
 
-    def __init__(self, credentials=None, http=None, use_gax=None):
+    def __init__(self, credentials=None, http=None, use_gax=None,
+                 timeout=None):
         super(Client, self).__init__(credentials=credentials, http=http)
         self._connection = Connection(
             credentials=self._credentials, http=self._http)
+        if timeout is not None:
+            self._connection.timeout = timeout
         if use_gax is None:
             self._use_gax = _USE_GAX
         else:
@@ -104,7 +118,10 @@ class Client(BaseClient):
     def speech_api(self):
         """Helper for speech-related API calls."""
         if self._speech_api is None:
+            if self._use_gax and not _load_gax():
+                self._use_gax = False
             if self._use_gax:
+                # pylint: disable=undefined-variable
                 self._speech_api = GAPICSpeechAPI(self)
             else:
                 self._speech_api = _JSONSpeechAPI(self)
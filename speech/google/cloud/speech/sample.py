@@ -233,10 +233,11 @@ class Sample(object):
 
         :raises: EnvironmentError if gRPC is not available.
         """
+        # Falls back to HTTP if gRPC cannot be imported.
+        api = self._client.speech_api
         if not self._client._use_gax:
             raise EnvironmentError('gRPC is required to use this API.')
 
-        api = self._client.speech_api
         responses = api.streaming_recognize(self, language_code,
                                             max_alternatives, profanity_filter,
                                             speech_context, single_utterance,
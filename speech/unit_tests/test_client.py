@@ -92,6 +92,12 @@ class TestClient(unittest.TestCase):
         self.assertIsInstance(client._connection, Connection)
         self.assertTrue(client._connection.credentials is creds)
         self.assertTrue(client._connection.http is http)
+        self.assertIsNone(client._connection.timeout)
+
+    def test_ctor_w_timeout(self):
+        creds = _make_credentials()
+        client = self._make_one(credentials=creds, timeout=5.0)
+        self.assertEqual(client._connection.timeout, 5.0)
 
     def test_ctor_use_gax_preset(self):
         creds = _make_credentials()
@@ -248,7 +254,8 @@ class TestClient(unittest.TestCase):
         channel_args = []
         channel_obj = object()
 
-        def make_channel(*args):
+        def make_channel(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client._connection.timeout})
             channel_args.append(args)
             return channel_obj
 
@@ -301,7 +308,8 @@ class TestClient(unittest.TestCase):
         channel_args = []
         channel_obj = object()
 
-        def make_channel(*args):
+        def make_channel(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client._connection.timeout})
             channel_args.append(args)
             return channel_obj
 
@@ -391,7 +399,8 @@ class TestClient(unittest.TestCase):
         channel_args = []
         channel_obj = object()
 
-        def make_channel(*args):
+        def make_channel(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client._connection.timeout})
             channel_args.append(args)
             return channel_obj
 
@@ -434,6 +443,25 @@ class TestClient(unittest.TestCase):
         with self.assertRaises(EnvironmentError):
             list(sample.streaming_recognize())
 
+    def test_streaming_gax_unavailable(self):
+        from google.cloud import speech
+        from google.cloud.speech.client import _JSONSpeechAPI
+
+        credentials = _make_credentials()
+        client = self._make_one(credentials=credentials, use_gax=True)
+        client.connection = _Connection()
+        sample = client.sample(content=self.AUDIO_CONTENT,
+                               encoding=speech.Encoding.LINEAR16,
+                               sample_rate=self.SAMPLE_RATE)
+
+        with mock.patch('google.cloud.speech.client._load_gax',
+                        new=lambda: False):
+            with self.assertRaises(EnvironmentError):
+                list(sample.streaming_recognize())
+
+        self.assertIsInstance(client.speech_api, _JSONSpeechAPI)
+        self.assertFalse(client._use_gax)
+
     def test_streaming_closed_stream(self):
         from io import BytesIO
 
@@ -451,7 +479,8 @@ class TestClient(unittest.TestCase):
         channel_args = []
         channel_obj = object()
 
-        def make_channel(*args):
+        def make_channel(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client._connection.timeout})
             channel_args.append(args)
             return channel_obj
 
@@ -509,7 +538,8 @@ class TestClient(unittest.TestCase):
         channel_args = []
         channel_obj = object()
 
-        def make_channel(*args):
+        def make_channel(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client._connection.timeout})
             channel_args.append(args)
             return channel_obj
 
@@ -582,7 +612,8 @@ class TestClient(unittest.TestCase):
         channel_args = []
         channel_obj = object()
 
-        def make_channel(*args):
+        def make_channel(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client._connection.timeout})
             channel_args.append(args)
             return channel_obj
 
@@ -626,7 +657,8 @@ class TestClient(unittest.TestCase):
         channel_args = []
         channel_obj = object()
 
-        def make_channel(*args):
+        def make_channel(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client._connection.timeout})
             channel_args.append(args)
             return channel_obj
 
@@ -660,7 +692,8 @@ class TestClient(unittest.TestCase):
         channel_args = []
         channel_obj = object()
 
-        def make_channel(*args):
+        def make_channel(*args, **kwargs):
+            self.assertEqual(kwargs, {'timeout': client._connection.timeout})
             channel_args.append(args)
             return channel_obj
 
@@ -732,6 +765,8 @@ class _MockGAPICSpeechAPI(object):
 
 class _Connection(object):
 
+    timeout = None
+
     def __init__(self, *responses):
         self._responses = responses
         self._requested = []
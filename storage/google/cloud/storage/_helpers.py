@@ -20,6 +20,9 @@ These are *not* part of the API.
 import base64
 from hashlib import md5
 
+from google.cloud.metadata_cache import invalidate_resource
+from google.cloud.metadata_cache import reload_resource
+
 
 class _PropertyMixin(object):
     """Abstract mixin for cloud storage classes with associated propertties.
@@ -74,8 +77,8 @@ class _PropertyMixin(object):
         # Pass only '?projection=noAcl' here because 'acl' and related
         # are handled via custom endpoints.
         query_params = {'projection': 'noAcl'}
-        api_response = client._connection.api_request(
-            method='GET', path=self.path, query_params=query_params,
+        api_response = reload_resource(
+            client, self.path, query_params=query_params,
             _target_object=self)
         self._set_properties(api_response)
 
@@ -125,6 +128,7 @@ class _PropertyMixin(object):
         api_response = client._connection.api_request(
             method='PATCH', path=self.path, data=update_properties,
             query_params={'projection': 'full'}, _target_object=self)
+        invalidate_resource(client, self.path)
         self._set_properties(api_response)
 
 
@@ -23,13 +23,16 @@ from email.parser import Parser
 import io
 import json
 
-import httplib2
 import six
 
+from google.cloud._helpers import _LazyModule
 from google.cloud.exceptions import make_exception
 from google.cloud.storage._http import Connection
 
 
+httplib2 = _LazyModule('httplib2')
+
+
 class MIMEApplicationHTTP(MIMEApplication):
     """MIME type for ``application/http``.
 
@@ -44,7 +47,7 @@ class MIMEApplicationHTTP(MIMEApplication):
     :type headers:  dict
     :param headers: HTTP headers
 
-    :type body: str
+    :type body: str or bytes
     :param body: (Optional) HTTP payload
 
     """
@@ -55,6 +58,9 @@ class MIMEApplicationHTTP(MIMEApplication):
             headers['Content-Length'] = len(body)
         if body is None:
             body = ''
+        elif isinstance(body, six.binary_type):
+            # Bodies encoded by the connection's codec.
+            body = body.decode('utf-8')
         lines = ['%s %s HTTP/1.1' % (method, uri)]
         lines.extend(['%s: %s' % (key, value)
                       for key, value in sorted(headers.items())])
@@ -131,13 +137,28 @@ class Batch(Connection):
     """
     _MAX_BATCH_SIZE = 1000
 
+    # Deferred requests never get a response of their own to share.
+    coalesce_gets = False
+    # A conditional request answered '304 Not Modified' would fail the batch.
+    cache_metadata = False
+
     def __init__(self, client):
         super(Batch, self).__init__()
         self._client = client
         self._requests = []
         self._target_objects = []
 
-    def _do_request(self, method, url, headers, data, target_object):
+    @property
+    def codec(self):
+        """Codec of the client's connection, encoding deferred requests.
+
+        :rtype: object
+        :returns: The codec (see :mod:`google.cloud.codec`).
+        """
+        return self._client._base_connection.codec
+
+    def _do_request(self, method, url, headers, data, target_object,
+                    timeout=None):  # pylint: disable=unused-argument
         """Override Connection:  defer actual HTTP request.
 
         Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred.
@@ -151,8 +172,8 @@ class Batch(Connection):
         :type headers: dict
         :param headers: A dictionary of HTTP headers to send with the request.
 
-        :type data: str
-        :param data: The data to send as the body of the request.
+        :type data: bytes or str
+        :param data: The (encoded) data to send as the body of the request.
 
         :type target_object: object
         :param target_object:
@@ -160,6 +181,11 @@ class Batch(Connection):
             connection. Here we defer an HTTP request and complete
             initialization of the object at a later time.
 
+        :type timeout: float
+        :param timeout: (Optional) Unused: deferred requests are sent by
+                        :meth:`finish`, with the timeout of the client's
+                        connection.
+
         :rtype: tuple of ``response`` (a dictionary of sorts)
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response.
@@ -244,8 +270,10 @@ class Batch(Connection):
         # Use the private ``_base_connection`` rather than the property
         # ``_connection``, since the property may be this
         # current batch.
-        response, content = self._client._base_connection._make_request(
-            'POST', url, data=body, headers=headers)
+        base_connection = self._client._base_connection
+        response, content = base_connection._make_request(
+            'POST', url, data=body, headers=headers,
+            timeout=base_connection.timeout)
         responses = list(_unpack_batch_response(response, content))
         self._finish_futures(responses)
         return responses
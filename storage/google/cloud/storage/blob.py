@@ -22,10 +22,13 @@ from io import UnsupportedOperation
 import json
 import mimetypes
 import os
+import threading
 import time
+import uuid
 
 import httplib2
 import six
+from six.moves import queue
 from six.moves.urllib.parse import quote
 
 from google.cloud._helpers import _rfc3339_to_datetime
@@ -37,11 +40,13 @@ from google.cloud.exceptions import make_exception
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage.acl import ObjectACL
+from google.cloud.streaming.exceptions import TransferInvalidError
 from google.cloud.streaming.http_wrapper import Request
 from google.cloud.streaming.http_wrapper import make_api_request
 from google.cloud.streaming.transfer import Download
 from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
 from google.cloud.streaming.transfer import Upload
+from google.cloud.transport import PooledHttp
 
 
 _API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
@@ -73,6 +78,41 @@ class Blob(_PropertyMixin):
     _CHUNK_SIZE_MULTIPLE = 256 * 1024
     """Number (256 KB, in bytes) that must divide the chunk size."""
 
+    upload_pipeline_depth = None
+    """Number of chunks read ahead while sending a resumable upload.
+
+    If set, a thread reads the next chunks of the file while the current
+    one is being sent (see :class:`~google.cloud.streaming.transfer.Upload`).
+    """
+
+    upload_checksum = False
+    """Whether to verify the MD5 hash of resumable uploads.
+
+    If True, the MD5 hash of the data sent in chunks is compared with the
+    :attr:`md5_hash` reported by the server once the upload is complete.
+    Uploads sent in a single request are not checked.
+    """
+
+    chunk_tuner = None
+    """Adapts the chunk size of transfers to the observed throughput.
+
+    A :class:`~google.cloud.streaming.transfer.ChunkSizeTuner`, used when
+    :attr:`chunk_size` is not set; it also raises the size above which
+    uploads are resumable on fast links.
+    """
+
+    _COMPOSE_MAX_SOURCES = 32
+    """Number of source objects that a single compose request accepts."""
+
+    composite_upload_threshold = 150 << 20
+    """Size (in bytes) above which parallel uploads are split into parts.
+
+    See :meth:`upload_from_filename`.
+    """
+
+    composite_part_size = 64 << 20
+    """Size (in bytes) of the parts of a parallel composite upload."""
+
     def __init__(self, name, bucket, chunk_size=None, encryption_key=None):
         super(Blob, self).__init__(name=name)
 
@@ -105,6 +145,17 @@ class Blob(_PropertyMixin):
                 self._CHUNK_SIZE_MULTIPLE,))
         self._chunk_size = value
 
+    def _chunk_tuner(self):
+        """Get the chunk size tuner for a transfer of this blob.
+
+        :rtype: :class:`~google.cloud.streaming.transfer.ChunkSizeTuner`
+        :returns: :attr:`chunk_tuner`, or :data:`None` if :attr:`chunk_size`
+                  is set.
+        """
+        if self.chunk_size is not None:
+            return None
+        return self.chunk_tuner
+
     @staticmethod
     def path_helper(bucket_path, blob_name):
         """Relative URL path for a blob.
@@ -290,7 +341,7 @@ class Blob(_PropertyMixin):
         """
         return self.bucket.delete_blob(self.name, client=client)
 
-    def download_to_file(self, file_obj, client=None):
+    def download_to_file(self, file_obj, client=None, parallelism=None):
         """Download the contents of this blob into a file-like object.
 
         .. note::
@@ -319,6 +370,12 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
+        :type parallelism: int
+        :param parallelism: Optional. The number of chunks fetched at once,
+                            if ``file_obj`` is seekable and the client uses
+                            a :class:`~google.cloud.transport.PooledHttp`
+                            (else the chunks are fetched one at a time).
+
         :raises: :class:`google.cloud.exceptions.NotFound`
         """
         client = self._require_client(client)
@@ -328,7 +385,9 @@ class Blob(_PropertyMixin):
         download_url = self.media_link
 
         # Use apitools 'Download' facility.
-        download = Download.from_stream(file_obj)
+        download = Download.from_stream(file_obj,
+                                        parallelism=parallelism or 1,
+                                        chunk_tuner=self._chunk_tuner())
 
         if self.chunk_size is not None:
             download.chunksize = self.chunk_size
@@ -343,9 +402,12 @@ class Blob(_PropertyMixin):
         # build_api_url) are also defined on the Batch class, but we just
         # use the wrapped connection since it has all three (http,
         # API_BASE_URL and build_api_url).
-        download.initialize_download(request, client._base_connection.http)
+        http = client._base_connection.http
+        if not _is_thread_safe(http):
+            download.parallelism = 1
+        download.initialize_download(request, http)
 
-    def download_to_filename(self, filename, client=None):
+    def download_to_filename(self, filename, client=None, parallelism=None):
         """Download the contents of this blob into a named file.
 
         :type filename: str
@@ -356,10 +418,15 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
+        :type parallelism: int
+        :param parallelism: Optional. The number of chunks fetched at once.
+                            See :meth:`download_to_file`.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
         """
         with open(filename, 'wb') as file_obj:
-            self.download_to_file(file_obj, client=client)
+            self.download_to_file(file_obj, client=client,
+                                  parallelism=parallelism)
 
         mtime = time.mktime(self.updated.timetuple())
         os.utime(file_obj.name, (mtime, mtime))
@@ -390,7 +457,6 @@ class Blob(_PropertyMixin):
             raise make_exception(faux_response, http_response.content,
                                  error_info=request.url)
 
-    # pylint: disable=too-many-locals
     def upload_from_file(self, file_obj, rewind=False, size=None,
                          content_type=None, num_retries=6, client=None):
         """Upload the contents of this blob from a file-like object.
@@ -452,15 +518,6 @@ class Blob(_PropertyMixin):
                  if the upload response returns an error status.
         """
         client = self._require_client(client)
-        # Use ``_base_connection`` rather ``_connection`` since the current
-        # connection may be a batch. A batch wraps a client's connection,
-        # but does not store the ``http`` object. The rest (API_BASE_URL and
-        # build_api_url) are also defined on the Batch class, but we just
-        # use the wrapped connection since it has all three (http,
-        # API_BASE_URL and build_api_url).
-        connection = client._base_connection
-        content_type = (content_type or self._properties.get('contentType') or
-                        'application/octet-stream')
 
         # Rewind the file if desired.
         if rewind:
@@ -475,6 +532,53 @@ class Blob(_PropertyMixin):
                 except (OSError, UnsupportedOperation):
                     pass  # Assuming fd is not an actual file (maybe socket).
 
+        self._upload_from_stream(file_obj, total_bytes, content_type,
+                                 num_retries, client)
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def _upload_from_stream(self, file_obj, total_bytes, content_type,
+                            num_retries, client, http=None):
+        """Upload the contents of this blob from a positioned stream.
+
+        Helper for :meth:`upload_from_file`.
+
+        :type file_obj: file
+        :param file_obj: A file handle open for reading.
+
+        :type total_bytes: int
+        :param total_bytes: The number of bytes to read from the file handle,
+                            or :data:`None` if unknown.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded (or ``None``).
+
+        :type num_retries: int
+        :param num_retries: Number of upload retries.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :type http: :class:`httplib2.Http` (or workalike)
+        :param http: (Optional) The HTTP object sending the upload requests,
+                     else that of the client's connection.
+
+        :raises: :class:`ValueError` if ``total_bytes`` is not known and no
+                 chunk size is set;
+                 :class:`google.cloud.exceptions.GoogleCloudError`
+                 if the upload response returns an error status.
+        """
+        # Use ``_base_connection`` rather ``_connection`` since the current
+        # connection may be a batch. A batch wraps a client's connection,
+        # but does not store the ``http`` object. The rest (API_BASE_URL and
+        # build_api_url) are also defined on the Batch class, but we just
+        # use the wrapped connection since it has all three (http,
+        # API_BASE_URL and build_api_url).
+        connection = client._base_connection
+        if http is None:
+            http = connection.http
+        content_type = (content_type or self._properties.get('contentType') or
+                        'application/octet-stream')
+
         headers = {
             'Accept': 'application/json',
             'Accept-Encoding': 'gzip, deflate',
@@ -484,7 +588,10 @@ class Blob(_PropertyMixin):
         headers.update(_get_encryption_headers(self._encryption_key))
 
         upload = Upload(file_obj, content_type, total_bytes,
-                        auto_transfer=False)
+                        auto_transfer=False, zero_copy=True,
+                        pipeline_depth=self.upload_pipeline_depth,
+                        checksum=self.upload_checksum,
+                        chunk_tuner=self._chunk_tuner())
 
         if self.chunk_size is not None:
             upload.chunksize = self.chunk_size
@@ -514,12 +621,12 @@ class Blob(_PropertyMixin):
         request.url = connection.build_api_url(api_base_url=base_url,
                                                path=self.bucket.path + '/o',
                                                query_params=query_params)
-        upload.initialize_upload(request, connection.http)
+        upload.initialize_upload(request, http)
 
         if upload.strategy == RESUMABLE_UPLOAD:
             http_response = upload.stream_file(use_chunks=True)
         else:
-            http_response = make_api_request(connection.http, request,
+            http_response = make_api_request(http, request,
                                              retries=num_retries)
 
         self._check_response_error(request, http_response)
@@ -529,9 +636,11 @@ class Blob(_PropertyMixin):
                           six.string_types):  # pragma: NO COVER  Python3
             response_content = response_content.decode('utf-8')
         self._set_properties(json.loads(response_content))
-    # pylint: enable=too-many-locals
+        _check_md5_hash(self, upload.md5_hash)
+    # pylint: enable=too-many-arguments,too-many-locals
 
-    def upload_from_filename(self, filename, content_type=None, client=None):
+    def upload_from_filename(self, filename, content_type=None, client=None,
+                             parallelism=None, num_retries=6):
         """Upload this blob's contents from the content of a named file.
 
         The content type of the upload will either be
@@ -560,14 +669,195 @@ class Blob(_PropertyMixin):
                       ``NoneType``
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
+
+        :type parallelism: int
+        :param parallelism: Optional. The number of parts uploaded at once.
+                            If greater than one, a file larger than
+                            :attr:`composite_upload_threshold` is uploaded
+                            as temporary objects of
+                            :attr:`composite_part_size` bytes, which are
+                            then composed into this blob (and deleted).
+                            A composed blob has no MD5 hash
+                            (:attr:`md5_hash`), only a CRC32C checksum
+                            (:attr:`crc32c`). Only used if the client uses
+                            a :class:`~google.cloud.transport.PooledHttp`,
+                            outside of a batch, and not with a
+                            customer-supplied encryption key.
+
+        :type num_retries: int
+        :param num_retries: Number of upload retries (of each part, if
+                            uploaded in parts). Defaults to 6.
         """
         content_type = content_type or self._properties.get('contentType')
         if content_type is None:
             content_type, _ = mimetypes.guess_type(filename)
 
+        if (parallelism is not None and parallelism > 1 and
+                self._encryption_key is None and
+                self._can_upload_parts(self._require_client(client))):
+            size = os.path.getsize(filename)
+            if size > self.composite_upload_threshold:
+                self._upload_composite(filename, size, content_type,
+                                       client, parallelism, num_retries)
+                return
+
         with open(filename, 'rb') as file_obj:
             self.upload_from_file(
-                file_obj, content_type=content_type, client=client)
+                file_obj, content_type=content_type, num_retries=num_retries,
+                client=client)
+
+    @staticmethod
+    def _can_upload_parts(client):
+        """Check whether a client can upload a file in parallel parts.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :rtype: bool
+        :returns: True if the client's HTTP object can be shared by threads,
+                  and no batch is active (composing and deleting the parts
+                  cannot be deferred).
+        """
+        return (client.current_batch is None and
+                _is_thread_safe(client._base_connection.http))
+
+    # pylint: disable=too-many-arguments
+    def _upload_composite(self, filename, size, content_type, client,
+                          parallelism, num_retries):
+        """Upload a file in parallel parts, then compose them into this blob.
+
+        Helper for :meth:`upload_from_filename`.  The parts are uploaded as
+        temporary objects next to this one, and deleted once composed (or
+        once the upload failed).
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type size: int
+        :param size: The size of the file.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded (or ``None``).
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: The client to use (or ``None``).
+
+        :type parallelism: int
+        :param parallelism: The number of parts uploaded at once.
+
+        :type num_retries: int
+        :param num_retries: Number of upload retries of each part.
+        """
+        client = self._require_client(client)
+        self.content_type = (content_type or self.content_type or
+                             'application/octet-stream')
+        prefix = '%s.%s.part' % (self.name, uuid.uuid4().hex)
+        offsets = six.moves.range(0, size, self.composite_part_size)
+        parts = [self._temporary_part('%s%d' % (prefix, index))
+                 for index in six.moves.range(len(offsets))]
+        temporary = list(parts)
+        try:
+            self._upload_parts(filename, size, offsets, parts, client,
+                               parallelism, num_retries)
+            while len(parts) > self._COMPOSE_MAX_SOURCES:
+                composites = []
+                for start in six.moves.range(
+                        0, len(parts), self._COMPOSE_MAX_SOURCES):
+                    sources = parts[start:start + self._COMPOSE_MAX_SOURCES]
+                    if len(sources) == 1:
+                        composites.extend(sources)
+                        continue
+                    composite = self._temporary_part(
+                        '%s%d' % (prefix, len(temporary)))
+                    temporary.append(composite)
+                    composite.compose(sources, client=client)
+                    composites.append(composite)
+                parts = composites
+            self.compose(parts, client=client)
+        finally:
+            self.bucket.delete_blobs(temporary, on_error=lambda blob: None,
+                                     client=client)
+    # pylint: enable=too-many-arguments
+
+    def _temporary_part(self, name):
+        """Create a blob holding a part of a composite upload.
+
+        :type name: str
+        :param name: The name of the part.
+
+        :rtype: :class:`Blob`
+        :returns: The part, sharing this blob's content type and upload
+                  settings.
+        """
+        part = Blob(name, bucket=self.bucket, chunk_size=self.chunk_size)
+        part.content_type = self.content_type
+        part.chunk_tuner = self.chunk_tuner
+        part.upload_pipeline_depth = self.upload_pipeline_depth
+        part.upload_checksum = self.upload_checksum
+        return part
+
+    # pylint: disable=too-many-arguments
+    def _upload_parts(self, filename, size, offsets, parts, client,
+                      parallelism, num_retries):
+        """Upload the parts of a file concurrently.
+
+        Helper for :meth:`_upload_composite`.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type size: int
+        :param size: The size of the file.
+
+        :type offsets: list of int
+        :param offsets: The offset of each part in the file.
+
+        :type parts: list of :class:`Blob`
+        :param parts: The blobs to upload each part to.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :type parallelism: int
+        :param parallelism: The number of parts uploaded at once.
+
+        :type num_retries: int
+        :param num_retries: Number of upload retries of each part.
+
+        :raises: the first error met while uploading a part.
+        """
+        http = client._base_connection.http
+        pending = queue.Queue()
+        for offset, part in zip(offsets, parts):
+            pending.put((offset, part))
+        errors = []
+
+        def worker():
+            while not errors:
+                try:
+                    offset, part = pending.get_nowait()
+                except queue.Empty:
+                    return
+                length = min(self.composite_part_size, size - offset)
+                try:
+                    with _FileRange(filename, offset, length) as file_obj:
+                        part._upload_from_stream(
+                            file_obj, length, self.content_type,
+                            num_retries, client, http=http)
+                except Exception as exc:  # pylint: disable=broad-except
+                    errors.append(exc)
+
+        threads = [threading.Thread(target=worker)
+                   for _ in six.moves.range(min(parallelism, len(parts)))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+    # pylint: enable=too-many-arguments
 
     def upload_from_string(self, data, content_type='text/plain', client=None):
         """Upload contents of this blob from the provided string.
@@ -1000,3 +1290,122 @@ def _get_encryption_headers(key, source=False):
         prefix + 'Key': _bytes_to_unicode(key),
         prefix + 'Key-Sha256': _bytes_to_unicode(key_hash),
     }
+
+
+class _FileRange(object):
+    """Read-only stream over a byte range of a file.
+
+    Opens its own handle, so that ranges of one file can be read (and
+    rewound) by several threads at once.
+
+    :type filename: str
+    :param filename: The path to the file.
+
+    :type start: int
+    :param start: The offset of the range in the file.
+
+    :type length: int
+    :param length: The number of bytes in the range.
+    """
+
+    def __init__(self, filename, start, length):
+        self._file = open(filename, 'rb')
+        self._start = start
+        self._length = length
+        self._file.seek(start)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def read(self, size=-1):
+        """Read bytes, up to the end of the range.
+
+        :type size: int
+        :param size: (Optional) The number of bytes to read, all if negative.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        remaining = max(self._length - self.tell(), 0)
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        return self._file.read(size)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move to a position in the range.
+
+        :type offset: int
+        :param offset: The position, relative to ``whence``.
+
+        :type whence: int
+        :param whence: (Optional) :data:`os.SEEK_SET`, :data:`os.SEEK_CUR`
+                       or :data:`os.SEEK_END` (the end of the range).
+
+        :rtype: int
+        :returns: The new position, relative to the start of the range.
+        """
+        if whence == os.SEEK_CUR:
+            offset += self.tell()
+        elif whence == os.SEEK_END:
+            offset += self._length
+        self._file.seek(self._start + offset)
+        return offset
+
+    @staticmethod
+    def seekable():
+        """Ranges can be rewound.
+
+        :rtype: bool
+        :returns: True.
+        """
+        return True
+
+    def tell(self):
+        """Get the position in the range.
+
+        :rtype: int
+        :returns: The offset from the start of the range.
+        """
+        return self._file.tell() - self._start
+
+    def close(self):
+        """Close the underlying file."""
+        self._file.close()
+
+
+def _is_thread_safe(http):
+    """Check if an HTTP object may be shared by transfer threads.
+
+    :type http: :class:`httplib2.Http` (or workalike)
+    :param http: The HTTP object of the client's connection.
+
+    :rtype: bool
+    :returns: True if ``http`` is (or wraps) a
+              :class:`~google.cloud.transport.PooledHttp`.
+    """
+    return isinstance(getattr(http, 'http', http), PooledHttp)
+
+
+def _check_md5_hash(blob, md5_hash):
+    """Compare the MD5 hash of uploaded data with the server's.
+
+    :type blob: :class:`Blob`
+    :param blob: The blob just uploaded, with the properties returned by
+                 the server.
+
+    :type md5_hash: str
+    :param md5_hash: The base64-encoded MD5 hash of the data sent, or
+                     :data:`None` if it was not computed.
+
+    :raises: :class:`~google.cloud.streaming.exceptions.TransferInvalidError`
+             if the hashes differ.
+    """
+    if md5_hash is None or blob.md5_hash is None:
+        return
+    if md5_hash != blob.md5_hash:
+        raise TransferInvalidError(
+            'MD5 hash of the data sent (%s) does not match the hash of %r '
+            'on the server (%s)' % (md5_hash, blob.name, blob.md5_hash))
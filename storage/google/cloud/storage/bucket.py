@@ -21,6 +21,7 @@ import six
 from google.cloud._helpers import _rfc3339_to_datetime
 from google.cloud.exceptions import NotFound
 from google.cloud.iterator import HTTPIterator
+from google.cloud.metadata_cache import invalidate_resource
 from google.cloud.storage._helpers import _PropertyMixin
 from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage.acl import BucketACL
@@ -67,6 +68,27 @@ def _item_to_blob(iterator, item):
     return blob
 
 
+def _items_to_blobs(iterator, items):
+    """Convert a batch of JSON blobs to native objects.
+
+    :type iterator: :class:`~google.cloud.iterator.Iterator`
+    :param iterator: The iterator that has retrieved the items.
+
+    :type items: list of dict
+    :param items: Items to be converted to blobs.
+
+    :rtype: list of :class:`.Blob`
+    :returns: The blobs, in the same order.
+    """
+    bucket = iterator.bucket
+    blobs = []
+    for item in items:
+        blob = Blob(item.get('name'), bucket=bucket)
+        blob._set_properties(item)
+        blobs.append(blob)
+    return blobs
+
+
 class Bucket(_PropertyMixin):
     """A class representing a Bucket on Cloud Storage.
 
@@ -305,7 +327,8 @@ class Bucket(_PropertyMixin):
         iterator = HTTPIterator(
             client=client, path=path, item_to_value=_item_to_blob,
             page_token=page_token, max_results=max_results,
-            extra_params=extra_params, page_start=_blobs_page_start)
+            extra_params=extra_params, page_start=_blobs_page_start,
+            items_to_values=_items_to_blobs)
         iterator.bucket = self
         iterator.prefixes = set()
         return iterator
@@ -361,6 +384,7 @@ class Bucket(_PropertyMixin):
         # in a batch request).
         client._connection.api_request(
             method='DELETE', path=self.path, _target_object=None)
+        invalidate_resource(client, self.path)
 
     def delete_blob(self, blob_name, client=None):
         """Deletes a blob from the current bucket.
@@ -398,6 +422,7 @@ class Bucket(_PropertyMixin):
         # in a batch request).
         client._connection.api_request(
             method='DELETE', path=blob_path, _target_object=None)
+        invalidate_resource(client, blob_path)
 
     def delete_blobs(self, blobs, on_error=None, client=None):
         """Deletes a list of blobs from the current bucket.
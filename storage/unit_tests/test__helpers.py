@@ -61,6 +61,26 @@ class Test_PropertyMixin(unittest.TestCase):
         # Make sure changes get reset by reload.
         self.assertEqual(derived._changes, set())
 
+    def test_reload_w_metadata_cache(self):
+        from google.cloud.exceptions import NotModified
+        from google.cloud.metadata_cache import MetadataCache
+
+        connection = _Connection(
+            {'foo': 'Foo', 'etag': 'ETAG'}, NotModified('unchanged'))
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        derived = self._derivedClass('/path')()
+        derived.reload(client=client)
+        derived._properties['foo'] = 'Changed'
+        derived.reload(client=client)
+        self.assertEqual(derived._properties, {'foo': 'Foo', 'etag': 'ETAG'})
+        kw = connection._requested
+        self.assertEqual(len(kw), 2)
+        self.assertIsNone(kw[0]['headers'])
+        self.assertEqual(kw[1]['headers'], {'If-None-Match': 'ETAG'})
+        self.assertEqual(kw[1]['query_params'], {'projection': 'noAcl'})
+        self.assertIs(kw[1]['_target_object'], derived)
+
     def test__set_properties(self):
         mixin = self._make_one()
         self.assertEqual(mixin._properties, {})
@@ -94,6 +114,19 @@ class Test_PropertyMixin(unittest.TestCase):
         # Make sure changes get reset by patch().
         self.assertEqual(derived._changes, set())
 
+    def test_patch_invalidates_metadata_cache(self):
+        from google.cloud.metadata_cache import MetadataCache
+
+        connection = _Connection(
+            {'foo': 'Foo', 'etag': 'ETAG'}, {'foo': 'Bar', 'etag': 'ETAG2'})
+        client = _Client(connection)
+        client.metadata_cache = MetadataCache()
+        derived = self._derivedClass('/path')()
+        derived.reload(client=client)
+        derived._patch_property('foo', 'Bar')
+        derived.patch(client=client)
+        self.assertEqual(len(client.metadata_cache), 0)
+
 
 class Test__scalar_property(unittest.TestCase):
 
@@ -181,6 +214,8 @@ class _Connection(object):
     def api_request(self, **kw):
         self._requested.append(kw)
         response, self._responses = self._responses[0], self._responses[1:]
+        if isinstance(response, Exception):
+            raise response
         return response
 
 
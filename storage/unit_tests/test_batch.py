@@ -58,6 +58,22 @@ class TestMIMEApplicationHTTP(unittest.TestCase):
         mah = self._make_one(METHOD, PATH, HEADERS, BODY)
         self.assertEqual(mah.get_payload().splitlines(), LINES)
 
+    def test_ctor_body_bytes(self):
+        METHOD = 'POST'
+        PATH = '/path/to/api'
+        BODY = b'{"foo": "bar"}'
+        HEADERS = {'Content-Length': len(BODY),
+                   'Content-Type': 'application/json'}
+        LINES = [
+            'POST /path/to/api HTTP/1.1',
+            'Content-Length: 14',
+            'Content-Type: application/json',
+            '',
+            '{"foo": "bar"}',
+            ]
+        mah = self._make_one(METHOD, PATH, HEADERS, BODY)
+        self.assertEqual(mah.get_payload().splitlines(), LINES)
+
     def test_ctor_body_dict(self):
         METHOD = 'GET'
         PATH = '/path/to/api'
@@ -114,7 +130,7 @@ class TestBatch(unittest.TestCase):
         expected = _Response()
         http = _HTTP((expected, ''))
         connection = _Connection(http=http)
-        batch = self._make_one(connection)
+        batch = self._make_one(_Client(connection))
         target = _MockObject()
         response, content = batch._make_request('GET', URL,
                                                 target_object=target)
@@ -139,7 +155,7 @@ class TestBatch(unittest.TestCase):
         URL = 'http://example.com/api'
         http = _HTTP()  # no requests expected
         connection = _Connection(http=http)
-        batch = self._make_one(connection)
+        batch = self._make_one(_Client(connection))
         target = _MockObject()
         response, content = batch._make_request('POST', URL, data={'foo': 1},
                                                 target_object=target)
@@ -157,14 +173,26 @@ class TestBatch(unittest.TestCase):
         headers = solo_request[2]
         for key, value in EXPECTED_HEADERS:
             self.assertEqual(headers[key], value)
-        self.assertEqual(solo_request[3], {'foo': 1})
+        self.assertEqual(solo_request[3], b'{"foo": 1}')
+
+    def test__make_request_w_connection_codec(self):
+        codec = _Codec()
+        connection = _Connection(http=_HTTP(), codec=codec)
+        batch = self._make_one(_Client(connection))
+        batch._make_request('POST', 'http://example.com/api',
+                            data={'foo': 1})
+        _, _, headers, data = batch._requests[0]
+        self.assertEqual(codec._dumped, [{'foo': 1}])
+        self.assertEqual(data, b'ENCODED')
+        self.assertEqual(headers['Content-Length'], '7')
+        self.assertEqual(headers['Content-Type'], 'application/json')
 
     def test__make_request_PATCH_normal(self):
         from google.cloud.storage.batch import _FutureDict
         URL = 'http://example.com/api'
         http = _HTTP()  # no requests expected
         connection = _Connection(http=http)
-        batch = self._make_one(connection)
+        batch = self._make_one(_Client(connection))
         target = _MockObject()
         response, content = batch._make_request('PATCH', URL, data={'foo': 1},
                                                 target_object=target)
@@ -182,14 +210,14 @@ class TestBatch(unittest.TestCase):
         headers = solo_request[2]
         for key, value in EXPECTED_HEADERS:
             self.assertEqual(headers[key], value)
-        self.assertEqual(solo_request[3], {'foo': 1})
+        self.assertEqual(solo_request[3], b'{"foo": 1}')
 
     def test__make_request_DELETE_normal(self):
         from google.cloud.storage.batch import _FutureDict
         URL = 'http://example.com/api'
         http = _HTTP()  # no requests expected
         connection = _Connection(http=http)
-        batch = self._make_one(connection)
+        batch = self._make_one(_Client(connection))
         target = _MockObject()
         response, content = batch._make_request('DELETE', URL,
                                                 target_object=target)
@@ -213,7 +241,7 @@ class TestBatch(unittest.TestCase):
         URL = 'http://example.com/api'
         http = _HTTP()  # no requests expected
         connection = _Connection(http=http)
-        batch = self._make_one(connection)
+        batch = self._make_one(_Client(connection))
         batch._MAX_BATCH_SIZE = 1
         batch._requests.append(('POST', URL, {}, {'bar': 2}))
         self.assertRaises(ValueError,
@@ -223,7 +251,7 @@ class TestBatch(unittest.TestCase):
     def test_finish_empty(self):
         http = _HTTP()  # no requests expected
         connection = _Connection(http=http)
-        batch = self._make_one(connection)
+        batch = self._make_one(_Client(connection))
         self.assertRaises(ValueError, batch.finish)
         self.assertIs(connection.http, http)
 
@@ -311,6 +339,21 @@ class TestBatch(unittest.TestCase):
 
         self._check_subrequest_no_payload(chunks[2], 'DELETE', URL)
 
+    def test_finish_w_connection_timeout(self):
+        URL = 'http://api.example.com/other_api'
+        expected = _Response()
+        expected['content-type'] = 'multipart/mixed; boundary="DEADBEEF="'
+        http = _HTTP((expected, _THREE_PART_MIME_RESPONSE))
+        connection = _Connection(http=http, timeout=12.5)
+        client = _Client(connection)
+        batch = self._make_one(client)
+        batch._do_request('POST', URL, {}, {'foo': 1, 'bar': 2}, None,
+                          timeout=1.0)
+        batch._do_request('PATCH', URL, {}, {'bar': 3}, None)
+        batch._do_request('DELETE', URL, {}, None, None)
+        batch.finish()
+        self.assertEqual(connection._made_request_timeout, 12.5)
+
     def test_finish_responses_mismatch(self):
         URL = 'http://api.example.com/other_api'
         expected = _Response()
@@ -570,11 +613,17 @@ class Test__FutureDict(unittest.TestCase):
 class _Connection(object):
 
     project = 'TESTING'
+    timeout = None
 
     def __init__(self, **kw):
+        from google.cloud.codec import DEFAULT_CODEC
+
+        self.codec = DEFAULT_CODEC
         self.__dict__.update(kw)
 
-    def _make_request(self, method, url, data=None, headers=None):
+    def _make_request(self, method, url, data=None, headers=None,
+                      timeout=None):
+        self._made_request_timeout = timeout
         return self.http.request(uri=url, method=method,
                                  headers=headers, body=data)
 
@@ -602,6 +651,16 @@ class _MockObject(object):
     pass
 
 
+class _Codec(object):
+
+    def __init__(self):
+        self._dumped = []
+
+    def dumps(self, value):
+        self._dumped.append(value)
+        return b'ENCODED'
+
+
 class _Client(object):
 
     def __init__(self, connection):
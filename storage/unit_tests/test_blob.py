@@ -356,6 +356,52 @@ class Test_Blob(unittest.TestCase):
     def test_download_to_file_with_chunk_size(self):
         self._download_to_file_helper(chunk_size=3)
 
+    def _download_parallel_helper(self, pooled_http):
+        import mock
+        from six.moves.http_client import PARTIAL_CONTENT
+        from io import BytesIO
+        from google.cloud.streaming.transfer import Download
+        from google.cloud.transport import PooledHttp
+
+        chunk1_response = {'status': PARTIAL_CONTENT,
+                           'content-range': 'bytes 0-2/6'}
+        chunk2_response = {'status': PARTIAL_CONTENT,
+                           'content-range': 'bytes 3-5/6'}
+        responder = _HTTP(
+            (chunk1_response, b'abc'),
+            (chunk2_response, b'def'),
+        )
+        connection = _Connection()
+        connection.http = responder
+        if pooled_http:
+            connection.http = PooledHttp(http_factory=lambda: responder)
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        properties = {'mediaLink': 'http://example.com/media/'}
+        blob = self._make_one('blob-name', bucket=bucket,
+                              properties=properties)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 3
+        fh = BytesIO()
+        parallel = mock.patch.object(
+            Download, '_stream_file_parallel', autospec=True,
+            side_effect=Download._stream_file_parallel)
+        with parallel as stream_file_parallel:
+            blob.download_to_file(fh, parallelism=4)
+        self.assertEqual(fh.getvalue(), b'abcdef')
+        self.assertEqual(
+            [request['headers']['range'] for request in responder._requested],
+            ['bytes=0-2', 'bytes=3-5'])
+        return stream_file_parallel
+
+    def test_download_to_file_parallel(self):
+        stream_file_parallel = self._download_parallel_helper(True)
+        self.assertEqual(stream_file_parallel.call_count, 1)
+
+    def test_download_to_file_parallel_wo_pooled_http(self):
+        stream_file_parallel = self._download_parallel_helper(False)
+        stream_file_parallel.assert_not_called()
+
     def test_download_to_filename(self):
         import os
         import time
@@ -515,6 +561,9 @@ class Test_Blob(unittest.TestCase):
             x.title(): str(y) for x, y in rq[0]['headers'].items()}
         self.assertEqual(headers['Content-Length'], '6')
         self.assertEqual(headers['Content-Type'], expected_content_type)
+        # The file was memory-mapped rather than read.
+        self.assertIsInstance(rq[0]['body'], memoryview)
+        self.assertEqual(rq[0]['body'], DATA)
 
     def test_upload_from_file_stream(self):
         from six.moves.http_client import OK
@@ -733,6 +782,139 @@ class Test_Blob(unittest.TestCase):
             'redirections': 5,
         })
 
+    def test_upload_from_file_resumable_w_pipeline(self):
+        import mock
+        from io import BytesIO
+        from six.moves.http_client import OK
+        from google.cloud.streaming import http_wrapper
+
+        UPLOAD_URL = 'http://example.com/upload/name/key'
+        DATA = b'ABCDEF'
+        loc_response = {'status': OK, 'location': UPLOAD_URL}
+        chunk1_response = {'status': http_wrapper.RESUME_INCOMPLETE,
+                           'range': 'bytes 0-4'}
+        chunk2_response = {'status': OK}
+        connection = _Connection(
+            (loc_response, b''),
+            (chunk1_response, b''),
+            (chunk2_response, b'{}'),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._make_one('blob-name', bucket=bucket)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 5
+        blob.upload_pipeline_depth = 2
+
+        patch = mock.patch(
+            'google.cloud.streaming.transfer.RESUMABLE_UPLOAD_THRESHOLD',
+            new=5)
+        with patch:
+            blob.upload_from_file(BytesIO(DATA), size=len(DATA))
+
+        rq = connection.http._requested
+        self.assertEqual([request['body'] for request in rq[1:]],
+                         [DATA[:5], DATA[5:]])
+        self.assertEqual(
+            [request['headers']['Content-Range'] for request in rq[1:]],
+            ['bytes 0-4/6', 'bytes 5-5/6'])
+
+    def _upload_checksum_helper(self, server_md5):
+        import json
+        import mock
+        from io import BytesIO
+        from six.moves.http_client import OK
+        from google.cloud.streaming import http_wrapper
+
+        UPLOAD_URL = 'http://example.com/upload/name/key'
+        DATA = b'ABCDEF'
+        loc_response = {'status': OK, 'location': UPLOAD_URL}
+        chunk1_response = {'status': http_wrapper.RESUME_INCOMPLETE,
+                           'range': 'bytes 0-4'}
+        chunk2_response = {'status': OK}
+        resource = {'md5Hash': server_md5} if server_md5 else {}
+        connection = _Connection(
+            (loc_response, b''),
+            (chunk1_response, b''),
+            (chunk2_response, json.dumps(resource).encode('utf-8')),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._make_one('blob-name', bucket=bucket)
+        blob._CHUNK_SIZE_MULTIPLE = 1
+        blob.chunk_size = 5
+        blob.upload_checksum = True
+
+        patch = mock.patch(
+            'google.cloud.streaming.transfer.RESUMABLE_UPLOAD_THRESHOLD',
+            new=5)
+        with patch:
+            blob.upload_from_file(BytesIO(DATA), size=len(DATA))
+        return blob
+
+    DATA_MD5 = 'iCekESKlAouYCMe/hLn89g=='  # MD5 of b'ABCDEF'
+
+    def test_upload_from_file_resumable_w_checksum(self):
+        blob = self._upload_checksum_helper(self.DATA_MD5)
+        self.assertEqual(blob.md5_hash, self.DATA_MD5)
+
+    def test_upload_from_file_resumable_w_checksum_wo_server_hash(self):
+        blob = self._upload_checksum_helper(None)
+        self.assertIsNone(blob.md5_hash)
+
+    def test_upload_from_file_resumable_w_checksum_mismatch(self):
+        from google.cloud.streaming.exceptions import TransferInvalidError
+
+        with self.assertRaises(TransferInvalidError):
+            self._upload_checksum_helper('1B2M2Y8AsgTpgAmY7PhCfg==')
+
+    def test_upload_from_file_resumable_w_chunk_tuner(self):
+        import mock
+        from io import BytesIO
+        from six.moves.http_client import OK
+        from google.cloud.streaming import http_wrapper
+        from google.cloud.streaming.transfer import ChunkSizeTuner
+        from google.cloud.streaming.transfer import RESUMABLE_UPLOAD
+
+        UPLOAD_URL = 'http://example.com/upload/name/key'
+        DATA = b'ABCDEF'
+        loc_response = {'status': OK, 'location': UPLOAD_URL}
+        chunk1_response = {'status': http_wrapper.RESUME_INCOMPLETE,
+                           'range': 'bytes 0-4'}
+        chunk2_response = {'status': OK}
+        connection = _Connection(
+            (loc_response, b''),
+            (chunk1_response, b''),
+            (chunk2_response, b'{}'),
+        )
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._make_one('blob-name', bucket=bucket)
+        tuner = ChunkSizeTuner(min_size=5, max_size=5, multiple=1)
+        tuner.chunksize = 5
+        blob.chunk_tuner = tuner
+
+        patch = mock.patch(
+            'google.cloud.streaming.transfer.RESUMABLE_UPLOAD_THRESHOLD',
+            new=5)
+        with patch:
+            blob.upload_from_file(BytesIO(DATA), size=len(DATA))
+
+        rq = connection.http._requested
+        self.assertEqual([request['body'] for request in rq[1:]],
+                         [DATA[:5], DATA[5:]])
+        self.assertEqual(tuner.strategy, RESUMABLE_UPLOAD)
+        self.assertIsNotNone(tuner.rtt)
+
+    def test__chunk_tuner(self):
+        tuner = object()
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        self.assertIsNone(blob._chunk_tuner())
+        blob.chunk_tuner = tuner
+        self.assertIs(blob._chunk_tuner(), tuner)
+        blob.chunk_size = 256 * 1024
+        self.assertIsNone(blob._chunk_tuner())
+
     def test_upload_from_file_resumable_w_error(self):
         import mock
         from six.moves.http_client import NOT_FOUND
@@ -1662,6 +1844,275 @@ class Test_Blob(unittest.TestCase):
         self.assertIsNone(blob.updated)
 
 
+    def _upload_from_filename_parallel_helper(self, size, parallelism,
+                                              encryption_key=None,
+                                              pooled_http=True,
+                                              in_batch=False, **kw):
+        import mock
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.transport import PooledHttp
+
+        connection = _Connection()
+        if pooled_http:
+            connection.http = PooledHttp()
+        client = _Client(connection)
+        if in_batch:
+            client.current_batch = object()
+        bucket = _Bucket(client)
+        blob = self._make_one('blob-name', bucket=bucket,
+                              encryption_key=encryption_key)
+        blob.composite_upload_threshold = 5
+        composite = mock.patch.object(blob, '_upload_composite')
+        upload = mock.patch.object(blob, 'upload_from_file')
+        with _NamedTemporaryFile(suffix='.jpeg') as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'X' * size)
+            with composite as upload_composite:
+                with upload as upload_from_file:
+                    blob.upload_from_filename(temp.name,
+                                              parallelism=parallelism, **kw)
+        return temp.name, upload_composite, upload_from_file
+
+    def test_upload_from_filename_parallel(self):
+        filename, upload_composite, upload_from_file = (
+            self._upload_from_filename_parallel_helper(6, 4))
+        upload_composite.assert_called_once_with(
+            filename, 6, 'image/jpeg', None, 4, 6)
+        upload_from_file.assert_not_called()
+
+    def test_upload_from_filename_parallel_w_num_retries(self):
+        filename, upload_composite, _ = (
+            self._upload_from_filename_parallel_helper(6, 4, num_retries=2))
+        upload_composite.assert_called_once_with(
+            filename, 6, 'image/jpeg', None, 4, 2)
+
+    def test_upload_from_filename_parallel_below_threshold_w_num_retries(
+            self):
+        _, _, upload_from_file = (
+            self._upload_from_filename_parallel_helper(5, 4, num_retries=2))
+        _, kwargs = upload_from_file.call_args
+        self.assertEqual(kwargs['num_retries'], 2)
+
+    def test_upload_from_filename_parallel_in_batch(self):
+        _, upload_composite, upload_from_file = (
+            self._upload_from_filename_parallel_helper(6, 4, in_batch=True))
+        upload_composite.assert_not_called()
+        self.assertEqual(upload_from_file.call_count, 1)
+
+    def test_upload_from_filename_parallel_below_threshold(self):
+        _, upload_composite, upload_from_file = (
+            self._upload_from_filename_parallel_helper(5, 4))
+        upload_composite.assert_not_called()
+        self.assertEqual(upload_from_file.call_count, 1)
+
+    def test_upload_from_filename_parallel_w_one_thread(self):
+        _, upload_composite, upload_from_file = (
+            self._upload_from_filename_parallel_helper(6, 1))
+        upload_composite.assert_not_called()
+        self.assertEqual(upload_from_file.call_count, 1)
+
+    def test_upload_from_filename_parallel_w_key(self):
+        _, upload_composite, upload_from_file = (
+            self._upload_from_filename_parallel_helper(
+                6, 4, encryption_key=b'aa426195405adee2c8081bb9e7e74b19'))
+        upload_composite.assert_not_called()
+        self.assertEqual(upload_from_file.call_count, 1)
+
+    def test_upload_from_filename_parallel_wo_pooled_http(self):
+        _, upload_composite, upload_from_file = (
+            self._upload_from_filename_parallel_helper(
+                6, 4, pooled_http=False))
+        upload_composite.assert_not_called()
+        self.assertEqual(upload_from_file.call_count, 1)
+
+    def _upload_composite_helper(self, http, *compose_responses, **kw):
+        import mock
+        from google.cloud._testing import _NamedTemporaryFile
+
+        connection = _Connection(*compose_responses)
+        connection.http = http
+        client = _Client(connection)
+        bucket = _Bucket(client)
+        blob = self._make_one('blob-name', bucket=bucket)
+        blob.composite_part_size = 3
+        blob._COMPOSE_MAX_SOURCES = 2
+        uuid4 = mock.patch('google.cloud.storage.blob.uuid.uuid4',
+                           return_value=mock.Mock(hex='TOKEN'))
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(self.COMPOSITE_DATA)
+            with uuid4:
+                expected_error = kw.get('expected_error')
+                if expected_error is None:
+                    blob._upload_composite(
+                        temp.name, len(self.COMPOSITE_DATA), 'foo/bar',
+                        None, 3, 6)
+                else:
+                    with self.assertRaises(expected_error):
+                        blob._upload_composite(
+                            temp.name, len(self.COMPOSITE_DATA),
+                            'foo/bar', None, 3, 6)
+        return blob, connection, bucket
+
+    COMPOSITE_DATA = b'ABCDEFGHIJ'
+    PART_PREFIX = 'blob-name.TOKEN.part'
+
+    def test__upload_composite(self):
+        from six.moves.http_client import OK
+        from six.moves.urllib.parse import parse_qsl
+        from six.moves.urllib.parse import urlsplit
+
+        DATA = self.COMPOSITE_DATA
+        PREFIX = self.PART_PREFIX
+        http = _EchoHTTP()
+        blob, connection, bucket = self._upload_composite_helper(
+            http, ({'status': OK}, {}), ({'status': OK}, {}),
+            ({'status': OK}, {'etag': 'DEADBEEF'}))
+
+        uploaded = {}
+        for request in http._requested:
+            query = dict(parse_qsl(urlsplit(request['uri']).query))
+            uploaded[query['name']] = request['body']
+        self.assertEqual(sorted(uploaded), [PREFIX + str(index)
+                                            for index in range(4)])
+        for index in range(4):
+            self.assertIn(DATA[3 * index:3 * index + 3],
+                          uploaded[PREFIX + str(index)])
+
+        composed = [(request['path'],
+                     [source['name']
+                      for source in request['data']['sourceObjects']])
+                    for request in connection._requested]
+        self.assertEqual(composed, [
+            ('/b/name/o/%s/compose' % (PREFIX + '4',),
+             [PREFIX + '0', PREFIX + '1']),
+            ('/b/name/o/%s/compose' % (PREFIX + '5',),
+             [PREFIX + '2', PREFIX + '3']),
+            ('/b/name/o/blob-name/compose', [PREFIX + '4', PREFIX + '5']),
+        ])
+        self.assertEqual(connection._requested[-1]['data']['destination'],
+                         {'contentType': 'foo/bar'})
+        self.assertEqual(blob.etag, 'DEADBEEF')
+        self.assertEqual(bucket._deleted_blobs,
+                         [PREFIX + str(index) for index in range(6)])
+
+    def test__upload_composite_w_part_error(self):
+        from six.moves.http_client import NOT_FOUND
+        from google.cloud.exceptions import NotFound
+
+        PREFIX = self.PART_PREFIX
+        http = _EchoHTTP(status=NOT_FOUND)
+        _, connection, bucket = self._upload_composite_helper(
+            http, expected_error=NotFound)
+
+        self.assertTrue(1 <= len(http._requested) <= 3)
+        self.assertEqual(connection._requested, [])
+        self.assertEqual(bucket._deleted_blobs,
+                         [PREFIX + str(index) for index in range(4)])
+        self.assertIsNotNone(bucket._on_error)
+
+    def test__upload_composite_w_compose_error(self):
+        from six.moves.http_client import NOT_FOUND
+        from six.moves.http_client import OK
+        from google.cloud.exceptions import NotFound
+
+        PREFIX = self.PART_PREFIX
+        http = _EchoHTTP()
+        _, connection, bucket = self._upload_composite_helper(
+            http, ({'status': OK}, {}), ({'status': NOT_FOUND}, {}),
+            expected_error=NotFound)
+
+        self.assertEqual(len(http._requested), 4)
+        self.assertEqual(len(connection._requested), 2)
+        self.assertEqual(bucket._deleted_blobs,
+                         [PREFIX + str(index) for index in range(6)])
+
+
+    def test__upload_parts_w_num_retries(self):
+        import mock
+        from google.cloud._testing import _NamedTemporaryFile
+
+        connection = _Connection()
+        connection.http = http = _EchoHTTP()
+        client = _Client(connection)
+        blob = self._make_one('blob-name', bucket=_Bucket(client))
+        blob.content_type = 'foo/bar'
+        blob.composite_part_size = 3
+        parts = [mock.Mock(), mock.Mock()]
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'ABCDE')
+            blob._upload_parts(temp.name, 5, [0, 3], parts, client, 2, 4)
+
+        for part, length in zip(parts, [3, 2]):
+            part._upload_from_stream.assert_called_once_with(
+                mock.ANY, length, 'foo/bar', 4, client, http=http)
+
+
+class Test__FileRange(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.blob import _FileRange
+        return _FileRange
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _check_range(self, check):
+        from google.cloud._testing import _NamedTemporaryFile
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(b'ABCDEFGHIJ')
+            with self._make_one(temp.name, 3, 4) as file_range:
+                check(file_range)
+            self.assertTrue(file_range._file.closed)
+
+    def test_read(self):
+        def check(file_range):
+            self.assertEqual(file_range.tell(), 0)
+            self.assertEqual(file_range.read(3), b'DEF')
+            self.assertEqual(file_range.tell(), 3)
+            self.assertEqual(file_range.read(3), b'G')
+            self.assertEqual(file_range.read(), b'')
+
+        self._check_range(check)
+
+    def test_read_all(self):
+        def check(file_range):
+            self.assertEqual(file_range.read(), b'DEFG')
+
+        self._check_range(check)
+
+    def test_seek(self):
+        import os
+
+        def check(file_range):
+            self.assertTrue(file_range.seekable())
+            self.assertEqual(file_range.seek(2), 2)
+            self.assertEqual(file_range.read(1), b'F')
+            self.assertEqual(file_range.seek(-2, os.SEEK_CUR), 1)
+            self.assertEqual(file_range.read(1), b'E')
+            self.assertEqual(file_range.seek(-1, os.SEEK_END), 3)
+            self.assertEqual(file_range.read(), b'G')
+
+        self._check_range(check)
+
+
+class _EchoHTTP(object):
+
+    def __init__(self, status=200):
+        self._status = status
+        self._requested = []
+
+    def request(self, uri, method, headers, body, **kw):
+        if hasattr(body, 'read'):
+            body = body.read()
+        self._requested.append(dict(uri=uri, method=method, headers=headers,
+                                    body=body, **kw))
+        return {'status': self._status}, b'{}'
+
+
 class _Responder(object):
 
     def __init__(self, *responses):
@@ -1725,6 +2176,7 @@ class _Bucket(object):
         self._blobs = {}
         self._copied = []
         self._deleted = []
+        self._deleted_blobs = []
         self.name = name
         self.path = '/b/' + name
 
@@ -1732,6 +2184,10 @@ class _Bucket(object):
         del self._blobs[blob_name]
         self._deleted.append((blob_name, client))
 
+    def delete_blobs(self, blobs, on_error=None, client=None):
+        self._deleted_blobs.extend(blob.name for blob in blobs)
+        self._on_error = on_error
+
 
 class _Signer(object):
 
@@ -1746,6 +2202,9 @@ class _Signer(object):
 
 class _Client(object):
 
+    _credentials = None
+    current_batch = None
+
     def __init__(self, connection):
         self._base_connection = connection
 
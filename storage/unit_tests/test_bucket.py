@@ -920,8 +920,8 @@ class Test_Bucket(unittest.TestCase):
                 _saved.append(
                     (self._bucket, self._name, self._granted, client))
 
-        def item_to_blob(self, item):
-            return _Blob(self.bucket, item['name'])
+        def items_to_blobs(self, items):
+            return [_Blob(self.bucket, item['name']) for item in items]
 
         NAME = 'name'
         BLOB_NAME = 'blob-name'
@@ -933,8 +933,8 @@ class Test_Bucket(unittest.TestCase):
         bucket.acl.loaded = True
         bucket.default_object_acl.loaded = True
 
-        with mock.patch('google.cloud.storage.bucket._item_to_blob',
-                        new=item_to_blob):
+        with mock.patch('google.cloud.storage.bucket._items_to_blobs',
+                        new=items_to_blobs):
             bucket.make_public(recursive=True)
         self.assertEqual(list(bucket.acl), permissive)
         self.assertEqual(list(bucket.default_object_acl), [])
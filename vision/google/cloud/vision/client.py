@@ -16,15 +16,20 @@
 
 import os
 
+from google.cloud._helpers import _lazy_import
 from google.cloud.client import JSONClient
 from google.cloud.environment_vars import DISABLE_GRPC
 
-from google.cloud.vision._gax import _GAPICVisionAPI
 from google.cloud.vision.connection import Connection
 from google.cloud.vision.image import Image
 from google.cloud.vision._http import _HTTPVisionAPI
 
 
+# The GAX module is only imported when first needed: by ``_load_gax()``,
+# which returns False (and HTTP is used) if it cannot be imported.
+_load_gax = _lazy_import(
+    __name__, 'google.cloud.vision._gax', _GAPICVisionAPI='_GAPICVisionAPI')
+
 _USE_GAX = not os.getenv(DISABLE_GRPC, False)
 
 
@@ -53,7 +58,7 @@ class Client(JSONClient):
     :param use_gax: (Optional) Explicitly specifies whether
                     to use the gRPC transport (via GAX) or HTTP. If unset,
                     falls back to the ``GOOGLE_CLOUD_DISABLE_GRPC`` environment
-                    variable
+                    variable. HTTP is used if GAX cannot be imported.
     """
     _vision_api_internal = None
 
@@ -96,7 +101,8 @@ class Client(JSONClient):
                   make requests.
         """
         if self._vision_api_internal is None:
-            if self._use_gax:
+            if self._use_gax and _load_gax():
+                # pylint: disable=undefined-variable
                 self._vision_api_internal = _GAPICVisionAPI(self)
             else:
                 self._vision_api_internal = _HTTPVisionAPI(self)
@@ -64,6 +64,24 @@ class TestClient(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             client._vision_api()
 
+    def test_gax_api_class_imported_lazily(self):
+        from google.cloud.vision import client as MUT
+        from google.cloud.vision._gax import _GAPICVisionAPI
+
+        self.assertIs(MUT._GAPICVisionAPI, _GAPICVisionAPI)
+
+    def test_gax_unavailable(self):
+        from google.cloud.vision._http import _HTTPVisionAPI
+
+        credentials = _make_credentials()
+        client = self._make_one(project=PROJECT, credentials=credentials,
+                                use_gax=True)
+        with mock.patch('google.cloud.vision.client._load_gax',
+                        new=lambda: False):
+            api = client._vision_api
+
+        self.assertIsInstance(api, _HTTPVisionAPI)
+
     def test_face_annotation(self):
         from google.cloud.vision.feature import Feature, FeatureTypes
         from unit_tests._fixtures import FACE_DETECTION_RESPONSE